@@ -5,10 +5,12 @@ import logging
 import sys
 from pathlib import Path
 from typing import Dict, Any, Optional, List
+import pandas as pd
 import streamlit as st
 from datetime import datetime
 
 from core.translation.translation_service import TranslationService
+from core.interfaces.components.model_health import render_model_health
 from core.monitoring.resource_monitor import ResourceMonitor
 from core.utils.logging_utils import setup_logger
 
@@ -146,25 +148,32 @@ class AdvancedTranslationUI:
         
         if st.button("Translate", key="translate_btn"):
             if input_text:
-                with st.spinner("Translating..."):
-                    # Get model capabilities
-                    model_info = self.capability_manager.get_model_info(model)
+                # Get model capabilities
+                model_info = self.capability_manager.get_model_info(model)
+                
+                # Render the translation as it is generated
+                label = st.empty()
+                output = st.empty()
+                output.caption("Translating...")
+                translation = ""
+                for chunk in self.translation_service.translate_stream(
+                    text=input_text,
+                    source_lang=st.session_state.source_lang,
+                    target_lang=st.session_state.target_lang,
+                    model=model
+                ):
+                    translation += chunk
+                    output.write(translation)
                     
-                    # Perform translation based on model capabilities
-                    translation = self.translation_service.translate(
-                        text=input_text,
-                        source_lang=st.session_state.source_lang,
-                        target_lang=st.session_state.target_lang
-                    )
+                if translation:
+                    label.success("Translation:")
                     
-                    if translation:
-                        st.success("Translation:")
-                        st.write(translation)
-                        
-                        # Show additional analysis if supported
-                        if "analysis" in model_info["features"]:
-                            st.info("Model Analysis:")
-                            # Add model-specific analysis here
+                    # Show additional analysis if supported
+                    if "analysis" in model_info["features"]:
+                        st.info("Model Analysis:")
+                        # Add model-specific analysis here
+                else:
+                    output.error("Translation failed. Please try again.")
                             
     def render_training_monitor(self):
         """Render training monitoring interface"""
@@ -221,10 +230,13 @@ class AdvancedTranslationUI:
             
         # Display system metrics
         self.render_system_metrics()
+        render_model_health(self.translation_service)
         
     def render_system_metrics(self):
         """Render system resource metrics"""
         st.sidebar.header("System Metrics")
+        if not self.translation_service.is_ready():
+            st.sidebar.warning("Models are warming up - first translations may be slow")
         
         metrics = self.resource_monitor.get_system_metrics()
         
@@ -237,6 +249,7 @@ class AdvancedTranslationUI:
             if hasattr(metrics, "gpu_usage"):
                 st.metric("GPU Usage", f"{metrics.gpu_usage:.1f}%")
 
+
 def main():
     """Main entry point for the advanced translation interface"""
     st.set_page_config(
@@ -254,3 +267,4 @@ def main():
         st.error(f"An error occurred: {str(e)}")
 
 if __name__ == "__main__":
+    main()
@@ -4,9 +4,11 @@ Interface components package
 from .translation_interface import TranslationInterface
 from .model_interface import ModelInterface
 from .monitoring_interface import MonitoringInterface
+from .model_health import render_model_health
 
 __all__ = [
     'TranslationInterface',
     'ModelInterface',
-    'MonitoringInterface'
+    'MonitoringInterface',
+    'render_model_health'
 ]
@@ -0,0 +1,24 @@
+"""
+Model health sidebar component
+"""
+from typing import Any
+
+import streamlit as st
+
+
+def render_model_health(translation_service: Any) -> None:
+    """Display circuit breaker state and health score per model"""
+    health = translation_service.get_model_health_stats()
+    if not health:
+        return
+
+    st.sidebar.header("Model Health")
+    icons = {"closed": "🟢", "half_open": "🟡", "open": "🔴"}
+    for model, stats in sorted(health.items(), key=lambda item: -item[1]["health_score"]):
+        status = f"{icons.get(stats['state'], '⚪')} **{model.split('/')[-1]}**: {stats['state'].replace('_', '-')}"
+        if stats["state"] == "open":
+            status += f", retry in {stats['retry_in_seconds']:.0f}s"
+        st.sidebar.markdown(
+            f"{status}  \nscore {stats['health_score']:.2f} · "
+            f"errors {stats['error_rate']:.0%} · p95 {stats['p95_ms']:.0f} ms"
+        )
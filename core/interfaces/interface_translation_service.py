@@ -4,7 +4,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 
 import yaml
-import requests
+
+from core.utils.http_session import get_http_client
 
 # Configure logging
 logging.basicConfig(
@@ -70,7 +71,7 @@ class InterfaceTranslationService:
 
         try:
             api_url = self.api_url + model
-            response = requests.post(api_url, headers=self.headers, json={"inputs": text})
+            response = get_http_client().post(api_url, headers=self.headers, json={"inputs": text})
             response.raise_for_status()
 
             result = response.json()
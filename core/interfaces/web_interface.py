@@ -17,6 +17,7 @@ import torch
 from typing import Dict, Any, Optional
 
 from core.translation.translation_service import TranslationService
+from core.interfaces.components.model_health import render_model_health
 from core.monitoring.resource_monitor import ResourceMonitor
 from core.utils.logging_utils import setup_logger
 
@@ -59,6 +60,8 @@ class TranslationUI:
         metrics = self.monitor.get_system_metrics()
         
         st.sidebar.header("System Status")
+        if not self.translation_service.is_ready():
+            st.sidebar.warning("Models are warming up - first translations may be slow")
         col1, col2 = st.sidebar.columns(2)
         
         with col1:
@@ -124,28 +127,32 @@ class TranslationUI:
         with col1:
             if st.button("Translate", use_container_width=True):
                 if input_text:
-                    with st.spinner("Translating..."):
-                        # Log resource usage before translation
-                        start_metrics = self.monitor.get_system_metrics()
-                        logger.info(f"Starting translation. Memory usage: {start_metrics.memory_usage}%")
-                        
-                        # Perform translation
-                        translation = self.translation_service.translate(
-                            input_text, source_lang, target_lang, selected_model
-                        )
-                        
-                        # Log resource usage after translation
-                        end_metrics = self.monitor.get_system_metrics()
-                        logger.info(
-                            f"Translation completed. Memory change: "
-                            f"{end_metrics.memory_usage - start_metrics.memory_usage}%"
-                        )
-                        
-                        if translation:
-                            st.success("Translation complete!")
-                            st.markdown(f"**{translation}**")
-                        else:
-                            st.error("Translation failed. Please try again.")
+                    # Log resource usage before translation
+                    start_metrics = self.monitor.get_system_metrics()
+                    logger.info(f"Starting translation. Memory usage: {start_metrics.memory_usage}%")
+                    
+                    # Render the translation as it is generated
+                    output = st.empty()
+                    output.caption("Translating...")
+                    translation = ""
+                    for chunk in self.translation_service.translate_stream(
+                        input_text, source_lang, target_lang, selected_model
+                    ):
+                        translation += chunk
+                        output.markdown(f"**{translation}**")
+                    
+                    # Log resource usage after translation
+                    end_metrics = self.monitor.get_system_metrics()
+                    logger.info(
+                        f"Translation completed. Memory change: "
+                        f"{end_metrics.memory_usage - start_metrics.memory_usage}%"
+                    )
+                    
+                    if translation:
+                        st.success("Translation complete!")
+                    else:
+                        output.empty()
+                        st.error("Translation failed. Please try again.")
                 else:
                     st.warning("Please enter text to translate.")
                     
@@ -162,6 +169,7 @@ class TranslationUI:
 
         # Display system metrics
         self.render_system_status()
+        render_model_health(self.translation_service)
 
         # Add information about the service
         st.markdown("---")
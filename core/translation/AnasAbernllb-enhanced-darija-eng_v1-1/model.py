@@ -1,6 +1,7 @@
 import logging
 import requests
 from config.credentials import load_credentials
+from core.utils.http_session import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +25,7 @@ class AnasAberNllbEnhancedTranslationService:
         
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(self.api_url, headers=self.headers, json=payload)
+                response = get_http_client().post(self.api_url, headers=self.headers, json=payload)
                 response.raise_for_status()
                 result = response.json()
                 
@@ -3,6 +3,8 @@ import requests
 import time
 import os
 
+from core.utils.http_session import get_http_client
+
 logger = logging.getLogger(__name__)
 
 class BAKKALIAYOUBDarijaTranslationService:
@@ -20,7 +22,7 @@ class BAKKALIAYOUBDarijaTranslationService:
         
         for attempt in range(self.max_retries):
             try:
-                response = requests.post(self.api_url, headers=self.headers, json=payload)
+                response = get_http_client().post(self.api_url, headers=self.headers, json=payload)
                 response.raise_for_status()
                 result = response.json()
                 
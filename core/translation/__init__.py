@@ -1,14 +1,40 @@
 """
 Translation service package.
 Provides model validation, response handling, and translation functionality.
+
+Submodules are imported on first attribute access, so importing the package
+does not pull in torch, transformers or streamlit.
 """
 
-from .model_validator import ModelValidator
-from .response_handler import ResponseHandler
-from .translation_service import TranslationService
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .model_validator import ModelValidator
+    from .response_handler import ResponseHandler
+    from .translation_service import TranslationService
+
+_LAZY_ATTRIBUTES = {
+    'ModelValidator': '.model_validator',
+    'ResponseHandler': '.response_handler',
+    'TranslationService': '.translation_service'
+}
 
 __all__ = [
     'ModelValidator',
     'ResponseHandler',
     'TranslationService'
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
@@ -0,0 +1,198 @@
+"""
+Asyncio client for the HuggingFace Inference API translation path.
+Keeps up to a fixed number of requests in flight per model, retries with
+non-blocking backoff and honours a per-request timeout. A request that
+fails, including one answered with a body that is not JSON, yields None
+for its item without failing the rest of a batch.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAPITranslationClient:
+    """
+    Async counterpart of ``TranslationService._translate_with_api``.
+
+    Payloads come from the service's ``_build_api_payload`` and responses are
+    parsed with its ``ResponseHandler``, so both paths behave the same. Use it
+    as an async context manager so the connection pool is closed afterwards.
+    """
+
+    def __init__(
+        self,
+        service: Any,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        base_delay: float = 5.0,
+        request_timeout: float = 30.0
+    ):
+        self.service = service
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.request_timeout = request_timeout
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncAPITranslationClient":
+        connector = aiohttp.TCPConnector(limit=0, limit_per_host=self.max_concurrency)
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers=self.service.headers
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying connection pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def translate(
+        self,
+        text: str,
+        model: str,
+        deadline: Optional[float] = None,
+        profile: Optional[str] = None,
+        timeout_seconds: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Translate one text, waiting for a free slot for the model.
+        ``deadline`` is a loop time (``loop.time()``) after which the request
+        is abandoned, including time spent queued and backing off.
+        ``timeout_seconds`` bounds the request from the moment it gets a
+        slot, so queueing behind other requests does not use it up.
+        ``profile`` selects the service's generation parameters.
+        """
+        if self._session is None:
+            raise RuntimeError("AsyncAPITranslationClient must be used as an async context manager")
+
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore(model):
+            start = loop.time()
+            if timeout_seconds is not None:
+                slot_deadline = loop.time() + timeout_seconds
+                deadline = slot_deadline if deadline is None else min(deadline, slot_deadline)
+            payload = self.service._build_api_payload(text, model, profile)
+            model_family = self.service._get_model_family(model)
+            url = f"{self.service.api_url}{model}"
+
+            for attempt in range(self.max_retries):
+                timeout = self.request_timeout
+                if deadline is not None:
+                    timeout = min(timeout, deadline - loop.time())
+                    if timeout <= 0:
+                        return self._fail(model, text, "Deadline exceeded", loop.time() - start)
+
+                try:
+                    async with self._session.post(
+                        url,
+                        json=payload,
+                        timeout=aiohttp.ClientTimeout(total=timeout)
+                    ) as response:
+                        if response.status == 503:
+                            delay = self.base_delay * (attempt + 1)
+                            if attempt < self.max_retries - 1 and self._can_wait(loop, deadline, delay):
+                                logger.warning(
+                                    f"Model is loading, retrying in {delay} seconds... "
+                                    f"(Attempt {attempt + 1}/{self.max_retries})"
+                                )
+                                await asyncio.sleep(delay)
+                                continue
+                            return self._fail(
+                                model, text, f"Model failed to load after {attempt + 1} attempts",
+                                loop.time() - start
+                            )
+
+                        if response.status != 200:
+                            body = await response.text()
+                            return self._fail(
+                                model, text, f"API error ({response.status}): {body}", loop.time() - start
+                            )
+
+                        result = await response.json(content_type=None)
+
+                except asyncio.TimeoutError:
+                    if attempt < self.max_retries - 1:
+                        logger.warning(
+                            f"API request timed out, retrying... "
+                            f"(Attempt {attempt + 1}/{self.max_retries})"
+                        )
+                        continue
+                    return self._fail(model, text, "API request timed out", loop.time() - start)
+                except aiohttp.ClientError as e:
+                    delay = self.base_delay * (attempt + 1)
+                    if attempt < self.max_retries - 1 and self._can_wait(loop, deadline, delay):
+                        logger.warning(f"API request failed, retrying in {delay} seconds: {str(e)}")
+                        await asyncio.sleep(delay)
+                        continue
+                    return self._fail(model, text, str(e), loop.time() - start)
+                except ValueError as e:
+                    # 200 responses with an HTML or otherwise non-JSON body
+                    return self._fail(
+                        model, text, f"Invalid JSON response: {str(e)}", loop.time() - start
+                    )
+
+                success, translation, error = self.service.response_handler.extract_translation(
+                    result, model_family
+                )
+                if success:
+                    self.service.response_handler.log_translation_attempt(
+                        True, model, text, translation, latency=loop.time() - start
+                    )
+                    return translation
+                return self._fail(
+                    model, text, f"Failed to extract translation: {error}", loop.time() - start
+                )
+
+        return None
+
+    async def translate_many(
+        self,
+        texts: List[str],
+        model: str,
+        deadline_seconds: Optional[float] = None,
+        profile: Optional[str] = None
+    ) -> List[Optional[str]]:
+        """
+        Translate texts concurrently, returning results in input order.
+        ``deadline_seconds`` bounds each request from the moment it gets a
+        concurrency slot. A request that raises yields None for its item.
+        """
+        results = await asyncio.gather(
+            *(self.translate(text, model, None, profile, deadline_seconds) for text in texts),
+            return_exceptions=True
+        )
+        return [
+            self._fail(model, text, f"Unexpected error: {str(result)}") if isinstance(result, BaseException) else result
+            for text, result in zip(texts, results)
+        ]
+
+    def _get_semaphore(self, model: str) -> asyncio.Semaphore:
+        """Get the concurrency limiter for a model."""
+        semaphore = self._semaphores.get(model)
+        if semaphore is None:
+            semaphore = self._semaphores[model] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    @staticmethod
+    def _can_wait(loop: asyncio.AbstractEventLoop, deadline: Optional[float], delay: float) -> bool:
+        """Check whether a backoff delay still fits before the deadline."""
+        return deadline is None or loop.time() + delay < deadline
+
+    def _fail(self, model: str, text: str, error: str, latency: Optional[float] = None) -> None:
+        """Log a failed attempt (``latency`` in seconds, when known) and return None."""
+        logger.error(error)
+        self.service.response_handler.log_translation_attempt(
+            False, model, text, None, error, latency=latency
+        )
+        return None
@@ -0,0 +1,213 @@
+"""
+Micro-batching scheduler for local translation models.
+Queues concurrent requests per model and flushes them as one batch when
+either the batch size cap or the maximum wait time is reached.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Runs one batch of texts through a model, returning results in input order.
+# Called as ``batch_fn(model, texts)``, or ``batch_fn(model, texts, profile)``
+# for requests submitted with a generation profile.
+BatchFunction = Callable[..., List[Optional[str]]]
+
+
+class _PendingRequest:
+    """A queued text waiting to be batched."""
+
+    __slots__ = ("text", "future", "enqueued_at")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.future: Future = Future()
+        self.enqueued_at = time.perf_counter()
+
+
+class _ModelQueue:
+    """Request queue, dispatcher thread and counters for a model and profile."""
+
+    def __init__(self, model: str, profile: Optional[str] = None):
+        self.model = model
+        self.profile = profile
+        self.pending: Deque[_PendingRequest] = deque()
+        self.condition = threading.Condition()
+        self.thread: Optional[threading.Thread] = None
+        self.batches = 0
+        self.requests = 0
+        self.max_batch_seen = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_batch_size = 0
+
+
+class MicroBatchScheduler:
+    """
+    Merges concurrent translation requests for the same model into batches.
+
+    Each model gets its own queue and dispatcher thread, one per generation
+    profile when requests name one. A batch is flushed
+    as soon as ``max_batch_size`` requests are waiting or the oldest request
+    has waited ``max_wait_ms``. Callers get a ``Future`` per request.
+    """
+
+    def __init__(
+        self,
+        batch_fn: BatchFunction,
+        max_batch_size: int = 16,
+        max_wait_ms: float = 10.0
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self._queues: Dict[Tuple[str, Optional[str]], _ModelQueue] = {}
+        self._lock = threading.Lock()
+        self._running = True
+
+    def submit(self, text: str, model: str, profile: Optional[str] = None) -> Future:
+        """Queue a text for translation with the given model and profile."""
+        if not self._running:
+            raise RuntimeError("MicroBatchScheduler has been shut down")
+
+        queue = self._get_queue(model, profile)
+        request = _PendingRequest(text)
+        with queue.condition:
+            queue.pending.append(request)
+            queue.condition.notify()
+        return request.future
+
+    def translate(
+        self,
+        text: str,
+        model: str,
+        timeout: Optional[float] = None,
+        profile: Optional[str] = None
+    ) -> Optional[str]:
+        """Queue a text and block until its batch has been translated."""
+        return self.submit(text, model, profile).result(timeout=timeout)
+
+    def queue_depth(self, model: Optional[str] = None) -> int:
+        """Number of requests waiting to be batched, for one model or all."""
+        with self._lock:
+            queues = [
+                queue for (queue_model, _), queue in self._queues.items()
+                if model is None or queue_model == model
+            ]
+        return sum(len(queue.pending) for queue in queues)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get queue depth, batch size and wait time figures per model.
+        Queues for a generation profile are reported as ``"<model> (<profile>)"``.
+        """
+        with self._lock:
+            queues = list(self._queues.values())
+
+        stats = {}
+        for queue in queues:
+            with queue.condition:
+                name = queue.model if queue.profile is None else f"{queue.model} ({queue.profile})"
+                stats[name] = {
+                    "model": queue.model,
+                    "profile": queue.profile,
+                    "queue_depth": len(queue.pending),
+                    "batches": queue.batches,
+                    "requests": queue.requests,
+                    "avg_batch_size": queue.requests / queue.batches if queue.batches else 0.0,
+                    "max_batch_size": queue.max_batch_seen,
+                    "last_batch_size": queue.last_batch_size,
+                    "avg_wait_ms": (queue.total_wait / queue.requests * 1000.0) if queue.requests else 0.0,
+                    "max_wait_ms": queue.max_wait * 1000.0
+                }
+        return stats
+
+    def shutdown(self, wait: bool = True):
+        """Stop accepting requests and let dispatchers drain their queues."""
+        self._running = False
+        with self._lock:
+            queues = list(self._queues.values())
+
+        for queue in queues:
+            with queue.condition:
+                queue.condition.notify_all()
+
+        if wait:
+            for queue in queues:
+                if queue.thread is not None:
+                    queue.thread.join()
+
+    def _get_queue(self, model: str, profile: Optional[str] = None) -> _ModelQueue:
+        """Get the queue for a model and profile, starting its dispatcher on first use."""
+        with self._lock:
+            queue = self._queues.get((model, profile))
+            if queue is None:
+                queue = _ModelQueue(model, profile)
+                queue.thread = threading.Thread(
+                    target=self._dispatch_loop,
+                    args=(queue,),
+                    name=f"batch-scheduler-{model}" + (f"-{profile}" if profile else ""),
+                    daemon=True
+                )
+                self._queues[(model, profile)] = queue
+                queue.thread.start()
+            return queue
+
+    def _dispatch_loop(self, queue: _ModelQueue):
+        """Collect requests into batches and run them until shut down."""
+        while True:
+            with queue.condition:
+                while not queue.pending and self._running:
+                    queue.condition.wait()
+                if not queue.pending:
+                    return
+
+                # Wait for the batch to fill up or the oldest request to expire
+                deadline = queue.pending[0].enqueued_at + self.max_wait
+                while len(queue.pending) < self.max_batch_size and self._running:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    queue.condition.wait(remaining)
+
+                size = min(self.max_batch_size, len(queue.pending))
+                batch = [queue.pending.popleft() for _ in range(size)]
+
+                flushed_at = time.perf_counter()
+                for request in batch:
+                    waited = flushed_at - request.enqueued_at
+                    queue.total_wait += waited
+                    queue.max_wait = max(queue.max_wait, waited)
+                queue.batches += 1
+                queue.requests += size
+                queue.last_batch_size = size
+                queue.max_batch_seen = max(queue.max_batch_seen, size)
+
+            self._run_batch(queue.model, batch, queue.profile)
+
+    def _run_batch(self, model: str, batch: List[_PendingRequest], profile: Optional[str] = None):
+        """Run one batch and hand each result to its future."""
+        logger.debug(f"Flushing batch of {len(batch)} requests for model {model}")
+        try:
+            texts = [request.text for request in batch]
+            if profile is None:
+                results = self.batch_fn(model, texts)
+            else:
+                results = self.batch_fn(model, texts, profile)
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch function returned {len(results)} results for {len(batch)} inputs"
+                )
+        except Exception as e:
+            logger.error(f"Batch translation failed for model {model}: {str(e)}")
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        for request, result in zip(batch, results):
+            request.future.set_result(result)
@@ -0,0 +1,393 @@
+"""
+Offline performance benchmarks for the TranslationService hot path.
+Builds tiny random Marian and NLLB models in a scratch workspace, points
+the Inference API at a local stub server and measures start-up time,
+single-request latency percentiles, batch throughput, cache hits and the
+API path. Results are written as JSON; given a baseline from an earlier
+commit, metrics that regressed by more than the threshold fail the run.
+
+Usage:
+    python -m core.translation.benchmark --output reports/benchmark.json
+    python -m core.translation.benchmark --baseline reports/benchmark_baseline.json \\
+        --threshold 0.25 --output reports/benchmark.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import yaml
+
+from core.utils.latency import latency_summary
+
+from .benchmark_fixtures import BENCHMARK_SENTENCES, StubInferenceAPI, build_tiny_model
+from .evaluation import timed_map
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Models served locally from the workspace model_cache, and one only reachable via the API
+LOCAL_MODELS = {"bench/tiny-marian": "marian", "bench/tiny-nllb": "nllb"}
+PINNED_MODEL = "bench/tiny-marian"
+API_MODEL = "bench/stub-marian"
+
+# Metric name suffixes that say which direction is an improvement
+_HIGHER_IS_BETTER = ("_per_second", "hit_rate")
+_LOWER_IS_BETTER = ("_ms", "_seconds")
+
+
+def workspace_config(base_config: Dict[str, Any], api_url: str) -> Dict[str, Any]:
+    """The repository model config, adapted to the benchmark models and stub API."""
+    config = json.loads(json.dumps(base_config))
+    config["translation_models"] = {
+        name: {
+            "direction": "bidirectional",
+            "lang_codes": {"source": "dar", "target": "en"},
+            "model_type": model_type,
+            "quantization": "none",
+            "backend": "pytorch"
+        }
+        for name, model_type in {**LOCAL_MODELS, API_MODEL: "marian"}.items()
+    }
+    config["inference_api"] = {"models_url": f"{api_url}/models/", "status_url": f"{api_url}/status/"}
+    config.setdefault("model_validation", {})["background_refresh"] = False
+    config.setdefault("result_cache", {})["disk_path"] = "cache/translation_cache.sqlite3"
+    config.setdefault("model_pool", {})["pinned"] = [PINNED_MODEL]
+    config.setdefault("warmup", {}).update({"enabled": True, "background": True})
+    for section in ("hedging", "status_server", "translation_memory", "worker_pool"):
+        config.setdefault(section, {})["enabled"] = False
+    return config
+
+
+def prepare_workspace(workspace: Path, api_url: str) -> Path:
+    """Write the config and tiny model cache the benchmarked services run from."""
+    workspace = Path(workspace)
+    with open(PROJECT_ROOT / "config" / "model_config.yaml") as f:
+        base_config = yaml.safe_load(f)
+    (workspace / "config").mkdir(parents=True, exist_ok=True)
+    with open(workspace / "config" / "model_config.yaml", "w") as f:
+        yaml.safe_dump(workspace_config(base_config, api_url), f, sort_keys=False)
+    for seed, (name, model_type) in enumerate(LOCAL_MODELS.items()):
+        model_dir = workspace / "model_cache" / name.replace("/", "_")
+        if not (model_dir / "config.json").exists():
+            build_tiny_model(model_dir, model_type, seed=seed)
+    return workspace
+
+
+@contextmanager
+def service_environment(workspace: Path, environment: str) -> Iterator[None]:
+    """Run with the workspace as working directory and the environment forced."""
+    from core.utils.environment import reset_environment
+
+    previous_cwd = os.getcwd()
+    previous_env = {name: os.environ.get(name) for name in ("DEPLOYMENT_ENV", "ENVIRONMENT_HINT_FILE")}
+    os.chdir(workspace)
+    os.environ["DEPLOYMENT_ENV"] = environment
+    os.environ["ENVIRONMENT_HINT_FILE"] = ""
+    reset_environment()
+    try:
+        yield
+    finally:
+        os.chdir(previous_cwd)
+        for name, value in previous_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        reset_environment()
+
+
+def bench_startup(workspace: Path) -> Dict[str, Any]:
+    """Cold start in a fresh interpreter: import, init, warm-up and first requests."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(PROJECT_ROOT), os.environ.get("PYTHONPATH")])))
+    completed = subprocess.run(
+        [sys.executable, "-m", "core.translation.benchmark", "--startup-probe", str(workspace)],
+        cwd=str(workspace), env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _startup_probe(workspace: Path):
+    """Entry point of the start-up subprocess; prints its timings as JSON."""
+    start = time.perf_counter()
+    with service_environment(workspace, "ec2"):
+        from .translation_service import TranslationService
+        imported = time.perf_counter()
+        service = TranslationService()
+        initialised = time.perf_counter()
+        if service.warmup is not None:
+            service.warmup.wait_until_ready()
+        ready = time.perf_counter()
+        warm = _time_call(lambda: service.translate("salam", "Darija", "English", PINNED_MODEL, "interactive"))
+        cold = _time_call(lambda: service.translate("salam", "Darija", "English", "bench/tiny-nllb", "interactive"))
+    print(json.dumps({
+        "import_seconds": imported - start,
+        "init_seconds": initialised - imported,
+        "ready_seconds": ready - start,
+        "first_warm_request_ms": warm * 1000.0,
+        "first_cold_model_request_ms": cold * 1000.0
+    }))
+
+
+def _time_call(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def bench_local(service: Any, model: str, sentences: Sequence[str], requests: int) -> Dict[str, Any]:
+    """Latency of single uncached requests and throughput of translate_batch."""
+    cache, service.result_cache = service.result_cache, None
+    try:
+        inputs = [sentences[i % len(sentences)] for i in range(requests)]
+        outputs, latencies = timed_map(
+            lambda text: service.translate(text, "Darija", "English", model, "interactive"), inputs
+        )
+        batch_seconds = _time_call(
+            lambda: service.translate_batch(inputs, "Darija", "English", model, "interactive")
+        )
+    finally:
+        service.result_cache = cache
+    return {
+        "latency": {
+            **latency_summary(latencies),
+            "requests_per_second": len(latencies) / sum(latencies) if sum(latencies) else 0.0,
+            "failures": sum(output is None for output in outputs)
+        },
+        "batch": {
+            "sentences": len(inputs),
+            "total_seconds": batch_seconds,
+            "sentences_per_second": len(inputs) / batch_seconds if batch_seconds else 0.0
+        }
+    }
+
+
+def bench_cache_hits(service: Any, model: str, requests: int) -> Dict[str, Any]:
+    """Latency of repeated requests answered by the result cache."""
+    if service.result_cache is None:
+        return {}
+    text = BENCHMARK_SENTENCES[4]
+    service.translate(text, "Darija", "English", model, "interactive")
+    before = service.result_cache.get_stats()
+    _, latencies = timed_map(
+        lambda item: service.translate(item, "Darija", "English", model, "interactive"), [text] * requests
+    )
+    after = service.result_cache.get_stats()
+    hits = (after["memory_hits"] + after["disk_hits"]) - (before["memory_hits"] + before["disk_hits"])
+    return {**latency_summary(latencies), "hit_rate": hits / requests if requests else 0.0}
+
+
+def bench_api(service: Any, sentences: Sequence[str], requests: int, concurrency: int) -> Dict[str, Any]:
+    """Latency of sequential API requests and throughput of translate_many."""
+    cache, service.result_cache = service.result_cache, None
+    try:
+        inputs = [f"{sentences[i % len(sentences)]} #{i}" for i in range(requests)]
+        outputs, latencies = timed_map(
+            lambda text: service.translate(text, "Darija", "English", API_MODEL, "interactive"), inputs
+        )
+        many_seconds = _time_call(lambda: asyncio.run(service.translate_many(
+            inputs, "Darija", "English", API_MODEL, max_concurrency=concurrency, profile="interactive"
+        )))
+    finally:
+        service.result_cache = cache
+    return {
+        "latency": {**latency_summary(latencies), "failures": sum(output is None for output in outputs)},
+        "concurrent": {
+            "requests": len(inputs),
+            "concurrency": concurrency,
+            "requests_per_second": len(inputs) / many_seconds if many_seconds else 0.0
+        }
+    }
+
+
+def run_benchmarks(
+    workspace: Path,
+    requests: int = 30,
+    api_delay: float = 0.005,
+    concurrency: int = 8,
+    include_startup: bool = True
+) -> Dict[str, Any]:
+    """Run every benchmark against services built from ``workspace``."""
+    from .translation_service import TranslationService
+
+    results: Dict[str, Any] = {}
+    with StubInferenceAPI(delay_seconds=api_delay) as stub:
+        prepare_workspace(workspace, stub.url)
+        if include_startup:
+            logger.info("Measuring cold start-up")
+            results["startup"] = bench_startup(workspace)
+
+        with service_environment(workspace, "ec2"):
+            service = TranslationService()
+            if service.warmup is not None:
+                service.warmup.wait_until_ready()
+            results["local"] = {}
+            for model in LOCAL_MODELS:
+                logger.info(f"Measuring local inference with {model}")
+                results["local"][model] = bench_local(service, model, BENCHMARK_SENTENCES, requests)
+            logger.info("Measuring result cache hits")
+            results["cache"] = bench_cache_hits(service, PINNED_MODEL, requests * 10)
+
+        with service_environment(workspace, "local"):
+            logger.info("Measuring the Inference API path against the stub server")
+            service = TranslationService()
+            results["api"] = bench_api(service, BENCHMARK_SENTENCES, requests, concurrency)
+            results["api"]["stub_requests"] = stub.requests
+    return results
+
+
+def flatten(results: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    """Dotted metric names mapped to their numeric values."""
+    flat: Dict[str, float] = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = float(value)
+    return flat
+
+
+def metric_direction(name: str) -> Optional[str]:
+    """"higher" or "lower" for metrics with a better direction, else None."""
+    if name.endswith(_HIGHER_IS_BETTER):
+        return "higher"
+    if name.endswith(_LOWER_IS_BETTER):
+        return "lower"
+    return None
+
+
+def compare_results(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = 0.25,
+    thresholds: Optional[Dict[str, float]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Metrics that got worse than ``baseline`` by more than the relative
+    threshold; ``thresholds`` overrides it per dotted metric name.
+    """
+    thresholds = thresholds or {}
+    current_flat = flatten(current)
+    regressions = []
+    for name, before in flatten(baseline).items():
+        direction = metric_direction(name)
+        after = current_flat.get(name)
+        if direction is None or after is None or before == 0:
+            continue
+        change = (after - before) / abs(before)
+        limit = thresholds.get(name, threshold)
+        if (direction == "lower" and change > limit) or (direction == "higher" and change < -limit):
+            regressions.append({
+                "metric": name,
+                "baseline": before,
+                "current": after,
+                "change": change,
+                "threshold": limit
+            })
+    return regressions
+
+
+def _metadata() -> Dict[str, Any]:
+    import torch
+    import transformers
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=str(PROJECT_ROOT),
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "torch": torch.__version__,
+        "transformers": transformers.__version__
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="reports/benchmark.json")
+    parser.add_argument("--baseline", help="Earlier benchmark JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression")
+    parser.add_argument("--thresholds", help="JSON file of per-metric thresholds")
+    parser.add_argument("--requests", type=int, default=30, help="Requests per latency benchmark")
+    parser.add_argument("--api-delay-ms", type=float, default=5.0, help="Stub API response delay")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--skip-startup", action="store_true")
+    parser.add_argument("--workspace", help="Keep the models and logs in this directory")
+    parser.add_argument("--startup-probe", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.startup_probe:
+        logging.basicConfig(level=logging.INFO, handlers=[logging.FileHandler("startup_probe.log")])
+        _startup_probe(Path(args.startup_probe).resolve())
+        return 0
+
+    output = Path(args.output).resolve()
+    baseline = Path(args.baseline).resolve() if args.baseline else None
+    with tempfile.TemporaryDirectory(prefix="translation-benchmark-") as scratch:
+        workspace = Path(args.workspace or scratch).resolve()
+        workspace.mkdir(parents=True, exist_ok=True)
+        # Service logs go to a file, as in production; progress to the console
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            handlers=[logging.FileHandler(workspace / "benchmark.log")]
+        )
+        logger.addHandler(logging.StreamHandler())
+
+        results = run_benchmarks(
+            workspace,
+            requests=args.requests,
+            api_delay=args.api_delay_ms / 1000.0,
+            concurrency=args.concurrency,
+            include_startup=not args.skip_startup
+        )
+
+    report: Dict[str, Any] = {
+        "meta": _metadata(),
+        "settings": {
+            "requests": args.requests,
+            "api_delay_ms": args.api_delay_ms,
+            "concurrency": args.concurrency
+        },
+        "results": results
+    }
+    if baseline is not None:
+        thresholds = json.loads(Path(args.thresholds).read_text()) if args.thresholds else None
+        previous = json.loads(baseline.read_text())
+        report["baseline"] = {"path": str(baseline), "commit": previous.get("meta", {}).get("commit")}
+        report["regressions"] = compare_results(results, previous["results"], args.threshold, thresholds)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    logger.info(f"Report written to {output}")
+
+    for regression in report.get("regressions", []):
+        logger.error(
+            f"Regression in {regression['metric']}: {regression['baseline']:.3f} -> "
+            f"{regression['current']:.3f} ({regression['change']:+.0%}, limit {regression['threshold']:.0%})"
+        )
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+Offline fixtures for the translation benchmarks.
+Tiny randomly initialised Marian and NLLB (M2M100) models with a word-level
+tokenizer, saved in the ``model_cache`` layout the service loads from, and
+a local stand-in for the HuggingFace Inference API.
+"""
+
+import json
+import logging
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Short to long inputs in both directions
+BENCHMARK_SENTENCES = (
+    "salam",
+    "labas 3lik?",
+    "Good morning",
+    "fin ghadi?",
+    "Where is the train station?",
+    "ana mabghitch nmchi l khedma lyoum",
+    "Can you help me find a cheap hotel near the medina?",
+    "wach kayn chi pharmacie qriba mn hna?",
+    "I would like two coffees and a bottle of water, please.",
+    "lbare7 mchina l be7r m3a l3a2ila w klina l7out f marsa",
+    "The meeting has been moved to Thursday afternoon because the manager is travelling.",
+    "ila bghiti tji m3ana l fes nhar sebt, goul lia daba bach n7jez lik blasa f tran",
+    "We spent the whole weekend in the mountains, walking between small villages and "
+    "drinking mint tea with the families who live there.",
+    "had l3am l9raya kanet s3iba bzaf 7it kano bzaf dyal l imti7anat w ma kanch 3andi "
+    "lwe9t bach nraje3 mzyan, walakin l7amdoullah nje7t",
+)
+
+# Special tokens: Marian uses <pad>=0, </s>=1, <unk>=2; NLLB uses <s>=0, <pad>=1, </s>=2, <unk>=3
+_SPECIAL_TOKENS = {
+    "marian": ["<pad>", "</s>", "<unk>"],
+    "nllb": ["<s>", "<pad>", "</s>", "<unk>"]
+}
+
+MODEL_TYPES = tuple(_SPECIAL_TOKENS)
+
+
+def _words(sentences: Sequence[str]) -> List[str]:
+    vocab: Dict[str, None] = {}
+    for sentence in sentences:
+        for word in re.findall(r"\w+|[^\w\s]", sentence.lower()):
+            vocab.setdefault(word, None)
+    return list(vocab)
+
+
+def build_word_tokenizer(model_type: str, sentences: Sequence[str] = BENCHMARK_SENTENCES) -> Any:
+    """Word-level fast tokenizer over the words of ``sentences``."""
+    from tokenizers import Tokenizer, normalizers, pre_tokenizers, processors
+    from tokenizers.models import WordLevel
+    from transformers import PreTrainedTokenizerFast
+
+    specials = _SPECIAL_TOKENS[model_type]
+    vocab = {token: index for index, token in enumerate(specials + _words(sentences))}
+    tokenizer = Tokenizer(WordLevel(vocab, unk_token="<unk>"))
+    tokenizer.normalizer = normalizers.Lowercase()
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="$A </s>", special_tokens=[("</s>", vocab["</s>"])]
+    )
+    return PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer,
+        pad_token="<pad>",
+        eos_token="</s>",
+        unk_token="<unk>",
+        bos_token="<s>" if "<s>" in vocab else None
+    )
+
+
+def build_tiny_model(
+    model_dir: Path,
+    model_type: str,
+    d_model: int = 64,
+    layers: int = 2,
+    seed: int = 0,
+    sentences: Sequence[str] = BENCHMARK_SENTENCES
+) -> Path:
+    """Save a random ``marian`` or ``nllb`` model and its tokenizer under ``model_dir``."""
+    import torch
+    from transformers import M2M100Config, M2M100ForConditionalGeneration, MarianConfig, MarianMTModel
+
+    tokenizer = build_word_tokenizer(model_type, sentences)
+    size = dict(
+        vocab_size=len(tokenizer), d_model=d_model,
+        encoder_layers=layers, decoder_layers=layers,
+        encoder_attention_heads=4, decoder_attention_heads=4,
+        encoder_ffn_dim=d_model * 4, decoder_ffn_dim=d_model * 4,
+        max_position_embeddings=512
+    )
+    torch.manual_seed(seed)
+    if model_type == "marian":
+        config = MarianConfig(**size, pad_token_id=0, eos_token_id=1, decoder_start_token_id=0, forced_eos_token_id=1)
+        model = MarianMTModel(config)
+    elif model_type == "nllb":
+        config = M2M100Config(**size, bos_token_id=0, pad_token_id=1, eos_token_id=2, decoder_start_token_id=2)
+        model = M2M100ForConditionalGeneration(config)
+    else:
+        raise ValueError(f"Unknown model type: {model_type}")
+
+    # Random weights would stop at an arbitrary step; never emitting </s> makes
+    # every request decode up to the profile's length limit, a stable workload
+    with torch.no_grad():
+        eos = config.eos_token_id
+        if hasattr(model, "final_logits_bias"):
+            model.final_logits_bias[..., eos] = -1e4
+        else:
+            model.get_output_embeddings().weight[eos].zero_()
+
+    model_dir = Path(model_dir)
+    model.eval().save_pretrained(str(model_dir))
+    tokenizer.save_pretrained(str(model_dir))
+    return model_dir
+
+
+class StubInferenceAPI:
+    """
+    Local HTTP server answering like the HuggingFace Inference API.
+
+    ``POST /models/<name>`` returns ``[{"translation_text": ...}]`` (or
+    ``generated_text`` for NLLB/Seamless names) after ``delay_seconds``;
+    ``GET /status/<name>`` reports every model as loaded.
+    """
+
+    def __init__(self, delay_seconds: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.delay_seconds = delay_seconds
+        self.requests = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                if self.path.startswith("/status/"):
+                    self._send(200, {"loaded": True, "state": "Loaded"})
+                else:
+                    self._send(404, {"error": "not found"})
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                payload = json.loads(self.rfile.read(length) or b"{}")
+                if not self.path.startswith("/models/"):
+                    self._send(404, {"error": "not found"})
+                    return
+                with stub._lock:
+                    stub.requests += 1
+                if stub.delay_seconds:
+                    time.sleep(stub.delay_seconds)
+                model = self.path[len("/models/"):].lower()
+                key = "generated_text" if ("nllb" in model or "seamless" in model) else "translation_text"
+                self._send(200, [{key: f"[{model}] {payload.get('inputs', '')}"}])
+
+            def _send(self, status: int, body: Any):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubInferenceAPI":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-inference-api", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubInferenceAPI":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
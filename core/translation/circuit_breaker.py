@@ -0,0 +1,219 @@
+"""
+Per-model circuit breakers and health scores.
+Every logged translation attempt feeds the breaker of its model. A breaker
+opens when the recent error rate or slow-call rate crosses its threshold,
+so requests skip the model instead of waiting on its timeouts; after a
+cool-down one probe request is let through (half-open) and its outcome
+closes or re-opens the breaker. Health scores rank fallback chains.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from core.utils.latency import percentile
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Breaker for one model over its last ``window`` attempts.
+
+    Opens once at least ``min_requests`` attempts were seen and either the
+    failure rate reaches ``failure_threshold`` or the share of calls slower
+    than ``slow_call_seconds`` reaches ``slow_call_threshold``. Each re-open
+    from half-open doubles the cool-down, up to ``max_open_seconds``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        slow_call_seconds: float = 20.0,
+        slow_call_threshold: float = 0.8,
+        min_requests: int = 5,
+        window: int = 20,
+        open_seconds: float = 30.0,
+        max_open_seconds: float = 600.0
+    ):
+        self.failure_threshold = failure_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_threshold = slow_call_threshold
+        self.min_requests = min_requests
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max_open_seconds
+        self.state = CLOSED
+        self.trips = 0
+        self.rejected = 0
+        self._outcomes: Deque[Tuple[bool, Optional[float]]] = deque(maxlen=window)
+        self._cool_down = open_seconds
+        self._opened_at = 0.0
+        self._probe_at: Optional[float] = None
+
+    def allow(self, now: float) -> bool:
+        """Whether a request may be sent; moves an expired open breaker to half-open."""
+        if self.state == OPEN and now - self._opened_at >= self._cool_down:
+            self.state = HALF_OPEN
+            self._probe_at = None
+        if self.state == HALF_OPEN:
+            # One probe at a time; a probe that never reports back is replaced
+            if self._probe_at is None or now - self._probe_at >= self._cool_down:
+                self._probe_at = now
+                return True
+        if self.state == CLOSED:
+            return True
+        self.rejected += 1
+        return False
+
+    def record(self, success: bool, latency: Optional[float], now: float) -> Optional[str]:
+        """Record an attempt; returns the new state if it changed."""
+        if self.state == HALF_OPEN:
+            if success:
+                self._outcomes.clear()
+                self._cool_down = self.open_seconds
+                self.state = CLOSED
+            else:
+                self._cool_down = min(self._cool_down * 2, self.max_open_seconds)
+                self._open(now)
+            return self.state
+
+        self._outcomes.append((success, latency))
+        if self.state == CLOSED and self._should_trip():
+            self._open(now)
+            return self.state
+        return None
+
+    def error_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for success, _ in self._outcomes if not success) / len(self._outcomes)
+
+    def latencies(self) -> List[float]:
+        return [latency for success, latency in self._outcomes if success and latency is not None]
+
+    def _should_trip(self) -> bool:
+        if len(self._outcomes) < self.min_requests:
+            return False
+        if self.error_rate() >= self.failure_threshold:
+            return True
+        timed = [latency for _, latency in self._outcomes if latency is not None]
+        if len(timed) < self.min_requests:
+            return False
+        slow = sum(1 for latency in timed if latency >= self.slow_call_seconds)
+        return slow / len(timed) >= self.slow_call_threshold
+
+    def _open(self, now: float):
+        self.state = OPEN
+        self.trips += 1
+        self._opened_at = now
+        self._probe_at = None
+
+    def retry_in(self, now: float) -> float:
+        """Seconds until an open breaker lets a probe through."""
+        if self.state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self._cool_down - now)
+
+
+class ModelHealthMonitor:
+    """
+    Circuit breakers and health scores for every model that has been tried.
+
+    The health score is 0 for an open breaker and otherwise the success rate
+    scaled down when the median latency exceeds ``latency_target_seconds``;
+    half-open models are halved. Models without history score 1.
+    """
+
+    def __init__(self, latency_target_seconds: float = 5.0, **breaker_options: Any):
+        self.latency_target_seconds = latency_target_seconds
+        self._breaker_options = breaker_options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ModelHealthMonitor":
+        """Create a monitor from the ``circuit_breakers`` section of the model config."""
+        return cls(
+            latency_target_seconds=config.get("latency_target_seconds", 5.0),
+            failure_threshold=config.get("failure_threshold", 0.5),
+            slow_call_seconds=config.get("slow_call_seconds", 20.0),
+            slow_call_threshold=config.get("slow_call_threshold", 0.8),
+            min_requests=config.get("min_requests", 5),
+            window=config.get("window", 20),
+            open_seconds=config.get("open_seconds", 30.0),
+            max_open_seconds=config.get("max_open_seconds", 600.0)
+        )
+
+    def allow(self, model: str) -> bool:
+        """Whether ``model`` may be tried now."""
+        with self._lock:
+            return self._breaker(model).allow(time.monotonic())
+
+    def record(self, model: str, success: bool, latency: Optional[float] = None):
+        """Feed the outcome of one translation attempt into the model's breaker."""
+        with self._lock:
+            changed = self._breaker(model).record(success, latency, time.monotonic())
+        if changed == OPEN:
+            logger.warning(f"Circuit breaker opened for model: {model}")
+        elif changed == CLOSED:
+            logger.info(f"Circuit breaker closed for model: {model}")
+
+    def state(self, model: str) -> str:
+        with self._lock:
+            breaker = self._breakers.get(model)
+            return breaker.state if breaker is not None else CLOSED
+
+    def score(self, model: str) -> float:
+        with self._lock:
+            breaker = self._breakers.get(model)
+            if breaker is None:
+                return 1.0
+            return self._score(breaker)
+
+    def rank(self, models: List[str]) -> List[str]:
+        """Order models by health score, keeping the configured order on ties."""
+        scores = {model: self.score(model) for model in models}
+        return sorted(models, key=lambda model: -scores[model])
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get breaker state, error rate, latency and health score per model."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                model: {
+                    "state": breaker.state,
+                    "health_score": self._score(breaker),
+                    "error_rate": breaker.error_rate(),
+                    "p50_ms": percentile(breaker.latencies(), 0.50) * 1000.0,
+                    "p95_ms": percentile(breaker.latencies(), 0.95) * 1000.0,
+                    "trips": breaker.trips,
+                    "rejected": breaker.rejected,
+                    "retry_in_seconds": breaker.retry_in(now)
+                }
+                for model, breaker in self._breakers.items()
+            }
+
+    def _breaker(self, model: str) -> CircuitBreaker:
+        breaker = self._breakers.get(model)
+        if breaker is None:
+            breaker = self._breakers[model] = CircuitBreaker(**self._breaker_options)
+        return breaker
+
+    def _score(self, breaker: CircuitBreaker) -> float:
+        if breaker.state == OPEN:
+            return 0.0
+        score = 1.0 - breaker.error_rate()
+        latencies = breaker.latencies()
+        if latencies:
+            median = percentile(latencies, 0.50)
+            if median > self.latency_target_seconds:
+                score *= self.latency_target_seconds / median
+        if breaker.state == HALF_OPEN:
+            score *= 0.5
+        return score
@@ -0,0 +1,74 @@
+"""
+Lightweight quality measures and timing helpers for comparing inference
+backends.
+"""
+
+import math
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+
+def _ngrams(tokens: List[str], n: int) -> Counter:
+    return Counter(tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+
+def corpus_bleu(hypotheses: Sequence[str], references: Sequence[str], max_n: int = 4) -> float:
+    """
+    Corpus-level BLEU (0-100) with a single reference per sentence.
+    Lowercased whitespace tokens; zero higher-order n-gram matches are
+    smoothed so short corpora do not collapse to 0.
+    """
+    matches = [0] * max_n
+    totals = [0] * max_n
+    hyp_length = 0
+    ref_length = 0
+    for hypothesis, reference in zip(hypotheses, references):
+        hyp_tokens = (hypothesis or "").lower().split()
+        ref_tokens = (reference or "").lower().split()
+        hyp_length += len(hyp_tokens)
+        ref_length += len(ref_tokens)
+        for n in range(1, max_n + 1):
+            hyp_ngrams = _ngrams(hyp_tokens, n)
+            ref_ngrams = _ngrams(ref_tokens, n)
+            matches[n - 1] += sum(min(count, ref_ngrams[gram]) for gram, count in hyp_ngrams.items())
+            totals[n - 1] += max(0, len(hyp_tokens) - n + 1)
+
+    if hyp_length == 0 or matches[0] == 0:
+        return 0.0
+    log_precision = 0.0
+    smoothing = 1.0
+    for n in range(max_n):
+        if totals[n] == 0:
+            return 0.0
+        if matches[n] == 0:
+            smoothing *= 2
+            log_precision += math.log(1.0 / (smoothing * totals[n]))
+        else:
+            log_precision += math.log(matches[n] / totals[n])
+    brevity_penalty = 1.0 if hyp_length > ref_length else math.exp(1 - ref_length / hyp_length)
+    return 100.0 * brevity_penalty * math.exp(log_precision / max_n)
+
+
+def timed_map(fn: Callable[[str], Any], inputs: Sequence[str]) -> Tuple[List[Any], List[float]]:
+    """Apply ``fn`` to each input, returning outputs and per-call latencies."""
+    outputs = []
+    latencies = []
+    for item in inputs:
+        start = time.perf_counter()
+        outputs.append(fn(item))
+        latencies.append(time.perf_counter() - start)
+    return outputs, latencies
+
+
+def make_translator(model: Any, tokenizer: Any, generation_kwargs: Dict[str, Any]) -> Callable[[str], str]:
+    """Build a single-sentence translate function for a model and tokenizer."""
+    import torch
+
+    def translate(text: str) -> str:
+        inputs = tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
+        with torch.no_grad():
+            outputs = model.generate(**inputs, **generation_kwargs)
+        return tokenizer.batch_decode(outputs, skip_special_tokens=True)[0].strip()
+
+    return translate
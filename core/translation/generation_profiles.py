@@ -0,0 +1,172 @@
+"""
+Named generation profiles for local and API translation.
+Each profile is a set of ``generate`` parameters; callers pick one per
+request or leave the choice to a policy based on input length and how many
+requests are already in flight.
+"""
+
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Optional, Sequence
+
+from core.utils.latency import latency_summary
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+QUALITY = "quality"
+BULK = "bulk"
+AUTO = "auto"
+
+# Used when model_config.yaml has no generation_profiles section; quality
+# matches the beam search settings translation always used before
+DEFAULT_PROFILES: Dict[str, Dict[str, Any]] = {
+    INTERACTIVE: {
+        "max_length": 128,
+        "num_beams": 1
+    },
+    QUALITY: {
+        "max_length": 512,
+        "num_beams": 4,
+        "length_penalty": 0.6,
+        "early_stopping": True
+    },
+    BULK: {
+        "max_new_tokens": 256,
+        "num_beams": 2,
+        "early_stopping": True
+    }
+}
+
+
+class _ProfileStats:
+    """Latency and output length counters for one profile."""
+
+    def __init__(self, max_samples: int):
+        self.calls = 0
+        self.items = 0
+        self.failures = 0
+        self.output_chars = 0
+        self.output_words = 0
+        self.latencies: Deque[float] = deque(maxlen=max_samples)
+
+
+class GenerationProfiles:
+    """
+    Registry of generation profiles with an automatic selection policy.
+
+    ``select`` resolves a requested profile name; ``auto`` (or no name)
+    picks ``bulk`` once ``bulk_queue_depth`` requests are in flight,
+    ``interactive`` for inputs of at most ``interactive_max_words`` words
+    and ``quality`` otherwise.
+    """
+
+    def __init__(
+        self,
+        profiles: Optional[Dict[str, Dict[str, Any]]] = None,
+        default: str = AUTO,
+        interactive_max_words: int = 12,
+        bulk_queue_depth: int = 8,
+        max_samples: int = 1000
+    ):
+        self.profiles = dict(profiles or DEFAULT_PROFILES)
+        if QUALITY not in self.profiles:
+            raise ValueError("Generation profiles must define a 'quality' profile")
+        if default != AUTO and default not in self.profiles:
+            raise ValueError(f"Unknown default generation profile: {default}")
+        self.default = default
+        self.interactive_max_words = interactive_max_words
+        self.bulk_queue_depth = bulk_queue_depth
+        self._max_samples = max_samples
+        self._stats: Dict[str, _ProfileStats] = {}
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "GenerationProfiles":
+        """Build the registry from the ``generation_profiles`` config section."""
+        auto = config.get("auto", {})
+        return cls(
+            profiles=config.get("profiles"),
+            default=config.get("default", AUTO),
+            interactive_max_words=auto.get("interactive_max_words", 12),
+            bulk_queue_depth=auto.get("bulk_queue_depth", 8)
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Number of translation calls currently running."""
+        return self._in_flight
+
+    def params(self, name: Optional[str] = None) -> Dict[str, Any]:
+        """Generation parameters of a profile (``quality`` when not given)."""
+        return dict(self.profiles[name or QUALITY])
+
+    def select(self, requested: Optional[str], text: str, pending: int = 1) -> str:
+        """
+        Resolve the profile for a request.
+
+        ``pending`` is the number of texts the caller is about to submit;
+        it is added to the requests already in flight when judging load.
+        """
+        name = requested or self.default
+        if name != AUTO:
+            if name not in self.profiles:
+                raise ValueError(f"Unknown generation profile: {name}")
+            return name
+
+        if BULK in self.profiles and self._in_flight + pending > self.bulk_queue_depth:
+            return BULK
+        if INTERACTIVE in self.profiles and len(text.split()) <= self.interactive_max_words:
+            return INTERACTIVE
+        return QUALITY
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Count a translation call as in flight for the duration of the block."""
+        with self._lock:
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def record(self, name: str, seconds: float, outputs: Sequence[Optional[str]]):
+        """Record one call's latency and the length of each output it produced."""
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = _ProfileStats(self._max_samples)
+            stats.calls += 1
+            stats.latencies.append(seconds)
+            for output in outputs:
+                if output is None:
+                    stats.failures += 1
+                    continue
+                stats.items += 1
+                stats.output_chars += len(output)
+                stats.output_words += len(output.split())
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get call counts, latency percentiles and output lengths per profile."""
+        with self._lock:
+            snapshot = {
+                name: (stats.calls, stats.items, stats.failures, stats.output_chars,
+                       stats.output_words, list(stats.latencies))
+                for name, stats in self._stats.items()
+            }
+
+        result = {}
+        for name, (calls, items, failures, chars, words, latencies) in snapshot.items():
+            result[name] = {
+                "calls": calls,
+                "translations": items,
+                "failures": failures,
+                "avg_output_chars": chars / items if items else 0.0,
+                "avg_output_words": words / items if items else 0.0,
+                **latency_summary(latencies)
+            }
+        return result
@@ -0,0 +1,214 @@
+"""
+Hedged requests across a model fallback chain.
+The primary model gets a head start equal to a percentile of its recent
+latency; if it has not answered by then the next fallback is launched in
+parallel and whichever answers first wins. Losing attempts are told to
+stop through a cancel event.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+from core.utils.latency import percentile
+
+logger = logging.getLogger(__name__)
+
+# Runs one attempt with a model; should give up early once the event is set
+Attempt = Callable[[str, threading.Event], Optional[str]]
+
+
+class _ModelHedgeStats:
+    def __init__(self, window: int):
+        self.attempts = 0
+        self.wins = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failures = 0
+        self.cancelled = 0
+        self.latencies: Deque[float] = deque(maxlen=window)
+
+
+class RequestHedger:
+    """
+    Runs an attempt against the first candidate model and hedges with the next.
+
+    The hedge delay for a model is the ``hedge_percentile`` of its last
+    ``window`` successful latencies, or ``default_delay`` until
+    ``min_samples`` have been seen. At most ``max_hedges`` extra attempts
+    run per request; a failed attempt is replaced by the next candidate
+    straight away, as the plain fallback chain would.
+    """
+
+    def __init__(
+        self,
+        hedge_percentile: float = 0.95,
+        default_delay: float = 2.0,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        max_hedges: int = 1,
+        window: int = 200,
+        max_workers: int = 16
+    ):
+        self.hedge_percentile = hedge_percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_hedges = max_hedges
+        self.window = window
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedged-request")
+        self._models: Dict[str, _ModelHedgeStats] = {}
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "hedged_requests": 0, "extra_attempts": 0, "wasted_seconds": 0.0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RequestHedger":
+        """Create a hedger from the ``hedging`` section of the model config."""
+        return cls(
+            hedge_percentile=config.get("percentile", 95) / 100.0,
+            default_delay=config.get("default_delay_seconds", 2.0),
+            min_delay=config.get("min_delay_seconds", 0.05),
+            min_samples=config.get("min_samples", 20),
+            max_hedges=config.get("max_hedges", 1),
+            window=config.get("window", 200),
+            max_workers=config.get("max_workers", 16)
+        )
+
+    def hedge_delay(self, model: str) -> float:
+        """How long ``model`` may run before a hedge is launched."""
+        with self._lock:
+            stats = self._models.get(model)
+            latencies = list(stats.latencies) if stats is not None else []
+        if len(latencies) < self.min_samples:
+            return self.default_delay
+        return max(self.min_delay, percentile(latencies, self.hedge_percentile))
+
+    def run(self, candidates: Iterator[str], attempt: Attempt) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Translate with the first candidate, hedging with later ones.
+        Returns the winning model and its result, or ``(None, None)``.
+        """
+        running: Dict[Future, Tuple[str, threading.Event, float, bool]] = {}
+        hedges = 0
+        with self._lock:
+            self._stats["requests"] += 1
+
+        def launch(hedge: bool) -> Optional[str]:
+            model = next(candidates, None)
+            if model is None:
+                return None
+            cancel = threading.Event()
+            future = self._executor.submit(attempt, model, cancel)
+            running[future] = (model, cancel, time.perf_counter(), hedge)
+            with self._lock:
+                stats = self._model_stats(model)
+                stats.attempts += 1
+                if hedge:
+                    stats.hedges += 1
+                    self._stats["extra_attempts"] += 1
+            return model
+
+        model = launch(hedge=False)
+        if model is None:
+            return None, None
+        hedge_at = time.perf_counter() + self.hedge_delay(model)
+
+        while running:
+            timeout = max(0.0, hedge_at - time.perf_counter()) if hedges < self.max_hedges else None
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                hedges += 1
+                model = launch(hedge=True)
+                if model is None:
+                    hedges = self.max_hedges
+                else:
+                    if hedges == 1:
+                        with self._lock:
+                            self._stats["hedged_requests"] += 1
+                    logger.info(f"Hedging slow request with model: {model}")
+                    hedge_at = time.perf_counter() + self.hedge_delay(model)
+                continue
+
+            for future in done:
+                model, _, started, hedge = running.pop(future)
+                elapsed = time.perf_counter() - started
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"Hedged attempt with {model} raised: {str(e)}")
+                    result = None
+                if result is not None:
+                    self._finish(model, elapsed, hedge, running)
+                    return model, result
+                with self._lock:
+                    self._model_stats(model).failures += 1
+
+            if not running:
+                # Every attempt failed, fall back to the next candidate
+                model = launch(hedge=False)
+                if model is None:
+                    break
+                hedge_at = time.perf_counter() + self.hedge_delay(model)
+        return None, None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request counters, the extra load caused by hedging and per-model wins."""
+        with self._lock:
+            stats = dict(self._stats)
+            models = {
+                name: {
+                    "attempts": model.attempts,
+                    "wins": model.wins,
+                    "hedges": model.hedges,
+                    "hedge_wins": model.hedge_wins,
+                    "failures": model.failures,
+                    "cancelled": model.cancelled,
+                    "p95_ms": percentile(list(model.latencies), 0.95) * 1000.0
+                }
+                for name, model in self._models.items()
+            }
+        stats["extra_load_ratio"] = stats["extra_attempts"] / stats["requests"] if stats["requests"] else 0.0
+        stats["models"] = models
+        for name in models:
+            models[name]["hedge_delay_ms"] = self.hedge_delay(name) * 1000.0
+        return stats
+
+    def _model_stats(self, model: str) -> _ModelHedgeStats:
+        stats = self._models.get(model)
+        if stats is None:
+            stats = self._models[model] = _ModelHedgeStats(self.window)
+        return stats
+
+    def _finish(
+        self,
+        winner: str,
+        elapsed: float,
+        hedge: bool,
+        losers: Dict[Future, Tuple[str, threading.Event, float, bool]]
+    ):
+        """Record the winner and cancel the attempts still running."""
+        with self._lock:
+            stats = self._model_stats(winner)
+            stats.wins += 1
+            if hedge:
+                stats.hedge_wins += 1
+            stats.latencies.append(elapsed)
+        for future, (model, cancel, started, _) in losers.items():
+            cancel.set()
+            future.cancel()
+            with self._lock:
+                self._model_stats(model).cancelled += 1
+            future.add_done_callback(
+                lambda _, started=started: self._add_wasted(time.perf_counter() - started)
+            )
+
+    def _add_wasted(self, seconds: float):
+        with self._lock:
+            self._stats["wasted_seconds"] += seconds
+
+    def shutdown(self):
+        """Stop accepting attempts; running ones finish in the background."""
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,184 @@
+"""
+Memory-mapped loading of cached model weights.
+Weights are read straight from a memory-mapped ``model.safetensors`` file,
+so read-only pages live in the OS page cache and are shared by every
+process that loads the same model instead of being copied into each one.
+``pytorch_model.bin`` checkpoints are converted to safetensors once, next
+to the original file.
+"""
+
+import json
+import logging
+import os
+import re
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+SAFETENSORS_FILE = "model.safetensors"
+PYTORCH_FILE = "pytorch_model.bin"
+
+# safetensors dtype tags and their torch dtype names
+_DTYPES = {
+    "F64": "float64",
+    "F32": "float32",
+    "F16": "float16",
+    "BF16": "bfloat16",
+    "I64": "int64",
+    "I32": "int32",
+    "I16": "int16",
+    "I8": "int8",
+    "U8": "uint8",
+    "BOOL": "bool"
+}
+
+
+def ensure_safetensors(model_dir: Path) -> Optional[Path]:
+    """
+    Path of the model's safetensors weights, converting ``pytorch_model.bin``
+    on first use. Returns None when neither file exists.
+    """
+    model_dir = Path(model_dir)
+    target = model_dir / SAFETENSORS_FILE
+    if target.exists():
+        return target
+    source = model_dir / PYTORCH_FILE
+    if not source.exists():
+        return None
+
+    import torch
+    from safetensors.torch import save_file
+
+    logger.info(f"Converting {source} to safetensors")
+    state_dict = torch.load(str(source), map_location="cpu", weights_only=True)
+    # safetensors refuses tensors sharing storage (tied embeddings); give each its own copy
+    seen = set()
+    tensors = {}
+    for name, tensor in state_dict.items():
+        key = (tensor.untyped_storage().data_ptr(), tensor.storage_offset())
+        tensors[name] = tensor.clone().contiguous() if key in seen else tensor.contiguous()
+        seen.add(key)
+
+    # Written under a per-process name so concurrent converters never see a partial file
+    partial = model_dir / f"{SAFETENSORS_FILE}.{os.getpid()}.tmp"
+    save_file(tensors, str(partial), metadata={"format": "pt", "converted_from": PYTORCH_FILE})
+    os.replace(partial, target)
+    logger.info(f"Wrote {target} ({target.stat().st_size / (1024 * 1024):.1f} MB)")
+    return target
+
+
+def load_mmap_state_dict(path: Path) -> Dict[str, Any]:
+    """
+    Tensors of a safetensors file as views of one copy-on-write file mapping.
+    Nothing is read until a tensor is used; pages are shared across processes
+    until written to.
+    """
+    import torch
+
+    path = Path(path)
+    with open(path, "rb") as f:
+        header_size = struct.unpack("<Q", f.read(8))[0]
+        header = json.loads(f.read(header_size))
+    data_start = 8 + header_size
+    buffer = torch.from_file(str(path), shared=False, size=path.stat().st_size, dtype=torch.uint8)
+
+    state_dict = {}
+    for name, info in header.items():
+        if name == "__metadata__":
+            continue
+        dtype = getattr(torch, _DTYPES[info["dtype"]])
+        start, end = info["data_offsets"]
+        raw = buffer[data_start + start:data_start + end]
+        try:
+            tensor = raw.view(dtype)
+        except RuntimeError:
+            # Misaligned for this dtype; fall back to a private copy
+            tensor = raw.clone().view(dtype)
+        state_dict[name] = tensor.reshape(info["shape"])
+    return state_dict
+
+
+def load_mmap_model(model_dir: Path, weights_path: Path) -> Any:
+    """
+    Build a seq2seq model whose weights are memory-mapped from ``weights_path``.
+
+    The model is created on the meta device so no private weight memory is
+    allocated, then the mapped tensors are assigned in place. Tensors the
+    checkpoint does not store (tied embeddings, sinusoidal positions) are
+    tied or initialised the way ``from_pretrained`` does it. Raises
+    ValueError when the checkpoint has keys the model does not, or lacks
+    weights that are neither tied nor ones the model may leave out (for
+    example a checkpoint saved without the base model prefix), so the
+    caller can fall back to ``from_pretrained``.
+    """
+    import torch
+    from transformers import AutoConfig, AutoModelForSeq2SeqLM, GenerationConfig
+
+    config = AutoConfig.from_pretrained(str(model_dir))
+    with torch.device("meta"):
+        model = AutoModelForSeq2SeqLM.from_config(config)
+    result = model.load_state_dict(load_mmap_state_dict(weights_path), strict=False, assign=True)
+    if result.unexpected_keys:
+        raise ValueError(
+            f"{weights_path} has {len(result.unexpected_keys)} weights the model does not "
+            f"(e.g. {result.unexpected_keys[0]})"
+        )
+    model.tie_weights()
+
+    # Missing weights are only tolerated when tying filled them in or the
+    # model declares them optional
+    tensors = dict(model.named_parameters(remove_duplicate=False))
+    tensors.update(model.named_buffers(remove_duplicate=False))
+    optional = getattr(model, "_keys_to_ignore_on_load_missing", None) or []
+    missing = [
+        key for key in result.missing_keys
+        if tensors[key].is_meta and not any(re.search(pattern, key) for pattern in optional)
+    ]
+    if missing:
+        raise ValueError(f"{weights_path} is missing {len(missing)} weights (e.g. {missing[0]})")
+
+    for name, module in model.named_modules():
+        tensors = list(module.parameters(recurse=False)) + list(module.buffers(recurse=False))
+        if any(tensor.is_meta for tensor in tensors):
+            logger.debug(f"Initialising weights missing from checkpoint: {name}")
+            module.to_empty(device="cpu", recurse=False)
+            model._init_weights(module)
+
+    if (Path(model_dir) / "generation_config.json").exists():
+        model.generation_config = GenerationConfig.from_pretrained(str(model_dir))
+    return model.eval()
+
+
+def process_memory_report(weight_suffixes: Iterable[str] = (".safetensors", ".bin")) -> Dict[str, Any]:
+    """
+    Memory of this process split into unique (USS) and shared pages, plus
+    the resident, shared and private bytes of each mapped weight file.
+    """
+    import psutil
+
+    process = psutil.Process()
+    info = process.memory_full_info()
+    report: Dict[str, Any] = {
+        "pid": process.pid,
+        "rss_bytes": info.rss,
+        "unique_bytes": info.uss,
+        "shared_bytes": info.rss - info.uss,
+        "pss_bytes": getattr(info, "pss", None),
+        "weight_files": {}
+    }
+    suffixes = tuple(weight_suffixes)
+    try:
+        for mapping in process.memory_maps(grouped=True):
+            if not mapping.path.endswith(suffixes):
+                continue
+            report["weight_files"][mapping.path] = {
+                "rss_bytes": mapping.rss,
+                "pss_bytes": getattr(mapping, "pss", None),
+                "shared_bytes": getattr(mapping, "shared_clean", 0) + getattr(mapping, "shared_dirty", 0),
+                "private_bytes": getattr(mapping, "private_clean", 0) + getattr(mapping, "private_dirty", 0)
+            }
+    except (psutil.AccessDenied, AttributeError, NotImplementedError) as e:
+        logger.debug(f"Per-mapping memory not available: {str(e)}")
+    return report
@@ -0,0 +1,252 @@
+"""
+Lazily loaded pool of local translation models.
+Models are loaded on first use and the least recently used ones are
+evicted when a memory budget would be exceeded. Pinned models are never
+evicted.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Weight files used to estimate a model's size before it is loaded
+_WEIGHT_FILES = ("model.safetensors", "pytorch_model.bin")
+
+LoadedModel = Tuple[Any, Any]
+
+
+def model_resident_bytes(model: Any) -> int:
+    """
+    Bytes held by a model's weights and buffers.
+    Walks the state dict so packed int8 weights of quantized layers, which
+    are not parameters, are counted too. Shared tensors are counted once.
+    Non-PyTorch backends report their own size via ``resident_bytes()``.
+    """
+    if hasattr(model, "resident_bytes"):
+        return model.resident_bytes()
+    seen = set()
+
+    def tensor_bytes(value: Any) -> int:
+        if isinstance(value, (tuple, list)):
+            return sum(tensor_bytes(item) for item in value)
+        if not hasattr(value, "element_size"):
+            return 0
+        key = (value.data_ptr(), value.numel())
+        if key in seen:
+            return 0
+        seen.add(key)
+        return value.numel() * value.element_size()
+
+    try:
+        return sum(tensor_bytes(value) for value in model.state_dict().values())
+    except Exception:
+        return 0
+
+
+class _PoolEntry:
+    """A loaded model, its tokenizer and its measured size."""
+
+    def __init__(self, model: Any, tokenizer: Any, size: int):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.size = size
+
+
+class ModelPool:
+    """
+    Mapping-style pool of ``(model, tokenizer)`` pairs keyed by model name.
+
+    ``name in pool`` is true for any model with a local cache directory;
+    ``pool[name]`` loads it on first access. ``memory_budget_bytes`` caps the
+    combined size of loaded models (None means unlimited).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        models: Iterable[str],
+        loader: Callable[[str, Path], LoadedModel],
+        memory_budget_bytes: Optional[int] = None,
+        pinned: Iterable[str] = (),
+        on_load: Optional[Callable[[str, Optional[float]], None]] = None
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.loader = loader
+        # Called with the load time in seconds, or None when a load fails
+        self.on_load = on_load
+        self.memory_budget_bytes = memory_budget_bytes
+        self.pinned = set(pinned)
+        self._models = list(models)
+        self._available: Dict[str, Path] = {}
+        self._loaded: "OrderedDict[str, _PoolEntry]" = OrderedDict()
+        self._resident_bytes = 0
+        self._lock = threading.Lock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._stats = {
+            "hits": 0,
+            "loads": 0,
+            "load_failures": 0,
+            "evictions": 0,
+            "load_seconds": 0.0
+        }
+        self.refresh()
+
+    @classmethod
+    def from_config(
+        cls,
+        cache_dir: Path,
+        models: Iterable[str],
+        loader: Callable[[str, Path], LoadedModel],
+        config: Dict[str, Any]
+    ) -> "ModelPool":
+        """Create a pool from the ``model_pool`` section of the model config."""
+        budget_mb = config.get("memory_budget_mb")
+        return cls(
+            cache_dir,
+            models,
+            loader,
+            memory_budget_bytes=int(budget_mb * 1024 * 1024) if budget_mb else None,
+            pinned=config.get("pinned", [])
+        )
+
+    def refresh(self):
+        """Rescan the cache directory for locally available models."""
+        available = {}
+        for model_name in self._models:
+            model_dir = self.cache_dir / model_name.replace("/", "_")
+            if model_dir.exists():
+                available[model_name] = model_dir
+        with self._lock:
+            self._available = available
+        logger.info(f"Model pool found {len(available)} locally cached models")
+
+    def __contains__(self, model_name: object) -> bool:
+        return model_name in self._available
+
+    def __getitem__(self, model_name: str) -> LoadedModel:
+        return self.get(model_name)
+
+    def __len__(self) -> int:
+        return len(self._loaded)
+
+    def is_loaded(self, model_name: str) -> bool:
+        """Check whether a model is currently resident."""
+        return model_name in self._loaded
+
+    def get(self, model_name: str) -> LoadedModel:
+        """Get a model and its tokenizer, loading it if needed."""
+        with self._lock:
+            entry = self._loaded.get(model_name)
+            if entry is not None:
+                self._loaded.move_to_end(model_name)
+                self._stats["hits"] += 1
+                return entry.model, entry.tokenizer
+            if model_name not in self._available:
+                raise KeyError(model_name)
+            load_lock = self._load_locks.setdefault(model_name, threading.Lock())
+
+        # Load outside the pool lock so other models stay servable
+        with load_lock:
+            with self._lock:
+                entry = self._loaded.get(model_name)
+                if entry is not None:
+                    self._loaded.move_to_end(model_name)
+                    self._stats["hits"] += 1
+                    return entry.model, entry.tokenizer
+                model_dir = self._available[model_name]
+                # Make room up front so peak memory stays within budget
+                self._evict_for(self._estimate_size(model_dir), keep=model_name)
+
+            logger.info(f"Loading model into pool: {model_name}")
+            start = time.perf_counter()
+            try:
+                model, tokenizer = self.loader(model_name, model_dir)
+            except Exception:
+                with self._lock:
+                    self._stats["load_failures"] += 1
+                if self.on_load is not None:
+                    self.on_load(model_name, None)
+                raise
+            elapsed = time.perf_counter() - start
+            if self.on_load is not None:
+                self.on_load(model_name, elapsed)
+            size = model_resident_bytes(model)
+
+            with self._lock:
+                self._loaded[model_name] = _PoolEntry(model, tokenizer, size)
+                self._resident_bytes += size
+                self._stats["loads"] += 1
+                self._stats["load_seconds"] += elapsed
+                self._evict_for(0, keep=model_name)
+            logger.info(
+                f"Loaded {model_name} in {elapsed:.2f}s "
+                f"({size / (1024 * 1024):.1f} MB resident)"
+            )
+            return model, tokenizer
+
+    def preload(self, model_names: Iterable[str]):
+        """Load the given models now, skipping those not cached locally."""
+        for model_name in model_names:
+            if model_name not in self:
+                continue
+            try:
+                self.get(model_name)
+            except Exception as e:
+                logger.error(f"Error preloading model {model_name}: {str(e)}")
+
+    def evict(self, model_name: str) -> bool:
+        """Unload a model, even if pinned. Returns whether it was loaded."""
+        with self._lock:
+            if model_name not in self._loaded:
+                return False
+            self._remove(model_name)
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get load/eviction counters and the models currently resident."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["resident_bytes"] = self._resident_bytes
+            stats["memory_budget_bytes"] = self.memory_budget_bytes
+            stats["available"] = len(self._available)
+            stats["loaded"] = {
+                name: {"bytes": entry.size, "pinned": name in self.pinned}
+                for name, entry in self._loaded.items()
+            }
+            return stats
+
+    def _estimate_size(self, model_dir: Path) -> int:
+        """Estimate a model's resident size from its weight file."""
+        for weight_file in _WEIGHT_FILES:
+            path = model_dir / weight_file
+            if path.exists():
+                return path.stat().st_size
+        return 0
+
+    def _evict_for(self, incoming: int, keep: str):
+        """Evict least recently used unpinned models until ``incoming`` bytes fit."""
+        if self.memory_budget_bytes is None:
+            return
+        for name in list(self._loaded):
+            if self._resident_bytes + incoming <= self.memory_budget_bytes:
+                return
+            if name == keep or name in self.pinned:
+                continue
+            logger.info(f"Evicting model from pool: {name}")
+            self._remove(name)
+            self._stats["evictions"] += 1
+        if self._resident_bytes + incoming > self.memory_budget_bytes:
+            logger.warning(
+                f"Model pool over budget: {self._resident_bytes + incoming} bytes "
+                f"of {self.memory_budget_bytes} (pinned or in-use models)"
+            )
+
+    def _remove(self, model_name: str):
+        """Drop a model from the resident set."""
+        entry = self._loaded.pop(model_name)
+        self._resident_bytes -= entry.size
@@ -1,27 +1,223 @@
 """
 Model validator for translation service.
 Handles model availability checks and fallback chain management.
+Validation results are cached with a TTL; failures are cached with an
+exponential backoff and a background thread keeps entries warm, so the
+translate hot path is a dictionary lookup.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Tuple
-import requests
+import threading
+import time
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from pathlib import Path
 
+from core.utils.http_session import get_http_client
+
 logger = logging.getLogger(__name__)
 
+DEFAULT_STATUS_URL = "https://api-inference.huggingface.co/status/"
+
+
+class _StatusEntry:
+    """Cached validation result for a single model."""
+
+    def __init__(self, is_valid: bool, message: str, expires_at: float, failures: int):
+        self.is_valid = is_valid
+        self.message = message
+        self.expires_at = expires_at
+        self.failures = failures
+
+
 class ModelValidator:
-    def __init__(self, api_url: str, headers: Dict[str, str], cache_dir: Path):
+    def __init__(
+        self,
+        api_url: str,
+        headers: Dict[str, str],
+        cache_dir: Path,
+        status_ttl: float = 300.0,
+        failure_ttl: float = 15.0,
+        max_failure_backoff: float = 600.0,
+        status_url: str = DEFAULT_STATUS_URL
+    ):
         self.api_url = api_url
+        self.status_url = status_url
         self.headers = headers
         self.cache_dir = cache_dir
+        self.status_ttl = status_ttl
+        self.failure_ttl = failure_ttl
+        self.max_failure_backoff = max_failure_backoff
         self.model_status_cache: Dict[str, Dict[str, Any]] = {}
+        self._status: Dict[str, _StatusEntry] = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "negative_hits": 0,
+            "misses": 0,
+            "refreshes": 0
+        }
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._refresh_stop = threading.Event()
+        self._refresh_interval = 30.0
+        # Set to a ModelHealthMonitor to order fallback chains by live health
+        self.health_monitor: Optional[Any] = None
+
+    @classmethod
+    def from_config(
+        cls,
+        api_url: str,
+        headers: Dict[str, str],
+        cache_dir: Path,
+        config: Dict[str, Any],
+        status_url: str = DEFAULT_STATUS_URL
+    ) -> "ModelValidator":
+        """Create a validator from the ``model_validation`` section of the model config."""
+        return cls(
+            api_url,
+            headers,
+            cache_dir,
+            status_ttl=config.get("status_ttl_seconds", 300.0),
+            failure_ttl=config.get("failure_ttl_seconds", 15.0),
+            max_failure_backoff=config.get("max_failure_backoff_seconds", 600.0),
+            status_url=status_url
+        )
         
     def validate_model(self, model_name: str) -> Tuple[bool, str]:
         """
         Validate model availability and status.
         Returns (is_valid, message)
+        
+        Cached results are returned without any I/O. Once an entry expires it
+        is still served while the background refresher is running; otherwise
+        the model is checked again inline.
         """
+        entry = self._status.get(model_name)
+        if entry is not None:
+            fresh = entry.expires_at > time.monotonic()
+            if fresh or self.is_refreshing():
+                with self._lock:
+                    if not fresh:
+                        self._stats["stale_hits"] += 1
+                    elif entry.is_valid:
+                        self._stats["hits"] += 1
+                    else:
+                        self._stats["negative_hits"] += 1
+                return entry.is_valid, entry.message
+                
+        with self._lock:
+            self._stats["misses"] += 1
+        return self.refresh(model_name)
+        
+    def refresh(self, model_name: str) -> Tuple[bool, str]:
+        """Check a model now and update its cached status."""
+        is_valid, message = self._check_model(model_name)
+        now = time.monotonic()
+        with self._lock:
+            previous = self._status.get(model_name)
+            if is_valid:
+                failures = 0
+                ttl = self.status_ttl
+            else:
+                failures = (previous.failures if previous is not None else 0) + 1
+                ttl = min(self.failure_ttl * (2 ** (failures - 1)), self.max_failure_backoff)
+                logger.info(f"Model {model_name} marked unavailable for {ttl:.0f}s after {failures} failed checks")
+            self._status[model_name] = _StatusEntry(is_valid, message, now + ttl, failures)
+            self._stats["refreshes"] += 1
+        return is_valid, message
+        
+    def invalidate(self, model_name: Optional[str] = None):
+        """Drop the cached status for one model, or for all models."""
+        with self._lock:
+            if model_name is None:
+                self._status.clear()
+                self.model_status_cache.clear()
+            else:
+                self._status.pop(model_name, None)
+                self.model_status_cache.pop(model_name, None)
+                
+    def start_background_refresh(
+        self,
+        models: Optional[Iterable[str]] = None,
+        interval: float = 30.0
+    ):
+        """
+        Start a daemon thread that re-checks cached models before they expire.
+        ``models`` are checked right away so the first requests hit a warm cache.
+        """
+        if self.is_refreshing():
+            return
+        self._refresh_interval = interval
+        self._refresh_stop.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop,
+            args=(list(models or []),),
+            name="model-status-refresh",
+            daemon=True
+        )
+        self._refresh_thread.start()
+        logger.info(f"Model status background refresh started (interval {interval}s)")
+        
+    def stop_background_refresh(self, wait: bool = True):
+        """Stop the background refresher."""
+        thread = self._refresh_thread
+        if thread is None:
+            return
+        self._refresh_stop.set()
+        if wait:
+            thread.join()
+        self._refresh_thread = None
+        
+    def is_refreshing(self) -> bool:
+        """Check whether the background refresher is running."""
+        thread = self._refresh_thread
+        return thread is not None and thread.is_alive()
+        
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss counters and the current status of each model."""
+        now = time.monotonic()
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["models"] = {
+                name: {
+                    "is_valid": entry.is_valid,
+                    "message": entry.message,
+                    "failures": entry.failures,
+                    "expires_in": max(0.0, entry.expires_at - now)
+                }
+                for name, entry in self._status.items()
+            }
+        stats["background_refresh"] = self.is_refreshing()
+        return stats
+        
+    def _refresh_loop(self, models: List[str]):
+        """Refresh entries that are missing or about to expire."""
+        for model_name in models:
+            if self._refresh_stop.is_set():
+                return
+            self._safe_refresh(model_name)
+            
+        while not self._refresh_stop.wait(self._refresh_interval):
+            horizon = time.monotonic() + self._refresh_interval
+            with self._lock:
+                due = [
+                    name for name, entry in self._status.items()
+                    if entry.expires_at <= horizon
+                ]
+            for model_name in due:
+                if self._refresh_stop.is_set():
+                    return
+                self._safe_refresh(model_name)
+                
+    def _safe_refresh(self, model_name: str):
+        """Refresh one model, keeping the refresher alive on errors."""
+        try:
+            self.refresh(model_name)
+        except Exception as e:
+            logger.error(f"Background refresh failed for {model_name}: {str(e)}")
+            
+    def _check_model(self, model_name: str) -> Tuple[bool, str]:
+        """Check local files and API status for a model."""
         logger.info(f"Validating model: {model_name}")
         
         # Check if model is cached locally
@@ -73,6 +269,9 @@ class ModelValidator:
         }
         
         chain = fallback_models.get(task_type, {}).get(primary_model, [])
+        health_monitor = getattr(self, "health_monitor", None)
+        if health_monitor is not None:
+            chain = health_monitor.rank(chain)
         logger.info(f"Fallback chain for {primary_model}: {chain}")
         return chain
         
@@ -97,13 +296,10 @@ class ModelValidator:
         
     def _check_api_status(self, model_name: str) -> Dict[str, Any]:
         """Check model status via HuggingFace API."""
-        # Use cached status if available and recent
-        if model_name in self.model_status_cache:
-            return self.model_status_cache[model_name]
-            
+        # Expiry is handled by the validation cache; this keeps the last response
         try:
-            response = requests.get(
-                f"https://api-inference.huggingface.co/status/{model_name}",
+            response = get_http_client().get(
+                f"{getattr(self, 'status_url', DEFAULT_STATUS_URL)}{model_name}",
                 headers=self.headers,
                 timeout=10
             )
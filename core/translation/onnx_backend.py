@@ -0,0 +1,509 @@
+"""
+ONNX Runtime backend for cached Marian and NLLB models.
+Each model is exported once to an encoder graph, a first-step decoder graph
+and a decoder graph that takes past key/values, all stored under
+model_cache/<model>/onnx/. Generation (greedy or beam search) runs in
+numpy on top of ONNX Runtime sessions and mirrors transformers' algorithm,
+so outputs match the PyTorch path.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from .quantization import source_fingerprint
+
+logger = logging.getLogger(__name__)
+
+PYTORCH_BACKEND = "pytorch"
+ONNX_BACKEND = "onnx"
+SUPPORTED_BACKENDS = (PYTORCH_BACKEND, ONNX_BACKEND)
+ONNX_MODEL_TYPES = ("marian", "nllb")
+
+ENCODER_FILE = "encoder_model.onnx"
+DECODER_FILE = "decoder_model.onnx"
+DECODER_WITH_PAST_FILE = "decoder_with_past_model.onnx"
+METADATA_FILE = "onnx_config.json"
+
+# The export wrappers build past key/values with the layered
+# EncoderDecoderCache API; this is the oldest release they are tested against
+MIN_TRANSFORMERS_VERSION = "5.0.0"
+
+_NEG_INF = -1.0e9
+
+
+def onnx_cache_dir(model_dir: Path) -> Path:
+    """Location of the exported ONNX graphs inside a model cache directory."""
+    return Path(model_dir) / "onnx"
+
+
+def export_unsupported_reason() -> Optional[str]:
+    """Explain why the installed transformers cannot export ONNX graphs, or None if it can."""
+    import transformers
+    from packaging.version import Version
+
+    if Version(transformers.__version__) < Version(MIN_TRANSFORMERS_VERSION):
+        return (
+            f"ONNX export requires transformers>={MIN_TRANSFORMERS_VERSION}, "
+            f"found {transformers.__version__}"
+        )
+    return None
+
+
+def model_backend(model_info: Dict[str, Any]) -> str:
+    """Get the configured inference backend for a model."""
+    backend = model_info.get("backend") or PYTORCH_BACKEND
+    if backend not in SUPPORTED_BACKENDS:
+        logger.warning(f"Ignoring unsupported backend {backend} - using {PYTORCH_BACKEND}")
+        return PYTORCH_BACKEND
+    if backend == ONNX_BACKEND and model_info.get("model_type") not in ONNX_MODEL_TYPES:
+        logger.warning(
+            f"ONNX backend is only supported for {ONNX_MODEL_TYPES} models, "
+            f"not {model_info.get('model_type')}"
+        )
+        return PYTORCH_BACKEND
+    if backend == ONNX_BACKEND:
+        reason = export_unsupported_reason()
+        if reason:
+            logger.warning(f"{reason} - using {PYTORCH_BACKEND}")
+            return PYTORCH_BACKEND
+    return backend
+
+
+def _past_names(num_layers: int, prefix: str) -> List[str]:
+    names = []
+    for layer in range(num_layers):
+        names += [
+            f"{prefix}.{layer}.decoder.key",
+            f"{prefix}.{layer}.decoder.value",
+            f"{prefix}.{layer}.encoder.key",
+            f"{prefix}.{layer}.encoder.value"
+        ]
+    return names
+
+
+def export_onnx(model: Any, output_dir: Path, opset_version: int = 17) -> Dict[str, Any]:
+    """
+    Export a seq2seq model to encoder, decoder and decoder-with-past graphs.
+    Returns the generation metadata stored alongside them.
+    """
+    reason = export_unsupported_reason()
+    if reason:
+        raise RuntimeError(reason)
+
+    import torch
+    from transformers.cache_utils import DynamicCache, EncoderDecoderCache
+
+    model.eval()
+    num_layers = model.config.decoder_layers
+    final_logits_bias = getattr(model, "final_logits_bias", None)
+
+    class EncoderWrapper(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.encoder = model.get_encoder()
+
+        def forward(self, input_ids, attention_mask):
+            return self.encoder(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+
+    class DecoderWrapper(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.decoder = model.get_decoder()
+            self.lm_head = model.get_output_embeddings()
+
+        def forward(self, decoder_input_ids, encoder_hidden_states, encoder_attention_mask, *past):
+            if past:
+                cache = EncoderDecoderCache(
+                    DynamicCache(ddp_cache_data=[(past[4 * i], past[4 * i + 1]) for i in range(num_layers)]),
+                    DynamicCache(ddp_cache_data=[(past[4 * i + 2], past[4 * i + 3]) for i in range(num_layers)])
+                )
+            else:
+                cache = EncoderDecoderCache(DynamicCache(), DynamicCache())
+            outputs = self.decoder(
+                input_ids=decoder_input_ids,
+                encoder_hidden_states=encoder_hidden_states,
+                encoder_attention_mask=encoder_attention_mask,
+                past_key_values=cache,
+                use_cache=True
+            )
+            logits = self.lm_head(outputs.last_hidden_state)
+            if final_logits_bias is not None:
+                logits = logits + final_logits_bias
+            present = outputs.past_key_values
+            results = [logits]
+            for layer in range(num_layers):
+                self_layer = present.self_attention_cache.layers[layer]
+                cross_layer = present.cross_attention_cache.layers[layer]
+                results += [self_layer.keys, self_layer.values, cross_layer.keys, cross_layer.values]
+            return tuple(results)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # Wrappers must be in eval mode: export restores the wrapper's training
+    # flag on every submodule afterwards, which would re-enable dropout
+    encoder = EncoderWrapper().eval()
+    decoder = DecoderWrapper().eval()
+
+    start_token = model.config.decoder_start_token_id
+    input_ids = torch.tensor([[5, 6, 7, model.config.eos_token_id]])
+    attention_mask = torch.ones_like(input_ids)
+    decoder_input_ids = torch.tensor([[start_token]])
+    sequence_axes = {0: "batch", 1: "sequence"}
+    common_axes = {
+        "decoder_input_ids": {0: "batch", 1: "decoder_sequence"},
+        "encoder_hidden_states": sequence_axes,
+        "encoder_attention_mask": sequence_axes
+    }
+    past_names = _past_names(num_layers, "past_key_values")
+    present_names = _past_names(num_layers, "present")
+    present_axes = {
+        name: {0: "batch", 2: "past_sequence" if ".decoder." in name else "sequence"}
+        for name in present_names
+    }
+
+    with torch.no_grad():
+        torch.onnx.export(
+            encoder,
+            (input_ids, attention_mask),
+            str(output_dir / ENCODER_FILE),
+            input_names=["input_ids", "attention_mask"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={
+                "input_ids": sequence_axes,
+                "attention_mask": sequence_axes,
+                "last_hidden_state": sequence_axes
+            },
+            opset_version=opset_version,
+            dynamo=False
+        )
+        encoder_hidden_states = encoder(input_ids, attention_mask)
+        torch.onnx.export(
+            decoder,
+            (decoder_input_ids, encoder_hidden_states, attention_mask),
+            str(output_dir / DECODER_FILE),
+            input_names=["decoder_input_ids", "encoder_hidden_states", "encoder_attention_mask"],
+            output_names=["logits"] + present_names,
+            dynamic_axes={**common_axes, **present_axes},
+            opset_version=opset_version,
+            dynamo=False
+        )
+        first_step = decoder(decoder_input_ids, encoder_hidden_states, attention_mask)
+        torch.onnx.export(
+            decoder,
+            (decoder_input_ids, encoder_hidden_states, attention_mask, *first_step[1:]),
+            str(output_dir / DECODER_WITH_PAST_FILE),
+            input_names=["decoder_input_ids", "encoder_hidden_states", "encoder_attention_mask"] + past_names,
+            output_names=["logits"] + present_names,
+            dynamic_axes={
+                **common_axes,
+                **present_axes,
+                **{
+                    name: {0: "batch", 2: "past_sequence" if ".decoder." in name else "sequence"}
+                    for name in past_names
+                }
+            },
+            opset_version=opset_version,
+            dynamo=False
+        )
+
+    generation_config = getattr(model, "generation_config", None)
+
+    def generation_value(name: str) -> Any:
+        value = getattr(generation_config, name, None) if generation_config is not None else None
+        return value if value is not None else getattr(model.config, name, None)
+
+    bad_words_ids = generation_value("bad_words_ids") or []
+    return {
+        "num_layers": num_layers,
+        "decoder_start_token_id": start_token,
+        "eos_token_id": generation_value("eos_token_id"),
+        "pad_token_id": generation_value("pad_token_id"),
+        "forced_bos_token_id": generation_value("forced_bos_token_id"),
+        "forced_eos_token_id": generation_value("forced_eos_token_id"),
+        # Only single-token bans can be applied without n-gram matching
+        "suppressed_token_ids": [ids[0] for ids in bad_words_ids if len(ids) == 1]
+    }
+
+
+class ONNXSeq2SeqModel:
+    """
+    Encoder-decoder model running under ONNX Runtime.
+
+    ``generate`` takes the same ``input_ids``/``attention_mask``/
+    ``generation_config`` arguments as the PyTorch model and returns a
+    ``torch.Tensor`` of token ids, so it can stand in for it in
+    ``TranslationService``.
+    """
+
+    def __init__(self, onnx_dir: Path, intra_op_threads: Optional[int] = None):
+        import onnxruntime as ort
+
+        self.onnx_dir = Path(onnx_dir)
+        self.metadata = json.loads((self.onnx_dir / METADATA_FILE).read_text())["generation"]
+        options = ort.SessionOptions()
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        providers = ["CPUExecutionProvider"]
+        self.encoder = ort.InferenceSession(str(self.onnx_dir / ENCODER_FILE), options, providers=providers)
+        self.decoder = ort.InferenceSession(str(self.onnx_dir / DECODER_FILE), options, providers=providers)
+        self.decoder_with_past = ort.InferenceSession(
+            str(self.onnx_dir / DECODER_WITH_PAST_FILE), options, providers=providers
+        )
+        self._past_inputs = [
+            item.name for item in self.decoder_with_past.get_inputs()
+            if item.name.startswith("past_key_values.")
+        ]
+        self._past_names = _past_names(self.metadata["num_layers"], "past_key_values")
+
+    def resident_bytes(self) -> int:
+        """Size of the exported graphs, a proxy for their weight memory."""
+        return sum(path.stat().st_size for path in self.onnx_dir.glob("*.onnx*"))
+
+    def eval(self) -> "ONNXSeq2SeqModel":
+        return self
+
+    def generate(
+        self,
+        input_ids: Any,
+        attention_mask: Any = None,
+        generation_config: Any = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Generate token ids with greedy or beam search decoding.
+        A ``streamer`` (transformers ``put``/``end`` protocol) is fed each
+        greedy step; like transformers, streaming requires ``num_beams=1``.
+        """
+        import torch
+
+        settings = {"max_length": 20, "num_beams": 1, "length_penalty": 1.0, "early_stopping": False}
+        if generation_config is not None:
+            for name in settings:
+                value = getattr(generation_config, name, None)
+                if value is not None:
+                    settings[name] = value
+        settings.update({name: value for name, value in kwargs.items() if name in settings})
+        # max_new_tokens wins over max_length, counting after the decoder start token
+        max_new_tokens = kwargs.get("max_new_tokens", getattr(generation_config, "max_new_tokens", None))
+        if max_new_tokens is not None:
+            settings["max_length"] = max_new_tokens + 1
+
+        input_ids = np.asarray(input_ids.cpu() if hasattr(input_ids, "cpu") else input_ids, dtype=np.int64)
+        if attention_mask is None:
+            attention_mask = np.ones_like(input_ids)
+        else:
+            attention_mask = np.asarray(
+                attention_mask.cpu() if hasattr(attention_mask, "cpu") else attention_mask, dtype=np.int64
+            )
+
+        encoder_hidden_states = self.encoder.run(
+            None, {"input_ids": input_ids, "attention_mask": attention_mask}
+        )[0]
+        streamer = kwargs.get("streamer")
+        if settings["num_beams"] > 1:
+            if streamer is not None:
+                raise ValueError("streamer cannot be used with beam search, set num_beams to 1")
+            sequences = self._beam_search(encoder_hidden_states, attention_mask, **settings)
+        else:
+            sequences = self._greedy_search(
+                encoder_hidden_states, attention_mask, settings["max_length"], streamer
+            )
+        return torch.from_numpy(sequences)
+
+    def _decode_step(self, tokens, encoder_hidden_states, attention_mask, past):
+        """Run one decoder step, returning last-position logits and the new past."""
+        feed = {
+            "decoder_input_ids": tokens,
+            "encoder_hidden_states": encoder_hidden_states,
+            "encoder_attention_mask": attention_mask
+        }
+        if past is None:
+            outputs = self.decoder.run(None, feed)
+        else:
+            for name, value in zip(self._past_names, past):
+                if name in self._past_inputs:
+                    feed[name] = value
+            outputs = self.decoder_with_past.run(None, feed)
+        return outputs[0][:, -1, :].astype(np.float32), outputs[1:]
+
+    def _process_scores(self, scores: np.ndarray, cur_len: int, max_length: int) -> np.ndarray:
+        """Apply suppressed tokens and forced BOS/EOS like the transformers processors."""
+        suppressed = self.metadata.get("suppressed_token_ids") or []
+        if suppressed:
+            scores[:, suppressed] = -np.inf
+        forced_bos = self.metadata.get("forced_bos_token_id")
+        if forced_bos is not None and cur_len == 1:
+            scores[:, :] = -np.inf
+            scores[:, forced_bos] = 0
+        forced_eos = self.metadata.get("forced_eos_token_id")
+        if forced_eos is not None and cur_len == max_length - 1:
+            scores[:, :] = -np.inf
+            scores[:, forced_eos] = 0
+        return scores
+
+    def _eos_ids(self) -> List[int]:
+        eos = self.metadata.get("eos_token_id")
+        if eos is None:
+            return []
+        return list(eos) if isinstance(eos, (list, tuple)) else [eos]
+
+    def _greedy_search(self, encoder_hidden_states, attention_mask, max_length: int, streamer: Any = None) -> np.ndarray:
+        batch_size = encoder_hidden_states.shape[0]
+        eos_ids = self._eos_ids()
+        pad = self.metadata.get("pad_token_id")
+        pad = pad if pad is not None else (eos_ids[0] if eos_ids else 0)
+
+        sequences = np.full((batch_size, 1), self.metadata["decoder_start_token_id"], dtype=np.int64)
+        unfinished = np.ones(batch_size, dtype=bool)
+        past = None
+        if streamer is not None:
+            streamer.put(sequences)
+        while sequences.shape[1] < max_length:
+            tokens = sequences if past is None else sequences[:, -1:]
+            logits, past = self._decode_step(tokens, encoder_hidden_states, attention_mask, past)
+            scores = self._process_scores(logits, sequences.shape[1], max_length)
+            next_tokens = np.where(unfinished, scores.argmax(axis=-1), pad)
+            sequences = np.concatenate([sequences, next_tokens[:, None]], axis=1)
+            if streamer is not None:
+                streamer.put(next_tokens)
+            unfinished &= ~np.isin(next_tokens, eos_ids)
+            if not unfinished.any():
+                break
+        if streamer is not None:
+            streamer.end()
+        return sequences
+
+    def _beam_search(
+        self,
+        encoder_hidden_states,
+        attention_mask,
+        max_length: int,
+        num_beams: int,
+        length_penalty: float,
+        early_stopping: Any
+    ) -> np.ndarray:
+        """Vectorized beam search following transformers' ``_beam_search``."""
+        batch_size = encoder_hidden_states.shape[0]
+        eos_ids = self._eos_ids()
+        # Same fill rule as transformers (a pad id of 0 falls back to EOS)
+        fill_value = (self.metadata.get("pad_token_id") or eos_ids[0]) if eos_ids else -1
+        beams_to_keep = max(2, 1 + len(eos_ids)) * num_beams
+        top_num_beam_mask = np.arange(beams_to_keep) < num_beams
+        batch_index = np.arange(batch_size)[:, None]
+
+        encoder_hidden_states = np.repeat(encoder_hidden_states, num_beams, axis=0)
+        attention_mask = np.repeat(attention_mask, num_beams, axis=0)
+
+        running_sequences = np.full((batch_size, num_beams, max_length), fill_value, dtype=np.int64)
+        running_sequences[:, :, 0] = self.metadata["decoder_start_token_id"]
+        sequences = running_sequences.copy()
+        lengths = np.ones((batch_size, num_beams), dtype=np.int64)
+        running_scores = np.zeros((batch_size, num_beams), dtype=np.float32)
+        running_scores[:, 1:] = _NEG_INF
+        beam_scores = np.full((batch_size, num_beams), _NEG_INF, dtype=np.float32)
+        is_finished = np.zeros((batch_size, num_beams), dtype=bool)
+        improvable = np.ones((batch_size, 1), dtype=bool)
+
+        cur_len = 1
+        past = None
+        while True:
+            flat = running_sequences.reshape(batch_size * num_beams, max_length)
+            tokens = flat[:, :cur_len] if past is None else flat[:, cur_len - 1:cur_len]
+            logits, present = self._decode_step(tokens, encoder_hidden_states, attention_mask, past)
+
+            shifted = logits - logits.max(axis=-1, keepdims=True)
+            log_probs = shifted - np.log(np.exp(shifted).sum(axis=-1, keepdims=True))
+            log_probs = self._process_scores(log_probs, cur_len, max_length)
+            vocab_size = log_probs.shape[-1]
+            log_probs = log_probs.reshape(batch_size, num_beams, vocab_size) + running_scores[:, :, None]
+            log_probs = log_probs.reshape(batch_size, num_beams * vocab_size)
+
+            # Top-K continuations across all beams of each item
+            topk_indices = np.argsort(-log_probs, axis=-1, kind="stable")[:, :beams_to_keep]
+            topk_log_probs = np.take_along_axis(log_probs, topk_indices, axis=-1)
+            topk_beams = topk_indices // vocab_size
+            topk_ids = topk_indices % vocab_size
+            topk_sequences = running_sequences[batch_index, topk_beams].copy()
+            topk_sequences[:, :, cur_len] = topk_ids
+
+            hits_stop = np.isin(topk_ids, eos_ids) | (cur_len + 1 >= max_length)
+
+            # Best non-finished beams continue
+            running_log_probs = topk_log_probs + hits_stop * _NEG_INF
+            next_indices = np.argsort(-running_log_probs, axis=-1, kind="stable")[:, :num_beams]
+            running_sequences = np.take_along_axis(topk_sequences, next_indices[:, :, None], axis=1)
+            running_scores = np.take_along_axis(running_log_probs, next_indices, axis=-1)
+            source_beams = np.take_along_axis(topk_beams, next_indices, axis=-1)
+
+            # Finished candidates compete with earlier finished sequences
+            just_finished = hits_stop & top_num_beam_mask[None, :]
+            finished_scores = topk_log_probs / (cur_len ** length_penalty)
+            full = is_finished.all(axis=-1, keepdims=True) & (early_stopping is True)
+            finished_scores = finished_scores + full * _NEG_INF
+            finished_scores = finished_scores + (~improvable) * _NEG_INF
+            finished_scores = finished_scores + (~just_finished) * _NEG_INF
+            merged_sequences = np.concatenate([sequences, topk_sequences], axis=1)
+            merged_scores = np.concatenate([beam_scores, finished_scores], axis=1)
+            merged_finished = np.concatenate([is_finished, just_finished], axis=1)
+            merged_lengths = np.concatenate(
+                [lengths, np.full((batch_size, beams_to_keep), cur_len + 1, dtype=np.int64)], axis=1
+            )
+            keep = np.argsort(-merged_scores, axis=-1, kind="stable")[:, :num_beams]
+            sequences = np.take_along_axis(merged_sequences, keep[:, :, None], axis=1)
+            beam_scores = np.take_along_axis(merged_scores, keep, axis=-1)
+            is_finished = np.take_along_axis(merged_finished, keep, axis=-1)
+            lengths = np.take_along_axis(merged_lengths, keep, axis=-1)
+
+            # Reorder the cache to follow the surviving beams
+            flat_sources = (source_beams + np.arange(batch_size)[:, None] * num_beams).reshape(-1)
+            past = [value[flat_sources] for value in present]
+
+            cur_len += 1
+            if early_stopping == "never" and length_penalty > 0.0:
+                best_length = max_length - 1
+            else:
+                best_length = cur_len - 1
+            best_running = running_scores[:, :1] / (best_length ** length_penalty)
+            worst_finished = np.where(is_finished, beam_scores.min(axis=1, keepdims=True), _NEG_INF)
+            improvable = improvable & (best_running > worst_finished).any(axis=-1, keepdims=True)
+
+            all_done = is_finished.all() and early_stopping is True
+            if not improvable.any() or all_done or hits_stop.all():
+                break
+
+        output_length = int(lengths[:, 0].max())
+        return sequences[:, 0, :output_length]
+
+
+def load_onnx_model(
+    model_dir: Path,
+    load_float_model: Callable[[], Any],
+    intra_op_threads: Optional[int] = None
+) -> ONNXSeq2SeqModel:
+    """
+    Load a model's ONNX graphs, exporting them on first use.
+    ``load_float_model`` is only called when the export is missing or stale.
+    """
+    onnx_dir = onnx_cache_dir(model_dir)
+    metadata_path = onnx_dir / METADATA_FILE
+    fingerprint = source_fingerprint(model_dir)
+
+    needs_export = True
+    if metadata_path.exists():
+        try:
+            needs_export = json.loads(metadata_path.read_text()).get("source") != fingerprint
+            if needs_export:
+                logger.info(f"ONNX export at {onnx_dir} is stale - re-exporting")
+        except Exception as e:
+            logger.warning(f"Could not read ONNX metadata {metadata_path}: {str(e)}")
+
+    if needs_export:
+        logger.info(f"Exporting {model_dir} to ONNX at {onnx_dir}")
+        generation = export_onnx(load_float_model(), onnx_dir)
+        metadata_path.write_text(json.dumps({"source": fingerprint, "generation": generation}))
+
+    return ONNXSeq2SeqModel(onnx_dir, intra_op_threads=intra_op_threads)
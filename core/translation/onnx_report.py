@@ -0,0 +1,133 @@
+"""
+Compare the PyTorch and ONNX Runtime backends for cached seq2seq models.
+Translates sample sentences from test_data_sample with both backends and
+reports output agreement, latency percentiles and throughput.
+
+Usage:
+    python -m core.translation.onnx_report \\
+        lachkarsalim/LatinDarija_English-v2 --limit 100 \\
+        --output reports/onnx_report.json
+"""
+
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from core.utils.latency import latency_summary
+
+from .evaluation import make_translator, timed_map
+from .onnx_backend import load_onnx_model
+from .parallel_corpus import DEFAULT_DATA_DIR, load_parallel_corpus
+
+logger = logging.getLogger(__name__)
+
+
+def _batch_throughput(model: Any, tokenizer: Any, sentences: Sequence[str],
+                      generation_kwargs: Dict[str, Any], batch_size: int) -> float:
+    """Sentences per second when translating padded batches."""
+    import torch
+
+    start = time.perf_counter()
+    for offset in range(0, len(sentences), batch_size):
+        batch = list(sentences[offset:offset + batch_size])
+        inputs = tokenizer(batch, return_tensors="pt", padding=True, truncation=True, max_length=512)
+        with torch.no_grad():
+            model.generate(**inputs, **generation_kwargs)
+    elapsed = time.perf_counter() - start
+    return len(sentences) / elapsed if elapsed else 0.0
+
+
+def compare_backends(
+    model_dir: Path,
+    sentences: Sequence[str],
+    generation_kwargs: Optional[Dict[str, Any]] = None,
+    load_float_model: Optional[Any] = None,
+    tokenizer: Optional[Any] = None,
+    batch_size: int = 8
+) -> Dict[str, Any]:
+    """Translate ``sentences`` with both backends and summarize the results."""
+    if load_float_model is None or tokenizer is None:
+        import torch
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+        if load_float_model is None:
+            def load_float_model():
+                return AutoModelForSeq2SeqLM.from_pretrained(
+                    str(model_dir), torch_dtype=torch.float32, low_cpu_mem_usage=True
+                ).eval()
+        if tokenizer is None:
+            tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+
+    generation_kwargs = generation_kwargs or {"max_length": 512, "num_beams": 4}
+    backends = {
+        "pytorch": load_float_model(),
+        "onnx": load_onnx_model(model_dir, load_float_model)
+    }
+
+    results: Dict[str, Any] = {"sentences": len(sentences), "batch_size": batch_size}
+    outputs: Dict[str, List[str]] = {}
+    for name, model in backends.items():
+        translations, latencies = timed_map(make_translator(model, tokenizer, generation_kwargs), sentences)
+        outputs[name] = translations
+        total = sum(latencies)
+        results[name] = {
+            **latency_summary(latencies),
+            "sequential_sentences_per_second": len(sentences) / total if total else 0.0,
+            "batched_sentences_per_second": _batch_throughput(
+                model, tokenizer, sentences, generation_kwargs, batch_size
+            )
+        }
+
+    matching = sum(a == b for a, b in zip(outputs["onnx"], outputs["pytorch"]))
+    results["identical_outputs"] = matching
+    results["identical_rate"] = matching / len(sentences) if sentences else 0.0
+    results["latency_speedup"] = (
+        results["pytorch"]["mean_ms"] / results["onnx"]["mean_ms"] if results["onnx"]["mean_ms"] else 0.0
+    )
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("models", nargs="+", help="Model names cached under --cache-dir")
+    parser.add_argument("--cache-dir", default="model_cache")
+    parser.add_argument("--data-dir", default=str(DEFAULT_DATA_DIR))
+    parser.add_argument("--source", default="darija", help="Source column type from column_mapping.yaml")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--num-beams", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--output", default="reports/onnx_report.json")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    pairs = load_parallel_corpus(args.data_dir, args.source, "english", limit=args.limit)
+    sentences = [source for source, _ in pairs]
+    logger.info(f"Loaded {len(sentences)} {args.source} sample sentences")
+
+    report: Dict[str, Any] = {"data_dir": args.data_dir, "models": {}}
+    for model_name in args.models:
+        model_dir = Path(args.cache_dir) / model_name.replace("/", "_")
+        if not model_dir.exists():
+            logger.error(f"Model {model_name} is not cached at {model_dir}")
+            continue
+        result = compare_backends(
+            model_dir, sentences, {"max_length": 512, "num_beams": args.num_beams},
+            batch_size=args.batch_size
+        )
+        report["models"][model_name] = result
+        logger.info(
+            f"{model_name}: ONNX {result['latency_speedup']:.2f}x faster, "
+            f"{result['identical_rate']:.0%} identical outputs"
+        )
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    logger.info(f"Report written to {output}")
+
+
+if __name__ == "__main__":
+    main()
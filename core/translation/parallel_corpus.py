@@ -0,0 +1,127 @@
+"""
+Parallel Darija/English sentence pairs from local dataset CSV files or,
+streamed, from the HuggingFace Hub.
+Columns are matched to languages with the ``column_types`` section of
+config/column_mapping.yaml, so every dataset layout is handled the same way.
+"""
+
+import csv
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COLUMN_MAPPING = Path("config/column_mapping.yaml")
+DEFAULT_DATA_DIR = Path("test_data_sample")
+
+
+def load_column_types(column_mapping: Union[str, Path] = DEFAULT_COLUMN_MAPPING) -> Dict[str, List[str]]:
+    """Load the column name aliases for each column type."""
+    with open(column_mapping) as f:
+        config = yaml.safe_load(f) or {}
+    return config.get("column_types", {})
+
+
+def _match_column(fieldnames: List[str], aliases: List[str]) -> Optional[str]:
+    """Pick the first alias present in a file's header."""
+    for alias in aliases:
+        if alias in fieldnames:
+            return alias
+    return None
+
+
+def iter_parallel_pairs(
+    data_dir: Union[str, Path] = DEFAULT_DATA_DIR,
+    source_type: str = "darija",
+    target_type: str = "english",
+    column_types: Optional[Dict[str, List[str]]] = None
+) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield ``(source, target, file)`` for every non-empty pair in the CSV files
+    under ``data_dir``. Files without both column types are skipped.
+    """
+    if column_types is None:
+        column_types = load_column_types()
+    source_aliases = column_types.get(source_type, [])
+    target_aliases = column_types.get(target_type, [])
+
+    for path in sorted(Path(data_dir).rglob("*.csv")):
+        try:
+            with open(path, newline="", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                fieldnames = reader.fieldnames or []
+                source_column = _match_column(fieldnames, source_aliases)
+                target_column = _match_column(fieldnames, target_aliases)
+                if source_column is None or target_column is None:
+                    logger.debug(f"Skipping {path}: no {source_type}/{target_type} columns")
+                    continue
+                for row in reader:
+                    source = (row.get(source_column) or "").strip()
+                    target = (row.get(target_column) or "").strip()
+                    if source and target:
+                        yield source, target, str(path)
+        except Exception as e:
+            logger.warning(f"Error reading parallel data from {path}: {str(e)}")
+
+
+def load_parallel_corpus(
+    data_dir: Union[str, Path] = DEFAULT_DATA_DIR,
+    source_type: str = "darija",
+    target_type: str = "english",
+    limit: Optional[int] = None,
+    column_types: Optional[Dict[str, List[str]]] = None
+) -> List[Tuple[str, str]]:
+    """Load unique ``(source, target)`` pairs, up to ``limit`` of them."""
+    pairs: List[Tuple[str, str]] = []
+    seen = set()
+    for source, target, _ in iter_parallel_pairs(data_dir, source_type, target_type, column_types):
+        if (source, target) in seen:
+            continue
+        seen.add((source, target))
+        pairs.append((source, target))
+        if limit is not None and len(pairs) >= limit:
+            break
+    return pairs
+
+
+def iter_hub_pairs(
+    column_mapping: Union[str, Path] = DEFAULT_COLUMN_MAPPING,
+    source_type: str = "darija",
+    target_type: str = "english",
+    column_types: Optional[Dict[str, List[str]]] = None,
+    split: str = "train"
+) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yield ``(source, target, dataset/subset)`` pairs by streaming every subset
+    listed in the ``datasets`` section of config/column_mapping.yaml from the
+    HuggingFace Hub. Subsets without both column types are skipped.
+    """
+    from datasets import load_dataset
+
+    with open(column_mapping) as f:
+        config = yaml.safe_load(f) or {}
+    if column_types is None:
+        column_types = config.get("column_types", {})
+    source_aliases = column_types.get(source_type, [])
+    target_aliases = column_types.get(target_type, [])
+
+    for name, spec in config.get("datasets", {}).items():
+        for subset in spec.get("subsets", ["default"]):
+            columns = spec.get("required_columns", {}).get(subset, [])
+            source_column = _match_column(columns, source_aliases)
+            target_column = _match_column(columns, target_aliases)
+            if source_column is None or target_column is None:
+                logger.debug(f"Skipping {name}/{subset}: no {source_type}/{target_type} columns")
+                continue
+            try:
+                rows = load_dataset(name, None if subset == "default" else subset, split=split, streaming=True)
+                for row in rows:
+                    source = str(row.get(source_column) or "").strip()
+                    target = str(row.get(target_column) or "").strip()
+                    if source and target:
+                        yield source, target, f"{name}/{subset}"
+            except Exception as e:
+                logger.warning(f"Error streaming parallel data from {name}/{subset}: {str(e)}")
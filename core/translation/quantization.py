@@ -0,0 +1,132 @@
+"""
+Dynamic int8 quantization for CPU inference of cached seq2seq models.
+Linear layers of Marian/NLLB models are quantized on load and the quantized
+state dict is cached next to the original weights, so later starts skip
+loading the float weights.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Quantization modes accepted in the per-model ``quantization`` config key
+DYNAMIC_INT8 = "dynamic_int8"
+SUPPORTED_MODES = (DYNAMIC_INT8,)
+
+# Model families whose Linear-heavy architecture quantizes well
+QUANTIZABLE_MODEL_TYPES = ("marian", "nllb")
+
+_WEIGHT_FILES = ("model.safetensors", "pytorch_model.bin")
+
+
+def quantize_dynamic_int8(model: Any) -> Any:
+    """Quantize the Linear layers of a model to int8 with dynamic activations."""
+    import torch
+
+    model.eval()
+    return torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+
+
+def quantized_cache_path(model_dir: Path, mode: str = DYNAMIC_INT8) -> Path:
+    """Location of the cached quantized model inside a model cache directory."""
+    return Path(model_dir) / "quantized" / f"{mode}.pt"
+
+
+def _empty_float_model(model_dir: Path) -> Any:
+    """Build the float model architecture from its config, without reading weights."""
+    from transformers import AutoConfig, AutoModelForSeq2SeqLM
+
+    config = AutoConfig.from_pretrained(str(model_dir))
+    return AutoModelForSeq2SeqLM.from_config(config)
+
+
+def source_fingerprint(model_dir: Path) -> Dict[str, Any]:
+    """Versions and weight file stats the cached model was built from."""
+    import torch
+    import transformers
+
+    fingerprint: Dict[str, Any] = {
+        "torch": torch.__version__,
+        "transformers": transformers.__version__
+    }
+    for weight_file in _WEIGHT_FILES:
+        path = Path(model_dir) / weight_file
+        if path.exists():
+            stat = path.stat()
+            fingerprint["weights"] = {
+                "file": weight_file,
+                "size": stat.st_size,
+                "mtime": stat.st_mtime
+            }
+            break
+    return fingerprint
+
+
+def load_quantized_model(
+    model_dir: Path,
+    load_float_model: Callable[[], Any],
+    mode: str = DYNAMIC_INT8
+) -> Any:
+    """
+    Load a quantized model from the cache, or build and cache it.
+
+    ``load_float_model`` is only called on a cache miss. The cache holds the
+    quantized state dict; on a hit the architecture is built from the model's
+    config, quantized the same way and the cached weights loaded into it
+    (``torch.load`` with ``weights_only=True``, so no code is unpickled). The
+    cache is rebuilt when the source weights or the torch/transformers
+    versions change, since the packed int8 layout is tied to both.
+    """
+    import torch
+
+    if mode not in SUPPORTED_MODES:
+        raise ValueError(f"Unsupported quantization mode: {mode}")
+
+    cache_path = quantized_cache_path(model_dir, mode)
+    meta_path = cache_path.with_suffix(".json")
+    fingerprint = source_fingerprint(model_dir)
+
+    if cache_path.exists() and meta_path.exists():
+        try:
+            if json.loads(meta_path.read_text()) == fingerprint:
+                state_dict = torch.load(str(cache_path), weights_only=True)
+                model = quantize_dynamic_int8(_empty_float_model(model_dir))
+                model.load_state_dict(state_dict)
+                model.eval()
+                logger.info(f"Loaded {mode} model from {cache_path}")
+                return model
+            logger.info(f"Quantized cache at {cache_path} is stale - rebuilding")
+        except Exception as e:
+            logger.warning(f"Could not load quantized cache {cache_path}: {str(e)}")
+
+    model = quantize_dynamic_int8(load_float_model())
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        torch.save(model.state_dict(), str(cache_path))
+        meta_path.write_text(json.dumps(fingerprint))
+        logger.info(f"Cached {mode} model at {cache_path}")
+    except Exception as e:
+        logger.warning(f"Could not cache quantized model at {cache_path}: {str(e)}")
+    return model
+
+
+def quantization_mode(model_info: Dict[str, Any]) -> Optional[str]:
+    """Get the configured quantization mode for a model, if it applies."""
+    mode = model_info.get("quantization")
+    if not mode or mode == "none":
+        return None
+    if mode not in SUPPORTED_MODES:
+        logger.warning(f"Ignoring unsupported quantization mode: {mode}")
+        return None
+    if model_info.get("model_type") not in QUANTIZABLE_MODEL_TYPES:
+        logger.warning(
+            f"Quantization is only supported for {QUANTIZABLE_MODEL_TYPES} models, "
+            f"not {model_info.get('model_type')}"
+        )
+        return None
+    return mode
@@ -0,0 +1,123 @@
+"""
+Compare float32 and dynamic int8 inference for cached seq2seq models.
+Reports BLEU against the test_data_sample references, BLEU drift between
+the two modes, latency and weight memory.
+
+Usage:
+    python -m core.translation.quantization_report \\
+        lachkarsalim/LatinDarija_English-v2 --limit 200 \\
+        --output reports/quantization_report.json
+"""
+
+import argparse
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from core.utils.latency import latency_summary
+
+from .evaluation import corpus_bleu, make_translator, timed_map
+from .model_pool import model_resident_bytes
+from .parallel_corpus import DEFAULT_DATA_DIR, load_parallel_corpus
+from .quantization import load_quantized_model
+
+logger = logging.getLogger(__name__)
+
+
+def compare_quantization(
+    model_dir: Path,
+    pairs: Sequence[Tuple[str, str]],
+    generation_kwargs: Optional[Dict[str, Any]] = None,
+    load_float_model: Optional[Any] = None,
+    tokenizer: Optional[Any] = None
+) -> Dict[str, Any]:
+    """
+    Translate ``pairs`` sources with the float32 and int8 models of
+    ``model_dir`` and summarize quality, latency and memory.
+    """
+    if load_float_model is None or tokenizer is None:
+        import torch
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+
+        if load_float_model is None:
+            def load_float_model():
+                return AutoModelForSeq2SeqLM.from_pretrained(
+                    str(model_dir), torch_dtype=torch.float32, low_cpu_mem_usage=True
+                ).eval()
+        if tokenizer is None:
+            tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+
+    generation_kwargs = generation_kwargs or {"max_length": 512, "num_beams": 4}
+    sources = [source for source, _ in pairs]
+    references = [target for _, target in pairs]
+
+    float_model = load_float_model()
+    int8_model = load_quantized_model(model_dir, load_float_model)
+
+    results: Dict[str, Any] = {"sentences": len(pairs)}
+    outputs: Dict[str, List[str]] = {}
+    for name, model in (("float32", float_model), ("int8", int8_model)):
+        translations, latencies = timed_map(make_translator(model, tokenizer, generation_kwargs), sources)
+        outputs[name] = translations
+        results[name] = {
+            "bleu": corpus_bleu(translations, references),
+            "weight_bytes": model_resident_bytes(model),
+            **latency_summary(latencies)
+        }
+
+    float_stats = results["float32"]
+    int8_stats = results["int8"]
+    results["bleu_drift"] = int8_stats["bleu"] - float_stats["bleu"]
+    results["bleu_int8_vs_float32"] = corpus_bleu(outputs["int8"], outputs["float32"])
+    results["identical_outputs"] = sum(a == b for a, b in zip(outputs["int8"], outputs["float32"]))
+    results["latency_speedup"] = (
+        float_stats["mean_ms"] / int8_stats["mean_ms"] if int8_stats["mean_ms"] else 0.0
+    )
+    results["memory_saving"] = (
+        1.0 - int8_stats["weight_bytes"] / float_stats["weight_bytes"]
+        if float_stats["weight_bytes"] else 0.0
+    )
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("models", nargs="+", help="Model names cached under --cache-dir")
+    parser.add_argument("--cache-dir", default="model_cache")
+    parser.add_argument("--data-dir", default=str(DEFAULT_DATA_DIR))
+    parser.add_argument("--source", default="darija", help="Source column type from column_mapping.yaml")
+    parser.add_argument("--target", default="english", help="Target column type from column_mapping.yaml")
+    parser.add_argument("--limit", type=int, default=200)
+    parser.add_argument("--num-beams", type=int, default=4)
+    parser.add_argument("--output", default="reports/quantization_report.json")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    pairs = load_parallel_corpus(args.data_dir, args.source, args.target, limit=args.limit)
+    logger.info(f"Loaded {len(pairs)} {args.source}->{args.target} sentence pairs")
+
+    report: Dict[str, Any] = {"data_dir": args.data_dir, "models": {}}
+    for model_name in args.models:
+        model_dir = Path(args.cache_dir) / model_name.replace("/", "_")
+        if not model_dir.exists():
+            logger.error(f"Model {model_name} is not cached at {model_dir}")
+            continue
+        result = compare_quantization(
+            model_dir, pairs, {"max_length": 512, "num_beams": args.num_beams}
+        )
+        report["models"][model_name] = result
+        logger.info(
+            f"{model_name}: BLEU {result['float32']['bleu']:.2f} -> {result['int8']['bleu']:.2f} "
+            f"(drift {result['bleu_drift']:+.2f}), {result['latency_speedup']:.2f}x faster, "
+            f"{result['memory_saving']:.0%} less weight memory"
+        )
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2, ensure_ascii=False))
+    logger.info(f"Report written to {output}")
+
+
+if __name__ == "__main__":
+    main()
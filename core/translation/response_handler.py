@@ -11,7 +11,12 @@ import requests
 logger = logging.getLogger(__name__)
 
 class ResponseHandler:
-    def __init__(self):
+    def __init__(self, health_monitor: Optional[Any] = None, attempt_log: Optional[Any] = None):
+        # Receives every logged attempt (see ModelHealthMonitor.record)
+        self.health_monitor = health_monitor
+        # Asynchronous, sampled destination for attempt records (see StructuredLog)
+        self.attempt_log = attempt_log
+        
         # Known response formats for different model types
         self.response_formats = {
             "marian": {
@@ -110,20 +115,36 @@ class ResponseHandler:
         model: str,
         source_text: str,
         translation: Optional[str],
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        latency: Optional[float] = None
     ):
         """
         Log translation attempt with detailed information.
+        ``latency`` is the attempt's duration in seconds, when known.
+        
+        With an ``attempt_log`` the record is queued as one compact JSON line
+        (successes may be sampled, failures are always kept); otherwise it
+        goes to this module's logger as a single line.
         """
+        health_monitor = getattr(self, "health_monitor", None)
+        if health_monitor is not None:
+            health_monitor.record(model, success, latency)
+            
         log_data = {
             "success": success,
             "model": model,
             "source_text": source_text[:100],  # Limit text length in logs
             "translation": translation[:100] if translation else None,
-            "error": error
+            "error": error,
+            "latency_ms": round(latency * 1000.0, 2) if latency is not None else None
         }
         
-        if success:
-            logger.info(f"Translation successful: {json.dumps(log_data, indent=2)}")
+        attempt_log = getattr(self, "attempt_log", None)
+        if attempt_log is not None:
+            attempt_log.log(
+                "translation_attempt", logging.INFO if success else logging.ERROR, **log_data
+            )
+        elif success:
+            logger.info(f"Translation successful: {json.dumps(log_data, ensure_ascii=False)}")
         else:
-            logger.error(f"Translation failed: {json.dumps(log_data, indent=2)}")
+            logger.error(f"Translation failed: {json.dumps(log_data, ensure_ascii=False)}")
@@ -0,0 +1,119 @@
+"""
+Sentence segmentation for long-document translation.
+Splits text into sentence spans using Arabic-script and Latin punctuation,
+leaving every whitespace run between spans untouched so translated
+sentences can be put back into the original layout.
+"""
+
+import re
+from typing import List, Sequence, Tuple
+
+# (start, end) character offsets of a segment in the source text
+Span = Tuple[int, int]
+
+# Sentence terminators: Latin . ! ? and ellipsis, Arabic question mark
+# and Urdu/Persian full stop (both appear in Arabic-script Darija)
+_BOUNDARY = re.compile(r"[.!?…؟۔]+[\"'”’»)\]}›]*(?=\s|$)")
+
+# Clause punctuation used to split sentences that exceed the word limit:
+# Latin , ; : and Arabic comma and semicolon
+_CLAUSE_MARKS = ",;:،؛"
+
+# Words after which a single "." does not end the sentence
+ABBREVIATIONS = frozenset({
+    "mr", "mrs", "ms", "dr", "prof", "st", "vs", "etc", "e.g", "i.e", "no",
+    "jr", "sr", "inc", "ltd", "co", "mme", "mlle", "av", "bd"
+})
+
+_WORD = re.compile(r"\S+")
+_LETTER = re.compile(r"[^\W\d_]")
+
+
+def _is_abbreviation(text: str, boundary_start: int, boundary: str) -> bool:
+    """Whether a "." boundary closes an abbreviation or initial rather than a sentence."""
+    if boundary.rstrip("\"'”’»)]}›") != ".":
+        return False
+    match = re.search(r"(\S+)$", text[:boundary_start])
+    if match is None:
+        return False
+    word = match.group(1).lstrip("(\"'“‘«")
+    if len(word) == 1 and word.isalpha() and word.isupper():
+        return True
+    return word.lower() in ABBREVIATIONS
+
+
+def _strip_span(text: str, start: int, end: int) -> Span:
+    """Shrink a span so that it neither starts nor ends with whitespace."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _split_long(text: str, span: Span, max_words: int) -> List[Span]:
+    """Split a span of more than ``max_words`` words, preferring clause punctuation."""
+    offset = span[0]
+    words = [(offset + m.start(), offset + m.end()) for m in _WORD.finditer(text[span[0]:span[1]])]
+    if len(words) <= max_words:
+        return [span]
+
+    spans = []
+    first = 0
+    while len(words) - first > max_words:
+        cut = max_words
+        for count in range(max_words, max_words // 2, -1):
+            if text[words[first + count - 1][1] - 1] in _CLAUSE_MARKS:
+                cut = count
+                break
+        spans.append((words[first][0], words[first + cut - 1][1]))
+        first += cut
+    spans.append((words[first][0], words[-1][1]))
+    return spans
+
+
+def split_sentences(text: str, max_words: int = 200) -> List[Span]:
+    """
+    Split text into sentence spans.
+
+    Line breaks always end a segment, so paragraphs and chat-style lines stay
+    separate. Within a line a sentence ends at terminal punctuation followed
+    by whitespace; decimals, URLs and common abbreviations are not split,
+    and no capital letter is required after the break since Latin-script
+    Darija is usually written in lower case. Sentences longer than
+    ``max_words`` words are split further at clause punctuation.
+    """
+    spans: List[Span] = []
+    for line in re.finditer(r"[^\n]+", text):
+        line_text = line.group(0)
+        start = 0
+        for boundary in _BOUNDARY.finditer(line_text):
+            if _is_abbreviation(line_text, boundary.start(), boundary.group(0)):
+                continue
+            spans.append((line.start() + start, line.start() + boundary.end()))
+            start = boundary.end()
+        spans.append((line.start() + start, line.end()))
+
+    result = []
+    for span in spans:
+        span = _strip_span(text, *span)
+        if span[0] < span[1]:
+            result.extend(_split_long(text, span, max_words))
+    return result
+
+
+def needs_translation(segment: str) -> bool:
+    """Segments without any letters (numbers, bullets, punctuation) are copied as is."""
+    return _LETTER.search(segment) is not None
+
+
+def reassemble(text: str, spans: Sequence[Span], translations: Sequence[str]) -> str:
+    """Replace each span of ``text`` with its translation, keeping the text between spans."""
+    parts = []
+    position = 0
+    for (start, end), translation in zip(spans, translations):
+        parts.append(text[position:start])
+        parts.append(translation)
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
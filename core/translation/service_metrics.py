@@ -0,0 +1,199 @@
+"""
+Prometheus metrics of the TranslationService.
+Requests are counted per model, path (cache, memory, coalesced, local,
+api, fallback) and outcome as they finish, and result cache lookups as
+they happen; cache size, queue, model pool, circuit breaker and memory
+figures are read from the service's own stats at scrape time.
+"""
+
+import logging
+import weakref
+from typing import Any, Dict, Optional, Sequence
+
+from core.utils.metrics import MetricsRegistry, get_metrics_registry
+from .circuit_breaker import CLOSED, HALF_OPEN, OPEN
+
+logger = logging.getLogger(__name__)
+
+# Request paths
+CACHE = "cache"
+LOCAL = "local"
+API = "api"
+FALLBACK = "fallback"
+COALESCED = "coalesced"
+MEMORY = "memory"
+
+# Model load times run from seconds (small Marian) to minutes (large NLLB)
+_LOAD_BUCKETS = (0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+# Gauge value per circuit breaker state
+_BREAKER_STATES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class ServiceMetrics:
+    """Metric families of one service, registered on a shared registry."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or get_metrics_registry()
+        r = self.registry
+        self.requests = r.counter(
+            "translation_requests_total",
+            "Translation requests by requested model, path and outcome",
+            ("model", "path", "outcome")
+        )
+        self.request_seconds = r.histogram(
+            "translation_request_duration_seconds",
+            "End-to-end latency of single translate requests",
+            ("model", "path")
+        )
+        self.fallbacks = r.counter(
+            "translation_fallbacks_total",
+            "Requests served by another model than the one requested",
+            ("requested_model", "served_model")
+        )
+        self.model_load_seconds = r.histogram(
+            "translation_model_load_duration_seconds",
+            "Time to load a local model from the cache directory",
+            ("model",),
+            buckets=_LOAD_BUCKETS
+        )
+        self.model_load_failures = r.counter(
+            "translation_model_load_failures_total", "Local model loads that raised", ("model",)
+        )
+        self.cache_hits = r.counter("translation_cache_hits_total", "Result cache hits (memory and disk)")
+        self.cache_misses = r.counter("translation_cache_misses_total", "Result cache misses")
+        self.cache_entries = r.gauge("translation_cache_entries", "Entries in each result cache tier", ("tier",))
+        self.queue_depth = r.gauge(
+            "translation_queue_depth", "Requests waiting for a micro-batch", ("model", "profile")
+        )
+        self.in_flight = r.gauge("translation_requests_in_flight", "Translations currently running")
+        self.worker_in_flight = r.gauge(
+            "translation_worker_in_flight", "Requests dispatched to each model worker", ("worker",)
+        )
+        self.model_resident_bytes = r.gauge(
+            "translation_model_resident_bytes", "Weight memory of each loaded local model", ("model",)
+        )
+        self.pool_resident_bytes = r.gauge(
+            "translation_model_pool_resident_bytes", "Weight memory of all loaded local models"
+        )
+        self.pool_budget_bytes = r.gauge(
+            "translation_model_pool_budget_bytes", "Memory budget of the local model pool (0 means none)"
+        )
+        self.breaker_state = r.gauge(
+            "translation_circuit_breaker_state", "Circuit breaker per model: 0 closed, 1 half open, 2 open",
+            ("model",)
+        )
+        self.process_resident_bytes = r.gauge(
+            "process_resident_memory_bytes", "Resident memory of the service process"
+        )
+
+    def record_request(
+        self,
+        requested_model: str,
+        served_model: str,
+        local: bool,
+        outcome: str,
+        seconds: Optional[float] = None
+    ):
+        """Count one finished request and, for single requests, its latency."""
+        path = self._path(requested_model, served_model, local)
+        self.requests.inc(model=requested_model, path=path, outcome=outcome)
+        if seconds is not None:
+            self.request_seconds.observe(seconds, model=requested_model, path=path)
+
+    def record_results(
+        self,
+        requested_model: str,
+        served_model: str,
+        local: bool,
+        results: Sequence[Optional[str]]
+    ):
+        """Count the items of a batch by outcome."""
+        path = self._path(requested_model, served_model, local, len(results))
+        succeeded = sum(result is not None for result in results)
+        if succeeded:
+            self.requests.inc(succeeded, model=requested_model, path=path, outcome="success")
+        if len(results) > succeeded:
+            self.requests.inc(len(results) - succeeded, model=requested_model, path=path, outcome="failure")
+
+    def record_cache_hits(self, model: str, count: int = 1, seconds: Optional[float] = None):
+        """Count requests answered from the result cache."""
+        self.cache_hits.inc(count)
+        self.requests.inc(count, model=model, path=CACHE, outcome="success")
+        if seconds is not None:
+            self.request_seconds.observe(seconds, model=model, path=CACHE)
+
+    def record_cache_misses(self, count: int = 1):
+        """Count result cache lookups that found nothing."""
+        self.cache_misses.inc(count)
+
+    def record_memory_hit(self, model: str, seconds: Optional[float] = None):
+        """Count a request answered from the translation memory."""
+        self.requests.inc(model=model, path=MEMORY, outcome="success")
+        if seconds is not None:
+            self.request_seconds.observe(seconds, model=model, path=MEMORY)
+
+    def record_coalesced(self, model: str, outcome: str, seconds: Optional[float] = None):
+        """Count a request that shared the result of an identical in-flight request."""
+        self.requests.inc(model=model, path=COALESCED, outcome=outcome)
+        if seconds is not None:
+            self.request_seconds.observe(seconds, model=model, path=COALESCED)
+
+    def _path(self, requested_model: str, served_model: str, local: bool, count: int = 1) -> str:
+        if served_model != requested_model:
+            self.fallbacks.inc(count, requested_model=requested_model, served_model=served_model)
+            return FALLBACK
+        return LOCAL if local else API
+
+    def record_model_load(self, model: str, seconds: Optional[float]):
+        """Record a model load; None marks a failed load."""
+        if seconds is None:
+            self.model_load_failures.inc(model=model)
+        else:
+            self.model_load_seconds.observe(seconds, model=model)
+
+    def attach(self, service: Any):
+        """Refresh the scrape-time gauges from ``service`` (held weakly) on every export."""
+        ref = weakref.ref(service)
+
+        def collect():
+            target = ref()
+            if target is not None:
+                self.collect(target)
+
+        self.registry.register_collector("translation_service", collect)
+
+    def collect(self, service: Any):
+        """Set the scrape-time gauges from the service's stats."""
+        cache_stats = service.get_cache_stats()
+        if cache_stats:
+            self.cache_entries.set(cache_stats.get("memory_entries", 0), tier="memory")
+            if "disk_entries" in cache_stats:
+                self.cache_entries.set(cache_stats["disk_entries"], tier="disk")
+
+        self.queue_depth.clear()
+        for queue in service.get_batching_stats().values():
+            self.queue_depth.set(queue["queue_depth"], model=queue["model"], profile=queue["profile"] or "")
+        self.in_flight.set(service._get_generation_profiles().in_flight)
+
+        self.worker_in_flight.clear()
+        for worker_id, worker in service.get_worker_pool_stats().get("workers", {}).items():
+            self.worker_in_flight.set(worker["in_flight"], worker=worker_id)
+
+        pool_stats: Dict[str, Any] = service.get_model_pool_stats()
+        self.model_resident_bytes.clear()
+        if pool_stats:
+            for model, entry in pool_stats["loaded"].items():
+                self.model_resident_bytes.set(entry["bytes"], model=model)
+            self.pool_resident_bytes.set(pool_stats["resident_bytes"])
+            self.pool_budget_bytes.set(pool_stats["memory_budget_bytes"] or 0)
+
+        self.breaker_state.clear()
+        for model, health in service.get_model_health_stats().items():
+            self.breaker_state.set(_BREAKER_STATES.get(health["state"], 0), model=model)
+
+        try:
+            import psutil
+            self.process_resident_bytes.set(psutil.Process().memory_info().rss)
+        except Exception as e:
+            logger.debug(f"Process memory not available: {str(e)}")
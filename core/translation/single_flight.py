@@ -0,0 +1,106 @@
+"""
+Single-flight coalescing of identical in-flight requests.
+The first caller for a key runs the computation; callers arriving with
+the same key while it runs wait for it and share its result (or its
+exception) instead of repeating the work. Nothing is remembered once
+the computation finishes; repeated requests later on are the result
+cache's job.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key.
+
+    ``do(key, fn, label)`` returns ``(result, leader)`` where ``leader``
+    says whether this call ran ``fn`` itself. ``label`` (e.g. the model
+    name) only groups the counters reported by ``get_stats``.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self._stats = {"leaders": 0, "coalesced": 0, "max_followers": 0}
+        self._labels: Dict[str, Dict[str, int]] = {}
+
+    def do(self, key: str, fn: Callable[[], Any], label: Optional[str] = None) -> Tuple[Any, bool]:
+        flight, leader = self.join(key, label)
+        if not leader:
+            return self.wait(flight), False
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self.finish(key, flight, error=e)
+            raise
+        self.finish(key, flight, result)
+        if flight.followers:
+            logger.info(f"Shared one computation with {flight.followers} identical requests ({label})")
+        return result, True
+
+    def join(self, key: str, label: Optional[str] = None) -> Tuple[_Flight, bool]:
+        """
+        Join the flight for ``key``, starting one if none is running.
+        A leader must ``finish`` the flight; a follower ``wait``s for it.
+        For callers such as streams that cannot wrap their work in ``do``.
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.followers += 1
+                self._stats["max_followers"] = max(self._stats["max_followers"], flight.followers)
+            self._stats["leaders" if leader else "coalesced"] += 1
+            counts = self._labels.setdefault(label or "unknown", {"leaders": 0, "coalesced": 0})
+            counts["leaders" if leader else "coalesced"] += 1
+        return flight, leader
+
+    @staticmethod
+    def wait(flight: _Flight) -> Any:
+        """Wait for a joined flight and return its result (or raise its exception)."""
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    def finish(self, key: str, flight: _Flight, result: Any = None, error: Optional[BaseException] = None):
+        """Publish the leader's result (or exception) to the flight's followers."""
+        flight.result = result
+        flight.error = error
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.done.set()
+
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being computed."""
+        with self._lock:
+            return len(self._flights)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get leader and coalesced call counts, overall and per label."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["in_flight"] = len(self._flights)
+            stats["models"] = {label: dict(counts) for label, counts in self._labels.items()}
+        calls = stats["leaders"] + stats["coalesced"]
+        stats["coalesced_ratio"] = stats["coalesced"] / calls if calls else 0.0
+        return stats
@@ -0,0 +1,120 @@
+"""
+Per-stage latency spans for translation requests.
+Each request is split into named stages (cache lookup, model resolution,
+tokenization, generate, HTTP round trip, ...) whose durations are kept
+per model and stage, so a slow translation can be attributed to the part
+that was slow. Recording is a lock and a deque append; it is cheap enough
+to stay enabled in production.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from core.utils.latency import latency_summary
+
+
+class _Span:
+    """Times one stage and records it on exit, including when the stage raises."""
+
+    __slots__ = ("_timings", "_model", "_stage", "_start")
+
+    def __init__(self, timings: "StageTimings", model: str, stage: str):
+        self._timings = timings
+        self._model = model
+        self._stage = stage
+        self._start = 0.0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._timings.record(self._model, self._stage, time.perf_counter() - self._start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _StageStats:
+    def __init__(self, max_samples: int):
+        self.count = 0
+        self.total = 0.0
+        self.latencies: Deque[float] = deque(maxlen=max_samples)
+
+
+class StageTimings:
+    """
+    Latency histograms per model and stage.
+
+    ``span(model, stage)`` is a context manager timing a block; ``record``
+    adds a duration measured elsewhere. The last ``max_samples`` durations
+    of each stage are kept for p50/p95/p99; counts and totals cover every
+    span. When disabled, spans are a shared no-op.
+    """
+
+    def __init__(self, max_samples: int = 1000, enabled: bool = True):
+        self.max_samples = max_samples
+        self.enabled = enabled
+        self._stages: Dict[Tuple[str, str], _StageStats] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "StageTimings":
+        """Build from the ``stage_timing`` section of the model config."""
+        return cls(
+            max_samples=config.get("max_samples", 1000),
+            enabled=config.get("enabled", True)
+        )
+
+    def span(self, model: Optional[str], stage: str) -> Any:
+        """Context manager recording the time spent in ``stage`` for ``model``."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, model or "unknown", stage)
+
+    def record(self, model: str, stage: str, seconds: float):
+        """Add one duration for a model and stage."""
+        if not self.enabled:
+            return
+        key = (model, stage)
+        with self._lock:
+            stats = self._stages.get(key)
+            if stats is None:
+                stats = self._stages[key] = _StageStats(self.max_samples)
+            stats.count += 1
+            stats.total += seconds
+            stats.latencies.append(seconds)
+
+    def get_stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get count, total and latency percentiles (ms) per model and stage."""
+        with self._lock:
+            snapshot = [
+                (model, stage, stats.count, stats.total, list(stats.latencies))
+                for (model, stage), stats in self._stages.items()
+            ]
+        report: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for model, stage, count, total, latencies in snapshot:
+            report.setdefault(model, {})[stage] = {
+                "count": count,
+                "total_ms": total * 1000.0,
+                **latency_summary(latencies)
+            }
+        return report
+
+    def reset(self):
+        """Drop everything recorded so far."""
+        with self._lock:
+            self._stages.clear()
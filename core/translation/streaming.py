@@ -0,0 +1,154 @@
+"""
+Token streaming for local translation.
+A streamer handed to ``generate`` receives token ids as they are produced
+and turns them into text chunks that the caller iterates over, while
+timing the first token and the decode rate of every stream.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, Optional
+
+from core.utils.latency import latency_summary, percentile
+
+_END = object()
+
+# Beam-search settings that do not apply when streaming greedily
+_BEAM_ONLY_PARAMS = ("num_beams", "num_beam_groups", "length_penalty", "early_stopping")
+
+
+def streaming_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn a generation profile into greedy settings ``generate`` can stream."""
+    streamable = {name: value for name, value in params.items() if name not in _BEAM_ONLY_PARAMS}
+    streamable["num_beams"] = 1
+    return streamable
+
+
+class TokenStreamer:
+    """
+    Streamer for ``generate`` (the transformers ``put``/``end`` protocol).
+
+    The decoder start token passed to the first ``put`` is skipped. Decoded
+    text is released up to the last space, since the word being generated
+    may still change as more sub-word pieces arrive; the rest is released
+    by ``end``. Iterating yields text chunks until generation finishes and
+    re-raises an error reported through ``fail``.
+    """
+
+    def __init__(self, tokenizer: Any, timeout: Optional[float] = None):
+        self.tokenizer = tokenizer
+        self.timeout = timeout
+        self.text = ""
+        self.tokens = 0
+        self.started_at = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._token_ids = []
+        self._skip_prompt = True
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+
+    def put(self, value: Any):
+        if self._skip_prompt:
+            self._skip_prompt = False
+            return
+        token_ids = value.reshape(-1).tolist()
+        if not token_ids:
+            return
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.tokens += len(token_ids)
+        self._token_ids.extend(token_ids)
+        decoded = self._decode()
+        self._release(decoded[:decoded.rfind(" ") + 1])
+
+    def end(self):
+        self._release(self._decode())
+        self.finished_at = time.perf_counter()
+        self._queue.put(_END)
+
+    def fail(self, error: BaseException):
+        """Stop iteration with ``error`` when generation raises."""
+        self.finished_at = time.perf_counter()
+        self._queue.put(error)
+
+    def __iter__(self) -> Iterator[str]:
+        while True:
+            item = self._queue.get(timeout=self.timeout)
+            if item is _END:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def tokens_per_second(self) -> float:
+        """Generated tokens per second over the whole stream."""
+        if self.finished_at is None or self.finished_at <= self.started_at:
+            return 0.0
+        return self.tokens / (self.finished_at - self.started_at)
+
+    def _decode(self) -> str:
+        return self.tokenizer.decode(
+            self._token_ids, skip_special_tokens=True, clean_up_tokenization_spaces=True
+        )
+
+    def _release(self, text: str):
+        """Queue the part of ``text`` not yet released, if it extends what was."""
+        if len(text) > len(self.text) and text.startswith(self.text):
+            self._queue.put(text[len(self.text):])
+            self.text = text
+
+
+class _ModelStreamStats:
+    def __init__(self, max_samples: int):
+        self.streams = 0
+        self.tokens = 0
+        self.ttft: Deque[float] = deque(maxlen=max_samples)
+        self.rates: Deque[float] = deque(maxlen=max_samples)
+
+
+class StreamingStats:
+    """Time-to-first-token and tokens/sec per model for streamed translations."""
+
+    def __init__(self, max_samples: int = 1000):
+        self._max_samples = max_samples
+        self._models: Dict[str, _ModelStreamStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, model: str, streamer: TokenStreamer):
+        with self._lock:
+            stats = self._models.get(model)
+            if stats is None:
+                stats = self._models[model] = _ModelStreamStats(self._max_samples)
+            stats.streams += 1
+            stats.tokens += streamer.tokens
+            if streamer.time_to_first_token is not None:
+                stats.ttft.append(streamer.time_to_first_token)
+            stats.rates.append(streamer.tokens_per_second)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            snapshot = {
+                model: (stats.streams, stats.tokens, list(stats.ttft), list(stats.rates))
+                for model, stats in self._models.items()
+            }
+
+        result = {}
+        for model, (streams, tokens, ttft, rates) in snapshot.items():
+            ttft_summary = latency_summary(ttft)
+            result[model] = {
+                "streams": streams,
+                "tokens": tokens,
+                **{f"ttft_{name}": value for name, value in ttft_summary.items()},
+                "tokens_per_second_mean": sum(rates) / len(rates) if rates else 0.0,
+                "tokens_per_second_p50": percentile(rates, 0.50)
+            }
+        return result
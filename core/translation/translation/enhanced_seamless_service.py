@@ -1,6 +1,6 @@
 import logging
 import requests
-from typing import List, Optional
+from typing import Any, List, Optional
 import sys
 import os
 from pathlib import Path
@@ -11,6 +11,7 @@ sys.path.insert(0, str(project_root))
 
 from validation.translation_validator import TranslationValidator
 from core.translation.translation.seamless_darija_translation_service import SeamlessDarijaTranslationService
+from core.utils.http_session import get_http_client
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -18,8 +19,8 @@ logger = logging.getLogger(__name__)
 class EnhancedSeamlessService(SeamlessDarijaTranslationService):
     """Enhanced translation service with validation"""
     
-    def __init__(self):
-        super().__init__()
+    def __init__(self, translation_service: Optional[Any] = None):
+        super().__init__(translation_service)
         self.validator = TranslationValidator()
         
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
@@ -28,7 +29,7 @@ class EnhancedSeamlessService(SeamlessDarijaTranslationService):
             payload = self.validator.validate_request_params(text, source_lang, target_lang)
             
             logger.info(f"Sending validated request with payload: {payload}")
-            response = requests.post(self.api_url, headers=self.headers, json=payload, timeout=30)
+            response = get_http_client().post(self.api_url, headers=self.headers, json=payload, timeout=30)
             
             response.raise_for_status()
             result = response.json()
@@ -55,7 +56,8 @@ class EnhancedSeamlessService(SeamlessDarijaTranslationService):
         if not self.validator.validate_batch_inputs(texts, source_lang, target_lang):
             return ["Translation error: Invalid batch input"] * len(texts)
             
-        return [self.translate(text, source_lang, target_lang) for text in texts]
+        # Uses TranslationService.translate_batch when a service is attached
+        return super().batch_translate(texts, source_lang, target_lang)
 
 # Example usage
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ import importlib
 
 from core.translation.translation.seamless_darija_translation_service import SeamlessDarijaTranslationService
 from core.translation.translation.anas_aber_seamless_service import AnasAberSeamlessTranslationService
+from core.utils.http_session import get_http_client
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -70,7 +71,7 @@ class ExtendedTranslationService:
 
         payload = {"inputs": text}
         try:
-            response = requests.post(api_url, headers=self.headers, json=payload)
+            response = get_http_client().post(api_url, headers=self.headers, json=payload)
             response.raise_for_status()
             result = response.json()
             if isinstance(result, list) and len(result) > 0:
@@ -96,7 +97,21 @@ class ExtendedTranslationService:
             return f"Extended translation error: {str(e)}"
 
     def batch_translate(self, texts: list, source_lang: str, target_lang: str, model: str = "seamless") -> list:
-        return [self.translate(text, source_lang, target_lang, model) for text in texts]
+        service = self.services.get(model)
+        if not hasattr(service, "batch_translate"):
+            return [self.translate(text, source_lang, target_lang, model) for text in texts]
+        try:
+            translations = service.batch_translate(texts, source_lang, target_lang)
+        except Exception as e:
+            logger.error(f"Error in extended batch_translate method: {str(e)}")
+            return [f"Extended translation error: {str(e)}"] * len(texts)
+        results = []
+        for text, translation in zip(texts, translations):
+            if translation.startswith("Translation error") or translation.startswith("[Fallback]"):
+                logger.warning(f"Service translation failed for {model}, attempting API translation")
+                translation = self.translate_with_api(text, model)
+            results.append(translation)
+        return results
 
 # Example usage
 if __name__ == "__main__":
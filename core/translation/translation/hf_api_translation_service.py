@@ -7,6 +7,8 @@ import time
 from typing import Dict, Any, Optional
 import os
 
+from core.utils.http_session import get_http_client
+
 logger = logging.getLogger(__name__)
 
 class HFAPITranslationService:
@@ -119,7 +121,7 @@ class HFAPITranslationService:
             # Make API request with retries
             for attempt in range(self.max_retries):
                 try:
-                    response = requests.post(api_url, headers=self.headers, json=payload, timeout=30)
+                    response = get_http_client().post(api_url, headers=self.headers, json=payload, timeout=30)
                     
                     if response.status_code == 503:
                         logger.warning(f"Model {model_name} is loading (attempt {attempt + 1}/{self.max_retries})")
@@ -2,20 +2,21 @@ import logging
 import requests
 import sys
 import os
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
 
 # Add the project root to the Python path
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..'))
 sys.path.insert(0, project_root)
 
 from core.translation.translation.services import UnifiedTranslationService
+from core.utils.http_session import get_http_client
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 class SeamlessDarijaTranslationService(UnifiedTranslationService):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, translation_service: Optional[Any] = None):
+        super().__init__(translation_service)
         self.model_name = "AnasAber/seamless-darija-eng"
         self.api_url = f"https://api-inference.huggingface.co/models/{self.model_name}"
         self.language_codes = {
@@ -47,7 +48,7 @@ class SeamlessDarijaTranslationService(UnifiedTranslationService):
             }
 
             logger.info(f"Sending request to API with payload: {payload}")
-            response = requests.post(self.api_url, headers=self.headers, json=payload, timeout=30)
+            response = get_http_client().post(self.api_url, headers=self.headers, json=payload, timeout=30)
             
             logger.info(f"Response status code: {response.status_code}")
             logger.info(f"Response headers: {response.headers}")
@@ -76,7 +77,7 @@ class SeamlessDarijaTranslationService(UnifiedTranslationService):
             return f"Translation error: {str(e)}"
 
     def batch_translate(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
-        return [self.translate(text, source_lang, target_lang) for text in texts]
+        return super().batch_translate(texts, source_lang, target_lang)
 
 # Example usage
 if __name__ == "__main__":
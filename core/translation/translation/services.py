@@ -1,11 +1,35 @@
 """Base translation service implementations"""
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_core_service: Optional[Any] = None
+_core_service_failed = False
+_core_service_lock = threading.Lock()
+
+
+def get_core_translation_service() -> Optional[Any]:
+    """
+    Get the process-wide core TranslationService used for batched
+    translation, building it on first use. Returns None if it cannot be
+    built (e.g. missing credentials); the failure is not retried.
+    """
+    global _core_service, _core_service_failed
+    with _core_service_lock:
+        if _core_service is None and not _core_service_failed:
+            try:
+                from core.translation.translation_service import TranslationService
+                _core_service = TranslationService()
+            except Exception as e:
+                logger.warning(f"Core TranslationService unavailable, batches run item by item: {str(e)}")
+                _core_service_failed = True
+        return _core_service
+
+
 class BaseTranslationService(ABC):
     """Abstract base class for translation services"""
     
@@ -22,7 +46,10 @@ class BaseTranslationService(ABC):
 class UnifiedTranslationService(BaseTranslationService):
     """Base implementation of unified translation service"""
     
-    def __init__(self):
+    def __init__(self, translation_service: Optional[Any] = None):
+        # Core TranslationService used for batched translation; the
+        # process-wide one is used when none is given
+        self.translation_service = translation_service
         self.language_codes = {
             "english": "eng",
             "darija": "ary"
@@ -38,5 +65,27 @@ class UnifiedTranslationService(BaseTranslationService):
         raise NotImplementedError("Subclasses must implement translate method")
     
     def batch_translate(self, texts: List[str], source_lang: str, target_lang: str) -> List[str]:
-        """Default batch translation implementation"""
-        return [self.translate(text, source_lang, target_lang) for text in texts]
+        """
+        Default batch translation implementation.
+        
+        When the model is configured in the core TranslationService, the
+        whole list goes through its batched ``translate_batch`` path, which
+        already retries failed buckets item by item; items that still fail
+        come back as translation errors instead of being run again. Without
+        a core service or a model name, items are translated one by one.
+        """
+        model_name = getattr(self, "model_name", None)
+        service = self.translation_service or (get_core_translation_service() if model_name else None)
+        if service is None or model_name not in service.get_available_models():
+            return [self.translate(text, source_lang, target_lang) for text in texts]
+            
+        try:
+            results = service.translate_batch(texts, source_lang, target_lang, model_name)
+        except Exception as e:
+            logger.error(f"Batched translation failed, translating items one by one: {str(e)}")
+            return [self.translate(text, source_lang, target_lang) for text in texts]
+            
+        return [
+            result if result is not None else f"Translation error: batch item failed with {model_name}"
+            for result in results
+        ]
@@ -0,0 +1,338 @@
+"""
+Two-tier cache for translation results.
+An in-process LRU bounded by a byte budget sits in front of a persistent
+SQLite tier that survives restarts. Both tiers honour a TTL. Disk writes
+and access times are buffered and committed in batches off the request
+path.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for cache lookups (NFC, trimmed, single spaces)."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def make_cache_key(
+    model: str,
+    source_lang: str,
+    target_lang: str,
+    text: str,
+    generation_params: Optional[Dict[str, Any]] = None
+) -> str:
+    """Build a cache key from model, language pair, normalized text and generation settings."""
+    key_data = {
+        "model": model,
+        "source_lang": source_lang,
+        "target_lang": target_lang,
+        "text": normalize_text(text),
+        "generation_params": generation_params or {}
+    }
+    serialized = json.dumps(key_data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class TranslationCache:
+    """
+    LRU memory cache with a byte budget, backed by an optional SQLite disk tier.
+
+    Entries found only on disk are promoted into memory. Expired entries are
+    dropped on read; the disk tier is trimmed to ``disk_max_entries`` on flush.
+    Writes, deletions and disk read times are buffered and committed in one
+    transaction every ``flush_interval_seconds`` by a daemon thread, or as soon
+    as ``max_pending_writes`` writes are waiting. The memory tier has its own
+    lock, so memory hits never wait on SQLite.
+    """
+
+    def __init__(
+        self,
+        memory_max_bytes: int = 32 * 1024 * 1024,
+        disk_path: Optional[Union[str, Path]] = None,
+        disk_max_entries: int = 100000,
+        ttl_seconds: Optional[float] = None,
+        flush_interval_seconds: float = 1.0,
+        max_pending_writes: int = 256
+    ):
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_entries = disk_max_entries
+        self.ttl_seconds = ttl_seconds
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending_writes = max_pending_writes
+        self._memory: "OrderedDict[str, Tuple[str, Optional[float], int]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+            "expirations": 0
+        }
+
+        # Disk tier state, guarded by _disk_lock; never held together with _lock
+        self._disk_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk_entries = 0
+        self._pending_writes: Dict[str, Tuple[str, Optional[float], float]] = {}
+        self._pending_reads: Dict[str, float] = {}
+        self._pending_deletes: Set[str] = set()
+        self._flush_stop = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+        if disk_path is not None:
+            self._open_disk_tier(Path(disk_path))
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "TranslationCache":
+        """Create a cache from the ``result_cache`` section of the model config."""
+        return cls(
+            memory_max_bytes=config.get("memory_max_bytes", 32 * 1024 * 1024),
+            disk_path=config.get("disk_path"),
+            disk_max_entries=config.get("disk_max_entries", 100000),
+            ttl_seconds=config.get("ttl_seconds"),
+            flush_interval_seconds=config.get("flush_interval_seconds", 1.0),
+            max_pending_writes=config.get("max_pending_writes", 256)
+        )
+
+    def _open_disk_tier(self, disk_path: Path):
+        """Open (or create) the SQLite disk tier and start the flusher."""
+        try:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(disk_path), check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translations_accessed "
+                "ON translations (accessed_at)"
+            )
+            self._db.commit()
+            self._disk_entries = self._db.execute(
+                "SELECT COUNT(*) FROM translations"
+            ).fetchone()[0]
+            logger.info(
+                f"Translation cache disk tier opened at {disk_path} "
+                f"({self._disk_entries} entries)"
+            )
+        except Exception as e:
+            logger.warning(f"Could not open translation cache disk tier: {e}")
+            self._db = None
+            return
+
+        if self.flush_interval_seconds and self.flush_interval_seconds > 0:
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop,
+                name="translation-cache-flush",
+                daemon=True
+            )
+            self._flush_thread.start()
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a cached translation, or None on a miss."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at, size = entry
+                if expires_at is not None and expires_at <= now:
+                    self._remove_from_memory(key)
+                    self._stats["expirations"] += 1
+                else:
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return value
+
+        disk_entry = self._get_from_disk(key, now)
+        with self._lock:
+            if disk_entry is None:
+                self._stats["misses"] += 1
+                return None
+
+            value, expires_at = disk_entry
+            self._stats["disk_hits"] += 1
+            if key not in self._memory:
+                self._set_in_memory(key, value, expires_at)
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[float] = None):
+        """Store a translation in memory and queue it for the disk tier."""
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = time.time() + ttl if ttl else None
+        with self._lock:
+            self._stats["sets"] += 1
+            self._set_in_memory(key, value, expires_at)
+
+        with self._disk_lock:
+            if self._db is None:
+                return
+            self._pending_writes[key] = (value, expires_at, time.time())
+            self._pending_deletes.discard(key)
+            full = len(self._pending_writes) >= self.max_pending_writes
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Commit buffered writes, deletions and read times in one transaction."""
+        with self._disk_lock:
+            if self._db is None or not (self._pending_writes or self._pending_reads or self._pending_deletes):
+                return
+            writes, self._pending_writes = self._pending_writes, {}
+            reads, self._pending_reads = self._pending_reads, {}
+            deletes, self._pending_deletes = self._pending_deletes, set()
+            evicted = 0
+            try:
+                if deletes:
+                    self._db.executemany(
+                        "DELETE FROM translations WHERE key = ?", [(key,) for key in deletes]
+                    )
+                if writes:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO translations (key, value, expires_at, accessed_at) "
+                        "VALUES (?, ?, ?, ?)",
+                        [(key, value, expires_at, accessed_at) for key, (value, expires_at, accessed_at) in writes.items()]
+                    )
+                if reads:
+                    self._db.executemany(
+                        "UPDATE translations SET accessed_at = ? WHERE key = ?",
+                        [(accessed_at, key) for key, accessed_at in reads.items()]
+                    )
+                self._disk_entries = self._db.execute(
+                    "SELECT COUNT(*) FROM translations"
+                ).fetchone()[0]
+                overflow = self._disk_entries - self.disk_max_entries
+                if overflow > 0:
+                    self._db.execute(
+                        "DELETE FROM translations WHERE key IN ("
+                        "SELECT key FROM translations ORDER BY accessed_at ASC LIMIT ?)",
+                        (overflow,)
+                    )
+                    self._disk_entries -= overflow
+                    evicted = overflow
+                self._db.commit()
+            except Exception as e:
+                logger.warning(f"Error writing to translation cache disk tier: {e}")
+                try:
+                    self._db.rollback()
+                except Exception:
+                    pass
+        if evicted:
+            with self._lock:
+                self._stats["disk_evictions"] += evicted
+
+    def clear(self):
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        with self._disk_lock:
+            self._pending_writes.clear()
+            self._pending_reads.clear()
+            self._pending_deletes.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM translations")
+                    self._db.commit()
+                    self._disk_entries = 0
+                except Exception as e:
+                    logger.warning(f"Error clearing translation cache disk tier: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit, miss and eviction counters plus current tier sizes."""
+        self.flush()
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+            stats["memory_bytes"] = self._memory_bytes
+            lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+            stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        with self._disk_lock:
+            if self._db is not None:
+                stats["disk_entries"] = self._disk_entries
+        return stats
+
+    def close(self):
+        """Flush pending writes and close the disk tier."""
+        thread = self._flush_thread
+        if thread is not None:
+            self._flush_stop.set()
+            if thread is not threading.current_thread():
+                thread.join()
+            self._flush_thread = None
+        self.flush()
+        with self._disk_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _flush_loop(self):
+        """Flush the disk tier every ``flush_interval_seconds`` until closed."""
+        while not self._flush_stop.wait(self.flush_interval_seconds):
+            self.flush()
+
+    def _set_in_memory(self, key: str, value: str, expires_at: Optional[float]):
+        """Insert into the LRU, evicting least recently used entries over budget."""
+        size = len(key) + len(value.encode("utf-8"))
+        if size > self.memory_max_bytes:
+            return
+        if key in self._memory:
+            self._remove_from_memory(key)
+        self._memory[key] = (value, expires_at, size)
+        self._memory_bytes += size
+        while self._memory_bytes > self.memory_max_bytes:
+            evicted_key = next(iter(self._memory))
+            self._remove_from_memory(evicted_key)
+            self._stats["memory_evictions"] += 1
+
+    def _remove_from_memory(self, key: str):
+        """Drop a key from the memory tier."""
+        _, _, size = self._memory.pop(key)
+        self._memory_bytes -= size
+
+    def _get_from_disk(self, key: str, now: float) -> Optional[Tuple[str, Optional[float]]]:
+        """Read a non-expired entry from the disk tier, including queued writes."""
+        with self._disk_lock:
+            if self._db is None or key in self._pending_deletes:
+                return None
+            try:
+                pending = self._pending_writes.get(key)
+                if pending is not None:
+                    row = pending[:2]
+                else:
+                    row = self._db.execute(
+                        "SELECT value, expires_at FROM translations WHERE key = ?", (key,)
+                    ).fetchone()
+                if row is None:
+                    return None
+                value, expires_at = row
+                if expires_at is not None and expires_at <= now:
+                    self._pending_writes.pop(key, None)
+                    self._pending_reads.pop(key, None)
+                    self._pending_deletes.add(key)
+                    expired = True
+                else:
+                    self._pending_reads[key] = now
+                    expired = False
+            except Exception as e:
+                logger.warning(f"Error reading from translation cache disk tier: {e}")
+                return None
+        if expired:
+            with self._lock:
+                self._stats["expirations"] += 1
+            return None
+        return value, expires_at
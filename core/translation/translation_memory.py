@@ -0,0 +1,420 @@
+"""
+Translation memory built from the parallel Darija/English datasets.
+Normalized source sentences and their reference translations are stored
+in a compact SQLite index with character n-gram postings. An exact match
+is one indexed lookup; a near-exact match (opt-in, since it serves the
+translation of a different sentence) gathers candidates from the
+postings of the query's rarest n-grams and verifies them with a bounded
+edit distance. Exact lookups take tens of microseconds and near ones a
+few hundred, so the service checks the memory before running a model.
+
+Build the index with:
+
+    python -m core.translation.translation_memory --output cache/translation_memory.sqlite3
+    python -m core.translation.translation_memory --hub   # stream the HF datasets instead
+"""
+
+import argparse
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from collections import Counter, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from core.utils.latency import latency_summary
+from .parallel_corpus import DEFAULT_COLUMN_MAPPING, DEFAULT_DATA_DIR, iter_hub_pairs, iter_parallel_pairs, load_column_types
+from .translation_cache import normalize_text
+
+try:
+    from rapidfuzz.distance import Levenshtein as _Levenshtein
+except ImportError:
+    _Levenshtein = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = Path("cache/translation_memory.sqlite3")
+DEFAULT_DIRECTIONS = ("darija-english", "english-darija")
+INDEX_VERSION = "1"
+
+# Punctuation that does not change which reference translation applies
+_EDGE_PUNCTUATION = " .,!?;:…\"'«»()-–—،؟؛"
+
+# Postings of n-grams this rare are kept in memory with the vocabulary;
+# the rarest n-grams are the ones lookups read
+_INLINE_POSTINGS = 16
+
+# Pads n-grams at both ends so short words and sentence edges are indexed
+_START, _END = "\x02", "\x03"
+
+
+def normalize_source(text: str) -> str:
+    """Normalize a source sentence for memory lookups (cache normalization, casefolded, edge punctuation dropped)."""
+    return normalize_text(text).casefold().strip(_EDGE_PUNCTUATION)
+
+
+def _norm_key(norm: str) -> int:
+    """64-bit key of a normalized sentence; the index stores this instead of a copy of the text."""
+    return int.from_bytes(hashlib.blake2b(norm.encode("utf-8"), digest_size=8).digest(), "big", signed=True)
+
+
+def language_type(language: str) -> Optional[str]:
+    """Map a service language name (English, Darija, Latin Darija) to its column type."""
+    name = language.lower()
+    if "darija" in name or name == "ary":
+        return "darija"
+    if name in ("english", "en"):
+        return "english"
+    return None
+
+
+def ngrams(text: str, size: int = 3) -> List[str]:
+    """Distinct padded character n-grams of a normalized string, in order of appearance."""
+    padded = _START * (size - 1) + text + _END * (size - 1)
+    return list(dict.fromkeys(padded[i:i + size] for i in range(len(padded) - size + 1)))
+
+
+def _same_numbers_and_words(a: str, b: str) -> bool:
+    """Check that two normalized sentences have the same digits and word count."""
+    return (
+        [c for c in a if c.isdigit()] == [c for c in b if c.isdigit()]
+        and len(a.split()) == len(b.split())
+    )
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Levenshtein distance between ``a`` and ``b``, or ``max_distance + 1``
+    as soon as it is certain to exceed ``max_distance``.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if _Levenshtein is not None:
+        return _Levenshtein.distance(a, b, score_cutoff=max_distance)
+    # A shared prefix and suffix never add edits; near-duplicates often differ in a few characters
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+    if len(a) > len(b):
+        a, b = b, a
+    over = max_distance + 1
+    # Only cells within max_distance of the diagonal can stay under the bound
+    previous = [j if j <= max_distance else over for j in range(len(b) + 1)]
+    for i, char in enumerate(a, 1):
+        current = [over] * (len(b) + 1)
+        current[0] = i if i <= max_distance else over
+        low = max(1, i - max_distance)
+        high = min(len(b), i + max_distance)
+        row_min = current[0]
+        for j in range(low, high + 1):
+            value = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char != b[j - 1])
+            )
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return over
+        previous = current
+    return min(previous[len(b)], over)
+
+
+@dataclass
+class MemoryMatch:
+    """A reference translation found in the memory."""
+    translation: str
+    source: str
+    score: float
+    exact: bool
+    dataset: str
+
+
+def build_index(
+    path: Union[str, Path],
+    pairs_by_direction: Dict[str, Iterable[Tuple[str, str, str]]],
+    ngram_size: int = 3,
+    max_indexed_length: int = 200
+) -> Dict[str, int]:
+    """
+    Write a translation memory index to ``path`` (replacing any existing one).
+
+    ``pairs_by_direction`` maps a direction such as ``darija-english`` to
+    ``(source, target, dataset)`` pairs. Sources that normalize to the same
+    string keep the translation the datasets agree on most. Only sources up
+    to ``max_indexed_length`` characters get n-gram postings; longer ones
+    are served by exact lookups only. Returns the entry count per direction.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+    db = sqlite3.connect(str(tmp_path))
+    db.executescript(
+        "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+        "CREATE TABLE entries (id INTEGER PRIMARY KEY, direction TEXT NOT NULL, key INTEGER NOT NULL, norm TEXT NOT NULL, "
+        "source TEXT NOT NULL, target TEXT NOT NULL, dataset TEXT NOT NULL, length INTEGER NOT NULL);"
+        "CREATE TABLE grams (id INTEGER PRIMARY KEY, direction TEXT NOT NULL, gram TEXT NOT NULL, "
+        "df INTEGER NOT NULL, ids BLOB NOT NULL);"
+    )
+
+    counts: Dict[str, int] = {}
+    next_id = 1
+    for direction, pairs in pairs_by_direction.items():
+        groups: Dict[str, Tuple[Counter, str, str]] = {}
+        for source, target, dataset in pairs:
+            norm = normalize_source(source)
+            if not norm or not target.strip():
+                continue
+            group = groups.get(norm)
+            if group is None:
+                group = groups[norm] = (Counter(), source, dataset)
+            group[0][target.strip()] += 1
+
+        postings: Dict[str, array] = {}
+        rows = []
+        for norm in sorted(groups):
+            targets, source, dataset = groups[norm]
+            rows.append((next_id, direction, _norm_key(norm), norm, source, targets.most_common(1)[0][0], dataset, len(norm)))
+            if len(norm) <= max_indexed_length:
+                for gram in ngrams(norm, ngram_size):
+                    postings.setdefault(gram, array("I")).append(next_id)
+            next_id += 1
+        db.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        db.executemany(
+            "INSERT INTO grams (direction, gram, df, ids) VALUES (?, ?, ?, ?)",
+            ((direction, gram, len(ids), ids.tobytes()) for gram, ids in postings.items())
+        )
+        counts[direction] = len(rows)
+        logger.info(f"Indexed {len(rows)} {direction} sentences ({len(postings)} n-grams)")
+
+    db.execute("CREATE INDEX idx_entries_key ON entries (key)")
+    db.executemany("INSERT INTO meta VALUES (?, ?)", [
+        ("version", INDEX_VERSION),
+        ("ngram_size", str(ngram_size)),
+        ("max_indexed_length", str(max_indexed_length)),
+        ("built_at", str(time.time()))
+    ])
+    db.commit()
+    db.execute("VACUUM")
+    db.close()
+    tmp_path.replace(path)
+    return counts
+
+
+class TranslationMemory:
+    """
+    Read-only lookups in a translation memory index.
+
+    ``lookup`` returns an exact match, or, when ``min_similarity`` is below
+    1.0, the closest entry whose edit distance similarity
+    (``1 - distance / longer length``) reaches it. The default of 1.0 only
+    serves exact matches. A near match must also have the same numbers and
+    the same number of words as the query, since a changed number or an
+    added negation gives the reference a different meaning. Sentences
+    shorter than ``min_fuzzy_length`` only match exactly; at most
+    ``max_candidates`` entries are verified per lookup. ``MemoryMatch``
+    reports whether a match is exact and its score.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_INDEX_PATH,
+        min_similarity: float = 1.0,
+        min_fuzzy_length: int = 12,
+        max_candidates: int = 32,
+        max_samples: int = 1000
+    ):
+        self.path = Path(path)
+        self.min_similarity = min_similarity
+        self.min_fuzzy_length = min_fuzzy_length
+        self.max_candidates = max_candidates
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=max_samples)
+        self._stats = {"lookups": 0, "exact_hits": 0, "fuzzy_hits": 0, "misses": 0}
+
+        self._db = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        meta = dict(self._db.execute("SELECT key, value FROM meta"))
+        if meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported translation memory index version: {meta.get('version')}")
+        self.ngram_size = int(meta["ngram_size"])
+        self.max_indexed_length = int(meta["max_indexed_length"])
+        # Entry lengths by id, for filtering candidates before reading them
+        self._lengths = array("I", [0])
+        self._lengths.extend(length for (length,) in self._db.execute("SELECT length FROM entries ORDER BY id"))
+        # The n-gram vocabulary stays in memory: document frequency and either
+        # the postings themselves (rare n-grams) or their row id on disk
+        self._grams: Dict[str, Dict[str, Tuple[int, Union[int, array]]]] = {}
+        for row_id, direction, gram, df, ids in self._db.execute(
+            "SELECT id, direction, gram, df, CASE WHEN df <= ? THEN ids END FROM grams", (_INLINE_POSTINGS,)
+        ):
+            if ids is not None:
+                postings = array("I")
+                postings.frombytes(ids)
+            self._grams.setdefault(direction, {})[gram] = (df, row_id if ids is None else postings)
+        self.entries = dict(self._db.execute("SELECT direction, COUNT(*) FROM entries GROUP BY direction"))
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "TranslationMemory":
+        """Open the index named in the ``translation_memory`` section of the model config."""
+        return cls(
+            path=config.get("path", DEFAULT_INDEX_PATH),
+            min_similarity=config.get("min_similarity", 1.0),
+            min_fuzzy_length=config.get("min_fuzzy_length", 12),
+            max_candidates=config.get("max_candidates", 32)
+        )
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def lookup(self, text: str, source_lang: str, target_lang: str) -> Optional[MemoryMatch]:
+        """Find a reference translation of ``text``, or None."""
+        start = time.perf_counter()
+        source_type, target_type = language_type(source_lang or ""), language_type(target_lang or "")
+        norm = normalize_source(text or "")
+        match = None
+        if norm and source_type and target_type:
+            direction = f"{source_type}-{target_type}"
+            with self._lock:
+                match = self._lookup_exact(direction, norm)
+                if match is None and self.min_similarity < 1.0 and self.min_fuzzy_length <= len(norm) <= self.max_indexed_length:
+                    match = self._lookup_near(direction, norm)
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self._stats["lookups"] += 1
+            if match is None:
+                self._stats["misses"] += 1
+            else:
+                self._stats["exact_hits" if match.exact else "fuzzy_hits"] += 1
+            self._latencies.append(elapsed)
+        return match
+
+    def _lookup_exact(self, direction: str, norm: str) -> Optional[MemoryMatch]:
+        row = self._db.execute(
+            "SELECT source, target, dataset FROM entries WHERE key = ? AND direction = ? AND norm = ?",
+            (_norm_key(norm), direction, norm)
+        ).fetchone()
+        if row is None:
+            return None
+        return MemoryMatch(row[1], row[0], 1.0, True, row[2])
+
+    def _lookup_near(self, direction: str, norm: str) -> Optional[MemoryMatch]:
+        # Longest edit distance that can still reach min_similarity
+        max_edits = int((1.0 - self.min_similarity) * len(norm) / self.min_similarity + 1e-9)
+        if max_edits == 0:
+            return None
+
+        # Each edit destroys at most ngram_size n-grams, so any entry within
+        # max_edits shares one of the query's ngram_size * max_edits + 1
+        # rarest n-grams (prefix filtering)
+        vocabulary = self._grams.get(direction, {})
+        grams = ngrams(norm, self.ngram_size)
+        known = sorted((vocabulary[gram] for gram in grams if gram in vocabulary), key=lambda entry: entry[0])
+        # N-grams missing from the index are the rarest of all but match nothing
+        prefix = known[:max(0, self.ngram_size * max_edits + 1 - (len(grams) - len(known)))]
+        if not prefix:
+            return None
+
+        shared: Counter = Counter()
+        lengths = self._lengths
+        for _, postings in prefix:
+            if isinstance(postings, int):
+                ids = self._db.execute("SELECT ids FROM grams WHERE id = ?", (postings,)).fetchone()[0]
+                postings = array("I")
+                postings.frombytes(ids)
+            shared.update(entry for entry in postings if abs(lengths[entry] - len(norm)) <= max_edits)
+        if not shared:
+            return None
+
+        # Most shared n-grams first, so a close match tightens the bound early
+        best = None
+        best_distance = max_edits + 1
+        query_grams = set(grams)
+        for entry, _ in shared.most_common(self.max_candidates):
+            if abs(lengths[entry] - len(norm)) >= best_distance:
+                continue
+            (candidate,) = self._db.execute("SELECT norm FROM entries WHERE id = ?", (entry,)).fetchone()
+            # Each edit also removes at most ngram_size n-grams from either side,
+            # which rules most candidates out before the edit distance is computed
+            candidate_grams = set(ngrams(candidate, self.ngram_size))
+            missing = max(len(query_grams - candidate_grams), len(candidate_grams - query_grams))
+            if -(-missing // self.ngram_size) >= best_distance:
+                continue
+            if not _same_numbers_and_words(norm, candidate):
+                continue
+            distance = bounded_edit_distance(norm, candidate, best_distance - 1)
+            if distance >= best_distance:
+                continue
+            score = 1.0 - distance / max(len(norm), len(candidate))
+            if score >= self.min_similarity:
+                best, best_distance = (entry, score), distance
+                if distance == 1:
+                    # Exact matches were ruled out, so nothing is closer
+                    break
+        if best is None:
+            return None
+        entry, score = best
+        source, target, dataset = self._db.execute(
+            "SELECT source, target, dataset FROM entries WHERE id = ?", (entry,)
+        ).fetchone()
+        return MemoryMatch(target, source, score, False, dataset)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit and miss counts, lookup latency and the indexed entries per direction."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            latencies = list(self._latencies)
+        hits = stats["exact_hits"] + stats["fuzzy_hits"]
+        stats["hit_rate"] = hits / stats["lookups"] if stats["lookups"] else 0.0
+        stats["latency"] = latency_summary(latencies)
+        stats["entries"] = dict(self.entries)
+        stats["path"] = str(self.path)
+        return stats
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data-dir", default=str(DEFAULT_DATA_DIR), help="Dataset CSV files to index")
+    parser.add_argument("--hub", action="store_true", help="Stream the datasets in column_mapping.yaml from the Hub")
+    parser.add_argument("--column-mapping", default=str(DEFAULT_COLUMN_MAPPING))
+    parser.add_argument("--directions", nargs="+", default=list(DEFAULT_DIRECTIONS),
+                        help="source-target column type pairs to index")
+    parser.add_argument("--ngram-size", type=int, default=3)
+    parser.add_argument("--max-indexed-length", type=int, default=200)
+    parser.add_argument("--output", default=str(DEFAULT_INDEX_PATH))
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    column_types = load_column_types(args.column_mapping)
+    pairs_by_direction: Dict[str, Iterable[Tuple[str, str, str]]] = {}
+    for direction in args.directions:
+        source_type, target_type = direction.split("-", 1)
+        if args.hub:
+            pairs_by_direction[direction] = iter_hub_pairs(args.column_mapping, source_type, target_type, column_types)
+        else:
+            pairs_by_direction[direction] = iter_parallel_pairs(args.data_dir, source_type, target_type, column_types)
+
+    start = time.perf_counter()
+    counts = build_index(args.output, pairs_by_direction, args.ngram_size, args.max_indexed_length)
+    size_mb = Path(args.output).stat().st_size / (1024 * 1024)
+    logger.info(
+        f"Translation memory written to {args.output}: {counts}, {size_mb:.1f} MB "
+        f"in {time.perf_counter() - start:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
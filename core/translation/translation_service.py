@@ -27,45 +27,139 @@ The following changes require explicit authorization before modification:
 DO NOT MODIFY THESE SECTIONS WITHOUT EXPLICIT AUTHORIZATION
 """
 
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 import logging
-from typing import Dict, Any, Optional, Tuple, Union, List, cast
+from typing import TYPE_CHECKING, Callable, Dict, Any, Iterator, Optional, Tuple, Union, List, cast
 import yaml
 import requests
-import torch
-from transformers import (
-    AutoModelForSeq2SeqLM, 
-    AutoTokenizer, 
-    PreTrainedModel, 
-    PreTrainedTokenizerBase,
-    GenerationConfig
-)
-from core.utils.environment import should_use_local_models
-from transformers.generation.utils import GenerateOutput
-from streamlit.delta_generator import DeltaGenerator
-import streamlit as st
-from .model_validator import ModelValidator
+from core.utils.environment import should_use_local_models, start_environment_probe
+from core.utils.http_session import configure_http_client, get_http_client
+from core.utils.metrics import metrics_response
+from core.utils.status_server import get_status_server, json_response
+from core.utils.structured_logging import StructuredLog, install_queue_logging, resolve_log_path
+from .batch_scheduler import MicroBatchScheduler
+from .circuit_breaker import ModelHealthMonitor
+from .generation_profiles import GenerationProfiles
+from .hedging import RequestHedger
+from .mmap_loader import ensure_safetensors, load_mmap_model, process_memory_report
+from .model_pool import ModelPool
+from .model_validator import DEFAULT_STATUS_URL, ModelValidator
+from .onnx_backend import ONNX_BACKEND, load_onnx_model, model_backend
+from .quantization import load_quantized_model, quantization_mode
 from .response_handler import ResponseHandler
+from .segmentation import needs_translation, reassemble, split_sentences
+from .service_metrics import ServiceMetrics
+from .single_flight import SingleFlight
+from .stage_timing import StageTimings
+from .streaming import StreamingStats, TokenStreamer, streaming_params
+from .translation_cache import TranslationCache, make_cache_key
+from .translation_memory import TranslationMemory
+from .warmup import ModelWarmup
+from .worker_pool import WorkerPool
+
+if TYPE_CHECKING:
+    # torch, transformers and streamlit take seconds to import; they are
+    # imported where a local model or the Streamlit UI is actually used
+    from transformers import GenerationConfig, PreTrainedModel, PreTrainedTokenizerBase
+    from streamlit.delta_generator import DeltaGenerator
+
+    ModelCache = Union[ModelPool, Dict[str, Tuple[PreTrainedModel, PreTrainedTokenizerBase]]]
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("translation_service.log"),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
-# Type definitions
-ModelCache = Dict[str, Tuple[PreTrainedModel, PreTrainedTokenizerBase]]
+_logging_configured = False
+
+
+def _configure_logging():
+    """Install the service log file handler once, when a service is created."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler(resolve_log_path("translation_service.log")),
+            logging.StreamHandler()
+        ]
+    )
+
+
+_attempt_log: Optional[StructuredLog] = None
+_attempt_log_pid: Optional[int] = None
+_attempt_log_lock = threading.Lock()
+
+
+def _configure_structured_logging(config: Dict[str, Any]) -> Optional[StructuredLog]:
+    """
+    Start the process-wide attempt log and, optionally, move the service
+    log handlers behind a queue. Done once per process; both are flushed
+    at exit.
+    """
+    global _attempt_log, _attempt_log_pid
+    if not config.get('enabled', False):
+        return None
+    with _attempt_log_lock:
+        # A forked worker inherits the log but not its writer thread
+        if _attempt_log is None or _attempt_log_pid != os.getpid():
+            if config.get('queue_service_logs', True):
+                listener = install_queue_logging(queue_size=config.get('queue_size', 10000))
+                if listener is not None:
+                    atexit.register(listener.stop)
+            _attempt_log = StructuredLog.from_config(config).start()
+            _attempt_log_pid = os.getpid()
+            atexit.register(_attempt_log.stop)
+        return _attempt_log
+
+
+_shared_components: Dict[Tuple[str, str], Any] = {}
+_shared_components_pid: Optional[int] = None
+_shared_components_lock = threading.RLock()
+
+
+def _process_shared(name: str, config: Any, factory: Callable[[], Any]) -> Any:
+    """
+    Get the process-wide component ``name`` built for ``config``, creating
+    it with ``factory`` on first use. The Streamlit interfaces build a new
+    TranslationService on every rerun; components whose state or threads
+    must outlive one instance are shared instead of rebuilt. A forked
+    child starts with none.
+    """
+    global _shared_components_pid
+    key = (name, json.dumps(config, sort_keys=True, default=str))
+    with _shared_components_lock:
+        if _shared_components_pid != os.getpid():
+            _shared_components.clear()
+            _shared_components_pid = os.getpid()
+        component = _shared_components.get(key)
+        if component is None:
+            component = _shared_components[key] = factory()
+        return component
+
+
+def _show_error(message: str):
+    """Report an error in the Streamlit UI."""
+    import streamlit as st
+    st.error(message)
+
 
 class TranslationService:
     def __init__(self):
+        _configure_logging()
         logger.info("Initializing TranslationService...")
+        # Resolve local vs EC2 while the configuration loads
+        start_environment_probe()
         try:
             # Import here to avoid circular imports
             from config.credentials import HUGGINGFACE_TOKEN
@@ -78,33 +172,135 @@ class TranslationService:
             if not self._config:
                 raise ValueError("Failed to load configuration")
             
+            # Inference API endpoints (overridable, e.g. for a local stub server)
+            api_config = self._config.get('inference_api', {})
+            self.api_url = api_config.get('models_url', self.api_url)
+            self.status_url = api_config.get('status_url', DEFAULT_STATUS_URL)
+            
+            # Shared keep-alive connection pool for API calls
+            http_pool = self._config.get('http_pool')
+            if http_pool:
+                configure_http_client(**http_pool)
+            
             # Initialize model cache if running on EC2
             self.use_local_models = should_use_local_models()
             self.cache_dir = Path("model_cache")
             self.cache_dir.mkdir(exist_ok=True)
             
             # Initialize components
-            self.model_validator = ModelValidator(self.api_url, self.headers, self.cache_dir)
-            self.response_handler = ResponseHandler()
+            # One validator (status cache and refresher thread) per process
+            self.model_validator = self._shared('model_validator', self._create_model_validator)
+            self.response_handler = ResponseHandler(
+                attempt_log=_configure_structured_logging(self._config.get('structured_logging', {}))
+            )
+            
+            # Per-model circuit breakers fed by every logged attempt
+            breaker_config = self._config.get('circuit_breakers', {})
+            self.health_monitor: Optional[ModelHealthMonitor] = None
+            if breaker_config.get('enabled', False):
+                self.health_monitor = self._shared(
+                    'health_monitor', lambda: ModelHealthMonitor.from_config(breaker_config)
+                )
+                self.response_handler.health_monitor = self.health_monitor
+                self.model_validator.health_monitor = self.health_monitor
+                
+            self.generation_profiles = GenerationProfiles.from_config(
+                self._config.get('generation_profiles', {})
+            )
+            self.streaming_stats = StreamingStats()
+            self.stage_timings = StageTimings.from_config(self._config.get('stage_timing', {}))
             
+            # Race slow primaries against their fallbacks
+            hedging_config = self._config.get('hedging', {})
+            self.hedger: Optional[RequestHedger] = None
+            if hedging_config.get('enabled', False):
+                self.hedger = self._shared('hedger', lambda: RequestHedger.from_config(hedging_config))
+                logger.info("Hedged requests enabled")
+            
+            # Result cache in front of both the local and API paths
+            cache_config = self._config.get('result_cache', {})
+            self.result_cache: Optional[TranslationCache] = None
+            if cache_config.get('enabled', False):
+                self.result_cache = self._shared('result_cache', lambda: TranslationCache.from_config(cache_config))
+                logger.info("Translation result cache enabled")
+            
+            # Sentences found in the parallel datasets skip the model entirely
+            memory_config = self._config.get('translation_memory', {})
+            self.translation_memory: Optional[TranslationMemory] = None
+            if memory_config.get('enabled', False):
+                self._init_translation_memory(memory_config)
+            
+            # Identical concurrent requests share one translation
+            self.single_flight: Optional[SingleFlight] = None
+            if self._config.get('request_coalescing', {}).get('enabled', False):
+                # Shared, so requests from different Streamlit reruns coalesce too
+                self.single_flight = self._shared('single_flight', SingleFlight)
+            
+            # Prometheus metrics, exported at /metrics by the status server
+            self.metrics: Optional[ServiceMetrics] = None
+            if self._config.get('metrics', {}).get('enabled', False):
+                # One set of metric families per process; the newest service feeds the gauges
+                self.metrics = self._shared('metrics', ServiceMetrics)
+                self.metrics.attach(self)
+            
+            self.batch_scheduler: Optional[MicroBatchScheduler] = None
+            self.worker_pool: Optional[WorkerPool] = None
+            self.warmup: Optional[ModelWarmup] = None
             if self.use_local_models:
                 logger.info("Running on EC2 - Using local model files")
-                self.model_cache: ModelCache = {}
-                self._load_cached_models()
+                self._init_model_pool()
+                if self._config.get('worker_pool', {}).get('enabled', False):
+                    # Workers warm their own models before reporting ready
+                    self._init_worker_pool()
+                else:
+                    self._init_batch_scheduler()
+                    self._init_warmup()
             else:
                 logger.info("Running locally - Using HuggingFace API")
-                self.model_cache = {}
+                self.model_cache: ModelCache = {}
+                
+            status_config = self._config.get('status_server', {})
+            if status_config.get('enabled', False):
+                self._register_status_endpoints(status_config)
                 
             logger.info("TranslationService initialized successfully")
         except ImportError as e:
             logger.error(f"Failed to import credentials: {str(e)}")
-            st.error("Failed to load HuggingFace token. Please check credentials.py")
+            _show_error("Failed to load HuggingFace token. Please check credentials.py")
             raise
         except Exception as e:
             logger.error(f"Failed to initialize TranslationService: {str(e)}")
-            st.error(f"Initialization error: {str(e)}")
+            _show_error(f"Initialization error: {str(e)}")
             raise
 
+    def _shared(self, name: str, factory: Callable[[], Any], *key: Any) -> Any:
+        """
+        Get a component shared by every service built from the same config
+        and model cache in this process (see ``_process_shared``).
+        """
+        return _process_shared(
+            name,
+            [
+                getattr(self, "api_url", None), getattr(self, "status_url", None),
+                str(Path(getattr(self, "cache_dir", "model_cache")).resolve()),
+                getattr(self, "use_local_models", None), getattr(self, "_config", None), *key
+            ],
+            factory
+        )
+
+    def _create_model_validator(self) -> ModelValidator:
+        """Build the model validator and start its background refresh if enabled."""
+        validation_config = self._config.get('model_validation', {})
+        validator = ModelValidator.from_config(
+            self.api_url, self.headers, self.cache_dir, validation_config, self.status_url
+        )
+        if validation_config.get('background_refresh', False):
+            validator.start_background_refresh(
+                models=self.get_available_models(),
+                interval=validation_config.get('refresh_interval_seconds', 30)
+            )
+        return validator
+
     def _load_config(self) -> Dict[str, Any]:
         """Load model configuration from YAML file."""
         try:
@@ -113,7 +309,7 @@ class TranslationService:
             
             if not config_path.exists():
                 logger.error(f"Config file not found at: {config_path}")
-                st.error(f"Configuration file not found at: {config_path}")
+                _show_error(f"Configuration file not found at: {config_path}")
                 return {}
             
             logger.info("Found config file attempting to load...")
@@ -122,12 +318,12 @@ class TranslationService:
                 
             if not isinstance(config, dict):
                 logger.error(f"Invalid config format: {type(config)}")
-                st.error("Invalid configuration format")
+                _show_error("Invalid configuration format")
                 return {}
                 
             if 'translation_models' not in config:
                 logger.error("No translation_models section in config")
-                st.error("Invalid configuration: missing translation_models")
+                _show_error("Invalid configuration: missing translation_models")
                 return {}
                 
             logger.info(f"Successfully loaded {len(config['translation_models'])} models")
@@ -138,29 +334,317 @@ class TranslationService:
             
         except Exception as e:
             logger.error(f"Error loading config: {str(e)}")
-            st.error(f"Configuration error: {str(e)}")
+            _show_error(f"Configuration error: {str(e)}")
             return {}
 
-    def _load_cached_models(self):
-        """Load any models that are already cached locally."""
+    @classmethod
+    def for_worker(cls, config: Dict[str, Any], cache_dir: str, models: List[str]) -> TranslationService:
+        """
+        Build a service for a model worker process (see ``worker_pool``).
+        It only runs local inference for ``models``: no API client, model
+        validation or result cache, which stay in the front process.
+        """
+        _configure_logging()
+        service = cls.__new__(cls)
+        service._config = config
+        service.use_local_models = True
+        service.cache_dir = Path(cache_dir)
+        # Each worker writes its own attempt log; rotation is not safe across processes
+        logging_config = dict(config.get('structured_logging', {}))
+        attempt_path = Path(logging_config.get('path', 'logs/translation_attempts.jsonl'))
+        logging_config['path'] = str(
+            attempt_path.with_name(f"{attempt_path.stem}.worker-{os.getpid()}{attempt_path.suffix}")
+        )
+        service.response_handler = ResponseHandler(attempt_log=_configure_structured_logging(logging_config))
+        service.generation_profiles = GenerationProfiles.from_config(config.get('generation_profiles', {}))
+        service.streaming_stats = StreamingStats()
+        service.stage_timings = StageTimings.from_config(config.get('stage_timing', {}))
+        service.result_cache = None
+        service.batch_scheduler = None
+        service.worker_pool = None
+        service._init_model_pool(models)
+        service._init_batch_scheduler()
+        service._init_warmup(background=False)
+        return service
+
+    def _init_model_pool(self, models: Optional[List[str]] = None):
+        """Set up lazy loading of locally cached models under a memory budget."""
+        self.model_cache = self._shared('model_pool', lambda: self._create_model_pool(models), models)
+        
+    def _create_model_pool(self, models: Optional[List[str]] = None) -> ModelPool:
+        """Build the model pool and preload its pinned models if configured."""
+        pool_config = self._config.get('model_pool', {})
+        translation_models = self._config.get('translation_models', {})
+        pool = ModelPool.from_config(
+            self.cache_dir,
+            [model for model in translation_models if models is None or model in models],
+            self._load_local_model,
+            pool_config
+        )
+        metrics = getattr(self, "metrics", None)
+        if metrics is not None:
+            pool.on_load = metrics.record_model_load
+        if pool_config.get('preload_pinned', False):
+            pool.preload(pool.pinned)
+        return pool
+
+    def _init_translation_memory(self, memory_config: Dict[str, Any]):
+        """Open the translation memory index; without one the service translates as before."""
+        path = Path(memory_config.get('path', 'cache/translation_memory.sqlite3'))
+        if not path.exists():
+            logger.warning(
+                f"Translation memory index {path} not found; build it with "
+                f"python -m core.translation.translation_memory --output {path}"
+            )
+            return
         try:
-            for model_name in self._config.get('translation_models', {}):
-                model_dir = self.cache_dir / model_name.replace("/", "_")
-                if model_dir.exists():
+            self.translation_memory = TranslationMemory.from_config(memory_config)
+            logger.info(f"Translation memory enabled ({self.translation_memory.entries})")
+        except Exception as e:
+            logger.error(f"Could not open translation memory {path}: {str(e)}")
+
+    def _init_warmup(self, background: Optional[bool] = None):
+        """Warm the pinned local models through the normal inference path."""
+        warmup_config = self._config.get('warmup', {})
+        self.warmup = None
+        if not warmup_config.get('enabled', False):
+            return
+        
+        def start_warmup() -> ModelWarmup:
+            models = [model for model in getattr(self.model_cache, "pinned", ()) if model in self.model_cache]
+            warmup = ModelWarmup.from_config(warmup_config)
+            warmup.start(
+                models,
+                self.model_cache.get,
+                self._translate_with_local_model,
+                lambda texts, model, profile: self._translate_batch_with_local_model(texts, model, profile=profile),
+                background=warmup_config.get('background', True) if background is None else background
+            )
+            return warmup
+            
+        # Warmed once per process; later services report the same readiness
+        self.warmup = self._shared('warmup', start_warmup)
+        
+    def is_ready(self) -> bool:
+        """Whether start-up, including model warm-up, has finished."""
+        worker_pool = getattr(self, "worker_pool", None)
+        if worker_pool is not None:
+            return all(worker["ready"] for worker in worker_pool.get_stats()["workers"].values())
+        warmup = getattr(self, "warmup", None)
+        return warmup is None or warmup.is_ready()
+        
+    def get_startup_report(self) -> Dict[str, Any]:
+        """Get readiness and per-model load, warm-up and first-vs-steady latency."""
+        worker_pool = getattr(self, "worker_pool", None)
+        if worker_pool is not None:
+            workers = worker_pool.get_stats()["workers"]
+            return {
+                "ready": all(worker["ready"] for worker in workers.values()),
+                "workers": {
+                    worker_id: worker["health"].get("warmup", {"ready": worker["ready"], "models": {}})
+                    for worker_id, worker in workers.items()
+                }
+            }
+        warmup = getattr(self, "warmup", None)
+        if warmup is None:
+            return {"ready": True, "startup_seconds": 0.0, "models": {}}
+        return warmup.get_report()
+        
+    def _register_status_endpoints(self, status_config: Dict[str, Any]):
+        """
+        Serve /ready (200 once warmed up, else 503), /startup and, with metrics
+        enabled, /metrics in Prometheus text format on the status server.
+        """
+        server = get_status_server(status_config.get('host', '0.0.0.0'), status_config.get('port', 8502))
+        server.register(
+            "/ready",
+            lambda: json_response({"ready": self.is_ready()}, 200 if self.is_ready() else 503)
+        )
+        server.register("/startup", lambda: json_response(self.get_startup_report()))
+        metrics = getattr(self, "metrics", None)
+        if metrics is not None:
+            server.register("/metrics", lambda: metrics_response(metrics.registry))
+        
+    def _load_local_model(self, model_name: str, model_dir: Path) -> Tuple[PreTrainedModel, PreTrainedTokenizerBase]:
+        """Load a cached model and its tokenizer from disk."""
+        import torch
+        from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
+        
+        loading_config = self._config.get('model_loading', {})
+        
+        def load_float_model():
+            if loading_config.get('mmap_safetensors', True):
+                # Weights stay in the shared page cache instead of private memory
+                weights_path = ensure_safetensors(model_dir)
+                if weights_path is not None:
                     try:
-                        logger.info(f"Loading cached model: {model_name}")
-                        model = AutoModelForSeq2SeqLM.from_pretrained(
-                            str(model_dir),
-                            torch_dtype=torch.float32,
-                            low_cpu_mem_usage=True
-                        )
-                        tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
-                        self.model_cache[model_name] = (model, tokenizer)
-                        logger.info(f"Successfully loaded cached model: {model_name}")
+                        return load_mmap_model(model_dir, weights_path)
                     except Exception as e:
-                        logger.error(f"Error loading cached model {model_name}: {str(e)}")
+                        logger.warning(f"Memory-mapped load failed for {model_name}, using from_pretrained: {str(e)}")
+            return AutoModelForSeq2SeqLM.from_pretrained(
+                str(model_dir),
+                torch_dtype=torch.float32,
+                low_cpu_mem_usage=True
+            )
+        
+        logger.info(f"Loading cached model: {model_name}")
+        model_info = self.get_model_info(model_name)
+        mode = quantization_mode(model_info)
+        if model_backend(model_info) == ONNX_BACKEND:
+            # Exported once under model_dir/onnx, then run with ONNX Runtime
+            onnx_config = self._config.get('onnx_runtime', {})
+            model = load_onnx_model(
+                model_dir,
+                load_float_model,
+                intra_op_threads=onnx_config.get('intra_op_threads')
+            )
+        elif mode is not None:
+            # Opt-in per model; the quantized copy is cached under model_dir
+            model = load_quantized_model(model_dir, load_float_model, mode)
+        else:
+            model = load_float_model()
+        tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+        logger.info(f"Successfully loaded cached model: {model_name}")
+        return model, tokenizer
+
+    def get_memory_report(self) -> Dict[str, Any]:
+        """
+        Get unique vs shared memory of this process and of each model worker.
+        Memory-mapped weights show up as shared once several processes map them.
+        """
+        report = {"process": process_memory_report(), "workers": {}}
+        worker_pool = getattr(self, "worker_pool", None)
+        if worker_pool is not None:
+            report["workers"] = {
+                worker_id: worker["health"].get("memory", {})
+                for worker_id, worker in worker_pool.get_stats()["workers"].items()
+            }
+        return report
+        
+    def get_model_pool_stats(self) -> Dict[str, Any]:
+        """Get model load/eviction metrics and resident memory."""
+        if not isinstance(self.model_cache, ModelPool):
+            return {}
+        return self.model_cache.get_stats()
+
+    def _init_batch_scheduler(self):
+        """Start micro-batching of concurrent local requests if enabled in config."""
+        batching = self._config.get('batching', {})
+        if not batching.get('enabled', False):
+            logger.info("Micro-batching disabled - local requests run individually")
+            return
+            
+        max_batch_size = batching.get('max_batch_size', 16)
+        self.batch_scheduler = self._shared('batch_scheduler', lambda: MicroBatchScheduler(
+            lambda model, texts, profile=None: self._translate_batch_with_local_model(
+                texts, model, max_batch_size, profile
+            ),
+            max_batch_size=max_batch_size,
+            max_wait_ms=batching.get('max_wait_ms', 10)
+        ))
+        logger.info(
+            f"Micro-batching enabled (max_batch_size={max_batch_size}, "
+            f"max_wait_ms={batching.get('max_wait_ms', 10)})"
+        )
+        
+    def _init_worker_pool(self):
+        """Serve local models from worker processes instead of this process."""
+        pool_config = self._config.get('worker_pool', {})
+        
+        def start_workers() -> WorkerPool:
+            local_models = [model for model in self.get_available_models() if self.is_model_cached(model)]
+            worker_pool = WorkerPool.from_config(
+                partial(TranslationService.for_worker, self._config, str(self.cache_dir)),
+                local_models,
+                pool_config
+            )
+            worker_pool.start()
+            return worker_pool
+            
+        # One set of worker processes per process, not per Streamlit rerun
+        self.worker_pool = self._shared('worker_pool', start_workers)
+        
+    def get_worker_pool_stats(self) -> Dict[str, Any]:
+        """Get per-worker load, restart and health figures."""
+        if getattr(self, "worker_pool", None) is None:
+            return {}
+        return self.worker_pool.get_stats()
+        
+    def _is_local(self, model: str) -> bool:
+        """Whether requests for a model are served by a locally cached copy."""
+        return self.use_local_models and self.is_model_cached(model)
+        
+    def _translate_routed(
+        self,
+        text: str,
+        model: str,
+        target_lang: str,
+        profile: Optional[str] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Optional[str]:
+        """Translate with one model through the local or API path."""
+        # When running locally, always use API
+        # When on EC2, try local model first
+        if not self.use_local_models:
+            logger.info("Running locally - Using API directly")
+            return self._translate_with_api(text, model, target_lang, profile, cancel_event)
+        if self.is_model_cached(model):
+            logger.info(f"Running on EC2 - Using cached model: {model}")
+            if getattr(self, "worker_pool", None) is not None:
+                return self._translate_in_worker(text, model, profile)
+            if self.batch_scheduler is not None:
+                # Merged with concurrent requests for the same model and profile
+                return self.batch_scheduler.translate(text, model, profile=profile)
+            return self._translate_with_local_model(text, model, profile)
+        logger.info(f"Running on EC2 - Model not cached, using API: {model}")
+        return self._translate_with_api(text, model, target_lang, profile, cancel_event)
+        
+    def _hedge_candidates(self, requested_model: str, resolved_model: str) -> Iterator[str]:
+        """Yield the resolved model, then valid models from the requested model's fallback chain."""
+        yield resolved_model
+        seen = {resolved_model}
+        for candidate in [requested_model] + self.model_validator.get_fallback_chain(requested_model, "translation"):
+            if candidate in seen:
+                continue
+            seen.add(candidate)
+            is_valid, _ = self._check_model_available(candidate)
+            if is_valid:
+                yield candidate
+                
+    def get_hedging_stats(self) -> Dict[str, Any]:
+        """Get hedged request counts, extra load and per-model wins."""
+        if getattr(self, "hedger", None) is None:
+            return {}
+        return self.hedger.get_stats()
+        
+    def _translate_in_worker(self, text: str, model: str, profile: Optional[str]) -> Optional[str]:
+        """Translate with a worker process, treating a worker failure as a failed attempt."""
+        start = time.perf_counter()
+        try:
+            translation = self.worker_pool.translate(
+                text, model, profile,
+                timeout=self._config.get('worker_pool', {}).get('request_timeout_seconds')
+            )
         except Exception as e:
-            logger.error(f"Error loading cached models: {str(e)}")
+            self.response_handler.log_translation_attempt(
+                False, model, text, None, str(e), time.perf_counter() - start
+            )
+            return None
+        # The worker logs in its own process; record the outcome here as well
+        self.response_handler.log_translation_attempt(
+            translation is not None, model, text, translation, latency=time.perf_counter() - start
+        )
+        return translation
+            
+    def get_batching_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get queue depth, batch size and wait time statistics per model."""
+        if self.batch_scheduler is None:
+            return {}
+        return self.batch_scheduler.get_stats()
+
+    def get_validation_stats(self) -> Dict[str, Any]:
+        """Get model status cache counters and per-model status."""
+        return self.model_validator.get_stats()
 
     def is_model_cached(self, model_name: str) -> bool:
         """Check if a model is available in the local cache."""
@@ -185,145 +669,890 @@ class TranslationService:
         logger.info(f"Model info: {model_info}")
         return model_info
 
-    def translate(self, text: str, source_lang: str, target_lang: str, model: str) -> Optional[str]:
-        """Translate text using specified model."""
+    def translate(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        profile: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Translate text using specified model.
+        
+        ``profile`` names a generation profile from config (e.g. interactive,
+        quality or bulk); None or "auto" lets the profile policy choose from
+        the input length and the number of requests already in flight.
+        Sentences found in the translation memory are answered from the
+        parallel datasets without running a model. With request coalescing
+        enabled, calls for the same model, language pair, normalized text
+        and profile that overlap share one translation.
+        """
         logger.info(f"Translating text: {text}")
         logger.info(f"Translating text using model: {model}")
         
+        request_start = time.perf_counter()
+        profile = self._get_generation_profiles().select(profile, text or "")
+        cache_key = self._result_cache_key(text, source_lang, target_lang, model, profile)
+        known = self._lookup_known(text, source_lang, target_lang, model, cache_key, request_start)
+        if known is not None:
+            return known
+        
+        single_flight = getattr(self, "single_flight", None)
+        if single_flight is None:
+            translation, served_model, outcome = self._translate_uncached(
+                text, source_lang, target_lang, model, profile
+            )
+            leader = True
+        else:
+            # Identical requests already in flight share one computation
+            (translation, served_model, outcome), leader = single_flight.do(
+                self._flight_key(text, source_lang, target_lang, model, profile, cache_key),
+                lambda: self._translate_uncached(text, source_lang, target_lang, model, profile),
+                label=model
+            )
+        self._record_request(model, served_model, outcome, request_start, leader)
+        return translation
+        
+    def _lookup_known(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        requested_model: str,
+        cache_key: Optional[str],
+        request_start: float
+    ) -> Optional[str]:
+        """
+        Answer a request from the result cache or the translation memory,
+        recording its timings and metrics. Returns None when neither knows it.
+        """
+        timings = self._get_stage_timings()
+        metrics = getattr(self, "metrics", None)
+        
+        # Serve repeated requests from the result cache
+        if cache_key is not None:
+            with timings.span(requested_model, "cache_lookup"):
+                cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Translation cache hit for model: {requested_model}")
+                elapsed = time.perf_counter() - request_start
+                timings.record(requested_model, "total", elapsed)
+                if metrics is not None:
+                    metrics.record_cache_hits(requested_model, seconds=elapsed)
+                return cached
+            if metrics is not None:
+                metrics.record_cache_misses()
+        
+        # Serve sentences the parallel datasets already translate
+        memory = getattr(self, "translation_memory", None)
+        if memory is not None:
+            with timings.span(requested_model, "memory_lookup"):
+                match = memory.lookup(text, source_lang, target_lang)
+            if match is not None:
+                logger.info(
+                    f"Translation memory {'exact' if match.exact else 'near'} match "
+                    f"({match.score:.2f}) from {match.dataset}"
+                )
+                elapsed = time.perf_counter() - request_start
+                timings.record(requested_model, "total", elapsed)
+                if metrics is not None:
+                    metrics.record_memory_hit(requested_model, elapsed)
+                return match.translation
+        return None
+        
+    def _lookup_known_batch(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        cache_keys: List[Optional[str]],
+        results: List[Optional[str]]
+    ) -> List[int]:
+        """
+        Fill ``results`` from the result cache, then the translation memory,
+        recording their metrics. Returns the indices still to translate.
+        """
+        metrics = getattr(self, "metrics", None)
+        pending = []
+        misses = 0
+        for index, cache_key in enumerate(cache_keys):
+            cached = self.result_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append(index)
+                misses += cache_key is not None
+        if metrics is not None and len(pending) < len(texts):
+            metrics.record_cache_hits(model, len(texts) - len(pending))
+        if metrics is not None and misses:
+            metrics.record_cache_misses(misses)
+        
+        memory = getattr(self, "translation_memory", None)
+        if memory is None or not pending:
+            return pending
+        timings = self._get_stage_timings()
+        remaining = []
+        for index in pending:
+            with timings.span(model, "memory_lookup"):
+                match = memory.lookup(texts[index], source_lang, target_lang)
+            if match is None:
+                remaining.append(index)
+                continue
+            results[index] = match.translation
+            if metrics is not None:
+                metrics.record_memory_hit(model)
+        if len(remaining) < len(pending):
+            logger.info(f"Translation memory answered {len(pending) - len(remaining)} of {len(texts)} texts")
+        return remaining
+        
+    def _flight_key(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        profile: str,
+        cache_key: Optional[str],
+        streaming: bool = False
+    ) -> str:
+        """Key under which identical in-flight requests are coalesced."""
+        return cache_key or make_cache_key(
+            model, source_lang, target_lang, text or "", self._generation_params(profile, streaming)
+        )
+        
+    def _record_request(
+        self,
+        requested_model: str,
+        served_model: str,
+        outcome: str,
+        request_start: float,
+        leader: bool = True
+    ):
+        """Record the total latency and request metrics of a translation that ran a model."""
+        timings = self._get_stage_timings()
+        metrics = getattr(self, "metrics", None)
+        elapsed = time.perf_counter() - request_start
+        timings.record(requested_model, "total", elapsed)
+        if not leader:
+            timings.record(requested_model, "coalesced_wait", elapsed)
+        if metrics is not None:
+            if leader:
+                metrics.record_request(
+                    requested_model, served_model, self._is_local(served_model), outcome, elapsed
+                )
+            else:
+                metrics.record_coalesced(requested_model, outcome, elapsed)
+        
+    def _translate_uncached(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        profile: str,
+        resolved_model: Optional[str] = None
+    ) -> Tuple[Optional[str], str, str]:
+        """
+        Resolve the model, translate and store the result in the cache under
+        the model that produced it. Returns the translation, that model and
+        the outcome (success, failure, unavailable or error). Callers that
+        already resolved the model pass it as ``resolved_model``.
+        """
+        requested_model = model
+        timings = self._get_stage_timings()
+        profiles = self._get_generation_profiles()
         try:
-            # Validate primary model
-            is_valid, message = self.model_validator.validate_model(model)
-            if not is_valid:
-                logger.warning(f"Primary model validation failed: {message}")
-                # Try fallback models
-                fallback_models = self.model_validator.get_fallback_chain(model, "translation")
-                for fallback in fallback_models:
-                    is_valid, message = self.model_validator.validate_model(fallback)
-                    if is_valid:
-                        logger.info(f"Using fallback model: {fallback}")
-                        model = fallback
-                        break
-                else:
-                    error_msg = "No valid models available for translation"
-                    logger.error(error_msg)
-                    return None
+            # Validate primary model, falling back if needed
+            if resolved_model is None:
+                with timings.span(requested_model, "model_resolution"):
+                    resolved_model = self._resolve_model(model)
+            if resolved_model is None:
+                return None, model, "unavailable"
+            model = resolved_model
             
-            # When running locally, always use API
-            # When on EC2, try local model first
-            if not self.use_local_models:
-                logger.info("Running locally - Using API directly")
-                return self._translate_with_api(text, model, target_lang)
-            elif self.is_model_cached(model):
-                logger.info(f"Running on EC2 - Using cached model: {model}")
-                return self._translate_with_local_model(text, model)
-            else:
-                logger.info(f"Running on EC2 - Model not cached, using API: {model}")
-                return self._translate_with_api(text, model, target_lang)
+            start = time.perf_counter()
+            with profiles.track(), timings.span(requested_model, "inference"):
+                hedger = getattr(self, "hedger", None)
+                if hedger is not None and not self._is_local(resolved_model):
+                    # Race slow API models against the fallback chain
+                    winner, translation = hedger.run(
+                        self._hedge_candidates(requested_model, resolved_model),
+                        lambda candidate, cancel: self._translate_routed(
+                            text, candidate, target_lang, profile, cancel
+                        )
+                    )
+                    model = winner or model
+                else:
+                    translation = self._translate_routed(text, model, target_lang, profile)
+            profiles.record(profile, time.perf_counter() - start, [translation])
+                
+            cache_key = self._result_cache_key(text, source_lang, target_lang, model, profile)
+            if translation is not None and cache_key is not None:
+                with timings.span(requested_model, "cache_store"):
+                    self.result_cache.set(cache_key, translation)
+            return translation, model, "success" if translation is not None else "failure"
             
         except Exception as e:
             error_context = {
                 "text": text[:100],
                 "source_lang": source_lang,
                 "target_lang": target_lang,
-                "model": model
+                "model": model,
+                "profile": profile
             }
             error_msg = self.response_handler.format_error(e, error_context)
             logger.error(f"Translation error: {error_msg}")
-            return None
+            return None, model, "error"
             
-    def _translate_with_local_model(self, text: str, model: str) -> Optional[str]:
-        """Translate using a locally cached model."""
+    def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        profile: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Translate text, yielding the translation in chunks as it is generated.
+        
+        Locally cached models stream token by token; the profile's settings
+        are used with greedy decoding, since beam search only knows its
+        output at the end. Cache and translation memory hits, API
+        translations, models served by the worker pool and requests that
+        join an identical one already in flight arrive as a single chunk.
+        Nothing is yielded if translation fails. Time to first token and
+        tokens/sec are available from ``get_streaming_stats``.
+        """
+        logger.info(f"Streaming translation using model: {model}")
+        request_start = time.perf_counter()
+        requested_model = model
+        timings = self._get_stage_timings()
+        profiles = self._get_generation_profiles()
+        profile = profiles.select(profile, text or "")
+        
+        # Results and flights are keyed on the settings the output is produced with
+        streams = self._streams_locally(model)
+        cache_key = self._result_cache_key(text, source_lang, target_lang, model, profile, streams)
+        known = self._lookup_known(text, source_lang, target_lang, model, cache_key, request_start)
+        if known is not None:
+            yield known
+            return
+            
+        single_flight = getattr(self, "single_flight", None)
+        flight_key = self._flight_key(text, source_lang, target_lang, model, profile, cache_key, streams)
+        flight = None
+        if single_flight is not None:
+            flight, leader = single_flight.join(flight_key, label=requested_model)
+            if not leader:
+                try:
+                    translation, _, outcome = single_flight.wait(flight)
+                except Exception as e:
+                    logger.error(f"Coalesced streaming translation failed: {str(e)}")
+                    translation, outcome = None, "error"
+                self._record_request(requested_model, model, outcome, request_start, leader=False)
+                if translation is not None:
+                    yield translation
+                return
+                
+        result: Tuple[Optional[str], str, str] = (None, model, "error")
+        try:
+            with timings.span(requested_model, "model_resolution"):
+                resolved_model = self._resolve_model(model)
+            if resolved_model is None:
+                result = (None, model, "unavailable")
+                return
+            model = resolved_model
+            
+            if not (streams and self._streams_locally(model)):
+                # The Inference API and worker processes return whole translations
+                result = self._translate_uncached(
+                    text, source_lang, target_lang, requested_model, profile, resolved_model
+                )
+                if result[0] is not None:
+                    yield result[0]
+                return
+                
+            result = yield from self._stream_local(text, source_lang, target_lang, model, profile)
+            
+        finally:
+            if flight is not None:
+                single_flight.finish(flight_key, flight, result)
+            self._record_request(requested_model, result[1], result[2], request_start)
+            
+    def _stream_local(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        profile: str
+    ) -> Iterator[str]:
+        """
+        Stream a locally cached model's translation token by token.
+        Returns the translation, the model and the outcome like ``_translate_uncached``.
+        """
+        from transformers import GenerationConfig
+        
+        profiles = self._get_generation_profiles()
+        start = time.perf_counter()
         try:
             model_obj, tokenizer = self.model_cache[model]
+            inputs = tokenizer(text, return_tensors="pt", truncation=True, max_length=512)
+            generation_config = GenerationConfig(**streaming_params(self._generation_params(profile)))
+            streamer = TokenStreamer(tokenizer)
             
-            # Encode input text
-            inputs = tokenizer(text, return_tensors="pt", padding=True)
-            input_ids = inputs["input_ids"]
-            attention_mask = inputs.get("attention_mask", None)
-            
-            # Configure generation parameters
-            generation_config = GenerationConfig(
-                max_length=512,
-                num_beams=4,
-                length_penalty=0.6,
-                early_stopping=True
-            )
+            def generate():
+                try:
+                    model_obj.generate(
+                        input_ids=inputs["input_ids"],
+                        attention_mask=inputs.get("attention_mask", None),
+                        generation_config=generation_config,
+                        streamer=streamer
+                    )
+                except Exception as e:
+                    streamer.fail(e)
+                    
+            with profiles.track():
+                threading.Thread(target=generate, name=f"stream-{model}", daemon=True).start()
+                for chunk in streamer:
+                    yield chunk
+            translation = streamer.text.strip()
+            profiles.record(profile, time.perf_counter() - start, [translation])
+            self._get_streaming_stats().record(model, streamer)
             
-            # Generate translation
-            outputs = model_obj.generate(
-                input_ids=input_ids,
-                attention_mask=attention_mask,
-                generation_config=generation_config
+            self.response_handler.log_translation_attempt(
+                True, model, text, translation, latency=time.perf_counter() - start
             )
+            cache_key = self._result_cache_key(text, source_lang, target_lang, model, profile, streaming=True)
+            if translation and cache_key is not None:
+                self.result_cache.set(cache_key, translation)
+            return translation or None, model, "success" if translation else "failure"
+                
+        except Exception as e:
+            self.response_handler.log_translation_attempt(
+                False, model, text, None, str(e), time.perf_counter() - start
+            )
+            return None, model, "error"
             
-            # Handle different output types
-            if isinstance(outputs, GenerateOutput):
-                sequences = outputs.sequences
-            elif isinstance(outputs, torch.Tensor):
-                sequences = outputs
-            else:
-                sequences = cast(torch.Tensor, outputs)
+    def _streams_locally(self, model: str) -> bool:
+        """Whether ``translate_stream`` generates a model's output token by token in this process."""
+        return self._is_local(model) and getattr(self, "worker_pool", None) is None
+        
+    def _get_streaming_stats(self) -> StreamingStats:
+        """Get the streaming metrics, creating them on first use."""
+        stats = getattr(self, "streaming_stats", None)
+        if stats is None:
+            stats = self.streaming_stats = StreamingStats()
+        return stats
+        
+    def get_streaming_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get time-to-first-token and tokens/sec statistics per model."""
+        return self._get_streaming_stats().get_stats()
+        
+    def _get_stage_timings(self) -> StageTimings:
+        """Get the per-stage latency spans, creating them from config on first use."""
+        timings = getattr(self, "stage_timings", None)
+        if timings is None:
+            config = getattr(self, "_config", None) or {}
+            timings = self.stage_timings = StageTimings.from_config(config.get('stage_timing', {}))
+        return timings
+        
+    def get_logging_stats(self) -> Dict[str, Any]:
+        """Get attempt log counts (submitted, sampled out, dropped) and mean caller overhead."""
+        attempt_log = getattr(getattr(self, "response_handler", None), "attempt_log", None)
+        if attempt_log is None:
+            return {}
+        return attempt_log.get_stats()
+        
+    def get_stage_timing_stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get count and p50/p95/p99 latency per model and request stage.
+        
+        Stages of ``translate`` (cache_lookup, model_resolution, inference,
+        cache_store, total) are keyed by the requested model; stages inside
+        the local and API paths by the model that actually ran.
+        """
+        return self._get_stage_timings().get_stats()
             
-            # Convert to list for decoding
-            if isinstance(sequences, torch.Tensor):
-                sequences = sequences.tolist()
+    def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        profile: Optional[str] = None
+    ) -> List[Optional[str]]:
+        """
+        Translate a list of texts using specified model.
+        
+        On EC2 with the model cached, texts are grouped into length buckets and
+        each bucket runs through a single ``generate`` call. Results are returned
+        in input order; an item that fails is returned as None without
+        affecting the rest of the batch. One generation profile is used for
+        the whole batch.
+        """
+        logger.info(f"Translating batch of {len(texts)} texts using model: {model}")
+        results: List[Optional[str]] = [None] * len(texts)
+        profiles = self._get_generation_profiles()
+        profile = self._select_batch_profile(profiles, profile, texts)
+        
+        # Only texts neither the cache nor the memory knows go on to the model
+        cache_keys = [
+            self._result_cache_key(text, source_lang, target_lang, model, profile)
+            for text in texts
+        ]
+        pending = self._lookup_known_batch(texts, source_lang, target_lang, model, cache_keys, results)
+        if not pending:
+            return results
+        pending_texts = [texts[index] for index in pending]
+        requested_model = model
             
-            # Decode output
-            translation = tokenizer.batch_decode(
+        try:
+            # Validate primary model once for the whole batch
+            resolved_model = self._resolve_model(model)
+            if resolved_model is None:
+                return results
+            model = resolved_model
+                    
+            start = time.perf_counter()
+            with profiles.track():
+                if self.use_local_models and self.is_model_cached(model):
+                    logger.info(f"Running on EC2 - Batching with cached model: {model}")
+                    if getattr(self, "worker_pool", None) is not None:
+                        translations = self.worker_pool.translate_batch(
+                            pending_texts, model, profile,
+                            timeout=self._config.get('worker_pool', {}).get('request_timeout_seconds')
+                        )
+                    else:
+                        translations = self._translate_batch_with_local_model(
+                            pending_texts, model, profile=profile
+                        )
+                else:
+                    logger.info(f"Model not cached locally, translating batch via API: {model}")
+                    translations = [
+                        self._translate_with_api(text, model, target_lang, profile)
+                        for text in pending_texts
+                    ]
+            profiles.record(profile, time.perf_counter() - start, translations)
+            metrics = getattr(self, "metrics", None)
+            if metrics is not None:
+                metrics.record_results(requested_model, model, self._is_local(model), translations)
+                
+            # Cache under the model that produced the translations
+            for index, translation in zip(pending, translations):
+                results[index] = translation
+                store_key = self._result_cache_key(texts[index], source_lang, target_lang, model, profile)
+                if translation is not None and store_key is not None:
+                    self.result_cache.set(store_key, translation)
+            return results
+            
+        except Exception as e:
+            error_context = {
+                "batch_size": len(texts),
+                "source_lang": source_lang,
+                "target_lang": target_lang,
+                "model": model,
+                "profile": profile
+            }
+            error_msg = self.response_handler.format_error(e, error_context)
+            logger.error(f"Batch translation error: {error_msg}")
+            return results
+            
+    async def translate_many(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        max_concurrency: Optional[int] = None,
+        deadline_seconds: Optional[float] = None,
+        profile: Optional[str] = None
+    ) -> List[Optional[str]]:
+        """
+        Translate many texts through the HuggingFace API concurrently.
+        
+        Keeps up to ``max_concurrency`` requests in flight for the model instead
+        of one blocking request at a time. ``deadline_seconds`` bounds each
+        request, including retries, from the moment it gets a concurrency slot. Results are returned in input order, with
+        None for items that failed.
+        """
+        from .async_api_client import AsyncAPITranslationClient
+        
+        logger.info(f"Translating {len(texts)} texts concurrently via API using model: {model}")
+        results: List[Optional[str]] = [None] * len(texts)
+        profiles = self._get_generation_profiles()
+        profile = self._select_batch_profile(profiles, profile, texts)
+        
+        cache_keys = [
+            self._result_cache_key(text, source_lang, target_lang, model, profile)
+            for text in texts
+        ]
+        pending = self._lookup_known_batch(texts, source_lang, target_lang, model, cache_keys, results)
+        if not pending:
+            return results
+            
+        # Model validation may hit the filesystem or network, keep it off the loop
+        loop = asyncio.get_running_loop()
+        resolved_model = await loop.run_in_executor(None, self._resolve_model, model)
+        if resolved_model is None:
+            return results
+            
+        async_config = self._config.get('async_api', {})
+        start = time.perf_counter()
+        with profiles.track():
+            async with AsyncAPITranslationClient(
+                self,
+                max_concurrency=max_concurrency or async_config.get('max_concurrency', 8),
+                max_retries=async_config.get('max_retries', 3),
+                base_delay=async_config.get('base_delay', 5),
+                request_timeout=async_config.get('request_timeout', 30)
+            ) as client:
+                translations = await client.translate_many(
+                    [texts[index] for index in pending],
+                    resolved_model,
+                    deadline_seconds,
+                    profile
+                )
+        profiles.record(profile, time.perf_counter() - start, translations)
+        metrics = getattr(self, "metrics", None)
+        if metrics is not None:
+            metrics.record_results(model, resolved_model, False, translations)
+            
+        # Cache under the model that produced the translations
+        for index, translation in zip(pending, translations):
+            results[index] = translation
+            store_key = self._result_cache_key(texts[index], source_lang, target_lang, resolved_model, profile)
+            if translation is not None and store_key is not None:
+                self.result_cache.set(store_key, translation)
+        return results
+        
+    def translate_document(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        profile: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Optional[str]:
+        """
+        Translate a long document sentence by sentence.
+        
+        The text is split into sentences (see ``segmentation.split_sentences``)
+        that are translated concurrently through ``translate``, so local
+        requests are merged by the micro-batcher and API requests overlap.
+        Translations are put back between the original whitespace, keeping
+        paragraphs and line breaks. ``progress_callback(done, total)`` is
+        called from the calling thread as each segment finishes.
+        
+        Returns None if any segment fails; segments that did succeed are in
+        the result cache, so a retry only repeats the failed ones.
+        """
+        document_config = self._config.get('document_translation', {})
+        spans = split_sentences(text or "", document_config.get('max_segment_words', 200))
+        segments = [text[start:end] for start, end in spans]
+        translations: List[Optional[str]] = list(segments)
+        total = len(segments)
+        logger.info(f"Translating document of {len(text or '')} characters as {total} segments using model: {model}")
+        
+        # Identical sentences are translated once
+        pending: Dict[str, List[int]] = {}
+        for index, segment in enumerate(segments):
+            if needs_translation(segment):
+                pending.setdefault(segment, []).append(index)
+        done = total - sum(len(indexes) for indexes in pending.values())
+        if progress_callback is not None and done:
+            progress_callback(done, total)
+            
+        workers = max_workers or document_config.get('max_workers', 8)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="document-translation") as executor:
+            futures = {
+                executor.submit(self.translate, segment, source_lang, target_lang, model, profile): segment
+                for segment in pending
+            }
+            for future in as_completed(futures):
+                indexes = pending[futures[future]]
+                translation = future.result()
+                for index in indexes:
+                    translations[index] = translation
+                done += len(indexes)
+                if progress_callback is not None:
+                    progress_callback(done, total)
+                    
+        failed = sum(translation is None for translation in translations)
+        if failed:
+            logger.error(f"Document translation failed for {failed} of {total} segments")
+            return None
+        return reassemble(text, spans, cast(List[str], translations))
+        
+    def _resolve_model(self, model: str) -> Optional[str]:
+        """Validate a model, walking its fallback chain if it is unavailable."""
+        is_valid, message = self._check_model_available(model)
+        if is_valid:
+            return model
+            
+        logger.warning(f"Primary model validation failed: {message}")
+        # Try fallback models
+        fallback_models = self.model_validator.get_fallback_chain(model, "translation")
+        for fallback in fallback_models:
+            is_valid, message = self._check_model_available(fallback)
+            if is_valid:
+                logger.info(f"Using fallback model: {fallback}")
+                return fallback
+                
+        logger.error("No valid models available for translation")
+        return None
+        
+    def _check_model_available(self, model: str) -> Tuple[bool, str]:
+        """Validate a model, treating an open circuit breaker as unavailable."""
+        health_monitor = getattr(self, "health_monitor", None)
+        if health_monitor is not None and not health_monitor.allow(model):
+            return False, "Circuit breaker open"
+        return self.model_validator.validate_model(model)
+        
+    def get_model_health_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get circuit breaker state and health score per model."""
+        if getattr(self, "health_monitor", None) is None:
+            return {}
+        return self.health_monitor.get_stats()
+        
+    def _result_cache_key(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        profile: Optional[str] = None,
+        streaming: bool = False
+    ) -> Optional[str]:
+        """
+        Build the result cache key for a request, or None when caching is off.
+        Greedy local streams are keyed on the settings they decode with, so
+        their output never answers a beam search request.
+        """
+        if getattr(self, "result_cache", None) is None or not text:
+            return None
+        return make_cache_key(
+            model, source_lang, target_lang, text, self._generation_params(profile, streaming)
+        )
+        
+    def get_translation_memory_stats(self) -> Dict[str, Any]:
+        """Get exact, near and missed translation memory lookups and their latency."""
+        if getattr(self, "translation_memory", None) is None:
+            return {}
+        return self.translation_memory.get_stats()
+        
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """Get how many translate calls ran themselves vs shared an identical in-flight call."""
+        if getattr(self, "single_flight", None) is None:
+            return {}
+        return self.single_flight.get_stats()
+        
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hit, miss and eviction counters for the result cache."""
+        if getattr(self, "result_cache", None) is None:
+            return {}
+        return self.result_cache.get_stats()
+        
+    def _translate_batch_with_local_model(
+        self,
+        texts: List[str],
+        model: str,
+        max_batch_size: int = 16,
+        profile: Optional[str] = None
+    ) -> List[Optional[str]]:
+        """
+        Translate a list of texts with a locally cached model.
+        
+        Inputs are tokenized once without padding, sorted by token length and
+        split into buckets of at most ``max_batch_size``. Each bucket is padded
+        only to its own longest member, so short inputs never pay for long ones.
+        If a bucket fails as a whole, its items are retried one by one.
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        timings = self._get_stage_timings()
+        with timings.span(model, "model_fetch"):
+            model_obj, tokenizer = self.model_cache[model]
+        
+        # Tokenize each item on its own so a bad input only fails itself. Blank
+        # and untokenizable inputs are input errors, not model failures, so
+        # they are skipped without counting against the model's health
+        encoded: Dict[int, Dict[str, List[int]]] = {}
+        tokenize_start = time.perf_counter()
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                logger.warning(f"Skipping empty batch item {index} for model {model}")
+                continue
+            try:
+                encoding = tokenizer(text, truncation=True, max_length=512)
+                encoded[index] = {key: list(value) for key, value in encoding.items()}
+            except Exception as e:
+                logger.warning(f"Skipping batch item {index} the {model} tokenizer rejected: {str(e)}")
+        timings.record(model, "tokenize", time.perf_counter() - tokenize_start)
+                
+        # Sort by token length so each bucket holds inputs of similar size
+        order = sorted(encoded, key=lambda i: len(encoded[i]["input_ids"]))
+        buckets = [
+            order[start:start + max_batch_size]
+            for start in range(0, len(order), max_batch_size)
+        ]
+        
+        for bucket in buckets:
+            try:
+                with timings.span(model, "pad"):
+                    batch = tokenizer.pad(
+                        [encoded[i] for i in bucket],
+                        padding=True,
+                        return_tensors="pt"
+                    )
+                with timings.span(model, "generate"):
+                    outputs = model_obj.generate(
+                        input_ids=batch["input_ids"],
+                        attention_mask=batch.get("attention_mask", None),
+                        generation_config=self._get_generation_config(profile)
+                    )
+                with timings.span(model, "decode"):
+                    translations = self._decode_sequences(tokenizer, outputs)
+                for index, translation in zip(bucket, translations):
+                    results[index] = translation
+                    self.response_handler.log_translation_attempt(
+                        True, model, texts[index], translation
+                    )
+            except Exception as e:
+                logger.warning(
+                    f"Batched generation failed for bucket of {len(bucket)} "
+                    f"with model {model}, retrying items individually: {str(e)}"
+                )
+                for index in bucket:
+                    results[index] = self._translate_with_local_model(texts[index], model, profile)
+                    
+        return results
+        
+    def _get_generation_profiles(self) -> GenerationProfiles:
+        """Get the generation profile registry, building it from config on first use."""
+        profiles = getattr(self, "generation_profiles", None)
+        if profiles is None:
+            config = getattr(self, "_config", None) or {}
+            profiles = GenerationProfiles.from_config(config.get('generation_profiles', {}))
+            self.generation_profiles = profiles
+        return profiles
+        
+    def _select_batch_profile(
+        self,
+        profiles: GenerationProfiles,
+        profile: Optional[str],
+        texts: List[str]
+    ) -> str:
+        """Resolve one profile for a batch, judged by its longest text and size."""
+        longest = max((text or "" for text in texts), key=lambda text: len(text.split()), default="")
+        return profiles.select(profile, longest, pending=len(texts))
+        
+    def get_generation_profile_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get latency and output length statistics per generation profile."""
+        return self._get_generation_profiles().get_stats()
+        
+    def _generation_params(self, profile: Optional[str] = None, streaming: bool = False) -> Dict[str, Any]:
+        """
+        Generation parameters shared by local generation and API payloads.
+        With ``streaming``, the greedy settings a local stream actually runs.
+        """
+        params = self._get_generation_profiles().params(profile)
+        if streaming and params.get("num_beams", 1) > 1:
+            return streaming_params(params)
+        return params
+        
+    def _get_generation_config(self, profile: Optional[str] = None) -> GenerationConfig:
+        """Generation config shared by single and batched local translation."""
+        from transformers import GenerationConfig
+        return GenerationConfig(**self._generation_params(profile))
+        
+    def _decode_sequences(self, tokenizer: PreTrainedTokenizerBase, outputs: Any) -> List[str]:
+        """Decode generated sequences into stripped strings."""
+        import torch
+        from transformers.generation.utils import GenerateOutput
+        
+        # Handle different output types
+        if isinstance(outputs, GenerateOutput):
+            sequences = outputs.sequences
+        elif isinstance(outputs, torch.Tensor):
+            sequences = outputs
+        else:
+            sequences = cast(torch.Tensor, outputs)
+            
+        # Convert to list for decoding
+        if isinstance(sequences, torch.Tensor):
+            sequences = sequences.tolist()
+            
+        return [
+            translation.strip()
+            for translation in tokenizer.batch_decode(
                 sequences,
                 skip_special_tokens=True,
                 clean_up_tokenization_spaces=True
-            )[0].strip()
+            )
+        ]
+            
+    def _translate_with_local_model(self, text: str, model: str, profile: Optional[str] = None) -> Optional[str]:
+        """Translate using a locally cached model."""
+        start = time.perf_counter()
+        timings = self._get_stage_timings()
+        try:
+            # Loads the model on first use
+            with timings.span(model, "model_fetch"):
+                model_obj, tokenizer = self.model_cache[model]
+            
+            # Encode input text
+            with timings.span(model, "tokenize"):
+                inputs = tokenizer(text, return_tensors="pt", padding=True)
+                input_ids = inputs["input_ids"]
+                attention_mask = inputs.get("attention_mask", None)
+            
+            # Generate translation
+            with timings.span(model, "generate"):
+                outputs = model_obj.generate(
+                    input_ids=input_ids,
+                    attention_mask=attention_mask,
+                    generation_config=self._get_generation_config(profile)
+                )
+            
+            # Decode output
+            with timings.span(model, "decode"):
+                translation = self._decode_sequences(tokenizer, outputs)[0]
             
             self.response_handler.log_translation_attempt(
-                True, model, text, translation
+                True, model, text, translation, latency=time.perf_counter() - start
             )
             return translation
             
         except Exception as e:
             self.response_handler.log_translation_attempt(
-                False, model, text, None, str(e)
+                False, model, text, None, str(e), time.perf_counter() - start
             )
             return None
             
-    def _translate_with_api(self, text: str, model: str, target_lang: str) -> Optional[str]:
-        """Translate using the HuggingFace API."""
+    def _translate_with_api(
+        self,
+        text: str,
+        model: str,
+        target_lang: str,
+        profile: Optional[str] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Optional[str]:
+        """
+        Translate using the HuggingFace API.
+        Setting ``cancel_event`` abandons the request at its next retry.
+        """
+        start = time.perf_counter()
+        timings = self._get_stage_timings()
         try:
             logger.info(f"Using API for model: {model}")
             
-            # Get model info for language codes
-            model_info = self._config.get("translation_models", {}).get(model, {})
-            model_type = model_info.get("model_type")
-            lang_codes = model_info.get("lang_codes", {})
-            
-            # Build payload based on model type
-            if model_type == "seamless":
-                # For seamless models, we need to set the target language token
-                payload = {
-                    "inputs": text,
-                    "parameters": {
-                        "max_length": 512,
-                        "num_beams": 4,
-                        "length_penalty": 0.6,
-                        "early_stopping": True,
-                        "task": "translation",
-                        "source_lang": lang_codes.get("source"),
-                        "target_lang": lang_codes.get("target")
-                    }
-                }
-            else:
-                # Default payload for other model types
-                payload = {
-                    "inputs": text,
-                    "parameters": {
-                        "max_length": 512,
-                        "num_beams": 4,
-                        "length_penalty": 0.6,
-                        "early_stopping": True
-                    }
-                }
-            
-            logger.info(f"API request payload: {payload}")
+            with timings.span(model, "payload"):
+                payload = self._build_api_payload(text, model, profile)
+            logger.debug("API request payload: %s", payload)
             
             # Get model family for response parsing
             model_family = self._get_model_family(model)
@@ -333,45 +1562,63 @@ class TranslationService:
             base_delay = 5  # seconds
             
             for attempt in range(max_retries):
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
                 try:
-                    response = requests.post(
-                        f"{self.api_url}{model}",
-                        headers=self.headers,
-                        json=payload,
-                        timeout=30
-                    )
+                    with timings.span(model, "http"):
+                        response = get_http_client().post(
+                            f"{self.api_url}{model}",
+                            headers=self.headers,
+                            json=payload,
+                            timeout=30
+                        )
                     
                     if response.status_code == 503:
                         if attempt < max_retries - 1:
                             delay = base_delay * (attempt + 1)  # Exponential backoff
                             logger.warning(f"Model is loading, retrying in {delay} seconds... (Attempt {attempt + 1}/{max_retries})")
-                            time.sleep(delay)
+                            with timings.span(model, "retry_wait"):
+                                if cancel_event is None:
+                                    time.sleep(delay)
+                                elif cancel_event.wait(delay):
+                                    logger.info(f"Request to {model} cancelled while waiting for the model to load")
+                                    return None
                             continue
                         else:
                             error_msg = f"Model failed to load after {max_retries} attempts"
                             logger.error(error_msg)
-                            st.error(error_msg)
+                            _show_error(error_msg)
+                            self.response_handler.log_translation_attempt(
+                                False, model, text, None, error_msg, time.perf_counter() - start
+                            )
                             return None
                         
                     if response.status_code != 200:
                         error_msg = f"API error ({response.status_code}): {response.text}"
                         logger.error(error_msg)
-                        st.error(error_msg)
+                        _show_error(error_msg)
+                        self.response_handler.log_translation_attempt(
+                            False, model, text, None, error_msg, time.perf_counter() - start
+                        )
                         return None
                         
-                    result = response.json()
-                    logger.info(f"API response: {result}")
-                    success, translation, error = self.response_handler.extract_translation(
-                        result, model_family
-                    )
+                    with timings.span(model, "parse"):
+                        result = response.json()
+                        success, translation, error = self.response_handler.extract_translation(
+                            result, model_family
+                        )
+                    logger.debug("API response: %s", result)
                     
                     if success:
                         self.response_handler.log_translation_attempt(
-                            True, model, text, translation
+                            True, model, text, translation, latency=time.perf_counter() - start
                         )
                         return translation
                     else:
                         logger.error(f"Failed to extract translation: {error}")
+                        self.response_handler.log_translation_attempt(
+                            False, model, text, None, error, time.perf_counter() - start
+                        )
                         return None
                         
                 except requests.exceptions.Timeout:
@@ -379,17 +1626,46 @@ class TranslationService:
                         continue
                     error_msg = "API request timed out"
                     logger.error(error_msg)
-                    st.error(error_msg)
+                    _show_error(error_msg)
+                    self.response_handler.log_translation_attempt(
+                        False, model, text, None, error_msg, time.perf_counter() - start
+                    )
                     return None
                     
             return None
             
         except Exception as e:
             self.response_handler.log_translation_attempt(
-                False, model, text, None, str(e)
+                False, model, text, None, str(e), time.perf_counter() - start
             )
             return None
 
+    def _build_api_payload(self, text: str, model: str, profile: Optional[str] = None) -> Dict[str, Any]:
+        """Build the Inference API payload for a model."""
+        # Get model info for language codes
+        model_info = self._config.get("translation_models", {}).get(model, {})
+        model_type = model_info.get("model_type")
+        lang_codes = model_info.get("lang_codes", {})
+        
+        # Build payload based on model type
+        if model_type == "seamless":
+            # For seamless models, we need to set the target language token
+            return {
+                "inputs": text,
+                "parameters": {
+                    **self._generation_params(profile),
+                    "task": "translation",
+                    "source_lang": lang_codes.get("source"),
+                    "target_lang": lang_codes.get("target")
+                }
+            }
+            
+        # Default payload for other model types
+        return {
+            "inputs": text,
+            "parameters": self._generation_params(profile)
+        }
+
     def _get_model_family(self, model: str) -> str:
         """Determine model family for response parsing."""
         model_lower = model.lower()
@@ -422,8 +1698,8 @@ class TranslationService:
                 return True
                 
             # If model not cached on EC2, check API status
-            response = requests.get(
-                f"https://api-inference.huggingface.co/status/{model}",
+            response = get_http_client().get(
+                f"{getattr(self, 'status_url', DEFAULT_STATUS_URL)}{model}",
                 headers=self.headers,
                 timeout=30
             )
@@ -442,6 +1718,8 @@ class TranslationService:
 
     def check_tokenizer_config(self, model: str):
         """Check the tokenizer configuration for a model."""
+        from transformers import AutoTokenizer
+        
         try:
             tokenizer = AutoTokenizer.from_pretrained(model)
             logger.info(f"Tokenizer configuration for {model}: {tokenizer}")
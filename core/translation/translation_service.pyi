@@ -1,5 +1,5 @@
 """Type stub file for TranslationService"""
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Iterator, List, Optional
 
 class TranslationService:
     def __init__(self) -> None: ...
@@ -9,9 +9,72 @@ class TranslationService:
         text: str,
         source_lang: str,
         target_lang: str,
-        model: Optional[str] = None
+        model: Optional[str] = None,
+        profile: Optional[str] = None
     ) -> str: ...
     
+    def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        profile: Optional[str] = None
+    ) -> Iterator[str]: ...
+    
+    def translate_batch(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        profile: Optional[str] = None
+    ) -> List[Optional[str]]: ...
+    
+    async def translate_many(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        max_concurrency: Optional[int] = None,
+        deadline_seconds: Optional[float] = None,
+        profile: Optional[str] = None
+    ) -> List[Optional[str]]: ...
+    
+    def translate_document(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model: str,
+        profile: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Optional[str]: ...
+    
+    def get_generation_profile_stats(self) -> Dict[str, Dict[str, Any]]: ...
+    
+    def get_streaming_stats(self) -> Dict[str, Dict[str, Any]]: ...
+    
+    def get_stage_timing_stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]: ...
+    
+    def get_logging_stats(self) -> Dict[str, Any]: ...
+    
+    def get_translation_memory_stats(self) -> Dict[str, Any]: ...
+    
+    def get_coalescing_stats(self) -> Dict[str, Any]: ...
+    
+    def get_hedging_stats(self) -> Dict[str, Any]: ...
+    
+    def get_model_health_stats(self) -> Dict[str, Dict[str, Any]]: ...
+    
+    def is_ready(self) -> bool: ...
+    
+    def get_startup_report(self) -> Dict[str, Any]: ...
+    
+    def get_memory_report(self) -> Dict[str, Any]: ...
+    
     def get_model_info(self, model: str) -> Dict[str, Any]: ...
     
     def get_supported_languages(self) -> Dict[str, str]: ...
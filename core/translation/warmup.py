@@ -0,0 +1,183 @@
+"""
+Warm-up of local models before the service reports ready.
+The first generate call on a freshly loaded model pays for allocator
+growth and lazy kernel initialisation. Warm-up runs dummy batches of
+several input lengths and batch sizes through each model so that cost is
+paid at start-up, and records a report of load time, warm-up time and the
+first versus steady-state latency of every model.
+"""
+
+import logging
+import threading
+import time
+from statistics import median
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Short, medium and long inputs in both directions
+DEFAULT_WARMUP_TEXTS = (
+    "salam",
+    "How are you doing today?",
+    "wach nta mezyan? bghit nmchi l souk m3ak ghedda f sbah.",
+    "The weather in Marrakech was beautiful this morning, so we walked through the "
+    "old medina, stopped for mint tea near the square and bought spices for dinner.",
+)
+
+PENDING = "pending"
+WARMING = "warming"
+READY = "ready"
+FAILED = "failed"
+
+
+class ModelWarmup:
+    """
+    Warms a list of models and tracks start-up readiness.
+
+    For each model: load it, time one translation of the longest text
+    (first latency), run every text at every batch size under every profile,
+    then time ``steady_runs`` more translations of the same text (steady
+    latency). The warm-up is ready once every model has been processed;
+    a model that fails is reported but does not block readiness.
+    """
+
+    def __init__(
+        self,
+        texts: Sequence[str] = DEFAULT_WARMUP_TEXTS,
+        batch_sizes: Sequence[int] = (1, 4),
+        profiles: Sequence[Optional[str]] = ("interactive",),
+        steady_runs: int = 3
+    ):
+        self.texts = list(texts)
+        self.batch_sizes = list(batch_sizes)
+        self.profiles = list(profiles)
+        self.steady_runs = max(1, steady_runs)
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._models: Dict[str, Dict[str, Any]] = {}
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ModelWarmup":
+        """Create a warm-up from the ``warmup`` section of the model config."""
+        return cls(
+            texts=config.get("texts") or DEFAULT_WARMUP_TEXTS,
+            batch_sizes=config.get("batch_sizes", [1, 4]),
+            profiles=config.get("profiles", ["interactive"]),
+            steady_runs=config.get("steady_runs", 3)
+        )
+
+    def start(
+        self,
+        models: Iterable[str],
+        load: Callable[[str], Any],
+        translate: Callable[[str, str, Optional[str]], Optional[str]],
+        translate_batch: Callable[[List[str], str, Optional[str]], List[Optional[str]]],
+        background: bool = True
+    ):
+        """Warm ``models`` now, or in a background thread when ``background``."""
+        models = list(models)
+        with self._lock:
+            self._started_at = time.perf_counter()
+            self._models = {model: {"status": PENDING} for model in models}
+        if not background:
+            self._run(models, load, translate, translate_batch)
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(models, load, translate, translate_batch),
+            name="model-warmup",
+            daemon=True
+        )
+        self._thread.start()
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until warm-up has finished; returns whether it has."""
+        return self._ready.wait(timeout)
+
+    def get_report(self) -> Dict[str, Any]:
+        """Get readiness, total start-up time and the per-model warm-up results."""
+        with self._lock:
+            started, finished = self._started_at, self._finished_at
+            models = {model: dict(result) for model, result in self._models.items()}
+        end = finished if finished is not None else time.perf_counter()
+        return {
+            "ready": self.is_ready(),
+            "startup_seconds": end - started if started is not None else 0.0,
+            "models": models
+        }
+
+    def _run(self, models: List[str], load, translate, translate_batch):
+        try:
+            for model in models:
+                self._update(model, status=WARMING)
+                try:
+                    result = self._warm_model(model, load, translate, translate_batch)
+                    self._update(model, status=READY, **result)
+                except Exception as e:
+                    logger.error(f"Warm-up failed for model {model}: {str(e)}")
+                    self._update(model, status=FAILED, error=str(e))
+        finally:
+            with self._lock:
+                self._finished_at = time.perf_counter()
+            self._ready.set()
+            self._log_report()
+
+    def _warm_model(self, model: str, load, translate, translate_batch) -> Dict[str, Any]:
+        start = time.perf_counter()
+        load(model)
+        load_seconds = time.perf_counter() - start
+
+        probe = max(self.texts, key=len)
+        first_latency = self._time(translate, probe, model, self.profiles[0])
+
+        start = time.perf_counter()
+        for profile in self.profiles:
+            for batch_size in self.batch_sizes:
+                for text in self.texts:
+                    if batch_size == 1:
+                        outputs = [translate(text, model, profile)]
+                    else:
+                        outputs = translate_batch([text] * batch_size, model, profile)
+                    if any(output is None for output in outputs):
+                        raise RuntimeError(f"warm-up translation failed (profile {profile}, batch {batch_size})")
+        warmup_seconds = time.perf_counter() - start
+
+        steady = [self._time(translate, probe, model, self.profiles[0]) for _ in range(self.steady_runs)]
+        steady_latency = median(steady)
+        return {
+            "load_seconds": load_seconds,
+            "warmup_seconds": warmup_seconds,
+            "first_latency_ms": first_latency * 1000.0,
+            "steady_latency_ms": steady_latency * 1000.0,
+            "first_to_steady_ratio": first_latency / steady_latency if steady_latency > 0 else 0.0
+        }
+
+    @staticmethod
+    def _time(translate, text: str, model: str, profile: Optional[str]) -> float:
+        start = time.perf_counter()
+        if translate(text, model, profile) is None:
+            raise RuntimeError("warm-up translation failed")
+        return time.perf_counter() - start
+
+    def _update(self, model: str, **fields: Any):
+        with self._lock:
+            self._models.setdefault(model, {}).update(fields)
+
+    def _log_report(self):
+        report = self.get_report()
+        logger.info(f"Model warm-up finished in {report['startup_seconds']:.2f}s")
+        for model, result in report["models"].items():
+            if result["status"] != READY:
+                logger.warning(f"  {model}: {result['status']} ({result.get('error')})")
+                continue
+            logger.info(
+                f"  {model}: load {result['load_seconds']:.2f}s, "
+                f"warm-up {result['warmup_seconds']:.2f}s, "
+                f"first {result['first_latency_ms']:.0f} ms vs steady {result['steady_latency_ms']:.0f} ms"
+            )
@@ -0,0 +1,490 @@
+"""
+Multi-process pool of local model workers.
+Each worker process hosts a subset of the locally cached models with its
+own torch thread budget. The front process sends requests over a pipe to
+the least loaded worker hosting the model, restarts workers that die and
+pings them for health.
+"""
+
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .mmap_loader import process_memory_report
+
+logger = logging.getLogger(__name__)
+
+# Called in the worker process with the worker's model names; returns an
+# object with the TranslationService local inference methods
+WorkerFactory = Callable[[List[str]], Any]
+
+# A request is sent to another worker at most this many times after the
+# worker handling it died
+_MAX_ATTEMPTS = 2
+
+# Workers that die within _STABLE_UPTIME seconds of starting are restarted
+# with an exponential delay of up to _MAX_RESTART_DELAY seconds
+_STABLE_UPTIME = 60.0
+_MAX_RESTART_DELAY = 30.0
+
+
+class WorkerCrashedError(RuntimeError):
+    """The worker process handling a request died before answering."""
+
+
+def assign_models(models: Sequence[str], num_workers: int, replicas: int = 1) -> List[List[str]]:
+    """Spread models round robin over workers, each hosted by ``replicas`` workers."""
+    replicas = max(1, min(replicas, num_workers))
+    assignment: List[List[str]] = [[] for _ in range(num_workers)]
+    for index, model in enumerate(models):
+        for replica in range(replicas):
+            assignment[(index * replicas + replica) % num_workers].append(model)
+    return assignment
+
+
+def _worker_main(
+    conn: Any,
+    worker_id: int,
+    models: List[str],
+    factory: WorkerFactory,
+    torch_threads: int,
+    max_concurrency: int
+):
+    """Worker process entry point: serve requests from ``conn`` until told to stop."""
+    if torch_threads:
+        import torch
+        torch.set_num_threads(torch_threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass
+
+    service = factory(models)
+    started_at = time.time()
+    counts = {"served": 0}
+    send_lock = threading.Lock()
+
+    def reply(request_id: int, ok: bool, value: Any, served: bool = False):
+        with send_lock:
+            if served:
+                counts["served"] += 1
+            conn.send((request_id, ok, value))
+
+    def finish(request_id: int, ok: bool, value: Any):
+        reply(request_id, ok, value, served=True)
+
+    def run(request_id: int, op: str, args: tuple):
+        try:
+            if op == "translate":
+                text, model, profile = args
+                result = service._translate_with_local_model(text, model, profile)
+            else:
+                texts, model, profile = args
+                result = service._translate_batch_with_local_model(texts, model, profile=profile)
+        except Exception as e:
+            finish(request_id, False, f"{type(e).__name__}: {str(e)}")
+        else:
+            finish(request_id, True, result)
+
+    def on_batched(future: Future, request_id: int):
+        error = future.exception()
+        if error is None:
+            finish(request_id, True, future.result())
+        else:
+            finish(request_id, False, f"{type(error).__name__}: {str(error)}")
+
+    def health() -> Dict[str, Any]:
+        model_cache = service.model_cache
+        report = {
+            "pid": os.getpid(),
+            "uptime_seconds": time.time() - started_at,
+            "served": counts["served"],
+            "loaded_models": [
+                model for model in models
+                if (model_cache.is_loaded(model) if hasattr(model_cache, "is_loaded") else model in model_cache)
+            ]
+        }
+        warmup = getattr(service, "warmup", None)
+        if warmup is not None:
+            report["warmup"] = warmup.get_report()
+        if hasattr(service, "get_stage_timing_stats"):
+            report["stage_timings"] = service.get_stage_timing_stats()
+        try:
+            report["memory"] = process_memory_report()
+        except Exception as e:
+            logger.debug(f"Worker memory report failed: {str(e)}")
+        return report
+
+    executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix=f"worker-{worker_id}")
+    scheduler = getattr(service, "batch_scheduler", None)
+    # Unsolicited first report tells the front process start-up (and warm-up) is done
+    reply(None, True, health())
+    while True:
+        try:
+            request_id, op, args = conn.recv()
+        except (EOFError, OSError):
+            break
+        if op == "shutdown":
+            break
+        if op == "ping":
+            reply(request_id, True, health())
+        elif op == "translate" and scheduler is not None:
+            # Merged with concurrent requests to this worker for the same model
+            text, model, profile = args
+            future = scheduler.submit(text, model, profile)
+            future.add_done_callback(lambda done, request_id=request_id: on_batched(done, request_id))
+        else:
+            executor.submit(run, request_id, op, args)
+
+    if scheduler is not None:
+        scheduler.shutdown(wait=False)
+    executor.shutdown(wait=False)
+
+
+class _Call:
+    """A request sent to a worker and waiting for its answer."""
+
+    __slots__ = ("op", "args", "model", "size", "future", "attempts")
+
+    def __init__(self, op: str, args: tuple, model: Optional[str], size: int):
+        self.op = op
+        self.args = args
+        self.model = model
+        self.size = size
+        self.future: Future = Future()
+        self.attempts = 0
+
+
+class _Worker:
+    """Front-side handle of one worker process."""
+
+    def __init__(self, worker_id: int, models: List[str]):
+        self.worker_id = worker_id
+        self.models = models
+        self.process: Any = None
+        self.conn: Any = None
+        self.alive = False
+        self.ready = False
+        self.stopping = False
+        self.pending: Dict[int, _Call] = {}
+        self.load = 0
+        self.served = 0
+        self.failures = 0
+        self.restarts = 0
+        self.started_at = 0.0
+        self.restart_delay = 0.0
+        self.health: Dict[str, Any] = {}
+        self.health_at: Optional[float] = None
+        self.send_lock = threading.Lock()
+
+
+class WorkerPool:
+    """
+    Routes local translation requests to a pool of worker processes.
+
+    Requests for a model go to the ready worker hosting it with the fewest
+    texts in flight (workers still starting are only used when no other
+    worker hosts the model). When a worker dies its requests are retried on
+    another worker (once) and the worker is restarted. A health thread pings
+    every ready worker each ``health_interval`` seconds and restarts those
+    that do not answer within ``health_timeout``, or that take longer than
+    ``startup_timeout`` to get ready.
+    """
+
+    def __init__(
+        self,
+        factory: WorkerFactory,
+        models: Sequence[str],
+        num_workers: Optional[int] = None,
+        torch_threads: Optional[int] = None,
+        replicas: int = 1,
+        max_concurrency: int = 2,
+        health_interval: float = 10.0,
+        health_timeout: float = 5.0,
+        startup_timeout: float = 120.0,
+        start_method: str = "spawn"
+    ):
+        cpus = os.cpu_count() or 1
+        if not num_workers:
+            num_workers = max(1, cpus // torch_threads) if torch_threads else cpus
+        if not torch_threads:
+            torch_threads = max(1, cpus // num_workers)
+        self.factory = factory
+        self.num_workers = num_workers
+        self.torch_threads = torch_threads
+        self.max_concurrency = max_concurrency
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.startup_timeout = startup_timeout
+        self._context = multiprocessing.get_context(start_method)
+        self._workers = [
+            _Worker(worker_id, assigned)
+            for worker_id, assigned in enumerate(assign_models(list(models), num_workers, replicas))
+        ]
+        self._request_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._running = False
+        self._stop_event = threading.Event()
+        self._health_thread: Optional[threading.Thread] = None
+        self._stats = {"dispatched": 0, "retried": 0, "crashes": 0}
+
+    @classmethod
+    def from_config(cls, factory: WorkerFactory, models: Sequence[str], config: Dict[str, Any]) -> "WorkerPool":
+        """Create a pool from the ``worker_pool`` section of the model config."""
+        return cls(
+            factory,
+            models,
+            num_workers=config.get("workers"),
+            torch_threads=config.get("torch_threads"),
+            replicas=config.get("replicas_per_model", 1),
+            max_concurrency=config.get("max_concurrency", 2),
+            health_interval=config.get("health_interval_seconds", 10),
+            health_timeout=config.get("health_timeout_seconds", 5),
+            startup_timeout=config.get("startup_timeout_seconds", 120),
+            start_method=config.get("start_method", "spawn")
+        )
+
+    def start(self):
+        """Start every worker process and the health checker."""
+        self._running = True
+        for worker in self._workers:
+            self._start_worker(worker)
+        self._health_thread = threading.Thread(
+            target=self._health_loop, name="worker-pool-health", daemon=True
+        )
+        self._health_thread.start()
+        logger.info(
+            f"Started {self.num_workers} model workers with {self.torch_threads} torch threads each"
+        )
+
+    def hosts(self, model: str) -> bool:
+        """Whether any worker hosts the model."""
+        return any(model in worker.models for worker in self._workers)
+
+    def translate(
+        self,
+        text: str,
+        model: str,
+        profile: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> Optional[str]:
+        """Translate one text in a worker, blocking until it answers."""
+        return self._submit("translate", (text, model, profile), model, 1).result(timeout=timeout)
+
+    def translate_batch(
+        self,
+        texts: List[str],
+        model: str,
+        profile: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> List[Optional[str]]:
+        """Translate a list of texts in one worker, results in input order."""
+        return self._submit("translate_batch", (texts, model, profile), model, len(texts)).result(timeout=timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get dispatch counters and per-worker load, restarts and last health report."""
+        now = time.perf_counter()
+        with self._lock:
+            workers = {
+                worker.worker_id: {
+                    "pid": worker.process.pid if worker.process is not None else None,
+                    "alive": worker.alive,
+                    "ready": worker.ready,
+                    "models": list(worker.models),
+                    "in_flight": sum(call.op != "ping" for call in worker.pending.values()),
+                    "load": worker.load,
+                    "served": worker.served,
+                    "failures": worker.failures,
+                    "restarts": worker.restarts,
+                    "health_age_seconds": now - worker.health_at if worker.health_at is not None else None,
+                    "health": dict(worker.health)
+                }
+                for worker in self._workers
+            }
+            return {**self._stats, "workers": workers}
+
+    def shutdown(self, timeout: float = 5.0):
+        """Stop the workers, failing requests still in flight."""
+        self._running = False
+        self._stop_event.set()
+        for worker in self._workers:
+            with self._lock:
+                worker.stopping = True
+                pending = list(worker.pending.values())
+                worker.pending.clear()
+            try:
+                with worker.send_lock:
+                    worker.conn.send((-1, "shutdown", ()))
+            except Exception:
+                pass
+            for call in pending:
+                if not call.future.done():
+                    call.future.set_exception(RuntimeError("Worker pool has been shut down"))
+        for worker in self._workers:
+            if worker.process is None:
+                continue
+            worker.process.join(timeout)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join(timeout)
+            worker.alive = False
+
+    def _start_worker(self, worker: _Worker):
+        """Launch (or relaunch) the process for a worker."""
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, worker.worker_id, worker.models, self.factory,
+                  self.torch_threads, self.max_concurrency),
+            name=f"model-worker-{worker.worker_id}",
+            daemon=True
+        )
+        process.start()
+        # Only the child keeps its end open, so the reader sees EOF if it dies
+        child_conn.close()
+        with self._lock:
+            worker.process = process
+            worker.conn = parent_conn
+            worker.alive = True
+            worker.ready = False
+            worker.stopping = False
+            worker.started_at = time.perf_counter()
+        threading.Thread(
+            target=self._read_loop,
+            args=(worker, process, parent_conn),
+            name=f"model-worker-{worker.worker_id}-reader",
+            daemon=True
+        ).start()
+
+    def _submit(self, op: str, args: tuple, model: Optional[str], size: int) -> Future:
+        if not self._running:
+            raise RuntimeError("Worker pool is not running")
+        call = _Call(op, args, model, size)
+        self._dispatch(call)
+        return call.future
+
+    def _dispatch(self, call: _Call, worker: Optional[_Worker] = None):
+        """Send a call to ``worker`` or the least loaded live worker hosting its model."""
+        with self._lock:
+            if worker is None:
+                candidates = [
+                    candidate for candidate in self._workers
+                    if candidate.alive and call.model in candidate.models
+                ]
+                if not candidates:
+                    call.future.set_exception(RuntimeError(f"No live worker hosts model {call.model}"))
+                    return
+                worker = min(candidates, key=lambda candidate: (not candidate.ready, candidate.load))
+            request_id = next(self._request_ids)
+            call.attempts += 1
+            worker.pending[request_id] = call
+            worker.load += call.size
+            if call.op != "ping":
+                self._stats["dispatched"] += 1
+            conn = worker.conn
+        try:
+            with worker.send_lock:
+                conn.send((request_id, call.op, call.args))
+        except (OSError, ValueError) as e:
+            # The reader notices the dead pipe and retries the call elsewhere
+            logger.warning(f"Could not send request to worker {worker.worker_id}: {str(e)}")
+
+    def _read_loop(self, worker: _Worker, process: Any, conn: Any):
+        """Resolve futures from a worker's answers until its pipe closes."""
+        while True:
+            try:
+                request_id, ok, value = conn.recv()
+            except (EOFError, OSError):
+                break
+            with self._lock:
+                if request_id is None:
+                    worker.ready = True
+                    worker.health = value
+                    worker.health_at = time.perf_counter()
+                    continue
+                call = worker.pending.pop(request_id, None)
+                if call is None:
+                    continue
+                worker.load -= call.size
+                if call.op == "ping":
+                    worker.health = value
+                    worker.health_at = time.perf_counter()
+                elif ok:
+                    worker.served += 1
+                else:
+                    worker.failures += 1
+            if ok:
+                call.future.set_result(value)
+            else:
+                call.future.set_exception(RuntimeError(value))
+        self._on_worker_exit(worker, process)
+
+    def _on_worker_exit(self, worker: _Worker, process: Any):
+        """Retry a dead worker's requests elsewhere and restart it."""
+        with self._lock:
+            if worker.process is not process or worker.stopping:
+                return
+            worker.alive = False
+            worker.ready = False
+            pending = list(worker.pending.values())
+            worker.pending.clear()
+            worker.load = 0
+            worker.restarts += 1
+            self._stats["crashes"] += 1
+        process.join(1.0)
+        logger.error(
+            f"Model worker {worker.worker_id} exited (code {process.exitcode}) "
+            f"with {len(pending)} requests in flight - restarting"
+        )
+
+        for call in pending:
+            if call.op == "ping":
+                call.future.set_exception(WorkerCrashedError(f"Worker {worker.worker_id} died"))
+            elif call.attempts < _MAX_ATTEMPTS and self._running:
+                with self._lock:
+                    self._stats["retried"] += 1
+                self._dispatch(call)
+            else:
+                call.future.set_exception(
+                    WorkerCrashedError(f"Worker {worker.worker_id} died while handling the request")
+                )
+
+        # Back off when a worker keeps dying right after starting
+        if time.perf_counter() - worker.started_at < _STABLE_UPTIME:
+            worker.restart_delay = min(_MAX_RESTART_DELAY, max(0.5, worker.restart_delay * 2))
+        else:
+            worker.restart_delay = 0.0
+        if worker.restart_delay and self._stop_event.wait(worker.restart_delay):
+            return
+        if self._running:
+            self._start_worker(worker)
+
+    def _health_loop(self):
+        """Ping every worker periodically, restarting those that stop answering."""
+        while not self._stop_event.wait(self.health_interval):
+            pings = []
+            for worker in self._workers:
+                process = worker.process
+                if worker.alive and worker.ready:
+                    ping = _Call("ping", (), None, 0)
+                    self._dispatch(ping, worker)
+                    pings.append((worker, process, ping))
+                elif (worker.alive and process.is_alive()
+                        and time.perf_counter() - worker.started_at > self.startup_timeout):
+                    logger.error(f"Model worker {worker.worker_id} did not start in time - restarting")
+                    process.terminate()
+            for worker, process, ping in pings:
+                try:
+                    ping.future.result(timeout=self.health_timeout)
+                except WorkerCrashedError:
+                    continue
+                except Exception:
+                    if self._running and worker.process is process and process.is_alive():
+                        logger.error(f"Model worker {worker.worker_id} failed its health check - restarting")
+                        # The reader sees the pipe close and restarts the worker
+                        process.terminate()
@@ -12,11 +12,15 @@ The following changes require explicit authorization before modification:
 from .environment import (
     is_running_on_ec2,
     get_environment,
-    should_use_local_models
+    reset_environment,
+    should_use_local_models,
+    start_environment_probe
 )
 
 __all__ = [
     'is_running_on_ec2',
     'get_environment',
-    'should_use_local_models'
+    'reset_environment',
+    'should_use_local_models',
+    'start_environment_probe'
 ]
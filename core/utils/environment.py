@@ -1,42 +1,169 @@
 """
 Environment detection utilities for the translation service.
 Handles detection of running environment (local vs EC2) and related settings.
+
+The environment is resolved once per process. Resolution order is the
+DEPLOYMENT_ENV variable, then an on-disk hint left by an earlier run on the
+same host, then a short probe of the EC2 metadata endpoint. Only a
+successful probe is recorded in the hint, and the hint expires, so one slow
+metadata response cannot pin an EC2 host to API mode. The probe can be
+started in the background with ``start_environment_probe()`` so it overlaps
+other start-up work.
 """
 
+import json
 import os
 import logging
+import socket
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
 import requests
 
 logger = logging.getLogger(__name__)
 
-def is_running_on_ec2() -> bool:
+EC2_METADATA_URL = 'http://169.254.169.254/latest/meta-data/instance-id'
+
+# The metadata service answers in a few milliseconds on EC2
+DEFAULT_PROBE_TIMEOUT = 0.2
+
+# Re-probe once a day in case the hint outlives the instance it describes
+DEFAULT_HINT_TTL = 24 * 3600
+
+_environment: Optional[str] = None
+_lock = threading.Lock()
+_probe_thread: Optional[threading.Thread] = None
+
+
+def _probe_timeout() -> float:
+    return float(os.getenv('EC2_METADATA_TIMEOUT', str(DEFAULT_PROBE_TIMEOUT)))
+
+
+def _hint_ttl() -> float:
+    return float(os.getenv('ENVIRONMENT_HINT_TTL', str(DEFAULT_HINT_TTL)))
+
+
+def _hint_path() -> Optional[Path]:
+    """Location of the on-disk environment hint, or None if disabled."""
+    path = os.getenv('ENVIRONMENT_HINT_FILE', 'cache/environment_hint.json')
+    return Path(path) if path else None
+
+
+def is_running_on_ec2(timeout: Optional[float] = None) -> bool:
     """
     Check if the application is running on an EC2 instance by attempting to
     access the EC2 metadata service.
     """
     try:
         response = requests.get(
-            'http://169.254.169.254/latest/meta-data/instance-id',
-            timeout=1  # Short timeout since metadata service should be fast
+            EC2_METADATA_URL,
+            timeout=timeout if timeout is not None else _probe_timeout()
         )
         return response.status_code == 200
     except requests.RequestException:
         return False
 
+
+def _read_hint() -> Optional[str]:
+    """Read the environment recorded by an earlier run on this host, unless expired."""
+    path = _hint_path()
+    if path is None or not path.exists():
+        return None
+    try:
+        hint = json.loads(path.read_text())
+        fresh = time.time() - float(hint.get('written_at', 0)) < _hint_ttl()
+        if hint.get('hostname') == socket.gethostname() and hint.get('environment') == 'ec2' and fresh:
+            return 'ec2'
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable environment hint {path}: {e}")
+    return None
+
+
+def _write_hint(environment: str):
+    """Record the detected environment for later runs on this host."""
+    path = _hint_path()
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            'environment': environment,
+            'hostname': socket.gethostname(),
+            'written_at': time.time()
+        }))
+    except Exception as e:
+        logger.warning(f"Could not write environment hint {path}: {e}")
+
+
+def _detect_environment() -> str:
+    """Resolve the environment without consulting the process cache."""
+    # Allow manual override through environment variable
+    env = os.getenv('DEPLOYMENT_ENV')
+    if env:
+        return env.lower()
+
+    hint = _read_hint()
+    if hint:
+        logger.info(f"Using cached environment hint: {hint}")
+        return hint
+
+    # Auto-detect environment; a failed probe may only have been slow, so
+    # 'local' is not recorded and the next process probes again
+    env = 'ec2' if is_running_on_ec2() else 'local'
+    if env == 'ec2':
+        _write_hint(env)
+    logger.info(f"Detected environment: {env}")
+    return env
+
+
+def _resolve():
+    global _environment
+    env = _detect_environment()
+    with _lock:
+        if _environment is None:
+            _environment = env
+
+
+def start_environment_probe():
+    """Start resolving the environment in the background if not done yet."""
+    global _probe_thread
+    with _lock:
+        if _environment is not None or _probe_thread is not None:
+            return
+        _probe_thread = threading.Thread(
+            target=_resolve, name="environment-probe", daemon=True
+        )
+        _probe_thread.start()
+
+
 def get_environment() -> str:
     """
     Get the current environment (local or ec2).
     Can be overridden by setting DEPLOYMENT_ENV environment variable.
+    Resolved once per process; later calls return the cached value.
     """
-    # Allow manual override through environment variable
-    env = os.getenv('DEPLOYMENT_ENV')
-    if env:
-        return env.lower()
-        
-    # Auto-detect environment
-    if is_running_on_ec2():
-        return 'ec2'
-    return 'local'
+    if _environment is not None:
+        return _environment
+
+    start_environment_probe()
+    thread = _probe_thread
+    if thread is not None:
+        thread.join()
+    if _environment is None:
+        # Probe thread died unexpectedly - resolve inline
+        _resolve()
+    return _environment
+
+
+def reset_environment():
+    """Forget the resolved environment so the next call detects it again."""
+    global _environment, _probe_thread
+    with _lock:
+        _environment = None
+        _probe_thread = None
+
 
 def should_use_local_models() -> bool:
     """
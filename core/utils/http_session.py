@@ -0,0 +1,175 @@
+"""
+Shared HTTP connection pool for Hugging Face Inference API calls.
+All API callers reuse one keep-alive session so repeated requests to the
+same host skip the TCP and TLS handshake. Request timings are recorded
+per host.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from core.utils.latency import latency_summary
+
+logger = logging.getLogger(__name__)
+
+# Number of recent request latencies kept per host for percentiles
+_LATENCY_WINDOW = 1000
+
+
+class _HostStats:
+    """Request counters and recent latencies for a single host."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.latencies: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+
+class PooledHTTPClient:
+    """
+    Keep-alive HTTP client backed by a single ``requests.Session``.
+
+    ``pool_connections`` is the number of hosts kept in the pool and
+    ``pool_maxsize`` the number of connections kept per host. With
+    ``pool_block`` set, callers wait for a free connection instead of
+    opening extra ones.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        pool_block: bool = False,
+        default_timeout: float = 30
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.default_timeout = default_timeout
+        self._stats: Dict[str, _HostStats] = {}
+        self._stats_lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the pool and record its timing."""
+        kwargs.setdefault("timeout", self.default_timeout)
+        host = urlsplit(url).netloc
+        start = time.perf_counter()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.RequestException:
+            self._record(host, time.perf_counter() - start, error=True)
+            raise
+        self._record(host, time.perf_counter() - start, error=response.status_code >= 500)
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a GET request through the pool."""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Send a POST request through the pool."""
+        return self.request("POST", url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-host request counts, latency percentiles and connection reuse."""
+        with self._stats_lock:
+            hosts = {
+                host: {
+                    "requests": stats.requests,
+                    "errors": stats.errors,
+                    **latency_summary(stats.latencies)
+                }
+                for host, stats in self._stats.items()
+            }
+
+        connections_opened = 0
+        for adapter in set(self.session.adapters.values()):
+            pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+            if pools is None:
+                continue
+            for key in list(pools.keys()):
+                try:
+                    connections_opened += pools[key].num_connections
+                except KeyError:
+                    continue
+
+        total_requests = sum(host["requests"] for host in hosts.values())
+        return {
+            "hosts": hosts,
+            "requests": total_requests,
+            "connections_opened": connections_opened,
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize
+        }
+
+    def close(self):
+        """Close all pooled connections."""
+        self.session.close()
+
+    def _record(self, host: str, elapsed: float, error: bool = False):
+        """Record the outcome of one request."""
+        with self._stats_lock:
+            stats = self._stats.get(host)
+            if stats is None:
+                stats = self._stats[host] = _HostStats()
+            stats.requests += 1
+            stats.latencies.append(elapsed)
+            if error:
+                stats.errors += 1
+
+
+_client: Optional[PooledHTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> PooledHTTPClient:
+    """
+    Get the process-wide pooled HTTP client.
+    Pool sizes can be set with HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE,
+    HTTP_POOL_BLOCK and HTTP_TIMEOUT environment variables.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = PooledHTTPClient(
+                    pool_connections=int(os.getenv("HTTP_POOL_CONNECTIONS", "10")),
+                    pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", "20")),
+                    pool_block=os.getenv("HTTP_POOL_BLOCK", "false").lower() == "true",
+                    default_timeout=float(os.getenv("HTTP_TIMEOUT", "30"))
+                )
+    return _client
+
+
+def configure_http_client(**kwargs: Any) -> PooledHTTPClient:
+    """Replace the process-wide client with one using the given pool settings."""
+    global _client
+    with _client_lock:
+        old_client = _client
+        if old_client is not None and all(
+            getattr(old_client, name, None) == value for name, value in kwargs.items()
+        ):
+            # Same settings - keep the warm connections
+            return old_client
+        _client = PooledHTTPClient(**kwargs)
+    if old_client is not None:
+        old_client.close()
+    logger.info(f"HTTP connection pool configured: {kwargs}")
+    return _client
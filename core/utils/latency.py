@@ -0,0 +1,27 @@
+"""
+Latency percentiles shared by the service components that report request
+timings.
+"""
+
+from typing import Dict, Sequence
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
+
+
+def latency_summary(latencies: Sequence[float]) -> Dict[str, float]:
+    """Mean and p50/p95/p99 of latencies given in seconds, reported in ms."""
+    if not latencies:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "p99_ms": 0.0}
+    return {
+        "mean_ms": sum(latencies) / len(latencies) * 1000.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000.0,
+        "p95_ms": percentile(latencies, 0.95) * 1000.0,
+        "p99_ms": percentile(latencies, 0.99) * 1000.0
+    }
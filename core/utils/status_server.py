@@ -0,0 +1,92 @@
+"""
+Small HTTP listener for health and status endpoints.
+One server per process; components register a handler per path, e.g.
+``/ready`` for load balancer readiness checks.
+"""
+
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# A handler returns (status code, content type, body)
+Handler = Callable[[], Tuple[int, str, bytes]]
+
+
+def json_response(payload: Any, status: int = 200) -> Tuple[int, str, bytes]:
+    """Build a handler result with a JSON body."""
+    return status, "application/json", json.dumps(payload).encode("utf-8")
+
+
+class StatusServer:
+    """Serves registered GET handlers from a daemon thread."""
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 8502):
+        self.host = host
+        self.port = port
+        self._handlers: Dict[str, Handler] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, path: str, handler: Handler):
+        """Serve ``handler`` at ``path``, replacing any earlier handler."""
+        self._handlers[path] = handler
+
+    def start(self):
+        """Bind the port and start serving."""
+        if self._server is not None:
+            return
+        handlers = self._handlers
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                handler = handlers.get(self.path.split("?", 1)[0])
+                if handler is None:
+                    status, content_type, body = json_response({"error": "not found"}, 404)
+                else:
+                    try:
+                        status, content_type, body = handler()
+                    except Exception as e:
+                        logger.error(f"Status handler for {self.path} failed: {str(e)}")
+                        status, content_type, body = json_response({"error": str(e)}, 500)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), RequestHandler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="status-server", daemon=True)
+        self._thread.start()
+        logger.info(f"Status server listening on {self.host}:{self.port}")
+
+    def stop(self):
+        """Stop serving and release the port."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+
+
+_server: Optional[StatusServer] = None
+_server_lock = threading.Lock()
+
+
+def get_status_server(host: str = "0.0.0.0", port: int = 8502) -> StatusServer:
+    """Get the process-wide status server, starting it on first use."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            server = StatusServer(host, port)
+            server.start()
+            _server = server
+        return _server
@@ -0,0 +1,196 @@
+"""
+Non-blocking structured logging.
+Callers put log records on a bounded queue and return; a listener thread
+formats them as compact single-line JSON and writes them to a size-rotated
+file. Successful events can be sampled, warnings and errors are always
+kept, and records are dropped (and counted) rather than blocking when
+the queue is full. The time spent in the calling thread is measured.
+Relative log paths are resolved against $TRANSLATION_LOG_DIR when set,
+otherwise against the working directory.
+"""
+
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+LOG_DIR_ENV = "TRANSLATION_LOG_DIR"
+
+
+def resolve_log_path(path: str) -> Path:
+    """Place a relative log path under $TRANSLATION_LOG_DIR when it is set."""
+    log_path = Path(path)
+    log_dir = os.environ.get(LOG_DIR_ENV)
+    if log_dir and not log_path.is_absolute():
+        return Path(log_dir) / log_path
+    return log_path
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, event and the record's fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": record.getMessage()
+        }
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    Queue handler that never blocks: records go on the queue unformatted
+    (formatting happens in the listener thread) and are dropped when the
+    queue is full.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Unformatted records only reference their args; the listener formats them
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class StructuredLog:
+    """
+    Asynchronous, sampled JSON-lines event log.
+
+    ``log(event, level, **fields)`` keeps every record at WARNING or above
+    and a ``success_sample_rate`` fraction of the rest. Records are written
+    to ``path``, rotated at ``max_bytes`` with ``backup_count`` old files.
+    """
+
+    def __init__(
+        self,
+        path: str = "logs/translation_attempts.jsonl",
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        queue_size: int = 10000,
+        success_sample_rate: float = 1.0,
+        name: str = "translation.attempts"
+    ):
+        self.path = resolve_log_path(path)
+        self.success_sample_rate = success_sample_rate
+        self._queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=queue_size)
+        self._handler = DroppingQueueHandler(self._queue)
+        self._logger = logging.getLogger(name)
+        self._logger.setLevel(logging.INFO)
+        self._logger.propagate = False
+        self._listener: Optional[QueueListener] = None
+        self._file_handler: Optional[RotatingFileHandler] = None
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._lock = threading.Lock()
+        self._stats = {"submitted": 0, "sampled_out": 0, "overhead_seconds": 0.0}
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "StructuredLog":
+        """Build from the ``structured_logging`` section of the model config."""
+        return cls(
+            path=config.get("path", "logs/translation_attempts.jsonl"),
+            max_bytes=int(config.get("max_mb", 10) * 1024 * 1024),
+            backup_count=config.get("backup_count", 5),
+            queue_size=config.get("queue_size", 10000),
+            success_sample_rate=config.get("success_sample_rate", 1.0)
+        )
+
+    def start(self) -> "StructuredLog":
+        """Open the log file and start the writer thread."""
+        if self._listener is not None:
+            return self
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file_handler = RotatingFileHandler(
+            str(self.path), maxBytes=self._max_bytes, backupCount=self._backup_count, encoding="utf-8"
+        )
+        self._file_handler.setFormatter(JsonLineFormatter())
+        self._listener = QueueListener(self._queue, self._file_handler)
+        self._listener.start()
+        # Replaces a log started earlier under the same name (or inherited by a fork)
+        for handler in list(self._logger.handlers):
+            if isinstance(handler, DroppingQueueHandler):
+                self._logger.removeHandler(handler)
+        self._logger.addHandler(self._handler)
+        return self
+
+    def stop(self):
+        """Write out everything queued, then stop the writer thread and close the file."""
+        if self._listener is None:
+            return
+        self._logger.removeHandler(self._handler)
+        self._listener.stop()
+        self._listener = None
+        self._file_handler.close()
+
+    def log(self, event: str, level: int = logging.INFO, **fields: Any) -> bool:
+        """Queue one record unless sampled out. Returns whether it was kept."""
+        start = time.perf_counter()
+        kept = level >= logging.WARNING or self.success_sample_rate >= 1.0 or random.random() < self.success_sample_rate
+        if kept:
+            self._logger.log(level, event, extra={"fields": fields})
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._stats["submitted"] += 1
+            self._stats["sampled_out"] += 0 if kept else 1
+            self._stats["overhead_seconds"] += elapsed
+        return kept
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get submitted, sampled-out and dropped counts and the mean caller overhead."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        stats["dropped"] = self._handler.dropped
+        stats["queue_depth"] = self._queue.qsize()
+        stats["mean_overhead_us"] = (
+            stats["overhead_seconds"] / stats["submitted"] * 1e6 if stats["submitted"] else 0.0
+        )
+        return stats
+
+
+class _FormattingQueueHandler(DroppingQueueHandler):
+    """Queue handler that merges args into the message before queueing, like ``QueueHandler``."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return QueueHandler.prepare(self, record)
+
+
+def install_queue_logging(target: Optional[logging.Logger] = None, queue_size: int = 10000) -> Optional[QueueListener]:
+    """
+    Move the handlers of ``target`` (the root logger by default) behind a
+    bounded queue, so logging calls only enqueue and the existing file and
+    console handlers write from a listener thread. Returns the listener, or
+    None if the logger has no handlers or is already queued.
+    """
+    target = target or logging.getLogger()
+    handlers: List[logging.Handler] = [
+        handler for handler in target.handlers if not isinstance(handler, QueueHandler)
+    ]
+    if not handlers or len(handlers) != len(target.handlers):
+        return None
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=queue_size)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    for handler in handlers:
+        target.removeHandler(handler)
+    target.addHandler(_FormattingQueueHandler(log_queue))
+    listener.start()
+    return listener
@@ -0,0 +1,176 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.async_api_client import AsyncAPITranslationClient
+from core.translation.response_handler import ResponseHandler
+from core.translation.translation_service import TranslationService
+
+
+class SlowInferenceHandler(BaseHTTPRequestHandler):
+    """Stand-in Inference API that answers slowly and tracks concurrency."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    delay = 0.05
+    # Number of 503 responses still to send before answering normally
+    loading_responses = 0
+
+    def do_POST(self):
+        cls = type(self)
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            loading = cls.loading_responses > 0
+            if loading:
+                cls.loading_responses -= 1
+        try:
+            time.sleep(cls.delay)
+            if loading:
+                status, body = 503, json.dumps({"error": "Model is loading"})
+            elif payload.get("inputs") == "html":
+                status, body = 200, "<html>Service Unavailable</html>"
+            else:
+                status, body = 200, json.dumps(
+                    [{"translation_text": payload.get("inputs", "").upper()}]
+                )
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+        data = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAsyncAPITranslationClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), SlowInferenceHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        SlowInferenceHandler.in_flight = 0
+        SlowInferenceHandler.max_in_flight = 0
+        SlowInferenceHandler.delay = 0.05
+        SlowInferenceHandler.loading_responses = 0
+
+        self.service = TranslationService.__new__(TranslationService)
+        self.service.api_url = f"http://127.0.0.1:{self.server.server_address[1]}/models/"
+        self.service.headers = {}
+        self.service._config = {"translation_models": {"m": {}}}
+        self.service.use_local_models = False
+        self.service.batch_scheduler = None
+        self.service.result_cache = None
+        self.service.response_handler = ResponseHandler()
+        self.service.model_validator = MagicMock()
+        self.service.model_validator.validate_model.return_value = (True, "ok")
+
+    def _run(self, coro):
+        return asyncio.run(coro)
+
+    def test_concurrency_is_bounded_per_model(self):
+        async def run():
+            async with AsyncAPITranslationClient(self.service, max_concurrency=3) as client:
+                return await client.translate_many([f"text {i}" for i in range(12)], "m")
+
+        start = time.perf_counter()
+        results = self._run(run())
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(results, [f"TEXT {i}" for i in range(12)])
+        self.assertEqual(SlowInferenceHandler.max_in_flight, 3)
+        # 12 requests at 3 in flight should take ~4 round trips, not 12
+        self.assertLess(elapsed, 12 * SlowInferenceHandler.delay)
+
+    def test_model_loading_is_retried_without_blocking(self):
+        SlowInferenceHandler.loading_responses = 1
+
+        async def run():
+            async with AsyncAPITranslationClient(self.service, base_delay=0.01) as client:
+                return await client.translate("hello", "m")
+
+        self.assertEqual(self._run(run()), "HELLO")
+
+    def test_deadline_abandons_slow_requests(self):
+        SlowInferenceHandler.delay = 0.5
+
+        async def run():
+            async with AsyncAPITranslationClient(self.service) as client:
+                return await client.translate_many(["a", "b"], "m", deadline_seconds=0.1)
+
+        start = time.perf_counter()
+        results = self._run(run())
+        self.assertEqual(results, [None, None])
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_non_json_body_fails_only_its_item(self):
+        async def run():
+            async with AsyncAPITranslationClient(self.service) as client:
+                return await client.translate_many(["a", "html", "b"], "m")
+
+        self.assertEqual(self._run(run()), ["A", None, "B"])
+
+    def test_timeout_starts_when_a_slot_is_acquired(self):
+        SlowInferenceHandler.delay = 0.1
+
+        async def run():
+            async with AsyncAPITranslationClient(self.service, max_concurrency=1) as client:
+                return await client.translate_many([f"t{i}" for i in range(4)], "m", deadline_seconds=0.3)
+
+        # Queued requests wait ~0.3s in total but each has its own 0.3s once running
+        self.assertEqual(self._run(run()), ["T0", "T1", "T2", "T3"])
+
+    def test_attempts_are_logged_with_their_latency(self):
+        self.service.response_handler = MagicMock(wraps=ResponseHandler())
+
+        async def run():
+            async with AsyncAPITranslationClient(self.service) as client:
+                return await client.translate_many(["a", "html"], "m")
+
+        self._run(run())
+        latencies = {
+            call.args[0]: call.kwargs["latency"]
+            for call in self.service.response_handler.log_translation_attempt.call_args_list
+        }
+        self.assertGreaterEqual(latencies[True], SlowInferenceHandler.delay)
+        self.assertGreaterEqual(latencies[False], SlowInferenceHandler.delay)
+
+    def test_service_translate_many_keeps_order(self):
+        texts = [f"line {i}" for i in range(5)]
+        results = self._run(
+            self.service.translate_many(texts, "Darija", "English", "m", max_concurrency=2)
+        )
+        self.assertEqual(results, [text.upper() for text in texts])
+        self.assertLessEqual(SlowInferenceHandler.max_in_flight, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import threading
+import time
+import unittest
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.batch_scheduler import MicroBatchScheduler
+
+
+class TestMicroBatchScheduler(unittest.TestCase):
+    def setUp(self):
+        self.batches = []
+        self.lock = threading.Lock()
+
+        def batch_fn(model, texts):
+            with self.lock:
+                self.batches.append((model, list(texts)))
+            return [f"{model}:{text.upper()}" for text in texts]
+
+        self.batch_fn = batch_fn
+
+    def test_concurrent_requests_are_merged(self):
+        scheduler = MicroBatchScheduler(self.batch_fn, max_batch_size=8, max_wait_ms=200)
+        texts = [f"text {i}" for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda t: scheduler.translate(t, "m"), texts))
+        scheduler.shutdown()
+
+        self.assertEqual(results, [f"m:{t.upper()}" for t in texts])
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(scheduler.get_stats()["m"]["max_batch_size"], 8)
+
+    def test_flushes_after_max_wait(self):
+        scheduler = MicroBatchScheduler(self.batch_fn, max_batch_size=64, max_wait_ms=10)
+        start = time.perf_counter()
+        result = scheduler.translate("hello", "m", timeout=5)
+        elapsed = time.perf_counter() - start
+        scheduler.shutdown()
+
+        self.assertEqual(result, "m:HELLO")
+        self.assertLess(elapsed, 1.0)
+        stats = scheduler.get_stats()["m"]
+        self.assertEqual(stats["batches"], 1)
+        self.assertEqual(stats["queue_depth"], 0)
+        self.assertGreaterEqual(stats["max_wait_ms"], 0.0)
+
+    def test_batch_size_cap(self):
+        scheduler = MicroBatchScheduler(self.batch_fn, max_batch_size=3, max_wait_ms=50)
+        futures = [scheduler.submit(f"t{i}", "m") for i in range(7)]
+        results = [f.result(timeout=5) for f in futures]
+        scheduler.shutdown()
+
+        self.assertEqual(results, [f"m:T{i}" for i in range(7)])
+        self.assertTrue(all(len(texts) <= 3 for _, texts in self.batches))
+
+    def test_models_are_queued_separately(self):
+        scheduler = MicroBatchScheduler(self.batch_fn, max_batch_size=4, max_wait_ms=20)
+        a = scheduler.submit("x", "model-a")
+        b = scheduler.submit("y", "model-b")
+        self.assertEqual(a.result(timeout=5), "model-a:X")
+        self.assertEqual(b.result(timeout=5), "model-b:Y")
+        scheduler.shutdown()
+        self.assertEqual({model for model, _ in self.batches}, {"model-a", "model-b"})
+
+    def test_batch_failure_propagates_to_futures(self):
+        def failing(model, texts):
+            raise RuntimeError("generate failed")
+
+        scheduler = MicroBatchScheduler(failing, max_batch_size=2, max_wait_ms=5)
+        future = scheduler.submit("x", "m")
+        with self.assertRaises(RuntimeError):
+            future.result(timeout=5)
+        scheduler.shutdown()
+
+    def test_submit_after_shutdown(self):
+        scheduler = MicroBatchScheduler(self.batch_fn)
+        scheduler.shutdown()
+        with self.assertRaises(RuntimeError):
+            scheduler.submit("x", "m")
+
+
+if __name__ == '__main__':
+    unittest.main()
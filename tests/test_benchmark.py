@@ -0,0 +1,86 @@
+import json
+import tempfile
+import unittest
+import sys
+import urllib.request
+import warnings
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.benchmark import (
+    LOCAL_MODELS,
+    compare_results,
+    flatten,
+    metric_direction,
+    run_benchmarks
+)
+from core.translation.benchmark_fixtures import StubInferenceAPI
+
+
+class TestRegressionCheck(unittest.TestCase):
+    BASELINE = {
+        "local": {"m": {"latency": {"p95_ms": 100.0, "failures": 0}, "batch": {"sentences_per_second": 50.0}}},
+        "cache": {"hit_rate": 1.0}
+    }
+
+    def test_flatten_and_directions(self):
+        flat = flatten(self.BASELINE)
+        self.assertEqual(flat["local.m.latency.p95_ms"], 100.0)
+        self.assertEqual(metric_direction("local.m.latency.p95_ms"), "lower")
+        self.assertEqual(metric_direction("local.m.batch.sentences_per_second"), "higher")
+        self.assertEqual(metric_direction("cache.hit_rate"), "higher")
+        self.assertIsNone(metric_direction("local.m.latency.failures"))
+
+    def test_regressions_beyond_threshold(self):
+        current = json.loads(json.dumps(self.BASELINE))
+        current["local"]["m"]["latency"]["p95_ms"] = 120.0
+        current["local"]["m"]["batch"]["sentences_per_second"] = 30.0
+        self.assertEqual(
+            [r["metric"] for r in compare_results(current, self.BASELINE, threshold=0.25)],
+            ["local.m.batch.sentences_per_second"]
+        )
+        regressions = compare_results(current, self.BASELINE, thresholds={"local.m.latency.p95_ms": 0.1})
+        self.assertEqual(
+            [r["metric"] for r in regressions],
+            ["local.m.latency.p95_ms", "local.m.batch.sentences_per_second"]
+        )
+
+    def test_improvements_are_not_regressions(self):
+        current = json.loads(json.dumps(self.BASELINE))
+        current["local"]["m"]["latency"]["p95_ms"] = 10.0
+        current["local"]["m"]["batch"]["sentences_per_second"] = 500.0
+        self.assertEqual(compare_results(current, self.BASELINE), [])
+
+
+class TestStubInferenceAPI(unittest.TestCase):
+    def test_translation_and_status(self):
+        with StubInferenceAPI() as stub:
+            request = urllib.request.Request(
+                f"{stub.url}/models/facebook/nllb-200", data=json.dumps({"inputs": "salam"}).encode(), method="POST"
+            )
+            with urllib.request.urlopen(request, timeout=5) as response:
+                self.assertEqual(json.loads(response.read()), [{"generated_text": "[facebook/nllb-200] salam"}])
+            with urllib.request.urlopen(f"{stub.url}/status/any", timeout=5) as response:
+                self.assertTrue(json.loads(response.read())["loaded"])
+            self.assertEqual(stub.requests, 1)
+
+
+class TestBenchmarkRun(unittest.TestCase):
+    def test_quick_run(self):
+        warnings.simplefilter("ignore")
+        with tempfile.TemporaryDirectory() as workspace:
+            results = run_benchmarks(Path(workspace), requests=3, api_delay=0.0, include_startup=False)
+        self.assertEqual(set(results["local"]), set(LOCAL_MODELS))
+        for model in LOCAL_MODELS:
+            self.assertEqual(results["local"][model]["latency"]["failures"], 0)
+            self.assertGreater(results["local"][model]["batch"]["sentences_per_second"], 0)
+        self.assertEqual(results["cache"]["hit_rate"], 1.0)
+        self.assertEqual(results["api"]["latency"]["failures"], 0)
+        self.assertGreaterEqual(results["api"]["stub_requests"], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, ModelHealthMonitor
+from core.translation.model_validator import ModelValidator
+from core.translation.response_handler import ResponseHandler
+from core.translation.translation_service import TranslationService
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.breaker = CircuitBreaker(min_requests=4, window=4, open_seconds=10.0, max_open_seconds=25.0)
+
+    def test_opens_on_error_rate(self):
+        for success in (True, False, True):
+            self.breaker.record(success, 0.1, now=0.0)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.breaker.record(False, 0.1, now=0.0), OPEN)
+        self.assertFalse(self.breaker.allow(now=5.0))
+        self.assertEqual(self.breaker.rejected, 1)
+
+    def test_opens_on_slow_calls(self):
+        for _ in range(4):
+            self.breaker.record(True, 30.0, now=0.0)
+        self.assertEqual(self.breaker.state, OPEN)
+
+    def test_half_open_probe_closes_or_reopens(self):
+        for _ in range(4):
+            self.breaker.record(False, None, now=0.0)
+        self.assertTrue(self.breaker.allow(now=10.0))
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        # Only one probe at a time
+        self.assertFalse(self.breaker.allow(now=10.5))
+
+        self.breaker.record(False, None, now=11.0)
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertEqual(self.breaker.retry_in(now=11.0), 20.0)
+        self.assertFalse(self.breaker.allow(now=30.0))
+
+        self.assertTrue(self.breaker.allow(now=31.0))
+        self.breaker.record(True, 0.2, now=31.5)
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.breaker.error_rate(), 0.0)
+
+
+class TestModelHealthMonitor(unittest.TestCase):
+    def test_scores_rank_fallback_chain(self):
+        monitor = ModelHealthMonitor(latency_target_seconds=1.0, min_requests=5)
+        monitor.record("flaky", True, 0.5)
+        monitor.record("flaky", False, 0.5)
+        monitor.record("flaky", True, 0.5)
+        monitor.record("slow", True, 4.0)
+        monitor.record("fast", True, 0.2)
+        self.assertEqual(monitor.rank(["slow", "flaky", "unknown", "fast"]), ["unknown", "fast", "flaky", "slow"])
+        self.assertAlmostEqual(monitor.score("slow"), 0.25)
+
+    def test_open_breaker_scores_zero(self):
+        monitor = ModelHealthMonitor(min_requests=2)
+        monitor.record("down", False)
+        monitor.record("down", False)
+        self.assertEqual(monitor.state("down"), OPEN)
+        self.assertEqual(monitor.score("down"), 0.0)
+        self.assertEqual(monitor.get_stats()["down"]["trips"], 1)
+
+    def test_validator_orders_chain_by_health(self):
+        validator = ModelValidator("https://example.invalid/", {}, Path("model_cache"))
+        primary = "AnasAber/seamless-darija-eng"
+        static_chain = validator.get_fallback_chain(primary, "translation")
+        validator.health_monitor = ModelHealthMonitor(min_requests=1)
+        validator.health_monitor.record(static_chain[0], False)
+        self.assertEqual(validator.get_fallback_chain(primary, "translation")[-1], static_chain[0])
+
+    def test_response_handler_feeds_monitor(self):
+        monitor = ModelHealthMonitor(min_requests=1)
+        ResponseHandler(health_monitor=monitor).log_translation_attempt(False, "m", "salam", None, "boom", 1.5)
+        self.assertEqual(monitor.state("m"), OPEN)
+
+
+class TestServiceCircuitBreakers(unittest.TestCase):
+    def setUp(self):
+        self.service = TranslationService.__new__(TranslationService)
+        self.service._config = {"translation_models": {"primary": {}, "fallback": {}}}
+        self.service.use_local_models = False
+        self.service.batch_scheduler = None
+        self.service.health_monitor = ModelHealthMonitor(min_requests=2, open_seconds=60.0)
+        self.service.response_handler = ResponseHandler(health_monitor=self.service.health_monitor)
+        self.service.model_validator = MagicMock()
+        self.service.model_validator.validate_model.return_value = (True, "ok")
+        self.service.model_validator.get_fallback_chain.return_value = ["fallback"]
+        self.service.model_cache = {}
+
+    def test_open_breaker_routes_to_fallback(self):
+        def api(text, model, target_lang, profile=None, cancel_event=None):
+            if model == "primary":
+                self.service.response_handler.log_translation_attempt(False, model, text, None, "timeout", 30.0)
+                return None
+            return "hello"
+
+        self.service._translate_with_api = MagicMock(side_effect=api)
+        self.assertIsNone(self.service.translate("salam 1", "Darija", "English", "primary"))
+        self.assertIsNone(self.service.translate("salam 2", "Darija", "English", "primary"))
+        self.assertEqual(self.service.translate("salam 3", "Darija", "English", "primary"), "hello")
+        self.assertEqual(self.service._translate_with_api.call_args.args[1], "fallback")
+        self.assertEqual(self.service.get_model_health_stats()["primary"]["state"], OPEN)
+
+
+if __name__ == '__main__':
+    unittest.main()
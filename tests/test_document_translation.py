@@ -0,0 +1,79 @@
+import threading
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.segmentation import reassemble, split_sentences
+from core.translation.translation_service import TranslationService
+
+
+def segments(text, max_words=200):
+    return [text[start:end] for start, end in split_sentences(text, max_words)]
+
+
+class TestSplitSentences(unittest.TestCase):
+    def test_latin_sentences(self):
+        text = "Dr. Alami arrived at 3.30 today. Is he here? Yes!"
+        self.assertEqual(segments(text), ["Dr. Alami arrived at 3.30 today.", "Is he here?", "Yes!"])
+
+    def test_arabic_script_punctuation(self):
+        text = "واش نتا مزيان؟ أنا بخير. شكرا بزاف!"
+        self.assertEqual(segments(text), ["واش نتا مزيان؟", "أنا بخير.", "شكرا بزاف!"])
+
+    def test_latin_darija_without_capitals(self):
+        text = "salam, kidayr? ana m3a sa7bi f dar... 3afak ji daba"
+        self.assertEqual(segments(text), ["salam, kidayr?", "ana m3a sa7bi f dar...", "3afak ji daba"])
+
+    def test_quotes_stay_with_sentence(self):
+        self.assertEqual(segments('He said "go." Then left.'), ['He said "go."', "Then left."])
+
+    def test_lines_are_always_separate(self):
+        self.assertEqual(segments("Title\n\nFirst line\nsecond line"), ["Title", "First line", "second line"])
+
+    def test_long_sentences_split_at_clauses(self):
+        text = "a b c, d e f g h"
+        self.assertEqual(segments(text, max_words=4), ["a b c,", "d e f g", "h"])
+
+    def test_reassembly_keeps_layout(self):
+        text = "  One. Two!\n\n\tThree?  \n"
+        spans = split_sentences(text)
+        self.assertEqual(reassemble(text, spans, ["1.", "2!", "3?"]), "  1. 2!\n\n\t3?  \n")
+
+
+class TestTranslateDocument(unittest.TestCase):
+    def setUp(self):
+        self.service = TranslationService.__new__(TranslationService)
+        self.service._config = {"document_translation": {"max_workers": 4}}
+        self.calls = []
+        self.lock = threading.Lock()
+
+        def translate(text, source_lang, target_lang, model, profile=None):
+            with self.lock:
+                self.calls.append(text)
+            return None if "fail" in text else text.upper()
+
+        self.service.translate = MagicMock(side_effect=translate)
+
+    def test_document_is_translated_per_segment(self):
+        progress = []
+        text = "Salam. Labas?\n\nSalam. 42.\n"
+        result = self.service.translate_document(
+            text, "Darija", "English", "m", progress_callback=lambda done, total: progress.append((done, total))
+        )
+        self.assertEqual(result, "SALAM. LABAS?\n\nSALAM. 42.\n")
+        # Repeated sentences are translated once, numbers are copied
+        self.assertEqual(sorted(self.calls), ["Labas?", "Salam."])
+        self.assertEqual(progress[0], (1, 4))
+        self.assertEqual(progress[-1], (4, 4))
+
+    def test_failed_segment_fails_document(self):
+        self.assertIsNone(self.service.translate_document("Good. This will fail.", "Darija", "English", "m"))
+
+
+if __name__ == '__main__':
+    unittest.main()
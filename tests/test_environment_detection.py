@@ -0,0 +1,101 @@
+import json
+import os
+import socket
+import tempfile
+import time
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.utils import environment
+
+
+class TestEnvironmentDetection(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.hint_file = Path(self.tmp.name) / "environment_hint.json"
+        self.env = patch.dict(os.environ, {"ENVIRONMENT_HINT_FILE": str(self.hint_file)})
+        self.env.start()
+        os.environ.pop("DEPLOYMENT_ENV", None)
+        environment.reset_environment()
+
+    def tearDown(self):
+        environment.reset_environment()
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def test_probe_runs_once_per_process(self):
+        with patch.object(environment, "is_running_on_ec2", return_value=False) as probe:
+            for _ in range(50):
+                self.assertEqual(environment.get_environment(), "local")
+                self.assertFalse(environment.should_use_local_models())
+        self.assertEqual(probe.call_count, 1)
+
+    def test_cached_lookup_is_cheap(self):
+        with patch.object(environment, "is_running_on_ec2", return_value=False):
+            environment.get_environment()
+        start = time.perf_counter()
+        for _ in range(10000):
+            environment.get_environment()
+        self.assertLess(time.perf_counter() - start, 0.1)
+
+    def test_override_skips_probe(self):
+        with patch.dict(os.environ, {"DEPLOYMENT_ENV": "EC2"}):
+            with patch.object(environment, "is_running_on_ec2") as probe:
+                self.assertTrue(environment.should_use_local_models())
+        probe.assert_not_called()
+
+    def test_hint_is_written_and_reused(self):
+        with patch.object(environment, "is_running_on_ec2", return_value=True):
+            self.assertEqual(environment.get_environment(), "ec2")
+        self.assertEqual(json.loads(self.hint_file.read_text())["environment"], "ec2")
+
+        environment.reset_environment()
+        with patch.object(environment, "is_running_on_ec2") as probe:
+            self.assertEqual(environment.get_environment(), "ec2")
+        probe.assert_not_called()
+
+    def test_failed_probe_is_not_recorded(self):
+        with patch.object(environment, "is_running_on_ec2", return_value=False):
+            self.assertEqual(environment.get_environment(), "local")
+        self.assertFalse(self.hint_file.exists())
+
+        environment.reset_environment()
+        with patch.object(environment, "is_running_on_ec2", return_value=True) as probe:
+            self.assertEqual(environment.get_environment(), "ec2")
+        probe.assert_called_once()
+
+    def test_expired_and_local_hints_are_ignored(self):
+        for hint in (
+            {"environment": "ec2", "written_at": time.time() - environment.DEFAULT_HINT_TTL - 1},
+            {"environment": "local", "written_at": time.time()}
+        ):
+            self.hint_file.write_text(json.dumps({**hint, "hostname": socket.gethostname()}))
+            environment.reset_environment()
+            with patch.object(environment, "is_running_on_ec2", return_value=True) as probe:
+                self.assertEqual(environment.get_environment(), "ec2")
+            probe.assert_called_once()
+
+    def test_hint_from_another_host_is_ignored(self):
+        self.hint_file.write_text(json.dumps({
+            "environment": "ec2",
+            "hostname": socket.gethostname() + "-other"
+        }))
+        with patch.object(environment, "is_running_on_ec2", return_value=False) as probe:
+            self.assertEqual(environment.get_environment(), "local")
+        probe.assert_called_once()
+
+    def test_unreachable_metadata_service_fails_fast(self):
+        with patch.object(environment, "EC2_METADATA_URL", "http://10.255.255.1/latest"):
+            start = time.perf_counter()
+            self.assertFalse(environment.is_running_on_ec2())
+        self.assertLess(time.perf_counter() - start, 0.9)
+
+
+if __name__ == '__main__':
+    unittest.main()
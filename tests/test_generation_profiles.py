@@ -0,0 +1,127 @@
+import threading
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import torch
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.batch_scheduler import MicroBatchScheduler
+from core.translation.generation_profiles import GenerationProfiles
+from core.translation.response_handler import ResponseHandler
+from core.translation.translation_service import TranslationService
+
+
+class FakeTokenizer:
+    def __call__(self, text, return_tensors=None, padding=False, truncation=False, max_length=None):
+        ids = [len(word) for word in text.split()] + [99]
+        return {"input_ids": torch.tensor([ids]), "attention_mask": torch.ones(1, len(ids), dtype=torch.long)}
+
+    def batch_decode(self, sequences, skip_special_tokens=True, clean_up_tokenization_spaces=True):
+        return [" ".join(str(t) for t in seq if t != 99) for seq in sequences]
+
+
+class RecordingModel:
+    """Echoes its input and records the beam width of every generate call."""
+
+    def __init__(self):
+        self.num_beams = []
+
+    def generate(self, input_ids, attention_mask=None, generation_config=None):
+        self.num_beams.append(generation_config.num_beams)
+        return input_ids
+
+
+class TestGenerationProfiles(unittest.TestCase):
+    def setUp(self):
+        self.profiles = GenerationProfiles(interactive_max_words=3, bulk_queue_depth=2)
+
+    def test_explicit_profile_is_used(self):
+        self.assertEqual(self.profiles.select("bulk", "hi"), "bulk")
+        with self.assertRaises(ValueError):
+            self.profiles.select("turbo", "hi")
+
+    def test_auto_policy_uses_input_length(self):
+        self.assertEqual(self.profiles.select(None, "salam labas"), "interactive")
+        self.assertEqual(self.profiles.select("auto", "one two three four five"), "quality")
+
+    def test_auto_policy_switches_to_bulk_under_load(self):
+        self.assertEqual(self.profiles.select(None, "salam", pending=3), "bulk")
+        with self.profiles.track(), self.profiles.track():
+            self.assertEqual(self.profiles.in_flight, 2)
+            self.assertEqual(self.profiles.select(None, "salam"), "bulk")
+        self.assertEqual(self.profiles.select(None, "salam"), "interactive")
+
+    def test_quality_profile_keeps_previous_beam_search(self):
+        self.assertEqual(
+            GenerationProfiles().params("quality"),
+            {"max_length": 512, "num_beams": 4, "length_penalty": 0.6, "early_stopping": True}
+        )
+
+    def test_stats_record_latency_and_output_length(self):
+        self.profiles.record("interactive", 0.02, ["hello there"])
+        self.profiles.record("interactive", 0.04, ["hi", None])
+        stats = self.profiles.get_stats()["interactive"]
+        self.assertEqual(stats["calls"], 2)
+        self.assertEqual(stats["translations"], 2)
+        self.assertEqual(stats["failures"], 1)
+        self.assertAlmostEqual(stats["avg_output_words"], 1.5)
+        self.assertAlmostEqual(stats["mean_ms"], 30.0)
+
+
+class TestServiceProfiles(unittest.TestCase):
+    def setUp(self):
+        self.service = TranslationService.__new__(TranslationService)
+        self.service._config = {
+            "translation_models": {"test/model": {}},
+            "generation_profiles": {"auto": {"interactive_max_words": 2}}
+        }
+        self.service.use_local_models = True
+        self.service.batch_scheduler = None
+        self.service.response_handler = ResponseHandler()
+        self.service.model_validator = MagicMock()
+        self.service.model_validator.validate_model.return_value = (True, "ok")
+        self.model = RecordingModel()
+        self.service.model_cache = {"test/model": (self.model, FakeTokenizer())}
+
+    def test_profile_sets_generation_parameters(self):
+        self.service.translate("a few more words", "Darija", "English", "test/model")
+        self.service.translate("short", "Darija", "English", "test/model")
+        self.service.translate("short", "Darija", "English", "test/model", profile="quality")
+        self.assertEqual(self.model.num_beams, [4, 1, 4])
+        stats = self.service.get_generation_profile_stats()
+        self.assertEqual(stats["quality"]["calls"], 2)
+        self.assertEqual(stats["interactive"]["calls"], 1)
+
+    def test_api_payload_follows_profile(self):
+        payload = self.service._build_api_payload("hi", "test/model", "interactive")
+        self.assertEqual(payload["parameters"], {"max_length": 128, "num_beams": 1})
+
+    def test_scheduler_batches_per_profile(self):
+        batches = []
+        lock = threading.Lock()
+
+        def batch_fn(model, texts, profile=None):
+            with lock:
+                batches.append((profile, list(texts)))
+            return texts
+
+        scheduler = MicroBatchScheduler(batch_fn, max_batch_size=4, max_wait_ms=50)
+        futures = [
+            scheduler.submit("a", "m", "interactive"),
+            scheduler.submit("b", "m", "bulk"),
+            scheduler.submit("c", "m", "interactive")
+        ]
+        self.assertEqual([f.result(timeout=5) for f in futures], ["a", "b", "c"])
+        self.assertEqual(scheduler.queue_depth(), 0)
+        scheduler.shutdown()
+        self.assertEqual(sorted(batches), [("bulk", ["b"]), ("interactive", ["a", "c"])])
+        self.assertIn("m (interactive)", scheduler.get_stats())
+
+
+if __name__ == '__main__':
+    unittest.main()
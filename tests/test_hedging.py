@@ -0,0 +1,136 @@
+import threading
+import time
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.hedging import RequestHedger
+from core.translation.response_handler import ResponseHandler
+from core.translation.translation_service import TranslationService
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class FakeModels:
+    """Attempts that sleep per model and record whether they were cancelled."""
+
+    def __init__(self, delays, failing=()):
+        self.delays = delays
+        self.failing = set(failing)
+        self.cancelled = {}
+
+    def __call__(self, model, cancel):
+        if cancel.wait(self.delays[model]):
+            self.cancelled[model] = True
+            return None
+        if model in self.failing:
+            return None
+        return f"{model}:ok"
+
+
+class TestRequestHedger(unittest.TestCase):
+    def setUp(self):
+        self.hedger = RequestHedger(default_delay=0.05, min_samples=3)
+
+    def tearDown(self):
+        self.hedger.shutdown()
+
+    def test_slow_primary_loses_to_hedge(self):
+        models = FakeModels({"primary": 2.0, "fallback": 0.01})
+        start = time.perf_counter()
+        winner, result = self.hedger.run(iter(["primary", "fallback"]), models)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual((winner, result), ("fallback", "fallback:ok"))
+
+        stats = self.hedger.get_stats()
+        self.assertEqual(stats["hedged_requests"], 1)
+        self.assertEqual(stats["extra_load_ratio"], 1.0)
+        self.assertEqual(stats["models"]["fallback"]["hedge_wins"], 1)
+        self.assertEqual(stats["models"]["primary"]["cancelled"], 1)
+        self.assertTrue(wait_for(lambda: models.cancelled.get("primary")))
+
+    def test_fast_primary_is_not_hedged(self):
+        models = FakeModels({"primary": 0.0, "fallback": 0.0})
+        self.assertEqual(self.hedger.run(iter(["primary", "fallback"]), models), ("primary", "primary:ok"))
+        self.assertEqual(self.hedger.get_stats()["extra_attempts"], 0)
+
+    def test_failed_primary_falls_back(self):
+        models = FakeModels({"primary": 0.0, "fallback": 0.0}, failing=["primary"])
+        self.assertEqual(self.hedger.run(iter(["primary", "fallback"]), models), ("fallback", "fallback:ok"))
+        self.assertEqual(self.hedger.get_stats()["models"]["primary"]["failures"], 1)
+
+    def test_all_candidates_failing(self):
+        models = FakeModels({"primary": 0.0, "fallback": 0.0}, failing=["primary", "fallback"])
+        self.assertEqual(self.hedger.run(iter(["primary", "fallback"]), models), (None, None))
+
+    def test_delay_follows_recorded_latency(self):
+        self.assertEqual(self.hedger.hedge_delay("primary"), 0.05)
+        models = FakeModels({"primary": 0.1})
+        for _ in range(3):
+            self.hedger.run(iter(["primary"]), models)
+        self.assertGreaterEqual(self.hedger.hedge_delay("primary"), 0.1)
+
+    def test_from_config(self):
+        hedger = RequestHedger.from_config({"percentile": 99, "default_delay_seconds": 1.5, "max_hedges": 2})
+        self.assertEqual((hedger.hedge_percentile, hedger.default_delay, hedger.max_hedges), (0.99, 1.5, 2))
+        hedger.shutdown()
+
+
+class TestServiceHedging(unittest.TestCase):
+    def setUp(self):
+        self.service = TranslationService.__new__(TranslationService)
+        self.service._config = {"translation_models": {"primary": {}, "fallback": {}}}
+        self.service.use_local_models = False
+        self.service.batch_scheduler = None
+        self.service.response_handler = ResponseHandler()
+        self.service.model_validator = MagicMock()
+        self.service.model_validator.validate_model.return_value = (True, "ok")
+        self.service.model_validator.get_fallback_chain.return_value = ["fallback"]
+        self.service.model_cache = {}
+        self.service.hedger = RequestHedger(default_delay=0.05)
+
+    def tearDown(self):
+        self.service.hedger.shutdown()
+
+    def test_api_requests_are_hedged_across_fallback_chain(self):
+        def api(text, model, target_lang, profile=None, cancel_event=None):
+            if model == "primary":
+                cancel_event.wait(2.0)
+                return None
+            return "hello"
+
+        self.service._translate_with_api = MagicMock(side_effect=api)
+        self.assertEqual(self.service.translate("salam", "Darija", "English", "primary"), "hello")
+        self.assertEqual(
+            [call.args[1] for call in self.service._translate_with_api.call_args_list], ["primary", "fallback"]
+        )
+        self.assertEqual(self.service.get_hedging_stats()["models"]["fallback"]["hedge_wins"], 1)
+
+    def test_cancelled_api_request_stops_retrying(self):
+        self.service.api_url = "https://example.invalid/"
+        self.service.headers = {}
+        client = MagicMock()
+        client.post.return_value = MagicMock(status_code=503)
+        cancel = threading.Event()
+        threading.Timer(0.1, cancel.set).start()
+        start = time.perf_counter()
+        with patch("core.translation.translation_service.get_http_client", return_value=client):
+            self.assertIsNone(self.service._translate_with_api("salam", "primary", "English", None, cancel))
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(client.post.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
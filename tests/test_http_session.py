@@ -0,0 +1,113 @@
+import json
+import threading
+import time
+import unittest
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.utils.http_session import PooledHTTPClient, configure_http_client, get_http_client
+
+
+# Per-connection setup cost standing in for the TCP and TLS handshake
+HANDSHAKE_SECONDS = 0.02
+
+
+class StandInInferenceHandler(BaseHTTPRequestHandler):
+    """Local stand-in for the HF Inference API that keeps connections alive."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        time.sleep(HANDSHAKE_SECONDS)
+        super().setup()
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        body = json.dumps([{"translation_text": payload.get("inputs", "").upper()}]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestPooledHTTPClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInInferenceHandler)
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/models/test"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_connections_are_reused(self):
+        client = PooledHTTPClient(pool_maxsize=4)
+        for i in range(20):
+            response = client.post(self.url, json={"inputs": f"hello {i}"})
+            self.assertEqual(response.json()[0]["translation_text"], f"HELLO {i}")
+        stats = client.get_stats()
+        client.close()
+
+        self.assertEqual(stats["requests"], 20)
+        self.assertEqual(stats["connections_opened"], 1)
+        host = next(iter(stats["hosts"].values()))
+        self.assertEqual(host["errors"], 0)
+        self.assertGreater(host["p50_ms"], 0.0)
+        self.assertNotIn("avg_ms", host)
+
+    def test_pooled_requests_skip_the_handshake(self):
+        client = PooledHTTPClient()
+        client.post(self.url, json={"inputs": "warm up"})
+
+        def p50(send):
+            timings = []
+            for _ in range(30):
+                start = time.perf_counter()
+                send()
+                timings.append(time.perf_counter() - start)
+            return sorted(timings)[len(timings) // 2]
+
+        pooled = p50(lambda: client.post(self.url, json={"inputs": "hi"}))
+        fresh = p50(lambda: requests.post(self.url, json={"inputs": "hi"}, timeout=5))
+        client.close()
+        # Every fresh connection pays the handshake; a pooled one never does
+        self.assertGreaterEqual(fresh, HANDSHAKE_SECONDS)
+        self.assertLess(pooled, HANDSHAKE_SECONDS)
+        self.assertLess(pooled, fresh - HANDSHAKE_SECONDS / 2)
+
+    def test_failed_requests_are_counted(self):
+        client = PooledHTTPClient(default_timeout=1)
+        with self.assertRaises(requests.RequestException):
+            client.get("http://127.0.0.1:9/unreachable")
+        stats = client.get_stats()
+        client.close()
+        self.assertEqual(stats["hosts"]["127.0.0.1:9"]["errors"], 1)
+
+    def test_configure_keeps_client_with_same_settings(self):
+        first = configure_http_client(pool_connections=3, pool_maxsize=7)
+        second = configure_http_client(pool_connections=3, pool_maxsize=7)
+        self.assertIs(first, second)
+        self.assertIs(get_http_client(), second)
+        third = configure_http_client(pool_connections=3, pool_maxsize=8)
+        self.assertIsNot(third, second)
+        self.assertEqual(get_http_client().pool_maxsize, 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
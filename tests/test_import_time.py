@@ -0,0 +1,64 @@
+import re
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+HEAVY_MODULES = ("torch", "transformers", "streamlit")
+
+# Cumulative import time budgets in milliseconds, measured with -X importtime.
+# Eager torch/transformers/streamlit imports put these at several seconds.
+IMPORT_BUDGETS_MS = {
+    "core.translation": 300,
+    "core.translation.translation_service": 1000
+}
+
+
+def run_import(statement: str):
+    """Run an import in a fresh interpreter and return (stdout, importtime rows)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=str(project_root),
+        capture_output=True,
+        text=True,
+        timeout=120
+    )
+    if result.returncode != 0:
+        raise AssertionError(result.stderr)
+    rows = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)", line)
+        if match:
+            rows[match.group(4)] = int(match.group(2)) / 1000.0
+    return result.stdout, rows
+
+
+class TestImportTime(unittest.TestCase):
+    def test_package_import_stays_within_budget(self):
+        for module, budget_ms in IMPORT_BUDGETS_MS.items():
+            _, rows = run_import(f"import {module}")
+            self.assertIn(module, rows)
+            self.assertLess(rows[module], budget_ms, f"{module} took {rows[module]:.1f}ms")
+
+    def test_heavy_dependencies_are_not_imported(self):
+        stdout, _ = run_import(
+            "import sys; "
+            "from core.translation import ModelValidator, ResponseHandler, TranslationService; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        self.assertEqual(stdout.strip(), "")
+
+    def test_import_installs_no_log_handlers(self):
+        stdout, _ = run_import(
+            "import logging; import core.translation.translation_service; "
+            "print(len(logging.getLogger().handlers))"
+        )
+        self.assertEqual(stdout.strip(), "0")
+
+
+if __name__ == '__main__':
+    unittest.main()
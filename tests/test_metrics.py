@@ -0,0 +1,153 @@
+import tempfile
+import unittest
+import sys
+import urllib.request
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.model_pool import ModelPool
+from core.translation.response_handler import ResponseHandler
+from core.translation.service_metrics import ServiceMetrics
+from core.translation.translation_cache import TranslationCache
+from core.translation.translation_service import TranslationService
+from core.utils.metrics import CONTENT_TYPE, MetricsRegistry
+from core.utils.status_server import StatusServer
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_text_format(self):
+        counter = self.registry.counter("requests_total", "Requests served", ("model", "outcome"))
+        counter.inc(model="a/b", outcome="success")
+        counter.inc(2, model="a/b", outcome="success")
+        self.registry.gauge("queue_depth", "Waiting requests").set(3)
+        histogram = self.registry.histogram("latency_seconds", "Latency", ("model",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value, model="a/b")
+
+        lines = self.registry.render().splitlines()
+        self.assertIn("# TYPE requests_total counter", lines)
+        self.assertIn('requests_total{model="a/b",outcome="success"} 3.0', lines)
+        self.assertIn("queue_depth 3.0", lines)
+        self.assertIn('latency_seconds_bucket{model="a/b",le="0.1"} 1', lines)
+        self.assertIn('latency_seconds_bucket{model="a/b",le="1.0"} 2', lines)
+        self.assertIn('latency_seconds_bucket{model="a/b",le="+Inf"} 3', lines)
+        self.assertIn('latency_seconds_count{model="a/b"} 3', lines)
+        self.assertIn('latency_seconds_sum{model="a/b"} 5.55', lines)
+
+    def test_label_values_are_escaped(self):
+        self.registry.counter("c_total", "C", ("text",)).inc(text='say "hi"\n')
+        self.assertIn('c_total{text="say \\"hi\\"\\n"} 1.0', self.registry.render())
+
+    def test_families_are_shared_by_name(self):
+        first = self.registry.counter("c_total", "C", ("model",))
+        self.assertIs(self.registry.counter("c_total", "C", ("model",)), first)
+        with self.assertRaises(ValueError):
+            self.registry.gauge("c_total", "C", ("model",))
+        with self.assertRaises(ValueError):
+            first.inc(other="x")
+
+    def test_collectors_run_on_render_and_failures_are_skipped(self):
+        gauge = self.registry.gauge("depth", "Depth")
+        self.registry.register_collector("ok", lambda: gauge.set(7))
+        self.registry.register_collector("broken", lambda: 1 / 0)
+        self.assertIn("depth 7.0", self.registry.render())
+
+
+class TestServiceMetrics(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        (Path(self.tmp.name) / "local_model").mkdir()
+        self.service = TranslationService.__new__(TranslationService)
+        self.service._config = {"translation_models": {"local/model": {}, "remote/model": {}}}
+        self.service.use_local_models = True
+        self.service.batch_scheduler = None
+        self.service.worker_pool = None
+        self.service.response_handler = ResponseHandler()
+        self.service.result_cache = TranslationCache()
+        self.service.model_validator = MagicMock()
+        self.service.model_validator.validate_model.return_value = (True, "ok")
+        self.service.model_validator.get_fallback_chain.return_value = []
+        self.service.model_cache = ModelPool(
+            Path(self.tmp.name), ["local/model"], lambda name, model_dir: (object(), object())
+        )
+        self.registry = MetricsRegistry()
+        self.service.metrics = ServiceMetrics(self.registry)
+        self.service.metrics.attach(self.service)
+        self.service.model_cache.on_load = self.service.metrics.record_model_load
+
+    def tearDown(self):
+        self.service.result_cache.close()
+        self.tmp.cleanup()
+
+    def test_requests_are_counted_by_path_and_outcome(self):
+        self.service._translate_with_local_model = MagicMock(return_value="hello")
+        self.service._translate_with_api = MagicMock(return_value=None)
+        self.service.translate("salam", "Darija", "English", "local/model")
+        self.service.translate("salam", "Darija", "English", "local/model")
+        self.service.translate("salam", "Darija", "English", "remote/model")
+
+        requests = self.service.metrics.requests
+        self.assertEqual(requests.get(model="local/model", path="local", outcome="success"), 1)
+        self.assertEqual(requests.get(model="local/model", path="cache", outcome="success"), 1)
+        self.assertEqual(requests.get(model="remote/model", path="api", outcome="failure"), 1)
+        self.assertEqual(self.service.metrics.request_seconds.get(model="local/model", path="local")["count"], 1)
+
+        text = self.registry.render()
+        self.assertIn("translation_cache_hits_total 1.0", text)
+        self.assertIn("translation_cache_misses_total 2.0", text)
+
+    def test_cache_counters_are_counted_at_lookup(self):
+        self.service._translate_with_local_model = MagicMock(return_value="hello")
+        self.service.translate("salam", "Darija", "English", "local/model")
+        self.service.translate("salam", "Darija", "English", "local/model")
+        # A fresh cache (e.g. after a rerun) must not rewind the counters
+        self.service.result_cache.close()
+        self.service.result_cache = TranslationCache()
+        text = self.registry.render()
+        self.assertIn("translation_cache_hits_total 1.0", text)
+        self.assertIn("translation_cache_misses_total 1.0", text)
+
+    def test_fallbacks_are_counted(self):
+        self.service.model_validator.validate_model.side_effect = (
+            lambda model: (model == "local/model", "ok")
+        )
+        self.service.model_validator.get_fallback_chain.return_value = ["local/model"]
+        self.service._translate_with_local_model = MagicMock(return_value="hello")
+        self.service.translate("salam", "Darija", "English", "remote/model")
+        self.assertEqual(
+            self.service.metrics.requests.get(model="remote/model", path="fallback", outcome="success"), 1
+        )
+        self.assertEqual(
+            self.service.metrics.fallbacks.get(requested_model="remote/model", served_model="local/model"), 1
+        )
+
+    def test_model_loads_and_resident_memory(self):
+        self.service.model_cache.get("local/model")
+        self.assertEqual(self.service.metrics.model_load_seconds.get(model="local/model")["count"], 1)
+        text = self.registry.render()
+        self.assertIn('translation_model_resident_bytes{model="local/model"} 0.0', text)
+        self.assertIn("process_resident_memory_bytes", text)
+
+    def test_metrics_endpoint(self):
+        self.service.warmup = None
+        server = StatusServer("127.0.0.1", 0)
+        server.start()
+        with patch("core.translation.translation_service.get_status_server", return_value=server):
+            self.service._register_status_endpoints({})
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+                self.assertEqual(response.headers["Content-Type"], CONTENT_TYPE)
+                self.assertIn("# TYPE translation_requests_total counter", response.read().decode())
+        finally:
+            server.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
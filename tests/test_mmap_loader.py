@@ -0,0 +1,149 @@
+import subprocess
+import tempfile
+import textwrap
+import unittest
+import sys
+import warnings
+from pathlib import Path
+
+import torch
+from transformers import M2M100Config, M2M100ForConditionalGeneration, MarianConfig, MarianMTModel
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.mmap_loader import (
+    PYTORCH_FILE,
+    SAFETENSORS_FILE,
+    ensure_safetensors,
+    load_mmap_model,
+    process_memory_report
+)
+
+SMALL = dict(
+    vocab_size=64, d_model=32, encoder_layers=2, decoder_layers=2,
+    encoder_attention_heads=2, decoder_attention_heads=2,
+    encoder_ffn_dim=64, decoder_ffn_dim=64, max_position_embeddings=64
+)
+
+
+def tiny_marian():
+    torch.manual_seed(0)
+    config = MarianConfig(**SMALL, pad_token_id=0, eos_token_id=1, decoder_start_token_id=0, forced_eos_token_id=1)
+    return MarianMTModel(config).eval()
+
+
+def tiny_m2m100():
+    torch.manual_seed(0)
+    config = M2M100Config(**SMALL, pad_token_id=1, eos_token_id=2, bos_token_id=0, decoder_start_token_id=2)
+    return M2M100ForConditionalGeneration(config).eval()
+
+
+def save_as_pytorch_bin(model, model_dir):
+    model_dir.mkdir()
+    model.config.save_pretrained(str(model_dir))
+    torch.save(model.state_dict(), str(model_dir / PYTORCH_FILE))
+
+
+def greedy(model):
+    return model.generate(torch.tensor([[5, 6, 7, 8, 2]]), max_new_tokens=8, num_beams=1, do_sample=False)
+
+
+class TestMmapLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        warnings.simplefilter("ignore")
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.model_dir = Path(self.tmp.name) / "model"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_pytorch_bin_is_converted_once(self):
+        save_as_pytorch_bin(tiny_marian(), self.model_dir)
+        weights = ensure_safetensors(self.model_dir)
+        self.assertEqual(weights, self.model_dir / SAFETENSORS_FILE)
+        mtime = weights.stat().st_mtime_ns
+        self.assertEqual(ensure_safetensors(self.model_dir).stat().st_mtime_ns, mtime)
+        self.assertEqual(sorted(p.name for p in self.model_dir.iterdir()), ["config.json", SAFETENSORS_FILE, PYTORCH_FILE])
+
+    def test_missing_weights(self):
+        self.model_dir.mkdir()
+        self.assertIsNone(ensure_safetensors(self.model_dir))
+
+    def test_mapped_models_match_originals(self):
+        for build in (tiny_marian, tiny_m2m100):
+            with self.subTest(model=build.__name__):
+                model_dir = Path(self.tmp.name) / build.__name__
+                original = build()
+                save_as_pytorch_bin(original, model_dir)
+                mapped = load_mmap_model(model_dir, ensure_safetensors(model_dir))
+                self.assertFalse(any(t.is_meta for t in list(mapped.parameters()) + list(mapped.buffers())))
+                self.assertTrue(torch.equal(greedy(mapped), greedy(original)))
+
+    def test_tied_and_optional_weights_may_be_missing(self):
+        # save_pretrained leaves out tied embeddings and sinusoidal positions
+        original = tiny_marian()
+        original.save_pretrained(str(self.model_dir))
+        mapped = load_mmap_model(self.model_dir, self.model_dir / SAFETENSORS_FILE)
+        self.assertTrue(torch.equal(greedy(mapped), greedy(original)))
+
+    def test_checkpoint_without_base_model_prefix_is_rejected(self):
+        model = tiny_m2m100()
+        state_dict = {
+            name[len("model."):] if name.startswith("model.") else name: tensor
+            for name, tensor in model.state_dict().items()
+        }
+        self.model_dir.mkdir()
+        model.config.save_pretrained(str(self.model_dir))
+        torch.save(state_dict, str(self.model_dir / PYTORCH_FILE))
+        with self.assertRaises(ValueError):
+            load_mmap_model(self.model_dir, ensure_safetensors(self.model_dir))
+
+    def test_checkpoint_missing_weights_is_rejected(self):
+        model = tiny_m2m100()
+        state_dict = {
+            name: tensor for name, tensor in model.state_dict().items()
+            if not name.startswith("model.encoder.layers.0.")
+        }
+        self.model_dir.mkdir()
+        model.config.save_pretrained(str(self.model_dir))
+        torch.save(state_dict, str(self.model_dir / PYTORCH_FILE))
+        with self.assertRaises(ValueError):
+            load_mmap_model(self.model_dir, ensure_safetensors(self.model_dir))
+
+    def test_weights_are_file_backed_and_shared(self):
+        save_as_pytorch_bin(tiny_marian(), self.model_dir)
+        weights = ensure_safetensors(self.model_dir)
+        mapped = load_mmap_model(self.model_dir, weights)
+        greedy(mapped)
+        files = process_memory_report()["weight_files"]
+        self.assertGreater(files[str(weights.resolve())]["rss_bytes"], 0)
+
+        # A second process mapping the same file shares its pages with this one
+        script = textwrap.dedent(f"""
+            import sys, time
+            sys.path.insert(0, {str(project_root)!r})
+            from pathlib import Path
+            from core.translation.mmap_loader import load_mmap_model
+            model = load_mmap_model(Path({str(self.model_dir)!r}), Path({str(weights)!r}))
+            sum(float(p.sum()) for p in model.parameters())
+            print("loaded", flush=True)
+            sys.stdin.read()
+        """)
+        child = subprocess.Popen([sys.executable, "-c", script], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        try:
+            self.assertEqual(child.stdout.readline().strip(), "loaded")
+            sum(float(p.sum()) for p in mapped.parameters())
+            report = process_memory_report()
+            self.assertGreater(report["weight_files"][str(weights.resolve())]["shared_bytes"], 0)
+            self.assertGreaterEqual(report["shared_bytes"], report["weight_files"][str(weights.resolve())]["shared_bytes"])
+        finally:
+            child.communicate("")
+
+
+if __name__ == '__main__':
+    unittest.main()
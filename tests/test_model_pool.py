@@ -0,0 +1,85 @@
+import tempfile
+import threading
+import unittest
+import sys
+from pathlib import Path
+
+import torch
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.model_pool import ModelPool, model_resident_bytes
+
+
+class TestModelPool(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmp.name)
+        for name in ("org/a", "org/b", "org/c"):
+            (self.cache_dir / name.replace("/", "_")).mkdir()
+        self.loaded = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _loader(self, model_name, model_dir):
+        self.loaded.append(model_name)
+        # 1000 float32 parameters = 4000 bytes
+        return torch.nn.Linear(1000, 1, bias=False), f"tokenizer:{model_name}"
+
+    def _pool(self, **kwargs):
+        return ModelPool(self.cache_dir, ["org/a", "org/b", "org/c", "org/missing"], self._loader, **kwargs)
+
+    def test_models_load_lazily(self):
+        pool = self._pool()
+        self.assertIn("org/a", pool)
+        self.assertNotIn("org/missing", pool)
+        self.assertEqual(self.loaded, [])
+        model, tokenizer = pool["org/a"]
+        pool["org/a"]
+        self.assertEqual(tokenizer, "tokenizer:org/a")
+        self.assertEqual(self.loaded, ["org/a"])
+        stats = pool.get_stats()
+        self.assertEqual(stats["loads"], 1)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["resident_bytes"], model_resident_bytes(model))
+
+    def test_least_recently_used_model_is_evicted(self):
+        pool = self._pool(memory_budget_bytes=9000)
+        pool["org/a"]
+        pool["org/b"]
+        pool["org/a"]  # "b" is now least recently used
+        pool["org/c"]
+        self.assertTrue(pool.is_loaded("org/a"))
+        self.assertFalse(pool.is_loaded("org/b"))
+        stats = pool.get_stats()
+        self.assertEqual(stats["evictions"], 1)
+        self.assertLessEqual(stats["resident_bytes"], 9000)
+
+    def test_pinned_models_are_never_evicted(self):
+        pool = self._pool(memory_budget_bytes=9000, pinned=["org/a"])
+        pool["org/a"]
+        pool["org/b"]
+        pool["org/b"]
+        pool["org/c"]
+        self.assertTrue(pool.is_loaded("org/a"))
+        self.assertFalse(pool.is_loaded("org/b"))
+
+    def test_concurrent_requests_load_once(self):
+        pool = self._pool()
+        threads = [threading.Thread(target=pool.get, args=("org/a",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.loaded, ["org/a"])
+
+    def test_unknown_model_raises_key_error(self):
+        with self.assertRaises(KeyError):
+            self._pool()["org/missing"]
+
+
+if __name__ == '__main__':
+    unittest.main()
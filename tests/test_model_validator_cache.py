@@ -0,0 +1,76 @@
+import tempfile
+import time
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.model_validator import ModelValidator
+
+
+class TestModelStatusCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.validator = ModelValidator(
+            "http://unused/", {}, Path(self.tmp.name),
+            status_ttl=60, failure_ttl=0.05, max_failure_backoff=0.2
+        )
+
+    def tearDown(self):
+        self.validator.stop_background_refresh()
+        self.tmp.cleanup()
+
+    def test_hot_path_does_no_io_after_first_check(self):
+        with patch.object(self.validator, "_check_api_status", return_value={"loaded": True}) as check:
+            self.assertTrue(self.validator.validate_model("m")[0])
+            with patch("pathlib.Path.exists", side_effect=AssertionError("filesystem hit")):
+                for _ in range(100):
+                    self.assertTrue(self.validator.validate_model("m")[0])
+        self.assertEqual(check.call_count, 1)
+        stats = self.validator.get_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 100)
+
+    def test_failures_are_cached_with_backoff(self):
+        with patch.object(self.validator, "_check_api_status", return_value={"state": "TooBig"}) as check:
+            self.assertFalse(self.validator.validate_model("m")[0])
+            self.assertFalse(self.validator.validate_model("m")[0])
+            self.assertEqual(check.call_count, 1)
+            first_ttl = self.validator.get_stats()["models"]["m"]["expires_in"]
+
+            time.sleep(0.06)
+            self.validator.validate_model("m")
+            self.assertEqual(check.call_count, 2)
+            status = self.validator.get_stats()["models"]["m"]
+            self.assertEqual(status["failures"], 2)
+            self.assertGreater(status["expires_in"], first_ttl)
+
+    def test_recovered_model_is_picked_up(self):
+        with patch.object(self.validator, "_check_api_status", return_value={"state": "TooBig"}):
+            self.assertFalse(self.validator.validate_model("m")[0])
+        time.sleep(0.06)
+        with patch.object(self.validator, "_check_api_status", return_value={"loaded": True}):
+            self.assertTrue(self.validator.validate_model("m")[0])
+        self.assertEqual(self.validator.get_stats()["models"]["m"]["failures"], 0)
+
+    def test_background_refresh_warms_and_serves_stale(self):
+        self.validator.status_ttl = 0.05
+        with patch.object(self.validator, "_check_api_status", return_value={"loaded": True}) as check:
+            self.validator.start_background_refresh(models=["m"], interval=0.05)
+            deadline = time.time() + 2
+            while "m" not in self.validator.get_stats()["models"] and time.time() < deadline:
+                time.sleep(0.01)
+            time.sleep(0.2)
+            calls_before = check.call_count
+            self.assertGreater(calls_before, 1)
+            # Served from the cache while the refresher keeps it warm
+            self.assertTrue(self.validator.validate_model("m")[0])
+            self.assertEqual(self.validator.get_stats()["misses"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import tempfile
+import unittest
+import sys
+import warnings
+from pathlib import Path
+from unittest.mock import patch
+
+import torch
+from transformers import GenerationConfig, MarianConfig, MarianMTModel
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.onnx_backend import export_onnx, load_onnx_model, model_backend, onnx_cache_dir
+from core.translation.onnx_report import compare_backends
+
+
+def tiny_marian(seed):
+    config = MarianConfig(
+        vocab_size=64, d_model=32, encoder_layers=2, decoder_layers=2,
+        encoder_attention_heads=2, decoder_attention_heads=2,
+        encoder_ffn_dim=64, decoder_ffn_dim=64, max_position_embeddings=64,
+        pad_token_id=0, eos_token_id=1, decoder_start_token_id=0, forced_eos_token_id=1
+    )
+    torch.manual_seed(seed)
+    return MarianMTModel(config).eval()
+
+
+class CharTokenizer:
+    """Maps characters to ids 2..63 so the tiny model can run end to end."""
+
+    def __call__(self, text, return_tensors=None, padding=False, truncation=False, max_length=None):
+        texts = text if isinstance(text, list) else [text]
+        rows = [[2 + ord(c) % 62 for c in t][:16] + [1] for t in texts]
+        width = max(len(row) for row in rows)
+        input_ids = torch.tensor([row + [0] * (width - len(row)) for row in rows])
+        mask = torch.tensor([[1] * len(row) + [0] * (width - len(row)) for row in rows])
+        return {"input_ids": input_ids, "attention_mask": mask}
+
+    def batch_decode(self, sequences, skip_special_tokens=True):
+        return [" ".join(str(int(t)) for t in seq if int(t) > 1) for seq in sequences]
+
+
+class TestONNXBackend(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        warnings.simplefilter("ignore")
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.model_dir = Path(cls.tmp.name) / "org_tiny"
+        tiny_marian(seed=0).save_pretrained(str(cls.model_dir))
+        cls.float_loads = 0
+
+        def load_float():
+            cls.float_loads += 1
+            return MarianMTModel.from_pretrained(str(cls.model_dir)).eval()
+
+        cls.load_float = staticmethod(load_float)
+        cls.torch_model = load_float()
+        cls.onnx_model = load_onnx_model(cls.model_dir, load_float)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def assert_same_outputs(self, generation_config):
+        input_ids = torch.tensor([[5, 6, 7, 8, 9, 1], [3, 4, 1, 0, 0, 0], [12, 40, 33, 1, 0, 0]])
+        attention_mask = (input_ids != 0).long()
+        expected = self.torch_model.generate(
+            input_ids=input_ids, attention_mask=attention_mask, generation_config=generation_config
+        )
+        actual = self.onnx_model.generate(
+            input_ids=input_ids, attention_mask=attention_mask, generation_config=generation_config
+        )
+        self.assertEqual(actual.tolist(), expected.tolist())
+
+    def test_greedy_matches_pytorch(self):
+        self.assert_same_outputs(GenerationConfig(max_length=12, num_beams=1))
+
+    def test_max_new_tokens_budget(self):
+        # The bulk generation profile bounds output with max_new_tokens
+        self.assert_same_outputs(GenerationConfig(max_new_tokens=6, num_beams=2, early_stopping=True))
+
+    def test_beam_search_matches_pytorch(self):
+        # The service's default generation settings
+        self.assert_same_outputs(GenerationConfig(max_length=20, num_beams=4, length_penalty=0.6, early_stopping=True))
+        self.assert_same_outputs(GenerationConfig(max_length=15, num_beams=3))
+        self.assert_same_outputs(
+            GenerationConfig(max_length=15, num_beams=4, length_penalty=1.0, early_stopping="never")
+        )
+
+    def test_export_is_cached(self):
+        self.assertTrue((onnx_cache_dir(self.model_dir) / "decoder_with_past_model.onnx").exists())
+        loads_before = self.float_loads
+        load_onnx_model(self.model_dir, self.load_float)
+        self.assertEqual(self.float_loads, loads_before)
+
+    def test_backend_selection(self):
+        self.assertEqual(model_backend({"model_type": "marian"}), "pytorch")
+        self.assertEqual(model_backend({"model_type": "nllb", "backend": "onnx"}), "onnx")
+        self.assertEqual(model_backend({"model_type": "seamless", "backend": "onnx"}), "pytorch")
+
+    def test_old_transformers_falls_back_to_pytorch(self):
+        with patch("transformers.__version__", "4.35.0"):
+            with self.assertLogs("core.translation.onnx_backend", level="WARNING") as logs:
+                self.assertEqual(model_backend({"model_type": "nllb", "backend": "onnx"}), "pytorch")
+            self.assertIn("transformers>=5.0.0", logs.output[0])
+            with self.assertRaises(RuntimeError):
+                export_onnx(None, Path(self.tmp.name) / "old")
+
+    def test_latency_report(self):
+        sentences = ["kayn lbrd", "lbs hwayjk", "salam labas", "fin ghadi"]
+        report = compare_backends(
+            self.model_dir, sentences, {"max_length": 12, "num_beams": 2},
+            load_float_model=self.load_float, tokenizer=CharTokenizer(), batch_size=2
+        )
+        self.assertEqual(report["identical_rate"], 1.0)
+        for backend in ("pytorch", "onnx"):
+            self.assertGreater(report[backend]["batched_sentences_per_second"], 0.0)
+            self.assertGreater(report[backend]["p50_ms"], 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
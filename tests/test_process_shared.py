@@ -0,0 +1,177 @@
+import tempfile
+import threading
+import time
+import unittest
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import yaml
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation import translation_service
+from core.translation.benchmark import service_environment
+from core.translation.translation_service import TranslationService, _process_shared
+
+# Nothing listens here, so status checks fail fast instead of reaching the network
+UNREACHABLE_API = "http://127.0.0.1:9"
+
+
+def service_config():
+    return {
+        "translation_models": {"m": {"direction": "bidirectional", "model_type": "marian"}},
+        "inference_api": {"models_url": f"{UNREACHABLE_API}/models/", "status_url": f"{UNREACHABLE_API}/status/"},
+        "model_validation": {"background_refresh": True, "refresh_interval_seconds": 3600},
+        "request_coalescing": {"enabled": True},
+        "metrics": {"enabled": True}
+    }
+
+
+class TestProcessShared(unittest.TestCase):
+    def setUp(self):
+        translation_service._shared_components.clear()
+
+    def test_components_are_shared_per_name_and_config(self):
+        first = _process_shared("component", {"size": 1}, object)
+        self.assertIs(_process_shared("component", {"size": 1}, object), first)
+        self.assertIsNot(_process_shared("component", {"size": 2}, object), first)
+        self.assertIsNot(_process_shared("other", {"size": 1}, object), first)
+
+    def test_failed_factories_are_retried(self):
+        def fail():
+            raise RuntimeError("no")
+
+        with self.assertRaises(RuntimeError):
+            _process_shared("component", {}, fail)
+        self.assertEqual(_process_shared("component", {}, lambda: 1), 1)
+
+
+class TestServiceInstancesShareState(unittest.TestCase):
+    """Streamlit builds a new TranslationService on every rerun."""
+
+    environment = "local"
+
+    def setUp(self):
+        translation_service._shared_components.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        workspace = Path(self.tmp.name)
+        (workspace / "config").mkdir()
+        with open(workspace / "config" / "model_config.yaml", "w") as f:
+            yaml.safe_dump(self.config(), f)
+        with service_environment(workspace, self.environment):
+            self.services = [TranslationService(), TranslationService()]
+
+    def tearDown(self):
+        for component in translation_service._shared_components.values():
+            for stop in ("stop_background_refresh", "shutdown", "close"):
+                if hasattr(component, stop):
+                    getattr(component, stop)()
+        translation_service._shared_components.clear()
+        self.tmp.cleanup()
+
+    def config(self):
+        return service_config()
+
+    def test_one_validator_and_refresher_per_process(self):
+        first, second = self.services
+        self.assertIs(first.model_validator, second.model_validator)
+        refreshers = [thread for thread in threading.enumerate() if thread.name == "model-status-refresh"]
+        self.assertEqual(len(refreshers), 1)
+
+    def test_metrics_are_kept_across_instances(self):
+        first, second = self.services
+        self.assertIs(first.metrics, second.metrics)
+        # Families live on the process-wide registry, so count from here
+        before = first.metrics.requests.get(model="m", path="api", outcome="success")
+        first.metrics.record_request("m", "m", False, "success", 0.1)
+        second.metrics.record_request("m", "m", False, "success", 0.1)
+        self.assertEqual(first.metrics.requests.get(model="m", path="api", outcome="success") - before, 2)
+
+    def test_requests_from_different_instances_coalesce(self):
+        first, second = self.services
+        self.assertIs(first.single_flight, second.single_flight)
+        release = threading.Event()
+        calls = []
+
+        def api(text, model, target_lang, profile=None, cancel_event=None):
+            calls.append(text)
+            release.wait(5)
+            return f"en:{text}"
+
+        for service in self.services:
+            service.model_validator = MagicMock()
+            service.model_validator.validate_model.return_value = (True, "ok")
+            service._translate_with_api = api
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(service.translate, "salam", "Darija", "English", "m", "interactive")
+                for service in self.services
+            ]
+            while first.single_flight.get_stats()["coalesced"] == 0:
+                time.sleep(0.01)
+            release.set()
+            self.assertEqual([future.result() for future in futures], ["en:salam", "en:salam"])
+        self.assertEqual(calls, ["salam"])
+
+
+
+class TestLocalModelServicesShareState(TestServiceInstancesShareState):
+    environment = "ec2"
+
+    def config(self):
+        config = service_config()
+        config.update({
+            "batching": {"enabled": True},
+            "circuit_breakers": {"enabled": True},
+            "hedging": {"enabled": True},
+            "result_cache": {"enabled": True},
+            "model_pool": {"pinned": ["m"]},
+            "warmup": {"enabled": True, "background": False}
+        })
+        return config
+
+    def test_stateful_components_are_shared(self):
+        first, second = self.services
+        for name in ("health_monitor", "hedger", "result_cache", "model_cache", "batch_scheduler", "warmup"):
+            self.assertIsNotNone(getattr(first, name), name)
+            self.assertIs(getattr(first, name), getattr(second, name), name)
+        self.assertIs(first.model_validator.health_monitor, first.health_monitor)
+        self.assertIs(second.response_handler.health_monitor, first.health_monitor)
+
+    def test_breaker_history_survives_a_rerun(self):
+        first, _ = self.services
+        for _ in range(10):
+            first.response_handler.log_translation_attempt(False, "m", "salam", None, "timeout", 1.0)
+        with service_environment(Path(self.tmp.name), self.environment):
+            rerun = TranslationService()
+        self.assertEqual(rerun.health_monitor.state("m"), "open")
+        self.assertIs(rerun.warmup, first.warmup)
+
+
+
+class TestWorkerPoolServicesShareState(TestServiceInstancesShareState):
+    environment = "ec2"
+
+    def config(self):
+        config = service_config()
+        config["worker_pool"] = {"enabled": True}
+        return config
+
+    def setUp(self):
+        with patch("core.translation.translation_service.WorkerPool") as worker_pool_class:
+            self.worker_pool_class = worker_pool_class
+            super().setUp()
+
+    def test_one_worker_pool_per_process(self):
+        first, second = self.services
+        self.assertIs(first.worker_pool, second.worker_pool)
+        self.worker_pool_class.from_config.assert_called_once()
+        first.worker_pool.start.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import tempfile
+import unittest
+import sys
+import warnings
+from pathlib import Path
+
+import torch
+from transformers import MarianConfig, MarianMTModel
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.evaluation import corpus_bleu
+from core.translation.model_pool import model_resident_bytes
+from core.translation.parallel_corpus import load_parallel_corpus
+from core.translation.quantization import load_quantized_model, quantization_mode, quantized_cache_path
+from core.translation.quantization_report import compare_quantization
+
+
+def tiny_marian():
+    config = MarianConfig(
+        vocab_size=64, d_model=32, encoder_layers=1, decoder_layers=1,
+        encoder_attention_heads=2, decoder_attention_heads=2,
+        encoder_ffn_dim=64, decoder_ffn_dim=64, max_position_embeddings=64,
+        pad_token_id=0, eos_token_id=1, decoder_start_token_id=0
+    )
+    torch.manual_seed(0)
+    return MarianMTModel(config).eval()
+
+
+class CharTokenizer:
+    """Maps characters to ids 2..63 so the tiny model can run end to end."""
+
+    def __call__(self, text, return_tensors=None, truncation=False, max_length=None):
+        ids = [2 + ord(c) % 62 for c in text][:16] + [1]
+        return {"input_ids": torch.tensor([ids]), "attention_mask": torch.ones(1, len(ids), dtype=torch.long)}
+
+    def batch_decode(self, sequences, skip_special_tokens=True):
+        return [" ".join(str(int(t)) for t in seq if int(t) > 1) for seq in sequences]
+
+
+class TestQuantization(unittest.TestCase):
+    def setUp(self):
+        warnings.simplefilter("ignore")
+        self.tmp = tempfile.TemporaryDirectory()
+        self.model_dir = Path(self.tmp.name) / "org_tiny"
+        tiny_marian().save_pretrained(str(self.model_dir))
+        self.float_loads = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _load_float(self):
+        self.float_loads += 1
+        return MarianMTModel.from_pretrained(str(self.model_dir)).eval()
+
+    def test_quantized_model_is_cached(self):
+        first = load_quantized_model(self.model_dir, self._load_float)
+        self.assertTrue(quantized_cache_path(self.model_dir).exists())
+        second = load_quantized_model(self.model_dir, self._load_float)
+        self.assertEqual(self.float_loads, 1)
+
+        inputs = torch.tensor([[5, 6, 7, 1]])
+        self.assertTrue(torch.equal(
+            first.generate(input_ids=inputs, max_length=8),
+            second.generate(input_ids=inputs, max_length=8)
+        ))
+
+    def test_cache_holds_a_state_dict(self):
+        load_quantized_model(self.model_dir, self._load_float)
+        state_dict = torch.load(str(quantized_cache_path(self.model_dir)), weights_only=True)
+        self.assertIsInstance(state_dict, dict)
+        self.assertTrue(any(key.endswith("_packed_params._packed_params") for key in state_dict))
+
+    def test_quantized_weights_are_smaller(self):
+        float_model = self._load_float()
+        int8_model = load_quantized_model(self.model_dir, self._load_float)
+        self.assertLess(model_resident_bytes(int8_model), model_resident_bytes(float_model))
+
+    def test_mode_is_opt_in_and_limited_to_seq2seq_families(self):
+        self.assertIsNone(quantization_mode({"model_type": "marian"}))
+        self.assertEqual(quantization_mode({"model_type": "nllb", "quantization": "dynamic_int8"}), "dynamic_int8")
+        self.assertIsNone(quantization_mode({"model_type": "seamless", "quantization": "dynamic_int8"}))
+
+    def test_report_compares_quality_latency_and_memory(self):
+        pairs = load_parallel_corpus(limit=5)
+        self.assertEqual(len(pairs), 5)
+        report = compare_quantization(
+            self.model_dir, pairs, {"max_length": 8, "num_beams": 1},
+            load_float_model=self._load_float, tokenizer=CharTokenizer()
+        )
+        for key in ("bleu_drift", "latency_speedup", "memory_saving", "bleu_int8_vs_float32"):
+            self.assertIn(key, report)
+        self.assertGreater(report["memory_saving"], 0.0)
+        self.assertEqual(report["sentences"], 5)
+
+
+class TestCorpusBleu(unittest.TestCase):
+    def test_identical_and_disjoint(self):
+        self.assertAlmostEqual(corpus_bleu(["the cat sat on the mat"], ["the cat sat on the mat"]), 100.0)
+        self.assertLess(corpus_bleu(["a b c d"], ["w x y z"]), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
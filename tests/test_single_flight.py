@@ -0,0 +1,132 @@
+import threading
+import time
+import unittest
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.response_handler import ResponseHandler
+from core.translation.service_metrics import ServiceMetrics
+from core.translation.single_flight import SingleFlight
+from core.translation.translation_service import TranslationService
+from core.utils.metrics import MetricsRegistry
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_concurrent_calls_share_one_computation(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            release.wait(5)
+            return "hello"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(flight.do, "k", compute, "m") for _ in range(4)]
+            deadline = time.time() + 5
+            while flight.get_stats()["coalesced"] < 3 and time.time() < deadline:
+                time.sleep(0.01)
+            release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(sorted(leader for _, leader in results), [False, False, False, True])
+        self.assertTrue(all(result == "hello" for result, _ in results))
+        stats = flight.get_stats()
+        self.assertEqual((stats["leaders"], stats["coalesced"], stats["in_flight"]), (1, 3, 0))
+        self.assertEqual(stats["models"]["m"], {"leaders": 1, "coalesced": 3})
+        self.assertEqual(stats["coalesced_ratio"], 0.75)
+
+    def test_errors_reach_every_waiter(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def compute():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("model crashed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(flight.do, "k", compute)
+            started.wait(5)
+            follower = executor.submit(flight.do, "k", compute)
+            while flight.get_stats()["coalesced"] < 1:
+                time.sleep(0.01)
+            release.set()
+            for future in (leader, follower):
+                with self.assertRaises(RuntimeError):
+                    future.result()
+
+    def test_finished_keys_run_again(self):
+        flight = SingleFlight()
+        self.assertEqual(flight.do("k", lambda: 1), (1, True))
+        self.assertEqual(flight.do("k", lambda: 2), (2, True))
+        self.assertEqual(flight.get_stats()["coalesced"], 0)
+
+
+class TestServiceCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.service = TranslationService.__new__(TranslationService)
+        self.service._config = {"translation_models": {"m": {}}}
+        self.service.use_local_models = False
+        self.service.batch_scheduler = None
+        self.service.result_cache = None
+        self.service.response_handler = ResponseHandler()
+        self.service.model_validator = MagicMock()
+        self.service.model_validator.validate_model.return_value = (True, "ok")
+        self.service.model_cache = {}
+        self.service.single_flight = SingleFlight()
+        self.service.metrics = ServiceMetrics(MetricsRegistry())
+        self.release = threading.Event()
+
+        def api(text, model, target_lang, profile=None, cancel_event=None):
+            self.release.wait(5)
+            return f"en:{text}"
+
+        self.service._translate_with_api = MagicMock(side_effect=api)
+
+    def translate_concurrently(self, texts):
+        with ThreadPoolExecutor(max_workers=len(texts)) as executor:
+            futures = [
+                executor.submit(self.service.translate, text, "Darija", "English", "m", "interactive")
+                for text in texts
+            ]
+            time.sleep(0.2)
+            self.release.set()
+            return [future.result() for future in futures]
+
+    def test_identical_requests_share_one_api_call(self):
+        results = self.translate_concurrently(["salam", "salam", " salam  ", "labas"])
+        self.assertEqual(results, ["en:salam", "en:salam", "en:salam", "en:labas"])
+        self.assertEqual(self.service._translate_with_api.call_count, 2)
+
+        stats = self.service.get_coalescing_stats()
+        self.assertEqual((stats["leaders"], stats["coalesced"]), (2, 2))
+        requests = self.service.metrics.requests
+        self.assertEqual(requests.get(model="m", path="coalesced", outcome="success"), 2)
+        self.assertEqual(requests.get(model="m", path="api", outcome="success"), 2)
+        self.assertEqual(self.service.get_stage_timing_stats()["m"]["coalesced_wait"]["count"], 2)
+
+    def test_different_profiles_are_not_coalesced(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.service.translate, "salam", "Darija", "English", "m", profile)
+                for profile in ("interactive", "quality")
+            ]
+            time.sleep(0.2)
+            self.release.set()
+            [future.result() for future in futures]
+        self.assertEqual(self.service._translate_with_api.call_count, 2)
+        self.assertEqual(self.service.get_coalescing_stats()["coalesced"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import time
+import timeit
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import torch
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.response_handler import ResponseHandler
+from core.translation.stage_timing import StageTimings
+from core.translation.translation_service import TranslationService
+
+
+class FakeTokenizer:
+    def __call__(self, text, **kwargs):
+        return {"input_ids": torch.tensor([[5, 6, 1]]), "attention_mask": torch.tensor([[1, 1, 1]])}
+
+    def batch_decode(self, sequences, **kwargs):
+        return ["hello" for _ in sequences]
+
+
+class SlowModel:
+    def generate(self, **kwargs):
+        time.sleep(0.02)
+        return torch.tensor([[0, 7, 1]])
+
+
+class TestStageTimings(unittest.TestCase):
+    def test_spans_collect_per_model_and_stage(self):
+        timings = StageTimings(max_samples=10)
+        for _ in range(3):
+            with timings.span("m", "generate"):
+                time.sleep(0.01)
+        with self.assertRaises(ValueError):
+            with timings.span("m", "decode"):
+                raise ValueError("bad output")
+        timings.record("other", "http", 0.5)
+
+        stats = timings.get_stats()
+        self.assertEqual(stats["m"]["generate"]["count"], 3)
+        self.assertGreaterEqual(stats["m"]["generate"]["p50_ms"], 10.0)
+        self.assertEqual(stats["m"]["decode"]["count"], 1)
+        self.assertEqual(stats["other"]["http"]["p99_ms"], 500.0)
+
+    def test_window_is_bounded(self):
+        timings = StageTimings(max_samples=5)
+        for seconds in [1.0] * 5 + [0.001] * 5:
+            timings.record("m", "generate", seconds)
+        stats = timings.get_stats()["m"]["generate"]
+        self.assertEqual(stats["count"], 10)
+        self.assertEqual(stats["p99_ms"], 1.0)
+        self.assertAlmostEqual(stats["total_ms"], 5005.0)
+
+    def test_disabled_records_nothing(self):
+        timings = StageTimings.from_config({"enabled": False})
+        with timings.span("m", "generate"):
+            pass
+        self.assertEqual(timings.get_stats(), {})
+
+    def test_span_overhead_is_small(self):
+        timings = StageTimings()
+
+        def span():
+            with timings.span("m", "generate"):
+                pass
+
+        per_span = min(timeit.repeat(span, number=2000, repeat=3)) / 2000
+        self.assertLess(per_span, 50e-6)
+
+
+class TestServiceStageTimings(unittest.TestCase):
+    def setUp(self):
+        self.service = TranslationService.__new__(TranslationService)
+        self.service._config = {"translation_models": {"local": {}, "remote": {}}}
+        self.service.use_local_models = True
+        self.service.batch_scheduler = None
+        self.service.result_cache = None
+        self.service.response_handler = ResponseHandler()
+        self.service.model_validator = MagicMock()
+        self.service.model_validator.validate_model.return_value = (True, "ok")
+        self.service.model_cache = {"local": (SlowModel(), FakeTokenizer())}
+        self.service.api_url = "https://example.invalid/"
+        self.service.headers = {}
+
+    def test_local_request_stages(self):
+        self.assertEqual(self.service.translate("salam", "Darija", "English", "local"), "hello")
+        stats = self.service.get_stage_timing_stats()["local"]
+        for stage in ("model_resolution", "inference", "total", "model_fetch", "tokenize", "generate", "decode"):
+            self.assertEqual(stats[stage]["count"], 1, stage)
+        self.assertGreaterEqual(stats["generate"]["p50_ms"], 20.0)
+        self.assertGreaterEqual(stats["total"]["p50_ms"], stats["generate"]["p50_ms"])
+
+    def test_api_request_stages(self):
+        client = MagicMock()
+        client.post.return_value = MagicMock(status_code=200, json=lambda: [{"translation_text": "hello"}])
+        with patch("core.translation.translation_service.get_http_client", return_value=client):
+            self.assertEqual(self.service.translate("salam", "Darija", "English", "remote"), "hello")
+        stats = self.service.get_stage_timing_stats()["remote"]
+        for stage in ("payload", "http", "parse", "inference", "total"):
+            self.assertEqual(stats[stage]["count"], 1, stage)
+        self.assertNotIn("generate", stats)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+import tempfile
+import threading
+import unittest
+import sys
+import warnings
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import torch
+from transformers import MarianConfig, MarianMTModel
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.onnx_backend import load_onnx_model
+from core.translation.response_handler import ResponseHandler
+from core.translation.service_metrics import ServiceMetrics
+from core.translation.single_flight import SingleFlight
+from core.translation.translation_cache import TranslationCache
+from core.translation.translation_memory import TranslationMemory, build_index
+from core.translation.translation_service import TranslationService
+from core.utils.metrics import MetricsRegistry
+
+
+def tiny_marian(seed):
+    config = MarianConfig(
+        vocab_size=64, d_model=32, encoder_layers=2, decoder_layers=2,
+        encoder_attention_heads=2, decoder_attention_heads=2,
+        encoder_ffn_dim=64, decoder_ffn_dim=64, max_position_embeddings=64,
+        pad_token_id=0, eos_token_id=1, decoder_start_token_id=0, forced_eos_token_id=1
+    )
+    torch.manual_seed(seed)
+    return MarianMTModel(config).eval()
+
+
+class WordTokenizer:
+    """Maps characters to ids 2..63 and decodes every id as one word."""
+
+    def __call__(self, text, return_tensors=None, padding=False, truncation=False, max_length=None):
+        ids = [2 + ord(c) % 62 for c in text][:16] + [1]
+        return {"input_ids": torch.tensor([ids]), "attention_mask": torch.ones(1, len(ids), dtype=torch.long)}
+
+    def decode(self, ids, skip_special_tokens=True, clean_up_tokenization_spaces=True):
+        return " ".join(str(int(t)) for t in ids if int(t) > 1)
+
+    def batch_decode(self, sequences, skip_special_tokens=True, clean_up_tokenization_spaces=True):
+        return [self.decode(seq) for seq in sequences]
+
+
+def make_service(model):
+    service = TranslationService.__new__(TranslationService)
+    service._config = {"translation_models": {"tiny/model": {}}}
+    service.use_local_models = True
+    service.batch_scheduler = None
+    service.response_handler = ResponseHandler()
+    service.model_validator = MagicMock()
+    service.model_validator.validate_model.return_value = (True, "ok")
+    service.model_cache = {"tiny/model": (model, WordTokenizer())}
+    return service
+
+
+class TestTranslateStream(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        warnings.simplefilter("ignore")
+        cls.model = tiny_marian(seed=3)
+
+    def test_stream_matches_greedy_translation(self):
+        service = make_service(self.model)
+        chunks = list(service.translate_stream("salam khouya", "Darija", "English", "tiny/model", "interactive"))
+        expected = service._translate_with_local_model("salam khouya", "tiny/model", "interactive")
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks).strip(), expected)
+
+        stats = service.get_streaming_stats()["tiny/model"]
+        self.assertEqual(stats["streams"], 1)
+        self.assertEqual(stats["tokens"], len(expected.split()) + 1)
+        self.assertGreater(stats["ttft_mean_ms"], 0.0)
+        self.assertGreater(stats["tokens_per_second_mean"], 0.0)
+
+    def test_beam_profiles_stream_greedily(self):
+        service = make_service(self.model)
+        streamed = "".join(service.translate_stream("salam", "Darija", "English", "tiny/model", "quality"))
+        greedy = service._translate_with_local_model("salam", "tiny/model", "interactive")
+        self.assertEqual(streamed.strip(), greedy)
+
+    def test_onnx_backend_streams(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            model_dir = Path(tmp) / "tiny"
+            self.model.save_pretrained(str(model_dir))
+            onnx_model = load_onnx_model(model_dir, lambda: MarianMTModel.from_pretrained(str(model_dir)).eval())
+            chunks = list(make_service(onnx_model).translate_stream(
+                "salam khouya", "Darija", "English", "tiny/model", "interactive"
+            ))
+        expected = make_service(self.model)._translate_with_local_model(
+            "salam khouya", "tiny/model", "interactive"
+        )
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks).strip(), expected)
+
+    def test_api_translation_arrives_in_one_chunk(self):
+        service = make_service(self.model)
+        service.use_local_models = False
+        service._translate_with_api = MagicMock(return_value="Hello brother")
+        self.assertEqual(list(service.translate_stream("salam khouya", "Darija", "English", "tiny/model")),
+                         ["Hello brother"])
+
+    def test_generation_error_yields_nothing(self):
+        broken = MagicMock()
+        broken.generate.side_effect = RuntimeError("out of memory")
+        service = make_service(broken)
+        self.assertEqual(list(service.translate_stream("salam", "Darija", "English", "tiny/model")), [])
+
+
+class TestStreamSharesTranslatePath(unittest.TestCase):
+    """Streams go through the same cache, memory, coalescing and metrics as translate."""
+
+    @classmethod
+    def setUpClass(cls):
+        warnings.simplefilter("ignore")
+        cls.model = tiny_marian(seed=3)
+
+    def setUp(self):
+        self.service = make_service(self.model)
+        self.service.metrics = ServiceMetrics(MetricsRegistry())
+
+    def stream(self, text, model="tiny/model"):
+        return list(self.service.translate_stream(text, "Darija", "English", model, "interactive"))
+
+    def test_memory_hits_and_local_streams_are_recorded(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tm.sqlite3"
+            build_index(path, {"darija-english": [("salam, labas 3lik?", "Hello, how are you?", "test")]})
+            self.service.translation_memory = TranslationMemory(path)
+            self.assertEqual(self.stream("Salam, labas 3lik"), ["Hello, how are you?"])
+            self.assertGreater(len(self.stream("salam khouya")), 1)
+            self.service.translation_memory.close()
+
+        requests = self.service.metrics.requests
+        self.assertEqual(requests.get(model="tiny/model", path="memory", outcome="success"), 1)
+        self.assertEqual(requests.get(model="tiny/model", path="local", outcome="success"), 1)
+
+    def test_fallback_streams_are_cached_under_the_serving_model(self):
+        self.service._config["translation_models"]["down/model"] = {}
+        self.service.result_cache = TranslationCache()
+        self.service.model_validator.validate_model.side_effect = lambda model: (model == "tiny/model", "")
+        self.service.model_validator.get_fallback_chain.return_value = ["tiny/model"]
+
+        translation = "".join(self.stream("salam khouya", model="down/model")).strip()
+        served_key = self.service._result_cache_key("salam khouya", "Darija", "English", "tiny/model", "interactive")
+        requested_key = self.service._result_cache_key("salam khouya", "Darija", "English", "down/model", "interactive")
+        self.assertEqual(self.service.result_cache.get(served_key), translation)
+        self.assertIsNone(self.service.result_cache.get(requested_key))
+        self.assertEqual(self.service.metrics.requests.get(model="down/model", path="fallback", outcome="success"), 1)
+
+    def test_greedy_streams_never_answer_beam_search_requests(self):
+        self.service.result_cache = TranslationCache()
+        streamed = "".join(self.service.translate_stream("salam khouya", "Darija", "English", "tiny/model", "quality"))
+        beam_key = self.service._result_cache_key("salam khouya", "Darija", "English", "tiny/model", "quality")
+        greedy_key = self.service._result_cache_key(
+            "salam khouya", "Darija", "English", "tiny/model", "quality", streaming=True
+        )
+        self.assertNotEqual(beam_key, greedy_key)
+        self.assertIsNone(self.service.result_cache.get(beam_key))
+        self.assertEqual(self.service.result_cache.get(greedy_key), streamed.strip())
+        # Interactive decoding is greedy already, so streams and translate share entries
+        self.assertEqual(
+            self.service._result_cache_key("salam", "Darija", "English", "tiny/model", "interactive", streaming=True),
+            self.service._result_cache_key("salam", "Darija", "English", "tiny/model", "interactive")
+        )
+
+    def test_streams_join_identical_requests_in_flight(self):
+        self.service.single_flight = SingleFlight()
+        key = self.service._flight_key("salam", "Darija", "English", "tiny/model", "interactive", None)
+        flight, leader = self.service.single_flight.join(key)
+        self.assertTrue(leader)
+
+        chunks = []
+        follower = threading.Thread(target=lambda: chunks.extend(self.stream("salam")))
+        follower.start()
+        while self.service.single_flight.get_stats()["coalesced"] == 0:
+            follower.join(0.01)
+        self.service.single_flight.finish(key, flight, ("shared", "tiny/model", "success"))
+        follower.join(5)
+
+        self.assertEqual(chunks, ["shared"])
+        self.assertEqual(self.service.metrics.requests.get(model="tiny/model", path="coalesced", outcome="success"), 1)
+        self.assertGreater(len(self.stream("salam")), 1)
+        self.assertEqual(self.service.single_flight.in_flight(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import json
+import logging
+import os
+import queue
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.response_handler import ResponseHandler
+from unittest.mock import patch
+
+from core.utils.structured_logging import (
+    LOG_DIR_ENV, DroppingQueueHandler, StructuredLog, install_queue_logging, resolve_log_path
+)
+
+
+def read_records(path):
+    return [json.loads(line) for line in Path(path).read_text(encoding="utf-8").splitlines()]
+
+
+class TestStructuredLog(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "attempts.jsonl"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_records_are_single_json_lines(self):
+        log = StructuredLog(str(self.path), name="test.attempts.lines").start()
+        log.log("translation_attempt", model="m", source_text="salam\nlabas", translation="héllo")
+        log.stop()
+        lines = self.path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 1)
+        record = json.loads(lines[0])
+        self.assertEqual(record["event"], "translation_attempt")
+        self.assertEqual(record["level"], "INFO")
+        self.assertEqual((record["model"], record["source_text"], record["translation"]), ("m", "salam\nlabas", "héllo"))
+
+    def test_successes_are_sampled_and_errors_kept(self):
+        log = StructuredLog(str(self.path), success_sample_rate=0.0, name="test.attempts.sampled").start()
+        for _ in range(20):
+            self.assertFalse(log.log("translation_attempt", success=True))
+        self.assertTrue(log.log("translation_attempt", logging.ERROR, success=False))
+        log.stop()
+        self.assertEqual([record["success"] for record in read_records(self.path)], [False])
+        stats = log.get_stats()
+        self.assertEqual((stats["submitted"], stats["sampled_out"], stats["dropped"]), (21, 20, 0))
+
+    def test_size_based_rotation(self):
+        log = StructuredLog(str(self.path), max_bytes=2000, backup_count=2, name="test.attempts.rotated").start()
+        for index in range(100):
+            log.log("translation_attempt", index=index, source_text="x" * 50)
+        log.stop()
+        self.assertTrue(Path(f"{self.path}.1").exists())
+        self.assertTrue(Path(f"{self.path}.2").exists())
+        self.assertFalse(Path(f"{self.path}.3").exists())
+        self.assertEqual(read_records(self.path)[-1]["index"], 99)
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = DroppingQueueHandler(queue.Queue(maxsize=1))
+        for _ in range(3):
+            handler.emit(logging.LogRecord("t", logging.INFO, __file__, 1, "event", None, None))
+        self.assertEqual(handler.dropped, 2)
+
+    def test_caller_overhead_is_measured_and_small(self):
+        log = StructuredLog(str(self.path), name="test.attempts.overhead").start()
+        for _ in range(2000):
+            log.log("translation_attempt", model="m", source_text="salam", translation="hello", latency_ms=12.5)
+        log.stop()
+        stats = log.get_stats()
+        self.assertGreater(stats["mean_overhead_us"], 0.0)
+        self.assertLess(stats["mean_overhead_us"], 500.0)
+        self.assertEqual(len(read_records(self.path)), 2000)
+
+    def test_relative_paths_follow_the_log_dir(self):
+        with patch.dict(os.environ, {LOG_DIR_ENV: self.tmp.name}):
+            log = StructuredLog("logs/attempts.jsonl", name="test.attempts.dir").start()
+            log.log("attempt", model="m")
+            log.stop()
+            self.assertEqual(len(read_records(Path(self.tmp.name) / "logs" / "attempts.jsonl")), 1)
+            self.assertEqual(resolve_log_path(str(self.path)), self.path)
+        with patch.dict(os.environ, {LOG_DIR_ENV: ""}):
+            self.assertEqual(resolve_log_path("service.log"), Path("service.log"))
+
+
+class TestQueuedServiceLogs(unittest.TestCase):
+    def test_handlers_move_behind_queue(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            target = logging.getLogger("test.queued.service")
+            target.propagate = False
+            target.setLevel(logging.INFO)
+            file_handler = logging.FileHandler(str(Path(tmp) / "service.log"))
+            target.addHandler(file_handler)
+            listener = install_queue_logging(target)
+            self.assertIsNotNone(listener)
+            self.assertIsNone(install_queue_logging(target))
+            target.info("Translating text using model: %s", "m")
+            listener.stop()
+            file_handler.close()
+            target.handlers.clear()
+            self.assertIn("Translating text using model: m", (Path(tmp) / "service.log").read_text())
+
+
+class TestAttemptLogging(unittest.TestCase):
+    def test_attempts_go_to_the_attempt_log(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "attempts.jsonl"
+            log = StructuredLog(str(path), name="test.attempts.handler").start()
+            handler = ResponseHandler(attempt_log=log)
+            handler.log_translation_attempt(True, "m", "salam", "hello", latency=0.0125)
+            handler.log_translation_attempt(False, "m", "salam", None, "timeout", 30.0)
+            log.stop()
+            records = read_records(path)
+        self.assertEqual([record["level"] for record in records], ["INFO", "ERROR"])
+        self.assertEqual(records[0]["latency_ms"], 12.5)
+        self.assertEqual(records[1]["error"], "timeout")
+
+    def test_fallback_logging_is_one_line(self):
+        with self.assertLogs("core.translation.response_handler", level="INFO") as captured:
+            ResponseHandler().log_translation_attempt(True, "m", "salam", "hello")
+        self.assertEqual(len(captured.output), 1)
+        self.assertNotIn("\n", captured.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
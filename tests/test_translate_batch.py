@@ -0,0 +1,148 @@
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import torch
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.response_handler import ResponseHandler
+from core.translation.translation_service import TranslationService
+from core.translation.translation import services
+from core.translation.translation.services import UnifiedTranslationService
+
+
+class FakeTokenizer:
+    """Whitespace tokenizer that maps each word to its length."""
+
+    pad_token_id = 0
+
+    def __call__(self, text, return_tensors=None, padding=False, truncation=False, max_length=None):
+        if "boom" in text:
+            raise ValueError("cannot tokenize")
+        ids = [len(word) for word in text.split()] + [99]
+        if return_tensors == "pt":
+            return {
+                "input_ids": torch.tensor([ids]),
+                "attention_mask": torch.ones(1, len(ids), dtype=torch.long),
+            }
+        return {"input_ids": ids, "attention_mask": [1] * len(ids)}
+
+    def pad(self, encodings, padding=True, return_tensors="pt"):
+        width = max(len(e["input_ids"]) for e in encodings)
+        input_ids = [e["input_ids"] + [self.pad_token_id] * (width - len(e["input_ids"])) for e in encodings]
+        mask = [e["attention_mask"] + [0] * (width - len(e["attention_mask"])) for e in encodings]
+        return {"input_ids": torch.tensor(input_ids), "attention_mask": torch.tensor(mask)}
+
+    def batch_decode(self, sequences, skip_special_tokens=True, clean_up_tokenization_spaces=True):
+        return [" ".join(str(t) for t in seq if t not in (0, 99)) + " " for seq in sequences]
+
+
+class FakeModel:
+    """Echoes its input ids and records the shape of every generate call."""
+
+    def __init__(self):
+        self.calls = []
+
+    def generate(self, input_ids, attention_mask=None, generation_config=None):
+        self.calls.append(tuple(input_ids.shape))
+        return input_ids
+
+
+class TestTranslateBatch(unittest.TestCase):
+    def setUp(self):
+        self.service = TranslationService.__new__(TranslationService)
+        self.service._config = {"translation_models": {"test/model": {}}}
+        self.service.use_local_models = True
+        self.service.response_handler = ResponseHandler()
+        self.service.model_validator = MagicMock()
+        self.service.model_validator.validate_model.return_value = (True, "Model available locally")
+        self.model = FakeModel()
+        self.service.model_cache = {"test/model": (self.model, FakeTokenizer())}
+
+    def test_results_keep_input_order(self):
+        texts = ["a bb ccc dddd eeeee", "hi", "xyz xyz"]
+        results = self.service.translate_batch(texts, "English", "Darija", "test/model")
+        self.assertEqual(results, ["1 2 3 4 5", "2", "3 3"])
+
+    def test_buckets_are_length_sorted_and_padded_dynamically(self):
+        texts = ["w " * 10, "w", "w " * 3, "w w"]
+        self.service._translate_batch_with_local_model(texts, "test/model", max_batch_size=2)
+        # Two buckets: the two shortest inputs, then the two longest
+        self.assertEqual(self.model.calls, [(2, 3), (2, 11)])
+
+    def test_failing_item_does_not_sink_batch(self):
+        texts = ["good one", "boom", "", "also fine"]
+        results = self.service.translate_batch(texts, "English", "Darija", "test/model")
+        self.assertEqual(results, ["4 3", None, None, "4 4"])
+
+    def test_input_errors_do_not_count_against_model_health(self):
+        health_monitor = MagicMock()
+        self.service.response_handler.health_monitor = health_monitor
+        results = self.service._translate_batch_with_local_model(["good one", "boom", "  "], "test/model")
+        self.assertEqual(results, ["4 3", None, None])
+        self.assertEqual([call.args[1] for call in health_monitor.record.call_args_list], [True])
+        # Nothing blank or untokenizable reaches generate
+        self.assertEqual(self.model.calls, [(1, 3)])
+
+    def test_failed_bucket_retries_items_individually(self):
+        def generate(input_ids, attention_mask=None, generation_config=None):
+            if input_ids.shape[0] > 1:
+                raise RuntimeError("out of memory")
+            return input_ids
+
+        self.model.generate = generate
+        results = self.service.translate_batch(["a b", "ccc"], "English", "Darija", "test/model")
+        self.assertEqual(results, ["1 1", "3"])
+
+    def test_uncached_model_uses_api_per_item(self):
+        self.service.use_local_models = False
+        self.service._translate_with_api = MagicMock(side_effect=["one", None])
+        results = self.service.translate_batch(["x", "y"], "English", "Darija", "test/model")
+        self.assertEqual(results, ["one", None])
+        self.assertEqual(self.service._translate_with_api.call_count, 2)
+
+    def test_empty_batch(self):
+        self.assertEqual(self.service.translate_batch([], "English", "Darija", "test/model"), [])
+
+
+class FakeUnifiedService(UnifiedTranslationService):
+    model_name = "test/model"
+
+    def __init__(self, translation_service=None):
+        super().__init__(translation_service)
+        self.translated = []
+
+    def translate(self, text, source_lang, target_lang):
+        self.translated.append(text)
+        return "single"
+
+
+class TestUnifiedBatchTranslate(unittest.TestCase):
+    def setUp(self):
+        self.core = MagicMock()
+        self.core.get_available_models.return_value = ["test/model"]
+        self.core.translate_batch.return_value = ["one", None]
+
+    def test_batch_translate_routes_through_translate_batch(self):
+        service = FakeUnifiedService()
+        with patch.object(services, "get_core_translation_service", return_value=self.core):
+            results = service.batch_translate(["x", "y"], "English", "Darija")
+        self.core.translate_batch.assert_called_once_with(["x", "y"], "English", "Darija", "test/model")
+        # Failed items are reported, not translated a second time
+        self.assertEqual(results[0], "one")
+        self.assertTrue(results[1].startswith("Translation error"))
+        self.assertEqual(service.translated, [])
+
+    def test_unconfigured_model_translates_item_by_item(self):
+        self.core.get_available_models.return_value = ["other/model"]
+        service = FakeUnifiedService(self.core)
+        self.assertEqual(service.batch_translate(["x", "y"], "English", "Darija"), ["single", "single"])
+        self.core.translate_batch.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,180 @@
+import sqlite3
+import tempfile
+import time
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.translation_cache import TranslationCache, make_cache_key
+from core.translation.translation_service import TranslationService
+
+
+class TestCacheKey(unittest.TestCase):
+    def test_whitespace_is_normalized(self):
+        a = make_cache_key("m", "English", "Darija", "  Hello   world ", {"num_beams": 4})
+        b = make_cache_key("m", "English", "Darija", "Hello world", {"num_beams": 4})
+        self.assertEqual(a, b)
+
+    def test_key_covers_model_languages_and_params(self):
+        base = make_cache_key("m", "English", "Darija", "Hello", {"num_beams": 4})
+        self.assertNotEqual(base, make_cache_key("other", "English", "Darija", "Hello", {"num_beams": 4}))
+        self.assertNotEqual(base, make_cache_key("m", "Darija", "English", "Hello", {"num_beams": 4}))
+        self.assertNotEqual(base, make_cache_key("m", "English", "Darija", "Hello", {"num_beams": 1}))
+
+
+class TestTranslationCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.disk_path = Path(self.tmp.name) / "cache.sqlite3"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_memory_hit_and_miss_counters(self):
+        cache = TranslationCache()
+        self.assertIsNone(cache.get("k"))
+        cache.set("k", "value")
+        self.assertEqual(cache.get("k"), "value")
+        stats = cache.get_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["memory_hits"], 1)
+
+    def test_lru_eviction_respects_byte_budget(self):
+        cache = TranslationCache(memory_max_bytes=25)
+        cache.set("a", "x" * 9)
+        cache.set("b", "x" * 9)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", "x" * 9)
+        self.assertLessEqual(cache.get_stats()["memory_bytes"], 25)
+        self.assertEqual(cache.get("a"), "x" * 9)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get_stats()["memory_evictions"], 1)
+
+    def test_disk_tier_survives_restart(self):
+        cache = TranslationCache(disk_path=self.disk_path)
+        cache.set("k", "سلام")
+        cache.close()
+
+        reopened = TranslationCache(disk_path=self.disk_path)
+        self.assertEqual(reopened.get("k"), "سلام")
+        self.assertEqual(reopened.get_stats()["disk_hits"], 1)
+        # Promoted into memory on the first disk hit
+        self.assertEqual(reopened.get("k"), "سلام")
+        self.assertEqual(reopened.get_stats()["memory_hits"], 1)
+        reopened.close()
+
+    def test_disk_tier_is_trimmed(self):
+        cache = TranslationCache(disk_path=self.disk_path, disk_max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, key)
+        stats = cache.get_stats()
+        self.assertEqual(stats["disk_entries"], 2)
+        self.assertEqual(stats["disk_evictions"], 1)
+        cache.close()
+
+    def test_ttl_expiry(self):
+        cache = TranslationCache(disk_path=self.disk_path, ttl_seconds=0.05)
+        cache.set("k", "v")
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("k"))
+        self.assertGreaterEqual(cache.get_stats()["expirations"], 1)
+        cache.close()
+
+    def test_disk_writes_are_committed_in_batches(self):
+        cache = TranslationCache(disk_path=self.disk_path, flush_interval_seconds=0, max_pending_writes=3)
+
+        def rows_on_disk():
+            with sqlite3.connect(str(self.disk_path)) as db:
+                return db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+
+        cache.set("a", "1")
+        cache.set("b", "2")
+        self.assertEqual(rows_on_disk(), 0)
+        cache.set("c", "3")
+        self.assertEqual(rows_on_disk(), 3)
+        cache.close()
+
+    def test_disk_reads_refresh_recency_on_flush(self):
+        # A zero memory budget sends every read to the disk tier
+        cache = TranslationCache(
+            memory_max_bytes=0, disk_path=self.disk_path, disk_max_entries=2, flush_interval_seconds=0
+        )
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.flush()
+        time.sleep(0.01)
+        self.assertEqual(cache.get("a"), "1")
+        cache.set("c", "3")
+        cache.flush()
+        self.assertEqual(cache.get("a"), "1")
+        self.assertIsNone(cache.get("b"))
+        cache.close()
+
+    def test_background_flush_persists_writes(self):
+        cache = TranslationCache(disk_path=self.disk_path, flush_interval_seconds=0.01)
+        cache.set("k", "v")
+        deadline = time.time() + 2.0
+        while time.time() < deadline:
+            with sqlite3.connect(str(self.disk_path)) as db:
+                if db.execute("SELECT COUNT(*) FROM translations").fetchone()[0]:
+                    break
+            time.sleep(0.01)
+        else:
+            self.fail("pending write was never flushed")
+        cache.close()
+
+
+class TestTranslateUsesCache(unittest.TestCase):
+    def setUp(self):
+        self.service = TranslationService.__new__(TranslationService)
+        self.service._config = {"translation_models": {"m": {}}}
+        self.service.use_local_models = False
+        self.service.batch_scheduler = None
+        self.service.result_cache = TranslationCache()
+        self.service.model_validator = MagicMock()
+        self.service.model_validator.validate_model.return_value = (True, "ok")
+        self.service._translate_with_api = MagicMock(return_value="Peace be upon you")
+
+    def test_repeated_request_is_served_from_cache(self):
+        first = self.service.translate("السلام عليكم", "Darija", "English", "m")
+        second = self.service.translate(" السلام   عليكم ", "Darija", "English", "m")
+        self.assertEqual(first, second)
+        self.assertEqual(self.service._translate_with_api.call_count, 1)
+        self.assertEqual(self.service.get_cache_stats()["memory_hits"], 1)
+
+    def test_failures_are_not_cached(self):
+        self.service._translate_with_api.return_value = None
+        self.service.translate("x", "Darija", "English", "m")
+        self.service.translate("x", "Darija", "English", "m")
+        self.assertEqual(self.service._translate_with_api.call_count, 2)
+
+    def test_batch_only_translates_misses(self):
+        self.service.translate("a", "Darija", "English", "m")
+        self.service._translate_with_api.reset_mock()
+        results = self.service.translate_batch(["a", "b"], "Darija", "English", "m")
+        self.assertEqual(results, ["Peace be upon you", "Peace be upon you"])
+        self.service._translate_with_api.assert_called_once_with("b", "m", "English", "interactive")
+
+    def test_fallback_results_are_cached_under_the_serving_model(self):
+        self.service._config["translation_models"]["fallback"] = {}
+        self.service.model_validator.validate_model.side_effect = lambda model: (model == "fallback", "")
+        self.service.model_validator.get_fallback_chain.return_value = ["fallback"]
+        self.service.translate("salam", "Darija", "English", "m")
+        self.service.translate_batch(["labas"], "Darija", "English", "m")
+
+        params = self.service._generation_params("interactive")
+        for text in ("salam", "labas"):
+            self.assertIsNone(self.service.result_cache.get(make_cache_key("m", "Darija", "English", text, params)))
+            self.assertEqual(
+                self.service.result_cache.get(make_cache_key("fallback", "Darija", "English", text, params)),
+                "Peace be upon you"
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
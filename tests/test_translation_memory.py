@@ -0,0 +1,183 @@
+import asyncio
+import csv
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation.parallel_corpus import iter_parallel_pairs
+from core.translation.response_handler import ResponseHandler
+from core.translation.service_metrics import ServiceMetrics
+from core.translation.translation_memory import (
+    TranslationMemory, bounded_edit_distance, build_index, language_type, normalize_source
+)
+from core.translation.translation_service import TranslationService
+from core.utils.metrics import MetricsRegistry
+
+COLUMN_TYPES = {"english": ["english", "eng"], "darija": ["darija", "sentence"]}
+
+ROWS = [
+    ("salam, labas 3lik?", "Hello, how are you?"),
+    ("ana mcha l dar dyali daba", "I went to my house just now"),
+    ("ana mcha l dar dyali daba", "I went to my house now"),
+    ("ana mcha l dar dyali daba", "I went to my house now"),
+    ("wach nta mn lmghrib wla la", "Are you from Morocco or not"),
+    ("chokran", "Thanks"),
+    ("khlst 20 dirham f lkhobz", "I paid 20 dirhams for the bread"),
+]
+
+
+def naive_edit_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current = [i]
+        for j, other in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char != other)))
+        previous = current
+    return previous[-1]
+
+
+class TestTranslationMemoryIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        data_dir = Path(self.tmp.name) / "data"
+        data_dir.mkdir()
+        with open(data_dir / "pairs.csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["darija", "eng"])
+            writer.writerows(ROWS)
+        self.path = Path(self.tmp.name) / "tm.sqlite3"
+        self.counts = build_index(self.path, {
+            "darija-english": iter_parallel_pairs(data_dir, "darija", "english", COLUMN_TYPES),
+            "english-darija": iter_parallel_pairs(data_dir, "english", "darija", COLUMN_TYPES)
+        })
+        self.memory = TranslationMemory(self.path, min_similarity=0.9, min_fuzzy_length=12)
+
+    def tearDown(self):
+        self.memory.close()
+        self.tmp.cleanup()
+
+    def test_duplicate_sources_keep_the_majority_translation(self):
+        self.assertEqual(self.counts, {"darija-english": 5, "english-darija": 6})
+        match = self.memory.lookup("ana mcha l dar dyali daba", "Darija", "English")
+        self.assertEqual(match.translation, "I went to my house now")
+        self.assertTrue(match.exact)
+
+    def test_exact_lookup_ignores_case_spacing_and_edge_punctuation(self):
+        match = self.memory.lookup("  Salam,  LABAS 3lik ", "Darija", "English")
+        self.assertEqual((match.translation, match.score, match.exact), ("Hello, how are you?", 1.0, True))
+        self.assertEqual(self.memory.lookup("Thanks!", "English", "Darija").translation, "chokran")
+
+    def test_near_lookup_within_similarity_threshold(self):
+        match = self.memory.lookup("wach nta mn lmaghrib wla la", "Latin Darija", "English")
+        self.assertEqual(match.translation, "Are you from Morocco or not")
+        self.assertFalse(match.exact)
+        self.assertAlmostEqual(match.score, 1 - 1 / 27)
+
+    def test_distant_short_and_unknown_direction_lookups_miss(self):
+        self.assertIsNone(self.memory.lookup("wach ntouma mn fransa wla la", "Darija", "English"))
+        # Short sentences only match exactly
+        self.assertIsNone(self.memory.lookup("chokrn", "Darija", "English"))
+        self.assertIsNone(self.memory.lookup("chokran", "Darija", "French"))
+        self.assertIsNone(self.memory.lookup("", "Darija", "English"))
+
+        stats = self.memory.get_stats()
+        self.assertEqual((stats["lookups"], stats["misses"], stats["exact_hits"]), (4, 4, 0))
+        self.assertEqual(stats["entries"], {"darija-english": 5, "english-darija": 6})
+
+    def test_exact_only_threshold(self):
+        memory = TranslationMemory(self.path, min_similarity=1.0)
+        self.assertIsNone(memory.lookup("wach nta mn lmaghrib wla la", "Darija", "English"))
+        memory.close()
+
+    def test_near_matches_are_opt_in(self):
+        memory = TranslationMemory(self.path)
+        self.assertIsNone(memory.lookup("wach nta mn lmaghrib wla la", "Darija", "English"))
+        self.assertTrue(memory.lookup("wach nta mn lmghrib wla la", "Darija", "English").exact)
+        memory.close()
+
+    def test_near_matches_keep_numbers_and_word_count(self):
+        # One edit away, but a different amount or a merged word changes the meaning
+        self.assertIsNone(self.memory.lookup("khlst 30 dirham f lkhobz", "Darija", "English"))
+        self.assertIsNone(self.memory.lookup("ana mcha ldar dyali daba", "Darija", "English"))
+        self.assertIsNotNone(self.memory.lookup("khlst 20 dirham f lkhobza", "Darija", "English"))
+
+
+class TestTranslationMemoryHelpers(unittest.TestCase):
+    def test_bounded_edit_distance_matches_full_distance(self):
+        words = ["", "a", "salam", "slam", "salaam", "labas", "lbas 3lik", "salam labas"]
+        for a in words:
+            for b in words:
+                distance = naive_edit_distance(a, b)
+                for bound in range(4):
+                    expected = distance if distance <= bound else bound + 1
+                    self.assertEqual(bounded_edit_distance(a, b, bound), expected, (a, b, bound))
+
+    def test_normalization_and_language_types(self):
+        self.assertEqual(normalize_source(" «Wach  nta labas؟» "), "wach nta labas")
+        self.assertEqual(
+            [language_type(name) for name in ("English", "Darija", "Latin Darija", "French")],
+            ["english", "darija", "darija", None]
+        )
+
+
+class TestServiceTranslationMemory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        path = Path(self.tmp.name) / "tm.sqlite3"
+        build_index(path, {"darija-english": [("salam, labas 3lik?", "Hello, how are you?", "test")]})
+        self.service = TranslationService.__new__(TranslationService)
+        self.service._config = {"translation_models": {"m": {}}}
+        self.service.use_local_models = False
+        self.service.batch_scheduler = None
+        self.service.result_cache = None
+        self.service.response_handler = ResponseHandler()
+        self.service.model_validator = MagicMock()
+        self.service.model_validator.validate_model.return_value = (True, "ok")
+        self.service.model_cache = {}
+        self.service.translation_memory = TranslationMemory(path)
+        self.service.metrics = ServiceMetrics(MetricsRegistry())
+        self.service._translate_with_api = MagicMock(return_value="from the model")
+
+    def tearDown(self):
+        self.service.translation_memory.close()
+        self.tmp.cleanup()
+
+    def test_memory_hits_skip_the_model(self):
+        self.assertEqual(self.service.translate("Salam, labas 3lik", "Darija", "English", "m"), "Hello, how are you?")
+        self.service._translate_with_api.assert_not_called()
+        requests = self.service.metrics.requests
+        self.assertEqual(requests.get(model="m", path="memory", outcome="success"), 1)
+        self.assertEqual(self.service.get_stage_timing_stats()["m"]["memory_lookup"]["count"], 1)
+
+    def test_misses_fall_through_to_the_model(self):
+        self.assertEqual(self.service.translate("salam, labas 3lik?", "English", "Darija", "m"), "from the model")
+        self.assertEqual(self.service._translate_with_api.call_count, 1)
+        stats = self.service.get_translation_memory_stats()
+        self.assertEqual((stats["lookups"], stats["misses"]), (1, 1))
+
+    def test_batches_check_the_memory_before_the_model(self):
+        results = self.service.translate_batch(["Salam, labas 3lik", "other"], "Darija", "English", "m")
+        self.assertEqual(results, ["Hello, how are you?", "from the model"])
+        self.service._translate_with_api.assert_called_once()
+        self.assertEqual(self.service.metrics.requests.get(model="m", path="memory", outcome="success"), 1)
+
+        results = asyncio.run(self.service.translate_many(["salam, labas 3lik?"], "Darija", "English", "m"))
+        self.assertEqual(results, ["Hello, how are you?"])
+
+    def test_missing_index_disables_the_memory(self):
+        service = TranslationService.__new__(TranslationService)
+        service.translation_memory = None
+        with self.assertLogs("core.translation.translation_service", level="WARNING"):
+            service._init_translation_memory({"path": str(Path(self.tmp.name) / "missing.sqlite3")})
+        self.assertIsNone(service.translation_memory)
+        self.assertEqual(service.get_translation_memory_stats(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import json
+import tempfile
+import threading
+import time
+import unittest
+import sys
+import urllib.error
+import urllib.request
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.translation import translation_service
+from core.translation.model_pool import ModelPool
+from core.translation.translation_service import TranslationService
+from core.translation.warmup import FAILED, READY, ModelWarmup
+from core.utils.status_server import StatusServer
+
+
+class ColdModel:
+    """Translations are slow until the model has run a few times."""
+
+    def __init__(self, cold_runs=2, cold_seconds=0.05):
+        self.cold_runs = cold_runs
+        self.cold_seconds = cold_seconds
+        self.calls = []
+
+    def translate(self, text, model, profile):
+        self.calls.append((len(self.calls), model, profile))
+        if len(self.calls) <= self.cold_runs:
+            time.sleep(self.cold_seconds)
+        return f"{model}:{text}"
+
+    def translate_batch(self, texts, model, profile):
+        return [self.translate(text, model, profile) for text in texts]
+
+
+class TestModelWarmup(unittest.TestCase):
+    def test_report_shows_first_vs_steady_latency(self):
+        cold = ColdModel()
+        warmup = ModelWarmup(texts=["a", "bb"], batch_sizes=[1, 2], profiles=["interactive", "quality"], steady_runs=2)
+        warmup.start(["m"], lambda model: time.sleep(0.01), cold.translate, cold.translate_batch, background=False)
+
+        report = warmup.get_report()
+        self.assertTrue(report["ready"])
+        result = report["models"]["m"]
+        self.assertEqual(result["status"], READY)
+        self.assertGreaterEqual(result["load_seconds"], 0.01)
+        self.assertGreater(result["first_latency_ms"], result["steady_latency_ms"])
+        self.assertGreater(result["first_to_steady_ratio"], 1.0)
+        # probe + 2 profiles x (2 singles + 2 batches of 2) + 2 steady runs
+        self.assertEqual(len(cold.calls), 1 + 2 * (2 + 4) + 2)
+        self.assertEqual({profile for _, _, profile in cold.calls}, {"interactive", "quality"})
+
+    def test_failed_model_does_not_block_readiness(self):
+        cold = ColdModel(cold_runs=0)
+
+        def load(model):
+            if model == "broken":
+                raise OSError("missing weights")
+
+        warmup = ModelWarmup(texts=["a"], batch_sizes=[1], steady_runs=1)
+        warmup.start(["broken", "m"], load, cold.translate, cold.translate_batch, background=False)
+        report = warmup.get_report()
+        self.assertTrue(report["ready"])
+        self.assertEqual(report["models"]["broken"]["status"], FAILED)
+        self.assertEqual(report["models"]["m"]["status"], READY)
+
+    def test_background_warmup_gates_readiness(self):
+        release = threading.Event()
+        warmup = ModelWarmup(texts=["a"], batch_sizes=[1], steady_runs=1)
+        cold = ColdModel(cold_runs=0)
+        warmup.start(["m"], lambda model: release.wait(5), cold.translate, cold.translate_batch)
+        self.assertFalse(warmup.is_ready())
+        self.assertEqual(warmup.get_report()["models"]["m"]["status"], "warming")
+        release.set()
+        self.assertTrue(warmup.wait_until_ready(5))
+
+
+class TestServiceWarmup(unittest.TestCase):
+    def setUp(self):
+        translation_service._shared_components.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        for name in ("pinned_model", "other_model"):
+            (Path(self.tmp.name) / name).mkdir()
+        self.service = TranslationService.__new__(TranslationService)
+        self.service._config = {
+            "warmup": {"enabled": True, "background": False, "texts": ["salam"], "batch_sizes": [1, 2]}
+        }
+        self.service.model_cache = ModelPool(
+            Path(self.tmp.name), ["pinned/model", "other/model"],
+            lambda name, model_dir: (object(), object()), pinned=["pinned/model"]
+        )
+        self.service._translate_with_local_model = MagicMock(return_value="hello")
+        self.service._translate_batch_with_local_model = MagicMock(
+            side_effect=lambda texts, model, profile=None: ["hello"] * len(texts)
+        )
+
+    def tearDown(self):
+        translation_service._shared_components.clear()
+        self.tmp.cleanup()
+
+    def test_pinned_models_are_warmed_before_ready(self):
+        self.service._init_warmup()
+        self.assertTrue(self.service.is_ready())
+        report = self.service.get_startup_report()
+        self.assertEqual(list(report["models"]), ["pinned/model"])
+        self.assertTrue(self.service.model_cache.is_loaded("pinned/model"))
+        self.assertFalse(self.service.model_cache.is_loaded("other/model"))
+        self.service._translate_batch_with_local_model.assert_called_with(
+            ["salam", "salam"], "pinned/model", profile="interactive"
+        )
+
+    def test_ready_endpoint(self):
+        self.service.warmup = MagicMock()
+        self.service.warmup.is_ready.return_value = False
+        server = StatusServer("127.0.0.1", 0)
+        server.start()
+        with patch("core.translation.translation_service.get_status_server", return_value=server):
+            self.service._register_status_endpoints({})
+        url = f"http://127.0.0.1:{server.port}/ready"
+        try:
+            with self.assertRaises(urllib.error.HTTPError) as raised:
+                urllib.request.urlopen(url, timeout=5)
+            self.assertEqual(raised.exception.code, 503)
+            self.service.warmup.is_ready.return_value = True
+            with urllib.request.urlopen(url, timeout=5) as response:
+                self.assertEqual(json.loads(response.read()), {"ready": True})
+        finally:
+            server.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import os
+import threading
+import time
+import unittest
+import sys
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from unittest.mock import MagicMock
+
+from core.translation.response_handler import ResponseHandler
+from core.translation.translation_service import TranslationService
+from core.translation.worker_pool import WorkerCrashedError, WorkerPool, assign_models
+
+
+class FakeWorkerService:
+    """Stands in for TranslationService.for_worker inside a worker process."""
+
+    def __init__(self, models):
+        self.models = models
+        self.model_cache = {model: None for model in models}
+        self.batch_scheduler = None
+
+    def _translate_with_local_model(self, text, model, profile=None):
+        if text == "crash":
+            os._exit(1)
+        if text == "slow":
+            time.sleep(1.0)
+        return f"{os.getpid()}:{model}:{text}"
+
+    def _translate_batch_with_local_model(self, texts, model, max_batch_size=16, profile=None):
+        return [self._translate_with_local_model(text, model, profile) for text in texts]
+
+
+def fake_worker(models):
+    return FakeWorkerService(models)
+
+
+def wait_for(condition, timeout=20.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class TestAssignModels(unittest.TestCase):
+    def test_models_are_spread_with_replicas(self):
+        self.assertEqual(assign_models(["a", "b", "c"], 2), [["a", "c"], ["b"]])
+        self.assertEqual(assign_models(["a", "b"], 3, replicas=2), [["a", "b"], ["a"], ["b"]])
+
+
+class TestWorkerPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = WorkerPool(
+            fake_worker, ["m"], num_workers=2, torch_threads=1, replicas=2,
+            health_interval=0.2, health_timeout=5.0
+        )
+        cls.pool.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def setUp(self):
+        self.assertTrue(wait_for(lambda: all(w["ready"] for w in self.pool.get_stats()["workers"].values())))
+
+    def test_requests_are_served_by_worker_processes(self):
+        result = self.pool.translate("salam", "m", timeout=30)
+        pid, model, text = result.split(":")
+        self.assertNotEqual(int(pid), os.getpid())
+        self.assertEqual((model, text), ("m", "salam"))
+        self.assertEqual(
+            [r.split(":")[2] for r in self.pool.translate_batch(["a", "b"], "m", timeout=30)],
+            ["a", "b"]
+        )
+
+    def test_least_loaded_worker_is_chosen(self):
+        self.pool.translate("warm up", "m", timeout=30)
+        self.pool.translate("warm up", "m", timeout=30)
+        slow = []
+        thread = threading.Thread(target=lambda: slow.append(self.pool.translate("slow", "m", timeout=30)))
+        thread.start()
+        self.assertTrue(wait_for(lambda: any(w["load"] for w in self.pool.get_stats()["workers"].values())))
+        fast = self.pool.translate("fast", "m", timeout=30)
+        thread.join()
+        self.assertNotEqual(fast.split(":")[0], slow[0].split(":")[0])
+
+    def test_crashed_worker_is_restarted(self):
+        self.pool.translate("warm up", "m", timeout=30)
+        before = self.pool.get_stats()
+        with self.assertRaises(WorkerCrashedError):
+            self.pool.translate("crash", "m", timeout=30)
+        stats = self.pool.get_stats()
+        self.assertEqual(stats["crashes"] - before["crashes"], 2)
+        self.assertEqual(stats["retried"] - before["retried"], 1)
+        self.assertTrue(wait_for(lambda: all(w["ready"] for w in self.pool.get_stats()["workers"].values())))
+        self.assertTrue(self.pool.translate("after", "m", timeout=30).endswith(":m:after"))
+
+    def test_health_reports(self):
+        self.assertTrue(wait_for(
+            lambda: all(w["health"] for w in self.pool.get_stats()["workers"].values())
+        ))
+        worker = self.pool.get_stats()["workers"][0]
+        self.assertEqual(worker["health"]["pid"], worker["pid"])
+        self.assertLess(worker["health_age_seconds"], 5.0)
+
+    def test_unknown_model_is_rejected(self):
+        with self.assertRaises(RuntimeError):
+            self.pool.translate("salam", "other", timeout=30)
+
+
+
+class TestServiceUsesWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.service = TranslationService.__new__(TranslationService)
+        self.service._config = {"translation_models": {"m": {}}, "worker_pool": {"request_timeout_seconds": 5}}
+        self.service.use_local_models = True
+        self.service.batch_scheduler = None
+        self.service.response_handler = ResponseHandler()
+        self.service.model_validator = MagicMock()
+        self.service.model_validator.validate_model.return_value = (True, "ok")
+        self.service.model_cache = {"m": None}
+        self.service.worker_pool = MagicMock()
+
+    def test_local_requests_are_routed_to_workers(self):
+        self.service.worker_pool.translate.return_value = "hello"
+        self.service.worker_pool.translate_batch.return_value = ["a", "b"]
+        self.assertEqual(self.service.translate("salam", "Darija", "English", "m"), "hello")
+        self.assertEqual(self.service.translate_batch(["x", "y"], "Darija", "English", "m"), ["a", "b"])
+        self.service.worker_pool.translate.assert_called_once_with("salam", "m", "interactive", timeout=5)
+
+    def test_worker_failure_fails_the_request(self):
+        self.service.worker_pool.translate.side_effect = WorkerCrashedError("died")
+        self.assertIsNone(self.service.translate("salam", "Darija", "English", "m"))
+
+
+if __name__ == '__main__':
+    unittest.main()